@@ -5,5 +5,6 @@ from .easy import EasyAI
 from .medium import MediumAI
 from .hard import HardAI
 from .expert import ExpertAI
+from .value import ValueAI
 
-__all__ = ['BaseAI', 'EasyAI', 'MediumAI', 'HardAI', 'ExpertAI']
\ No newline at end of file
+__all__ = ['BaseAI', 'EasyAI', 'MediumAI', 'HardAI', 'ExpertAI', 'ValueAI']
\ No newline at end of file
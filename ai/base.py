@@ -4,12 +4,21 @@ from abc import ABC, abstractmethod
 import json
 import os
 
+from .trace import DEBUG, INFO, WARNING
+
 
 class BaseAI(ABC):
     """Base class for all AI strategies"""
     
     # Class variable to store element categories (loaded once)
     _element_categories = None
+    # Class variable to store the draft opening book (loaded once)
+    _draft_book = None
+    # Class variable to store the element matchup matrix (loaded once)
+    _element_matchups = None
+    MIN_MATCHUP_GAMES = 8  # Matrix cells with fewer games are treated as unknown
+    # EndgameSolver for the last clashes of a round (set by the AIs that search)
+    endgame = None
     
     def __init__(self):
         self.engine = None  # Will be set by GameEngine
@@ -17,6 +26,22 @@ class BaseAI(ABC):
         self.opponent_drafted_elements = {}  # Track which elements opponents drafted
         self._load_element_categories()
         self.element_win_rates = self._load_element_win_rates()
+        self.draft_book = self._load_draft_book()
+        self.element_matchups = self._load_element_matchups()
+    
+    def tracing(self, level=DEBUG):
+        """Whether the engine's decision trace records `level`; check before building a message"""
+        trace = getattr(self.engine, 'decision_trace', None)
+        return trace is not None and trace.enabled(level)
+    
+    def trace(self, level, message):
+        """Add a message (a string, or a callable returning one) to the engine's decision trace"""
+        trace = getattr(self.engine, 'decision_trace', None)
+        if trace is None:
+            return
+        gs = getattr(self.engine, 'gs', None)
+        trace.record(level, message, ai=type(self).__name__,
+                     round=getattr(gs, 'round_num', None), clash=getattr(gs, 'clash_num', None))
     
     def choose_card_to_play(self, player, gs):
         """Main entry point for AI card selection"""
@@ -28,6 +53,15 @@ class BaseAI(ABC):
         # Strategy-specific selection
         return self._select_card(player, gs, valid_indices)
     
+    def play_request(self, player, gs):
+        """This prepare decision as a request to be scored in a batch with other games'
+        (see lockstep_sim.py), or None to decide in choose_card_to_play as usual
+        
+        AIs that return requests also provide decide_play_requests(requests),
+        which returns the chosen hand index for each.
+        """
+        return None
+    
     def _get_valid_card_indices(self, player, gs):
         """Common method to filter cards by clash rules"""
         valid = list(range(len(player.hand)))
@@ -37,6 +71,24 @@ class BaseAI(ABC):
             valid = [i for i in valid if player.hand[i].notlast < 2]
         return valid
     
+    def endgame_filter(self, player, gs, valid_indices):
+        """Narrow valid_indices to the cards an exact search of the rest of the round rates best
+        
+        Returns valid_indices unchanged when there is no solver or the position
+        is too large for it, so the caller's heuristics decide as usual.
+        """
+        if self.endgame is None or self.engine is None:
+            return valid_indices
+        values = self.endgame.solve(self.engine, player, valid_indices)
+        if not values:
+            return valid_indices
+        best = max(values.values())
+        chosen = [idx for idx in valid_indices if values[idx] >= best - 1e-9]
+        if self.tracing(INFO):
+            names = ', '.join(player.hand[idx].name for idx in chosen)
+            self.trace(INFO, f"[AI-ENDGAME] {player.name} searched {self.endgame.nodes} clashes: {names} ({best:+.2f})")
+        return chosen
+    
     @abstractmethod
     def _select_card(self, player, gs, valid_indices):
         """Override in subclasses to implement selection strategy"""
@@ -195,10 +247,8 @@ class BaseAI(ABC):
             except Exception as e:
                 # If loading fails, use empty categories
                 BaseAI._element_categories = {"categories": {}}
-                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                    self.engine.ai_decision_logs.append(
-                        f"\\033[90m[AI-WARNING] Could not load element categories: {e}\\033[0m"
-                    )
+                if self.tracing(WARNING):
+                    self.trace(WARNING, f"[AI-WARNING] Could not load element categories: {e}")
     
     def get_element_category(self, element):
         """Get the strategic category of an element"""
@@ -242,8 +292,70 @@ class BaseAI(ABC):
             return {'win_rates': {}, 'selection_rates': {}, 'total_games': 0}
     
     def get_element_win_rate(self, element):
-        """Get win rate for an element from analytics data"""
-        return self.element_win_rates.get('win_rates', {}).get(element, 0.5)
+        """Get win rate for an element: the matchup matrix's overall rate if built, else analytics data"""
+        return self.element_win_rate_table().get(element, 0.5)
+    
+    def element_win_rate_table(self):
+        """{element: win rate}, preferring the stratified matchup matrix over marginal analytics rates"""
+        if self.element_matchups:
+            return {element: stats['rate'] for element, stats in self.element_matchups['elements'].items()
+                    if stats['games'] >= self.MIN_MATCHUP_GAMES}
+        return self.element_win_rates.get('win_rates', {})
+    
+    def _load_element_matchups(self):
+        """Load the element matchup matrix built by matchup_matrix.py (empty if there is none)"""
+        if BaseAI._element_matchups is None:
+            try:
+                current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+                with open(os.path.join(current_dir, 'element_matchups.json'), 'r') as f:
+                    BaseAI._element_matchups = json.load(f)
+            except Exception:
+                BaseAI._element_matchups = {}
+        return BaseAI._element_matchups
+    
+    def get_matchup_win_rate(self, element, enemy_element):
+        """Measured win rate of teams with `element` against teams with `enemy_element`, or None if unknown"""
+        if not self.element_matchups:
+            return None
+        cell = self.element_matchups['matrix'].get(element, {}).get(enemy_element)
+        if not cell or cell['games'] < self.MIN_MATCHUP_GAMES:
+            return None
+        return cell['rate']
+    
+    def _load_draft_book(self):
+        """Load the draft opening book built by draft_book.py (empty if there is none)"""
+        if BaseAI._draft_book is None:
+            try:
+                current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+                book_path = os.path.join(current_dir, 'draft_book.json')
+                with open(book_path, 'r') as f:
+                    BaseAI._draft_book = json.load(f).get('book', {})
+            except Exception:
+                BaseAI._draft_book = {}
+        return BaseAI._draft_book
+    
+    def draft_book_pick(self, player, gs, available_sets):
+        """The opening book's set for this draft position, or None to evaluate live
+        
+        Positions are keyed by the elements each player has drafted so far, so
+        only the opening draft is covered; redrafts later in the game fall back.
+        """
+        if not self.draft_book or len(gs.players) != 2:
+            return None
+        opponent = next(p for p in gs.players if p is not player)
+        key = f"{','.join(self._drafted_elements(player))}|{','.join(self._drafted_elements(opponent))}"
+        element = self.draft_book.get(key)
+        if element is None:
+            return None
+        pick = next((s for s in available_sets if s and s[0].element == element), None)
+        if pick and self.tracing(INFO):
+            self.trace(INFO, f"[AI-BOOK] {player.name} drafts {pick[0].elephant} from the opening book")
+        return pick
+    
+    @staticmethod
+    def _drafted_elements(player):
+        cards = player.hand + player.discard_pile + [pc.card for clash in player.board for pc in clash]
+        return sorted({card.element for card in cards})
     
     def choose_draft_set(self, player, gs, available_sets):
         """Choose a spell set during drafting phase
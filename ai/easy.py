@@ -2,6 +2,7 @@
 
 import random
 from .base import BaseAI
+from .trace import INFO
 
 
 class EasyAI(BaseAI):
@@ -18,10 +19,8 @@ class EasyAI(BaseAI):
         choice = random.choice(valid_indices)
         
         # Debug logging
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-EASY] {player.name} randomly picked: {player.hand[choice].name}\033[0m"
-            )
+        if self.tracing(INFO):
+            self.trace(INFO, f"[AI-EASY] {player.name} randomly picked: {player.hand[choice].name}")
         return choice
     
     def make_choice(self, valid_options, caster, gs, current_card):
@@ -32,12 +31,10 @@ class EasyAI(BaseAI):
         choice = random.choice(valid_options)
         
         # Debug logging
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
+        if self.tracing(INFO):
             # Format option description for logging
             option_desc = self._describe_option(choice)
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-EASY] {caster.name} randomly chose: {option_desc}\033[0m"
-            )
+            self.trace(INFO, f"[AI-EASY] {caster.name} randomly chose: {option_desc}")
         
         return choice
     
@@ -106,9 +103,7 @@ class EasyAI(BaseAI):
         target = random.choice(potential_targets)
         
         # Debug logging
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-EASY] {caster.name} randomly chose to cancel: {target.card.name}\033[0m"
-            )
+        if self.tracing(INFO):
+            self.trace(INFO, f"[AI-EASY] {caster.name} randomly chose to cancel: {target.card.name}")
         
         return target
\ No newline at end of file
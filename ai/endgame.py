@@ -0,0 +1,261 @@
+"""Exact endgame search over the last prepares of a round
+
+From clash 3 on each player holds only a few cards, so the rest of the
+round can be searched outright: for every card we could prepare, and every
+card the opponent might prepare, the engine state is cloned and the clash
+is played out by the real rules, recursing into the following clashes.
+Our own choices are maximised; the opponent's are averaged over, because
+its hand is hidden and its prepare is simultaneous with ours.
+
+The opponent's candidates are what is public: the cards of every drafted
+set (any set no longer in the main deck, since it may have taken some of
+ours) that are not face up on the board and not in our hand or discard
+pile. Its actual hand is never looked at beyond its size. Choices
+made while spells resolve (targets, options) are left to a HardAI proxy
+for both sides. Sub-positions are memoised for the rest of the round, so
+the clash-4 decision is usually answered from the clash-3 search. A node
+budget caps the work; when it runs out the caller falls back to its
+heuristics.
+"""
+
+import copy
+import random
+import sys
+
+from game_logger import NullGameLogger
+
+from .trace import DecisionTrace
+
+FROM_CLASH = 3       # First clash of a round the solver is tried on
+MAX_LEAVES = 200     # Largest estimated number of leaf outcomes worth searching
+NODE_BUDGET = 400    # Clashes simulated per search before giving up
+TRUNK_VALUE = 10     # A trunk is worth this much health in leaf scores
+WIN_VALUE = 1000
+
+_MUTED = NullGameLogger()  # Simulated clashes are not part of the game's record
+
+
+class BudgetExceeded(Exception):
+    """The search needed more than its node budget"""
+
+
+def _no_pause(message=""):
+    pass
+
+
+def _engine_module(engine):
+    """The module the engine's GameEngine was defined in (elephants_prototype, or __main__ when run directly)
+    
+    None for stand-in engines that do not derive from GameEngine and so cannot play clashes.
+    """
+    base = next((cls for cls in type(engine).__mro__ if cls.__name__ == 'GameEngine'), None)
+    return sys.modules[base.__module__] if base else None
+
+
+def clone_state(gs):
+    """Copy of a GameState that simulated clashes can mutate; cards themselves are shared"""
+    clone = copy.copy(gs)
+    clone.players = [copy.copy(p) for p in gs.players]
+    owners = {id(p): c for p, c in zip(gs.players, clone.players)}
+    for player in clone.players:
+        player.hand = list(player.hand)
+        player.discard_pile = list(player.discard_pile)
+        board = []
+        for clash in player.board:
+            spells = []
+            for pc in clash:
+                spell = copy.copy(pc)
+                spell.owner = owners.get(id(pc.owner), pc.owner)
+                spells.append(spell)
+            board.append(spells)
+        player.board = board
+    clone.main_deck = [list(s) for s in gs.main_deck]
+    clone.event_log = list(gs.event_log)
+    clone.action_log = type(gs.action_log)()
+    clone.resolution_queue = []
+    clone.clash_passive_effects = []
+    clone.advance_phase_active_spells = []
+    return clone
+
+
+class EndgameSolver:
+    """Expectimax over the remaining prepare decisions of the current round"""
+
+    def __init__(self, node_budget=NODE_BUDGET, max_leaves=MAX_LEAVES, from_clash=FROM_CLASH):
+        self.node_budget = node_budget
+        self.max_leaves = max_leaves
+        self.from_clash = from_clash
+        self.nodes = 0
+        self._memo = {}
+        self._memo_round = None
+        self._proxies = None
+
+    # --- public entry point ---
+
+    def solve(self, engine, player, valid_indices):
+        """{hand index: expected leaf score} for the valid cards, or None if the position is out of reach"""
+        gs = engine.gs
+        module = _engine_module(engine)
+        if module is None or len(gs.players) != 2 or gs.clash_num < self.from_clash or len(valid_indices) < 2:
+            return None
+        me = gs.players.index(player)
+        opponent = gs.players[1 - me]
+        pool, count, hidden = self._opponent_view(gs, me)
+        if self._estimate_leaves(gs, player, opponent, pool) > self.max_leaves:
+            return None
+        round_key = (id(engine), gs.round_num)
+        if self._memo_round != round_key:
+            self._memo, self._memo_round = {}, round_key
+
+        root = self._clone(engine)
+        if hidden is not None:
+            root.gs.players[1 - me].board[gs.clash_num - 1].remove(
+                next(pc for pc in root.gs.players[1 - me].board[gs.clash_num - 1] if pc.card is hidden))
+        self.nodes = 0
+        random_state = random.getstate()
+        try:
+            values = {}
+            by_card = {}
+            for idx in valid_indices:
+                card = player.hand[idx]
+                if card.id not in by_card:
+                    by_card[card.id] = self._expect(module, root, me, card, pool, count)
+                values[idx] = by_card[card.id]
+            return values
+        except BudgetExceeded:
+            return None
+        finally:
+            random.setstate(random_state)
+
+    # --- search ---
+
+    def _value(self, module, sim, me, pool, count):
+        """Best expected score for `me` from the prepare phase of sim's current clash"""
+        key = self._signature(sim.gs, me, pool, count)
+        if key in self._memo:
+            return self._memo[key]
+        player = sim.gs.players[me]
+        options = self._distinct(self._playable(sim.gs, player, player.hand))
+        value = max(self._expect(module, sim, me, card, pool, count) for card in options)
+        self._memo[key] = value
+        return value
+
+    def _expect(self, module, sim, me, card, pool, count):
+        """Mean score over the opponent's candidate prepares when we prepare `card`"""
+        opponent = sim.gs.players[1 - me]
+        replies = self._distinct(self._playable(sim.gs, opponent, pool if count else []))
+        return sum(self._after(module, sim, me, card, reply, pool, count) for reply in replies) / len(replies)
+
+    def _after(self, module, sim, me, card, reply, pool, count):
+        self.nodes += 1
+        if self.nodes > self.node_budget:
+            raise BudgetExceeded()
+        child = self._clone(sim)
+        gs = child.gs
+        player, opponent = gs.players[me], gs.players[1 - me]
+        filler = [c for c in pool if c is not reply]
+        opponent.hand = ([reply] if reply else []) + filler[:count - (1 if reply else 0)]
+        hand_before = list(opponent.hand)
+        for owner, chosen in ((player, card), (opponent, reply)):
+            if chosen is not None:
+                owner.hand.remove(chosen)
+                owner.board[gs.clash_num - 1].append(module.PlayedCard(chosen, owner))
+        if self._play_clash(module, child):
+            return self._score(gs, me)
+        # Cards the clash took from the opponent's stand-in hand leave the pool; cards it gained join it
+        next_pool = [c for c in pool if c is not reply and (c in opponent.hand or c not in hand_before)]
+        next_pool += [c for c in opponent.hand if c not in pool]
+        gs.clash_num += 1
+        return self._value(module, child, me, next_pool, len(opponent.hand))
+
+    def _play_clash(self, module, sim):
+        """Cast, resolve and advance the prepared clash; True when the round (or game) is over"""
+        gs = sim.gs
+        for proxy in self._proxies.values():
+            proxy.engine = sim
+        phases = [sim._run_cast_phase, sim._run_resolve_phase]
+        if gs.clash_num < 4:
+            phases.append(sim._run_advance_phase)
+        try:
+            for phase in phases:
+                phase()
+                if gs.game_over:
+                    return True
+        except module.RoundOverException:
+            return True
+        return gs.clash_num == 4
+
+    def _clone(self, engine):
+        if self._proxies is None:
+            from .hard import HardAI  # Imported here: hard.py imports this module
+            self._proxies = {0: HardAI(), 1: HardAI()}
+        sim = copy.copy(engine)
+        sim.gs = clone_state(engine.gs)
+        for p in sim.gs.players:
+            p.is_human = False
+        sim.action_handler = type(engine.action_handler)(sim)
+        sim.ai_strategies = self._proxies
+        sim.decision_trace = DecisionTrace()  # Off: simulated decisions are not the real ones
+        sim.logger = _MUTED
+        sim._pause = _no_pause
+        return sim
+
+    # --- helpers ---
+
+    def _opponent_view(self, gs, me):
+        """(candidate cards, hand size, hidden card already prepared this clash) for the opponent"""
+        player, opponent = gs.players[me], gs.players[1 - me]
+        hidden = None
+        current = opponent.board[gs.clash_num - 1]
+        if gs.ringleader_index == 1 - me and current and current[-1].status == 'prepared':
+            hidden = current[-1].card  # Prepared face down before our turn this clash
+        undrafted = {id(card) for spell_set in gs.main_deck if spell_set for card in spell_set}
+        shown = {id(pc.card) for p in gs.players for clash in p.board for pc in clash if pc.card is not hidden}
+        shown |= {id(card) for card in player.hand + player.discard_pile}
+        pool = [card for card in gs.all_cards.values() if id(card) not in undrafted and id(card) not in shown]
+        return pool, len(opponent.hand) + (1 if hidden is not None else 0), hidden
+
+    @staticmethod
+    def _estimate_leaves(gs, player, opponent, pool):
+        leaves = 1
+        for k in range(5 - gs.clash_num):
+            leaves *= max(len(player.hand) - k, 1) * max(len(pool) - k, 1)
+        return leaves
+
+    @staticmethod
+    def _playable(gs, player, cards):
+        """Cards `player` may prepare this clash, or [None] if it cannot prepare"""
+        if player.is_invulnerable:
+            return [None]
+        if gs.clash_num == 1:
+            cards = [c for c in cards if c.notfirst < 2]
+        if gs.clash_num == 4:
+            cards = [c for c in cards if c.notlast < 2]
+        return cards or [None]
+
+    @staticmethod
+    def _distinct(cards):
+        seen = {}
+        for card in cards:
+            seen.setdefault(card.id if card else None, card)
+        return list(seen.values())
+
+    @staticmethod
+    def _score(gs, me):
+        player, opponent = gs.players[me], gs.players[1 - me]
+        if opponent.trunks == 0 and player.trunks > 0:
+            return WIN_VALUE
+        if player.trunks == 0:
+            return -WIN_VALUE
+        return (player.trunks - opponent.trunks) * TRUNK_VALUE + player.health - opponent.health
+
+    @staticmethod
+    def _signature(gs, me, pool, count):
+        players = tuple(
+            (p.health, p.max_health, p.trunks, p.is_invulnerable, p.knocked_out_this_turn, len(p.discard_pile),
+             tuple(tuple((pc.card.id, pc.status, pc.has_resolved, pc.advances_this_round, pc.owner.name)
+                         for pc in clash) for clash in p.board))
+            for p in gs.players)
+        return (gs.clash_num, gs.ringleader_index, me, players,
+                tuple(sorted(c.id for c in gs.players[me].hand)), tuple(sorted(c.id for c in pool)), count,
+                len(gs.main_deck), repr(gs.event_log))
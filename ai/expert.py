@@ -5,17 +5,63 @@ import os
 import random
 from collections import defaultdict
 from .base import BaseAI
+from .endgame import EndgameSolver
+from .features import encode_state, play_context
+from .trace import DEBUG, INFO, WARNING
+from .value import load_value_model
 
 
 class ExpertAI(BaseAI):
     """Expert difficulty - overthinks everything, plans multiple turns ahead"""
     
-    def __init__(self):
+    # Tunable weights (see expert_tuner.py); expert_weights.json overrides these when present
+    DEFAULT_WEIGHTS = {
+        # _select_card: multipliers for each evaluation
+        'tactics': 0.15,
+        'strategic': 0.15,
+        'future_combos': 0.15,
+        'clash_combo': 0.15,
+        'damage_efficiency': 0.10,
+        'response_threat': 0.20,
+        'response_threat_low_health': 0.30,
+        'response_threat_conjury': 0.15,  # Added for conjuries
+        'response_threat_multi_type': 0.10,  # Added for attack+boost cards
+        'board_synergy': 0.15,
+        'condition_timing': 0.10,
+        'mobility': 0.10,
+        # choose_draft_set: bonus per spell type in a set
+        'draft_attack': 30,
+        'draft_remedy': 35,
+        'draft_response': 40,
+        'draft_boost': 25,
+        'draft_conjury': 45,
+        # Learned value model (value_model.json) mixed into both; 0 = not used
+        'value_model': 0.0,
+    }
+    
+    def __init__(self, weights=None):
         super().__init__()
+        self.weights = {**self.DEFAULT_WEIGHTS, **self._load_tuned_weights(), **(weights or {})}
         self.win_rate_data = self._load_win_rate_data()
         self.current_player = None  # Track current player for analysis
         self.threat_data = self._load_threat_data()
         self.spell_database = self._build_spell_database()
+        self.response_index = self._build_response_index()
+        self._response_threat_table = {}  # (card id, priority, enemy elements, our health) -> threats
+        self._targeted_types = {}  # id(resolve_effects) -> (resolve_effects, spell types they mention)
+        self.value_model = load_value_model() if self.weights['value_model'] else None
+        self.endgame = EndgameSolver()
+    
+    def _load_tuned_weights(self):
+        """Load weights installed by expert_tuner.py, if any"""
+        try:
+            weights_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'expert_weights.json')
+            if os.path.exists(weights_file):
+                with open(weights_file, 'r') as f:
+                    return {k: v for k, v in json.load(f).get('weights', {}).items() if k in self.DEFAULT_WEIGHTS}
+        except (IOError, json.JSONDecodeError):
+            pass
+        return {}
     
     def _load_win_rate_data(self):
         """Load win rate data from JSON file"""
@@ -32,98 +78,97 @@ class ExpertAI(BaseAI):
         """Select card with extreme analysis and future planning"""
         self.current_player = player  # Set current player for analysis
         
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-EXPERT] {player.name} initiating deep analysis...\033[0m"
-            )
+        # Late in a round, only consider the cards an exact search rates best
+        valid_indices = self.endgame_filter(player, gs, valid_indices)
+        if len(valid_indices) == 1:
+            return valid_indices[0]
+        
+        if self.tracing(DEBUG):
+            self.trace(DEBUG, f"[AI-EXPERT] {player.name} initiating deep analysis...")
         
         # Build a comprehensive game plan
         game_plan = self._build_multi_turn_plan(player, gs)
         
         best_score = float('-inf')
         best_index = valid_indices[0]
+        w = self.weights
+        value_context = play_context(encode_state(gs, player)) if self.value_model else None
         
         for idx in valid_indices:
             card = player.hand[idx]
             score = 0
             
             # 1. Immediate tactical evaluation (now with context-aware damage)
-            score += self._evaluate_immediate_tactics(card, player, gs) * 0.15
+            score += self._evaluate_immediate_tactics(card, player, gs) * w['tactics']
             
             # 2. Multi-turn strategic value
-            score += self._evaluate_strategic_value(card, player, gs, game_plan) * 0.15
+            score += self._evaluate_strategic_value(card, player, gs, game_plan) * w['strategic']
             
             # 3. Future combo potential
-            score += self._evaluate_future_combos(card, player, gs) * 0.15
+            score += self._evaluate_future_combos(card, player, gs) * w['future_combos']
             
             # 4. Same-clash combo potential
-            score += self._evaluate_clash_combo_potential(card, player, gs) * 0.15
+            score += self._evaluate_clash_combo_potential(card, player, gs) * w['clash_combo']
             
             # 5. Context-aware damage efficiency
-            score += self._evaluate_damage_efficiency(card, player, gs) * 0.10
+            score += self._evaluate_damage_efficiency(card, player, gs) * w['damage_efficiency']
             
             # 6. Response threat evaluation (NEW)
             # Increase weight when health is low or card is extra vulnerable
-            response_weight = 0.20
+            response_weight = w['response_threat']
             if player.health <= 5:
-                response_weight = 0.30
+                response_weight = w['response_threat_low_health']
             if card.is_conjury:
-                response_weight += 0.15  # Conjuries need extra caution
+                response_weight += w['response_threat_conjury']  # Conjuries need extra caution
             if 'attack' in card.types and 'boost' in card.types:
-                response_weight += 0.10  # Multi-type cards are risky
+                response_weight += w['response_threat_multi_type']  # Multi-type cards are risky
                 
             response_threat = self._evaluate_response_threat_for_attack(card, player, gs)
             score += response_threat * response_weight
             
             # Log if we're avoiding due to responses
-            if response_threat < -50 and self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-EXPERT] {card.name} has high response risk ({response_threat:.0f})\033[0m"
-                )
+            if response_threat < -50 and self.tracing(DEBUG):
+                self.trace(DEBUG, f"[AI-EXPERT] {card.name} has high response risk ({response_threat:.0f})")
             
             # 7. Board state synergy evaluation (NEW)
-            score += self._evaluate_board_state_synergy(card, player, gs) * 0.15
+            score += self._evaluate_board_state_synergy(card, player, gs) * w['board_synergy']
             
             # 8. Conditional spell timing evaluation
             if self._has_conditional_effects(card):
                 condition_score = self._evaluate_condition_timing(card, player, gs)
-                score += condition_score * 0.10
-                if condition_score > 50 and self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-EXPERT] {card.name} has good condition timing (+{condition_score})\033[0m"
-                    )
+                score += condition_score * w['condition_timing']
+                if condition_score > 50 and self.tracing(DEBUG):
+                    self.trace(DEBUG, f"[AI-EXPERT] {card.name} has good condition timing (+{condition_score})")
             
             # 9. Mobility evaluation (NEW)
             mobility_score = self._evaluate_contextual_mobility_value(card, player, gs)
             if mobility_score > 0:
-                score += mobility_score * 0.10
-                if self.engine and hasattr(self.engine, 'ai_decision_logs') and mobility_score > 50:
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-EXPERT] {card.name} has mobility potential (+{mobility_score:.0f})\033[0m"
-                    )
+                score += mobility_score * w['mobility']
+                if self.tracing(DEBUG) and mobility_score > 50:
+                    self.trace(DEBUG, f"[AI-EXPERT] {card.name} has mobility potential (+{mobility_score:.0f})")
+            
+            # 10. Learned value model
+            if value_context:
+                score += self.value_model.play_value(value_context, card) * w['value_model']
             
             # Log extensive analysis
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-EXPERT] {card.name} - Total Score: {score:.1f}\033[0m"
-                )
+            if self.tracing(DEBUG):
+                self.trace(DEBUG, f"[AI-EXPERT] {card.name} - Total Score: {score:.1f}")
             
             if score > best_score:
                 best_score = score
                 best_index = idx
         
         chosen_card = player.hand[best_index]
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-EXPERT] Final choice: {chosen_card.name} (Score: {best_score:.1f})\033[0m"
-            )
+        if self.tracing(DEBUG):
+            self.trace(INFO, f"[AI-EXPERT] Final choice: {chosen_card.name} (Score: {best_score:.1f})")
             
             # Log if we avoided attacks due to response threats
             if player.health <= 5 and 'attack' not in chosen_card.types:
                 attack_options = [player.hand[i] for i in valid_indices if 'attack' in player.hand[i].types]
                 if attack_options:
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-EXPERT] Avoided {len(attack_options)} attack options due to low health ({player.health} HP) and response threats\033[0m"
+                    self.trace(DEBUG,
+                        f"[AI-EXPERT] Avoided {len(attack_options)} attack options due to low health ({player.health} HP) and response threats"
                     )
         
         return best_index
@@ -139,10 +184,8 @@ class ExpertAI(BaseAI):
             'condition_setups': self._plan_condition_setups(player, gs)
         }
         
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-EXPERT] Win condition: {plan['win_condition']}\033[0m"
-            )
+        if self.tracing(INFO):
+            self.trace(INFO, f"[AI-EXPERT] Win condition: {plan['win_condition']}")
         
         return plan
     
@@ -300,10 +343,8 @@ class ExpertAI(BaseAI):
             static_damage = self._estimate_card_damage(card)
             
             # Log if context damage differs significantly
-            if self.engine and hasattr(self.engine, 'ai_decision_logs') and abs(damage - static_damage) > 1:
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-EXPERT] {card.name} - Static DMG: {static_damage}, Context DMG: {damage:.1f}\033[0m"
-                )
+            if self.tracing(DEBUG) and abs(damage - static_damage) > 1:
+                self.trace(DEBUG, f"[AI-EXPERT] {card.name} - Static DMG: {static_damage}, Context DMG: {damage:.1f}")
             
             if enemy.health <= damage:
                 score += 200  # Lethal
@@ -379,9 +420,9 @@ class ExpertAI(BaseAI):
                 score += 30
             
             # Log conjury evaluation
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-EXPERT] {card.name} conjury value: {base_conjury_value * threat_multiplier:.0f} (threat level: {enemy_conjury_removal:.1f})\033[0m"
+            if self.tracing(DEBUG):
+                self.trace(DEBUG,
+                    f"[AI-EXPERT] {card.name} conjury value: {base_conjury_value * threat_multiplier:.0f} (threat level: {enemy_conjury_removal:.1f})"
                 )
         
         
@@ -414,9 +455,9 @@ class ExpertAI(BaseAI):
                 score -= 30
                 score += enablement_value
                 
-                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-EXPERT] {card.name} advance-only card: base -30, enablement +{enablement_value}\033[0m"
+                if self.tracing(DEBUG):
+                    self.trace(DEBUG,
+                        f"[AI-EXPERT] {card.name} advance-only card: base -30, enablement +{enablement_value}"
                     )
             else:
                 score += 10 * (4 - gs.clash_num)  # Advance priority scales with remaining clashes
@@ -483,10 +524,8 @@ class ExpertAI(BaseAI):
             if synergy > 30:
                 score += synergy * 0.7
                 
-                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-EXPERT] {card.name} → {other_card.name} synergy: {synergy}\033[0m"
-                    )
+                if self.tracing(DEBUG):
+                    self.trace(DEBUG, f"[AI-EXPERT] {card.name} → {other_card.name} synergy: {synergy}")
         
         # Check advance patterns
         if 'advance' in str(card.advance_effects):
@@ -523,9 +562,9 @@ class ExpertAI(BaseAI):
                         if remaining_turns >= pattern['required_locations'] - current_locations:
                             score += 80  # Very high value - we can reach the goal!
                             
-                            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                                self.engine.ai_decision_logs.append(
-                                    f"\033[90m[AI-EXPERT] {card.name} can reach {pattern['required_locations']} locations with {len(advance_cards)} advance cards (+80)\033[0m"
+                            if self.tracing(DEBUG):
+                                self.trace(DEBUG,
+                                    f"[AI-EXPERT] {card.name} can reach {pattern['required_locations']} locations with {len(advance_cards)} advance cards (+80)"
                                 )
         
         return score
@@ -1065,9 +1104,9 @@ class ExpertAI(BaseAI):
                 score += 15
             
             # Log significant differences
-            if self.engine and hasattr(self.engine, 'ai_decision_logs') and efficiency_ratio > 1.3:
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-EXPERT] {card.name} - Efficiency: {efficiency_ratio:.1f}x (Static: {static_total}, Context: {context_total:.1f})\033[0m"
+            if self.tracing(DEBUG) and efficiency_ratio > 1.3:
+                self.trace(DEBUG,
+                    f"[AI-EXPERT] {card.name} - Efficiency: {efficiency_ratio:.1f}x (Static: {static_total}, Context: {context_total:.1f})"
                 )
         
         # Bonus for scaling damage (damage_per_spell, etc)
@@ -1130,10 +1169,8 @@ class ExpertAI(BaseAI):
                             'effects': self._extract_spell_effects(spell)
                         }
         except Exception as e:
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-EXPERT] Warning: Could not load spell database: {e}\033[0m"
-                )
+            if self.tracing(WARNING):
+                self.trace(WARNING, f"[AI-EXPERT] Warning: Could not load spell database: {e}")
         
         return spell_db
     
@@ -1224,16 +1261,15 @@ class ExpertAI(BaseAI):
                             immediate_threat *= 2
                         
                         # Check if it specifically targets our card type
-                        spell_str = str(spell.card.resolve_effects).lower()
-                        if any(t in spell_str for t in card.types):
+                        if not self._response_targeted_types(spell.card).isdisjoint(card.types):
                             immediate_threat *= 1.5
                         
                         threat_score += immediate_threat * vulnerability_multiplier
                         
-                        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                            self.engine.ai_decision_logs.append(
-                                f"\033[90m[AI-EXPERT] WARNING: {spell.card.name} is already revealed! "
-                                f"Threat to {card.name}: {immediate_threat * vulnerability_multiplier:.0f}\033[0m"
+                        if self.tracing(WARNING):
+                            self.trace(WARNING,
+                                f"[AI-EXPERT] WARNING: {spell.card.name} is already revealed! "
+                                f"Threat to {card.name}: {immediate_threat * vulnerability_multiplier:.0f}"
                             )
         
         # Then check potential responses from hand (existing logic)
@@ -1244,30 +1280,23 @@ class ExpertAI(BaseAI):
             # Get opponent's drafted elements
             enemy_elements = self.get_opponent_elements(enemy.name)
             
-            # Analyze potential response threats from those elements
-            for element in enemy_elements:
-                element_threats = self._analyze_element_response_threats(element)
+            # Responses from those elements that could trigger against this card, with their impact
+            threats = self._response_threats_against(card, enemy_elements, player, weights)
+            if not threats:
+                continue
+            likelihood_factor = self._threat_likelihood_factor(enemy, gs)
+            played = {spell['name'] for spell in self.opponent_history.get(enemy.name, {}).get('spells_played', [])}
+            
+            for element, spell_name, impact in threats:
+                # Estimate likelihood based on game state
+                likelihood = min(0.9, max(0.1, (0.7 if spell_name in played else 0.4) * likelihood_factor))
+                threat_score += impact * likelihood
                 
-                for threat_info in element_threats:
-                    # Check if this response could trigger against our attack
-                    if self._could_response_trigger_against_attack(threat_info, card):
-                        # Calculate threat impact
-                        impact = self._calculate_generic_threat_impact(
-                            threat_info, card, player, weights
-                        )
-                        
-                        # Estimate likelihood based on game state
-                        likelihood = self._estimate_threat_likelihood(
-                            threat_info, enemy, gs
-                        )
-                        
-                        threat_score += impact * likelihood
-                        
-                        if self.engine and hasattr(self.engine, 'ai_decision_logs') and impact > 20:
-                            self.engine.ai_decision_logs.append(
-                                f"\033[90m[AI-EXPERT] {card.name} vulnerable to {element} response "
-                                f"(Impact: {impact:.1f}, Likelihood: {likelihood:.1%})\033[0m"
-                            )
+                if self.tracing(DEBUG) and impact > 20:
+                    self.trace(DEBUG,
+                        f"[AI-EXPERT] {card.name} vulnerable to {element} response "
+                        f"(Impact: {impact:.1f}, Likelihood: {likelihood:.1%})"
+                    )
         
         # Apply health multiplier to the threat score
         threat_score *= health_multiplier
@@ -1278,9 +1307,9 @@ class ExpertAI(BaseAI):
             if enemy != player and enemy.health <= our_damage:
                 # If we can kill them, reduce threat concern by 50%
                 threat_score *= 0.5
-                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-EXPERT] {card.name} could be lethal ({our_damage} dmg vs {enemy.health} hp) - accepting risk\033[0m"
+                if self.tracing(DEBUG):
+                    self.trace(DEBUG,
+                        f"[AI-EXPERT] {card.name} could be lethal ({our_damage} dmg vs {enemy.health} hp) - accepting risk"
                     )
                 break
         
@@ -1288,23 +1317,56 @@ class ExpertAI(BaseAI):
     
     def _analyze_element_response_threats(self, element):
         """Analyze what response threats an element might have"""
-        threats = []
+        return self.response_index['threats'].get(element, [])
+    
+    def _build_response_index(self):
+        """Index the response spells of every element once, with their threat levels pre-classified
         
-        # Look up all spells for this element in our database
+        'threats' maps element -> [{spell_name, spell_info, threat_level, triggers_on_attack}]
+        for responses that match a threat category; 'counts' maps element -> number of
+        response spells of any kind.
+        """
+        index = {'threats': defaultdict(list), 'counts': defaultdict(int)}
         for spell_name, spell_info in self.spell_database.items():
-            if spell_info.get('element') == element and 'response' in spell_info.get('types', []):
-                # Classify the threat level based on properties
-                threat_level = self._classify_response_threat(spell_info)
-                
-                if threat_level:
-                    threats.append({
-                        'spell_name': spell_name,
-                        'spell_info': spell_info,
-                        'threat_level': threat_level
-                    })
-        
+            if 'response' not in spell_info.get('types', []):
+                continue
+            element = spell_info.get('element')
+            index['counts'][element] += 1
+            # Classify the threat level based on properties
+            threat_level = self._classify_response_threat(spell_info)
+            if threat_level:
+                threat_info = {'spell_name': spell_name, 'spell_info': spell_info, 'threat_level': threat_level}
+                threat_info['triggers_on_attack'] = self._could_response_trigger_against_attack(threat_info, None)
+                index['threats'][element].append(threat_info)
+        return {'threats': dict(index['threats']), 'counts': dict(index['counts'])}
+    
+    def _response_threats_against(self, card, enemy_elements, player, weights):
+        """[(element, spell name, impact)] for the enemy responses that could trigger against card
+        
+        Impact only depends on the card, the enemy elements and our health, so it is
+        computed once per combination; likelihood is applied by the caller.
+        """
+        key = (card.id, card.priority, tuple(enemy_elements), player.health)
+        threats = self._response_threat_table.get(key)
+        if threats is None:
+            threats = [(element, threat_info['spell_name'],
+                        self._calculate_generic_threat_impact(threat_info, card, player, weights))
+                       for element in enemy_elements
+                       for threat_info in self._analyze_element_response_threats(element)
+                       if threat_info['triggers_on_attack']]
+            self._response_threat_table[key] = threats
         return threats
     
+    def _response_targeted_types(self, card):
+        """Spell types a card's resolve effects mention, i.e. what a revealed response singles out"""
+        effects = card.resolve_effects
+        cached = self._targeted_types.get(id(effects))
+        if cached is None or cached[0] is not effects:
+            text = str(effects).lower()
+            cached = (effects, frozenset(t for t in ('attack', 'boost', 'remedy', 'response') if t in text))
+            self._targeted_types[id(effects)] = cached
+        return cached[1]
+    
     def _classify_response_threat(self, spell_info):
         """Classify how threatening a response spell is"""
         response_threats = self.threat_data.get('response_threats', {})
@@ -1434,30 +1496,38 @@ class ExpertAI(BaseAI):
         if self._has_played_spell(enemy.name, spell_name):
             likelihood = 0.7
         
+        likelihood *= self._threat_likelihood_factor(enemy, gs, 'response' in spell_info.get('types', []))
+        
+        # Cap at reasonable bounds
+        return min(0.9, max(0.1, likelihood))
+    
+    def _threat_likelihood_factor(self, enemy, gs, is_response=True):
+        """Game-state multiplier on the base likelihood of an enemy threat"""
+        factor = 1.0
+        
         # Response spells are more likely to be saved for the right moment
-        if 'response' in spell_info.get('types', []):
+        if is_response:
             # Players tend to hold response spells when facing attack-heavy opponents
             our_attack_count = sum(1 for c in self.current_player.hand if 'attack' in c.types)
             if our_attack_count >= 3:
-                likelihood *= 1.3  # More likely to have responses ready
+                factor *= 1.3  # More likely to have responses ready
         
         # Adjust based on hand size
         if len(enemy.hand) >= 4:
-            likelihood *= 1.2
+            factor *= 1.2
         elif len(enemy.hand) <= 2:
-            likelihood *= 0.7
+            factor *= 0.7
         
         # Adjust based on game state
         if gs.clash_num >= 3:
             # Late game, more likely to have key spells
-            likelihood *= 1.1
+            factor *= 1.1
         
         # If we're low health, enemies are more likely to save damage responses
         if self.current_player and self.current_player.health <= 3:
-            likelihood *= 1.2
+            factor *= 1.2
         
-        # Cap at reasonable bounds
-        return min(0.9, max(0.1, likelihood))
+        return factor
     
     def _response_could_trigger(self, threat, our_card, us, enemy, gs):
         """Check if a response threat could trigger against our card"""
@@ -1679,10 +1749,8 @@ class ExpertAI(BaseAI):
         
         best_option = option_scores[0][0]
         
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-EXPERT] Chose option with score {option_scores[0][1]:.1f}\033[0m"
-            )
+        if self.tracing(INFO):
+            self.trace(INFO, f"[AI-EXPERT] Chose option with score {option_scores[0][1]:.1f}")
         
         return best_option
     
@@ -1846,10 +1914,16 @@ class ExpertAI(BaseAI):
         # Track what elements other players have drafted
         self._update_opponent_draft_tracking(gs)
         
+        # Opening book first; positions it doesn't cover are evaluated live
+        book_pick = self.draft_book_pick(player, gs, available_sets)
+        if book_pick:
+            return book_pick
+        
         # Analyze opponent's actual draft choices
         opponent_analysis = self._analyze_opponent_drafting_patterns(gs)
         
         set_evaluations = []
+        value_features = encode_state(gs, player) if self.value_model else None
         
         for spell_set in available_sets:
             evaluation = {
@@ -1864,10 +1938,9 @@ class ExpertAI(BaseAI):
             # Deep set analysis
             element = spell_set[0].element
             
-            # Win rate data
-            if hasattr(self, 'win_rate_data') and self.win_rate_data:
-                win_rate = self.win_rate_data.get('win_rates', {}).get(element, 0.5)
-                evaluation['score'] += win_rate * 100
+            # Win rate data (matchup matrix when built, else marginal analytics rates)
+            if self.element_matchups or self.win_rate_data:
+                evaluation['score'] += self.get_element_win_rate(element) * 100
             
             # Analyze each spell in detail
             for spell in spell_set:
@@ -1875,21 +1948,21 @@ class ExpertAI(BaseAI):
                 for spell_type in spell.types:
                     if spell_type == 'attack':
                         evaluation['strengths'].append('damage')
-                        evaluation['score'] += 30
+                        evaluation['score'] += self.weights['draft_attack']
                     elif spell_type == 'remedy':
                         evaluation['strengths'].append('sustain')
-                        evaluation['score'] += 35
+                        evaluation['score'] += self.weights['draft_remedy']
                     elif spell_type == 'response':
                         evaluation['strengths'].append('reactive')
-                        evaluation['score'] += 40
+                        evaluation['score'] += self.weights['draft_response']
                     elif spell_type == 'boost':
                         evaluation['strengths'].append('scaling')
-                        evaluation['score'] += 25
+                        evaluation['score'] += self.weights['draft_boost']
                 
                 # Conjury value
                 if spell.is_conjury:
                     evaluation['strengths'].append('board_control')
-                    evaluation['score'] += 45
+                    evaluation['score'] += self.weights['draft_conjury']
                 
                 # Priority diversity
                 if spell.priority == 'A':
@@ -1905,6 +1978,9 @@ class ExpertAI(BaseAI):
             evaluation['counter_potential'] = self._calculate_counter_potential(element, opponent_analysis)
             evaluation['score'] += evaluation['counter_potential']
             
+            if value_features:
+                evaluation['score'] += self.value_model.draft_value(value_features, spell_set) * self.weights['value_model']
+            
             set_evaluations.append(evaluation)
         
         # Sort by score
@@ -1929,13 +2005,12 @@ class ExpertAI(BaseAI):
             upto += weight
         
         # Log extensive analysis
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-EXPERT] Drafted {chosen_eval['set'][0].elephant} (Score: {chosen_eval['score']:.1f})\033[0m"
-            )
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-EXPERT] Strengths: {', '.join(set(chosen_eval['strengths']))}\033[0m"
+        if self.tracing(INFO):
+            self.trace(INFO,
+                f"[AI-EXPERT] Drafted {chosen_eval['set'][0].elephant} (Score: {chosen_eval['score']:.1f})"
             )
+        if self.tracing(DEBUG):
+            self.trace(DEBUG, f"[AI-EXPERT] Strengths: {', '.join(set(chosen_eval['strengths']))}")
         
         return chosen_eval['set']
     
@@ -1971,8 +2046,8 @@ class ExpertAI(BaseAI):
         # If no elements tracked yet (early draft), use win rate data
         if not analysis['drafted_elements']:
             # Use elements with highest win rates as likely choices
-            if hasattr(self, 'win_rate_data') and self.win_rate_data:
-                win_rates = self.win_rate_data.get('win_rates', {})
+            if self.element_matchups or self.win_rate_data:
+                win_rates = self.element_win_rate_table()
                 sorted_elements = sorted(win_rates.items(), key=lambda x: x[1], reverse=True)
                 analysis['drafted_elements'] = [elem[0] for elem in sorted_elements[:3]]
             else:
@@ -2026,6 +2101,12 @@ class ExpertAI(BaseAI):
         enemy_elements = opponent_analysis.get('drafted_elements', [])
         
         for enemy_element in enemy_elements:
+            # A measured head-to-head rate replaces the category and archetype heuristics
+            matchup = self.get_matchup_win_rate(element, enemy_element)
+            if matchup is not None:
+                counter_score += (matchup - 0.5) * 100
+                continue
+            
             enemy_category = self.get_element_category(enemy_element)
             enemy_archetype = self._get_element_archetype(enemy_element)
             
@@ -2088,13 +2169,7 @@ class ExpertAI(BaseAI):
     
     def _count_element_response_spells(self, element):
         """Count how many response spells an element has"""
-        count = 0
-        
-        for spell_name, spell_info in self.spell_database.items():
-            if spell_info.get('element') == element and 'response' in spell_info.get('types', []):
-                count += 1
-        
-        return count
+        return self.response_index['counts'].get(element, 0)
     
     def _evaluate_board_state_synergy(self, card, player, gs):
         """Evaluate how well this card synergizes with the current board state"""
@@ -2110,10 +2185,8 @@ class ExpertAI(BaseAI):
             synergy = self._calculate_active_spell_synergy(card, spell.card, gs)
             score += synergy
             
-            if self.engine and hasattr(self.engine, 'ai_decision_logs') and synergy > 20:
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-EXPERT] {card.name} synergizes with active {spell.card.name} (+{synergy})\033[0m"
-                )
+            if self.tracing(DEBUG) and synergy > 20:
+                self.trace(DEBUG, f"[AI-EXPERT] {card.name} synergizes with active {spell.card.name} (+{synergy})")
         
         # 2. Evaluate against enemy active spells
         for enemy_spell in enemy_active_spells:
@@ -2121,10 +2194,8 @@ class ExpertAI(BaseAI):
             interaction = self._evaluate_spell_interaction(card, enemy_spell, player, gs)
             score += interaction
             
-            if self.engine and hasattr(self.engine, 'ai_decision_logs') and abs(interaction) > 20:
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-EXPERT] {card.name} vs enemy {enemy_spell.card.name} ({interaction:+.0f})\033[0m"
-                )
+            if self.tracing(DEBUG) and abs(interaction) > 20:
+                self.trace(DEBUG, f"[AI-EXPERT] {card.name} vs enemy {enemy_spell.card.name} ({interaction:+.0f})")
         
         # 3. Special consideration for advancing spells
         advancing_threats = self._get_advancing_enemy_spells(gs)
@@ -2137,10 +2208,8 @@ class ExpertAI(BaseAI):
             elif 'remedy' in card.types:
                 score += 25  # Defensive preparation
                 
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-EXPERT] {len(advancing_threats)} enemy spells advancing!\033[0m"
-                )
+            if self.tracing(DEBUG):
+                self.trace(DEBUG, f"[AI-EXPERT] {len(advancing_threats)} enemy spells advancing!")
         
         return score
     
@@ -2268,10 +2337,8 @@ class ExpertAI(BaseAI):
         should_draft = self._should_draft_new_set(player, gs)
         
         if should_draft:
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-EXPERT] Strategic decision: Drafting new set!\033[0m"
-                )
+            if self.tracing(INFO):
+                self.trace(INFO, f"[AI-EXPERT] Strategic decision: Drafting new set!")
             return []  # Discard everything to draft
         
         # Otherwise, evaluate cards to keep
@@ -2299,11 +2366,9 @@ class ExpertAI(BaseAI):
         
         cards_to_keep = [card for card, score in sorted_cards[:ideal_keep_count]]
         
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
+        if self.tracing(INFO):
             kept_names = [c.name for c in cards_to_keep]
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-EXPERT] Keeping: {', '.join(kept_names)}\033[0m"
-            )
+            self.trace(INFO, f"[AI-EXPERT] Keeping: {', '.join(kept_names)}")
         
         return cards_to_keep
     
@@ -2351,12 +2416,12 @@ class ExpertAI(BaseAI):
             draft_score += 15
         
         # Log decision factors
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
+        if self.tracing(DEBUG):
             min_trunks = min(p.trunks for p in gs.players)
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-EXPERT] Draft evaluation - Score: {draft_score}, "
+            self.trace(DEBUG,
+                f"[AI-EXPERT] Draft evaluation - Score: {draft_score}, "
                 f"Hand: {hand_size}, Quality: {hand_quality:.1f}, Health: {health_ratio:.1%}, "
-                f"Trunks: {player.trunks} (min: {min_trunks})\033[0m"
+                f"Trunks: {player.trunks} (min: {min_trunks})"
             )
         
         # Draft if score exceeds threshold
@@ -2603,20 +2668,18 @@ class ExpertAI(BaseAI):
             best_analysis = threat_analysis[best_target]
             
             # Log detailed analysis
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
+            if self.tracing(DEBUG):
                 # Summary of top threats
                 sorted_threats = sorted(threat_analysis.items(), key=lambda x: x[1]['total'], reverse=True)[:3]
                 for spell, data in sorted_threats:
-                    self.engine.ai_decision_logs.append(
-                        f"\\033[90m[AI-EXPERT] {spell.card.name}: Total={data['total']:.0f} "
+                    self.trace(DEBUG,
+                        f"[AI-EXPERT] {spell.card.name}: Total={data['total']:.0f} "
                         f"(Dmg={data['breakdown']['immediate_damage']}, "
                         f"Combo={data['breakdown']['enables_combos']}, "
-                        f"Future={data['breakdown']['future_threat']})\\033[0m"
+                        f"Future={data['breakdown']['future_threat']})"
                     )
                 
-                self.engine.ai_decision_logs.append(
-                    f"\\033[90m[AI-EXPERT] {caster.name} chose to cancel {best_target.card.name}\\033[0m"
-                )
+                self.trace(INFO, f"[AI-EXPERT] {caster.name} chose to cancel {best_target.card.name}")
             
             return best_target
         
@@ -2769,9 +2832,9 @@ class ExpertAI(BaseAI):
                 advance_cards = [c for c in player.hand if 'advance' in str(c.resolve_effects + c.advance_effects)]
                 if advance_cards:
                     timing_score += 100
-                    if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                        self.engine.ai_decision_logs.append(
-                            f"\\033[90m[AI-EXPERT] {card.name} can be set up with {len(advance_cards)} advance cards\\033[0m"
+                    if self.tracing(DEBUG):
+                        self.trace(DEBUG,
+                            f"[AI-EXPERT] {card.name} can be set up with {len(advance_cards)} advance cards"
                         )
             else:
                 timing_score -= 50  # Too late to set up
@@ -2781,11 +2844,9 @@ class ExpertAI(BaseAI):
             setup_needs = self._analyze_setup_needs(card, player, gs)
             if setup_needs['can_meet'] and setup_needs['cards_required']:
                 timing_score += 80
-                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
+                if self.tracing(DEBUG):
                     enabler_names = [c.name for c in setup_needs['cards_required'][:2]]
-                    self.engine.ai_decision_logs.append(
-                        f"\\033[90m[AI-EXPERT] {card.name} can combo with {enabler_names}\\033[0m"
-                    )
+                    self.trace(DEBUG, f"[AI-EXPERT] {card.name} can combo with {enabler_names}")
                     
         # Cards that scale with active spells (player_choice with damage/heal per spell)
         elif self._has_scaling_choice_effects(card):
@@ -2855,9 +2916,9 @@ class ExpertAI(BaseAI):
                         move_val = self._calculate_single_move_value(spell, clash_idx, caster, gs)
                         best_move_value = max(best_move_value, move_val)
                         
-                        if move_val > 50 and self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                            self.engine.ai_decision_logs.append(
-                                f"\\033[90m[AI-EXPERT] Considering move: {spell.card.name} from clash {clash_idx+1} (+{move_val})\033[0m"
+                        if move_val > 50 and self.tracing(DEBUG):
+                            self.trace(DEBUG,
+                                f"[AI-EXPERT] Considering move: {spell.card.name} from clash {clash_idx+1} (+{move_val})"
                             )
         
         return best_move_value
@@ -2910,10 +2971,8 @@ class ExpertAI(BaseAI):
                 if 'response' in card.types and caster.health <= 5:
                     base_value += 30
                     
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                self.engine.ai_decision_logs.append(
-                    f"\\033[90m[AI-EXPERT] Cast option value: {base_value} (hand size: {len(caster.hand)})\033[0m"
-                )
+            if self.tracing(DEBUG):
+                self.trace(DEBUG, f"[AI-EXPERT] Cast option value: {base_value} (hand size: {len(caster.hand)})")
         
         return base_value
     
@@ -2947,9 +3006,9 @@ class ExpertAI(BaseAI):
                                 spell_value = self._calculate_single_advance_value(spell.card, caster, gs, clash_idx)
                                 max_value = max(max_value, spell_value)
                                 
-                                if spell_value > 100 and self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                                    self.engine.ai_decision_logs.append(
-                                        f"\\033[90m[AI-EXPERT] High-value advance target: {spell.card.name} (+{spell_value})\033[0m"
+                                if spell_value > 100 and self.tracing(DEBUG):
+                                    self.trace(DEBUG,
+                                        f"[AI-EXPERT] High-value advance target: {spell.card.name} (+{spell_value})"
                                     )
         else:
             # Evaluate specific target
@@ -2979,9 +3038,9 @@ class ExpertAI(BaseAI):
                         bonus_value = (conditional_damage - base_damage) * 50
                         value += bonus_value
                         
-                        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                            self.engine.ai_decision_logs.append(
-                                f"\\033[90m[AI-EXPERT] Advancing {card.name} will unlock {conditional_damage} damage!\033[0m"
+                        if self.tracing(DEBUG):
+                            self.trace(DEBUG,
+                                f"[AI-EXPERT] Advancing {card.name} will unlock {conditional_damage} damage!"
                             )
         
         # 2. Base value for advancing any spell
@@ -3011,9 +3070,9 @@ class ExpertAI(BaseAI):
                     progress_ratio = (current_locations + 1) / pattern['required_locations']
                     value += pattern['payoff'] * progress_ratio * 30
                     
-                    if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                        self.engine.ai_decision_logs.append(
-                            f"\\033[90m[AI-EXPERT] {card.name} is {current_locations}/{pattern['required_locations']} locations toward goal\033[0m"
+                    if self.tracing(DEBUG):
+                        self.trace(DEBUG,
+                            f"[AI-EXPERT] {card.name} is {current_locations}/{pattern['required_locations']} locations toward goal"
                         )
             
             elif pattern['type'] == 'temporal_sequencer':
@@ -3135,9 +3194,9 @@ class ExpertAI(BaseAI):
                     payoff_ratio = pattern['payoff'] / max(1, base_value) if base_value > 0 else pattern['payoff']
                     mobility_value += payoff_ratio * 50 * achievable['probability']
                     
-                    if self.engine and hasattr(self.engine, 'ai_decision_logs') and payoff_ratio > 2:
-                        self.engine.ai_decision_logs.append(
-                            f"\\033[90m[AI-MOBILITY] {card.name} has {payoff_ratio:.1f}x payoff at {pattern['required_locations']} locations\\033[0m"
+                    if self.tracing(DEBUG) and payoff_ratio > 2:
+                        self.trace(DEBUG,
+                            f"[AI-MOBILITY] {card.name} has {payoff_ratio:.1f}x payoff at {pattern['required_locations']} locations"
                         )
             
             elif pattern['type'] == 'temporal_sequencer':
@@ -3171,10 +3230,8 @@ class ExpertAI(BaseAI):
                     # Need actual valuable targets to justify playing it
                     if movement_opportunities == 0:
                         mobility_value -= 50  # Penalty for no targets
-                        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                            self.engine.ai_decision_logs.append(
-                                f"\\033[90m[AI-MOBILITY] {card.name} has no valuable advance targets (-50)\\033[0m"
-                            )
+                        if self.tracing(DEBUG):
+                            self.trace(DEBUG, f"[AI-MOBILITY] {card.name} has no valuable advance targets (-50)")
                     else:
                         mobility_value += movement_opportunities * 25
                 else:
@@ -3247,9 +3304,9 @@ class ExpertAI(BaseAI):
                                     if unlocked_value > 0:
                                         value += unlocked_value * 10  # High value for unlocking conditions
                                         
-                                        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                                            self.engine.ai_decision_logs.append(
-                                                f"\033[90m[AI-EXPERT] {spell.card.name} would unlock {unlocked_value} extra value at {required} locations\033[0m"
+                                        if self.tracing(DEBUG):
+                                            self.trace(DEBUG,
+                                                f"[AI-EXPERT] {spell.card.name} would unlock {unlocked_value} extra value at {required} locations"
                                             )
                         
                         # Moving our high-damage spells is valuable
@@ -3326,9 +3383,9 @@ class ExpertAI(BaseAI):
                                 valuable_targets_exist = True
                                 opportunities += 2  # High value target
                                 
-                                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                                    self.engine.ai_decision_logs.append(
-                                        f"\\033[90m[AI-MOBILITY] {spell.card.name} needs more locations ({current_locations}/{pattern['required_locations']})\\033[0m"
+                                if self.tracing(DEBUG):
+                                    self.trace(DEBUG,
+                                        f"[AI-MOBILITY] {spell.card.name} needs more locations ({current_locations}/{pattern['required_locations']})"
                                     )
                         
                         elif pattern['type'] == 'temporal_sequencer':
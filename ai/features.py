@@ -0,0 +1,101 @@
+"""State features shared by the self-play dataset and the learned value model
+
+A state is encoded from one player's point of view as a flat vector (see
+FEATURE_NAMES). Opponent spells that are still face down are only counted,
+never identified. Each decision is also described by a small context
+vector taken from that state (PLAY_CONTEXT, DRAFT_CONTEXT), which a model
+can weigh separately for every card or set on offer.
+"""
+
+import json
+import os
+
+with open(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'spells.json'), 'r') as _f:
+    _SPELLS = json.load(_f)
+
+SPELL_IDS = sorted(spell['id'] for spell in _SPELLS)
+SPELL_INDEX = {spell_id: i for i, spell_id in enumerate(SPELL_IDS)}
+ELEMENTS = sorted({spell['element'] for spell in _SPELLS})
+ELEMENT_INDEX = {element: i for i, element in enumerate(ELEMENTS)}
+MAX_OPTIONS = len({spell['elephant'] for spell in _SPELLS})  # A draft can offer every set
+
+# Per-side block: scalars, clash occupancy, drafted elements, spells on the board
+SIDE_SCALARS = ['health', 'max_health', 'trunks', 'invulnerable', 'hand_size', 'discard_size', 'hidden_spells']
+FEATURE_NAMES = (
+    ['round', 'clash', 'is_ringleader', 'deck_sets']
+    + [f"{side}_{name}" for side in ('me', 'opp')
+       for name in (SIDE_SCALARS + [f"clash{c}_spells" for c in range(1, 5)]
+                    + [f"element_{e}" for e in ELEMENTS] + [f"board_{i}" for i in SPELL_IDS])]
+    + [f"me_hand_{i}" for i in SPELL_IDS]
+)
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURE_NAMES)}
+SIDE_WIDTH = len(SIDE_SCALARS) + 4 + len(ELEMENTS) + len(SPELL_IDS)
+
+
+def _encode_side(player, hide_prepared):
+    values = [0.0] * SIDE_WIDTH
+    values[0:6] = [player.health, player.max_health, player.trunks, float(player.is_invulnerable),
+                   len(player.hand), len(player.discard_pile)]
+    clash_base = len(SIDE_SCALARS)
+    element_base = clash_base + 4
+    board_base = element_base + len(ELEMENTS)
+    drafted = player.hand + player.discard_pile
+    for clash, played in enumerate(player.board):
+        for pc in played:
+            drafted.append(pc.card)
+            if pc.status == 'cancelled':
+                continue
+            values[clash_base + clash] += 1
+            if hide_prepared and pc.status == 'prepared':
+                values[6] += 1  # Face down: the opponent only sees that something is there
+            else:
+                values[board_base + SPELL_INDEX[pc.card.id]] += 1
+    for card in drafted:
+        values[element_base + ELEMENT_INDEX[card.element]] = 1.0  # Drafting is public
+    return values
+
+
+def encode_state(gs, player):
+    """Feature vector (see FEATURE_NAMES) of the state as `player` can see it"""
+    opponent = next(p for p in gs.players if p is not player)
+    features = [gs.round_num, gs.clash_num, float(gs.players[gs.ringleader_index] is player),
+                sum(1 for s in gs.main_deck if s)]
+    features += _encode_side(player, hide_prepared=False)
+    features += _encode_side(opponent, hide_prepared=True)
+    hand = [0.0] * len(SPELL_IDS)
+    for card in player.hand:
+        hand[SPELL_INDEX[card.id]] += 1
+    return features + hand
+
+
+# --- decision context ---
+
+SET_CODES = {}  # Lowest spell id of a set -> its element
+for _spell in _SPELLS:
+    SET_CODES.setdefault(min(s['id'] for s in _SPELLS if s['elephant'] == _spell['elephant']), _spell['element'])
+
+PLAY_CONTEXT = ['clash1', 'clash2', 'clash3', 'clash4', 'me_health_frac', 'opp_health_frac',
+                'me_trunks', 'opp_trunks', 'round', 'me_hand_size', 'opp_hidden_spells']
+DRAFT_CONTEXT = ['bias', 'is_ringleader', 'own_element', 'opp_element', 'me_discard_size']
+
+
+def set_code(spell_set):
+    """A spell set is identified by its lowest spell id"""
+    return min(card.id for card in spell_set)
+
+
+def play_context(features):
+    """Context (see PLAY_CONTEXT) a card choice is weighed in, from an encoded state"""
+    f = features
+    i = FEATURE_INDEX
+    clash = int(f[i['clash']])
+    return [float(clash == c) for c in range(1, 5)] + [
+        f[i['me_health']] / max(f[i['me_max_health']], 1), f[i['opp_health']] / max(f[i['opp_max_health']], 1),
+        f[i['me_trunks']], f[i['opp_trunks']], f[i['round']], f[i['me_hand_size']], f[i['opp_hidden_spells']]]
+
+
+def draft_context(features, code):
+    """Context (see DRAFT_CONTEXT) for drafting the set with this code"""
+    element = SET_CODES[code]
+    return [1.0, features[FEATURE_INDEX['is_ringleader']], features[FEATURE_INDEX[f"me_element_{element}"]],
+            features[FEATURE_INDEX[f"opp_element_{element}"]], features[FEATURE_INDEX['me_discard_size']]]
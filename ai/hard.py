@@ -2,11 +2,17 @@
 
 import random
 from .base import BaseAI
+from .endgame import EndgameSolver
+from .trace import DEBUG, INFO, WARNING
 
 
 class HardAI(BaseAI):
     """Hard AI - strategic play with card evaluation"""
     
+    def __init__(self):
+        super().__init__()
+        self.endgame = EndgameSolver()
+    
     def _select_card(self, player, gs, valid_indices):
         """Evaluate each card and pick the best one"""
         if not valid_indices:
@@ -15,10 +21,13 @@ class HardAI(BaseAI):
         # Update opponent tracking
         self.update_opponent_history(gs)
         
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-HARD] {player.name} evaluated {len(valid_indices)} options\033[0m"
-            )
+        # Late in a round, only consider the cards an exact search rates best
+        valid_indices = self.endgame_filter(player, gs, valid_indices)
+        if len(valid_indices) == 1:
+            return valid_indices[0]
+        
+        if self.tracing(DEBUG):
+            self.trace(DEBUG, f"[AI-HARD] {player.name} evaluated {len(valid_indices)} options")
         
         # Evaluate each valid card
         scores = {}
@@ -26,17 +35,13 @@ class HardAI(BaseAI):
             card = player.hand[idx]
             score = self._evaluate_card(card, player, gs)
             scores[idx] = score
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-HARD]   {card.name}: score = {score}\033[0m"
-                )
+            if self.tracing(DEBUG):
+                self.trace(DEBUG, f"[AI-HARD]   {card.name}: score = {score}")
         
         # Return highest scoring card
         best = max(scores.items(), key=lambda x: x[1])
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-HARD] {player.name} chose: {player.hand[best[0]].name} (score: {best[1]})\033[0m"
-            )
+        if self.tracing(INFO):
+            self.trace(INFO, f"[AI-HARD] {player.name} chose: {player.hand[best[0]].name} (score: {best[1]})")
         return best[0]
     
     def _evaluate_card(self, card, player, gs):
@@ -103,10 +108,8 @@ class HardAI(BaseAI):
                     has_advance = any('advance' in str(c.resolve_effects + c.advance_effects) for c in player.hand)
                     if has_advance:
                         score += 50  # Strong synergy potential
-                        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                            self.engine.ai_decision_logs.append(
-                                f"\033[90m[AI-RESPONSE] {card.name} can trigger with advance cards in hand\033[0m"
-                            )
+                        if self.tracing(DEBUG):
+                            self.trace(DEBUG, f"[AI-RESPONSE] {card.name} can trigger with advance cards in hand")
                             
         if 'conjury' in card.types and gs.clash_num <= 2:
             score += 45  # Conjuries best early
@@ -177,10 +180,8 @@ class HardAI(BaseAI):
                     
                 if matches >= required:
                     score += 50  # Condition WILL trigger
-                    if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                        self.engine.ai_decision_logs.append(
-                            f"\033[90m[AI-COMBO] {card.name} combo ready with {spell_type} spells!\033[0m"
-                        )
+                    if self.tracing(DEBUG):
+                        self.trace(DEBUG, f"[AI-COMBO] {card.name} combo ready with {spell_type} spells!")
                         
             elif condition.get('type') == 'if_enemy_has_active_spell_of_type':
                 # Response spells that trigger off enemy spells
@@ -204,9 +205,9 @@ class HardAI(BaseAI):
                         score += 80  # High value for guaranteed response trigger
                     else:
                         score += 60
-                    if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                        self.engine.ai_decision_logs.append(
-                            f"\033[90m[AI-RESPONSE] {card.name} will trigger - enemies have {enemy_matches} {spell_type} spells!\033[0m"
+                    if self.tracing(DEBUG):
+                        self.trace(DEBUG,
+                            f"[AI-RESPONSE] {card.name} will trigger - enemies have {enemy_matches} {spell_type} spells!"
                         )
         
         # Special synergies with specific active spells
@@ -254,10 +255,8 @@ class HardAI(BaseAI):
         if 'advance' in effects_str and 'this_spell' in effects_str:
             if gs.clash_num < 3:  # Can advance at least once
                 score += 40
-                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-MOBILITY] {card.name} can self-advance for future value\033[0m"
-                    )
+                if self.tracing(DEBUG):
+                    self.trace(DEBUG, f"[AI-MOBILITY] {card.name} can self-advance for future value")
         
         # Cards that move other spells (like Gravitate)
         if 'move_to_future_clash' in effects_str:
@@ -278,10 +277,8 @@ class HardAI(BaseAI):
                     score += 30 + (10 * min(past_spells_count, 3))
                 else:
                     score -= 50  # No targets - bad play
-                    if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                        self.engine.ai_decision_logs.append(
-                            f"\033[90m[AI-MOBILITY] {card.name} has no past spells to recall!\033[0m"
-                        )
+                    if self.tracing(DEBUG):
+                        self.trace(DEBUG, f"[AI-MOBILITY] {card.name} has no past spells to recall!")
             elif 'from_enemy_hand' in effects_str:
                 # Hand disruption + gain
                 score += 50
@@ -291,10 +288,8 @@ class HardAI(BaseAI):
             extra_cards = len(player.hand) - 1
             if extra_cards > 0:
                 score += 30 * min(extra_cards, 2)  # Value capped at 2 extra
-                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-MOBILITY] {card.name} enables spell burst with {extra_cards} options\033[0m"
-                    )
+                if self.tracing(DEBUG):
+                    self.trace(DEBUG, f"[AI-MOBILITY] {card.name} enables spell burst with {extra_cards} options")
         
         # Cards that advance other spells
         if 'advance' in effects_str and 'prompt' in effects_str:
@@ -312,9 +307,9 @@ class HardAI(BaseAI):
             total_value = advance_targets
             if total_value > 0:
                 score += 25 * total_value
-                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-MOBILITY] {card.name} can advance {advance_targets} targets + {advance_needed_targets} advance-scaling cards\033[0m"
+                if self.tracing(DEBUG):
+                    self.trace(DEBUG,
+                        f"[AI-MOBILITY] {card.name} can advance {advance_targets} targets + {advance_needed_targets} advance-scaling cards"
                     )
         
         # Evaluate positioning strategy
@@ -344,10 +339,8 @@ class HardAI(BaseAI):
                     if any('gravitate' in spell.lower() or 'move' in spell.lower() 
                           for spell in remaining):
                         score -= 20
-                        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                            self.engine.ai_decision_logs.append(
-                                f"\033[90m[AI-MOBILITY] {card.name} vulnerable to opponent's movement spells\033[0m"
-                            )
+                        if self.tracing(DEBUG):
+                            self.trace(DEBUG, f"[AI-MOBILITY] {card.name} vulnerable to opponent's movement spells")
         
         # Priority-based positioning
         if card.priority == 'A':
@@ -395,10 +388,8 @@ class HardAI(BaseAI):
                         # This card enables the future card
                         if card and (spell_type == 'any' or spell_type in card.types):
                             future_enablement_score += 50
-                            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                                self.engine.ai_decision_logs.append(
-                                    f"\033[90m[AI-SYNERGY] {card.name} enables {future_card.name} next turn!\033[0m"
-                                )
+                            if self.tracing(DEBUG):
+                                self.trace(DEBUG, f"[AI-SYNERGY] {card.name} enables {future_card.name} next turn!")
                     
                     elif condition.get('type') == 'if_spell_previously_resolved_this_round':
                         # Playing this card early enables the condition later
@@ -422,18 +413,16 @@ class HardAI(BaseAI):
                     if enablers_in_hand >= required_count and gs.clash_num < 3:
                         # We have enablers - maybe wait to play this card
                         hold_value -= 30  # Negative score encourages waiting
-                        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                            self.engine.ai_decision_logs.append(
-                                f"\033[90m[AI-SYNERGY] {card.name} could wait for {spell_type} enablers\033[0m"
-                            )
+                        if self.tracing(DEBUG):
+                            self.trace(DEBUG, f"[AI-SYNERGY] {card.name} could wait for {spell_type} enablers")
         
         # Multi-card combo detection
         combo_chains = self._detect_combo_chains(card, other_cards, gs)
         chain_score = len(combo_chains) * 40
-        if combo_chains and self.engine and hasattr(self.engine, 'ai_decision_logs'):
+        if combo_chains and self.tracing(DEBUG):
             chain_names = [c.name for c in combo_chains]
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-SYNERGY] Combo chain detected: {card.name if card else 'Hand'} -> {' -> '.join(chain_names)}\033[0m"
+            self.trace(DEBUG,
+                f"[AI-SYNERGY] Combo chain detected: {card.name if card else 'Hand'} -> {' -> '.join(chain_names)}"
             )
         
         # Element/type clustering bonus
@@ -502,9 +491,9 @@ class HardAI(BaseAI):
                     score += 40
                 if 'response' in card.types and 'damage' in str(card.resolve_effects):
                     score += 35  # Retaliation is good
-                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-COUNTING] {opponent.name} has {remaining_threats['high_damage_count']} high damage spells remaining\033[0m"
+                if self.tracing(DEBUG):
+                    self.trace(DEBUG,
+                        f"[AI-COUNTING] {opponent.name} has {remaining_threats['high_damage_count']} high damage spells remaining"
                     )
             
             if remaining_threats['cancel_count'] > 0:
@@ -524,9 +513,9 @@ class HardAI(BaseAI):
                 remaining_for_set = self.get_remaining_spells(opponent.name, elephant)
                 if len(remaining_for_set) == 1:
                     # We know their last card from this set!
-                    if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                        self.engine.ai_decision_logs.append(
-                            f"\033[90m[AI-COUNTING] {opponent.name}'s last {elephant} spell must be: {remaining_for_set[0]}\033[0m"
+                    if self.tracing(DEBUG):
+                        self.trace(DEBUG,
+                            f"[AI-COUNTING] {opponent.name}'s last {elephant} spell must be: {remaining_for_set[0]}"
                         )
                     # Could add specific counters here
         
@@ -572,10 +561,8 @@ class HardAI(BaseAI):
             # Check if response conditions are likely to be met
             if self._check_response_timing(card, player, gs):
                 score += 60
-                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-TIMING] {card.name} response conditions likely to trigger\033[0m"
-                    )
+                if self.tracing(DEBUG):
+                    self.trace(DEBUG, f"[AI-TIMING] {card.name} response conditions likely to trigger")
             else:
                 score -= 40  # Responses are weak if they won't trigger
         
@@ -676,10 +663,8 @@ class HardAI(BaseAI):
                             analysis = self.analyze_opponent_patterns(opponent.name)
                             if analysis and analysis.get('aggression_level', 0) > 0.5:
                                 score += 30
-                                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                                    self.engine.ai_decision_logs.append(
-                                        f"\033[90m[AI-COUNTER] {card.name} counters aggressive opponent\033[0m"
-                                    )
+                                if self.tracing(DEBUG):
+                                    self.trace(DEBUG, f"[AI-COUNTER] {card.name} counters aggressive opponent")
                 else:
                     score -= 30  # Early game, less likely
             
@@ -728,19 +713,15 @@ class HardAI(BaseAI):
                     score += 40
                 if 'remedy' in card.types:
                     score += 30
-                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-COUNTER] {opponent.name} is aggressive - valuing defensive cards\033[0m"
-                    )
+                if self.tracing(DEBUG):
+                    self.trace(DEBUG, f"[AI-COUNTER] {opponent.name} is aggressive - valuing defensive cards")
             
             elif analysis['support_level'] > 0.5:
                 # Opponent likes support spells - value disruption
                 if 'cancel' in str(card.resolve_effects) or 'discard' in str(card.resolve_effects):
                     score += 50
-                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-COUNTER] {opponent.name} uses support - valuing disruption\033[0m"
-                    )
+                if self.tracing(DEBUG):
+                    self.trace(DEBUG, f"[AI-COUNTER] {opponent.name} uses support - valuing disruption")
             
             # Check opponent's recent spells for specific counters
             recent_elements = [spell['element'] for spell in analysis.get('recent_spells', [])]
@@ -791,10 +772,8 @@ class HardAI(BaseAI):
                     
                     if matching_in_hand + matching_on_board >= required_count:
                         combo_score += 60  # Condition will be met
-                        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                            self.engine.ai_decision_logs.append(
-                                f"\033[90m[AI-COMBO] {card.name} synergizes with {spell_type} spells!\033[0m"
-                            )
+                        if self.tracing(DEBUG):
+                            self.trace(DEBUG, f"[AI-COMBO] {card.name} synergizes with {spell_type} spells!")
         
         # Check if this card enables other cards' conditions
         for other_card in player.hand:
@@ -809,10 +788,8 @@ class HardAI(BaseAI):
                         spell_type = params.get('spell_type', 'any')
                         if spell_type == 'any' or spell_type in card.types:
                             combo_score += 40  # This card enables another
-                            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                                self.engine.ai_decision_logs.append(
-                                    f"\033[90m[AI-COMBO] {card.name} enables {other_card.name}!\033[0m"
-                                )
+                            if self.tracing(DEBUG):
+                                self.trace(DEBUG, f"[AI-COMBO] {card.name} enables {other_card.name}!")
         
         # Check for passive effect synergies
         for spell in my_active_spells:
@@ -822,10 +799,8 @@ class HardAI(BaseAI):
                     if passive.get('type') == 'modify_spell_logic':
                         if 'player_choice' in str(card.resolve_effects):
                             combo_score += 100  # Very powerful combo
-                            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                                self.engine.ai_decision_logs.append(
-                                    f"\033[90m[AI-COMBO] {card.name} enhanced by spell logic modifier!\033[0m"
-                                )
+                            if self.tracing(DEBUG):
+                                self.trace(DEBUG, f"[AI-COMBO] {card.name} enhanced by spell logic modifier!")
         
         # Type synergies - cards of the same type often work well together
         type_counts = {}
@@ -849,21 +824,17 @@ class HardAI(BaseAI):
         if not valid_options:
             return None
             
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-HARD] {caster.name} analyzing {len(valid_options)} options strategically\033[0m"
-            )
+        if self.tracing(DEBUG):
+            self.trace(DEBUG, f"[AI-HARD] {caster.name} analyzing {len(valid_options)} options strategically")
         
         # Score each option
         option_scores = {}
         for i, option in enumerate(valid_options):
             score = self._evaluate_option(option, caster, gs, current_card)
             option_scores[i] = score
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
+            if self.tracing(DEBUG):
                 option_desc = self._describe_option(option)
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-HARD]   Option {i+1} ({option_desc}): score = {score}\033[0m"
-                )
+                self.trace(DEBUG, f"[AI-HARD]   Option {i+1} ({option_desc}): score = {score}")
         
         # Final safety check - never choose lethal self-damage
         safe_options = {}
@@ -872,29 +843,23 @@ class HardAI(BaseAI):
             self_damage = self._get_self_damage_amount(option)
             if self_damage >= caster.health:
                 # Skip lethal options entirely
-                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-SAFETY] Removing lethal option {idx+1} from consideration\033[0m"
-                    )
+                if self.tracing(WARNING):
+                    self.trace(WARNING, f"[AI-SAFETY] Removing lethal option {idx+1} from consideration")
                 continue
             safe_options[idx] = score
         
         # If no safe options, choose the least bad option
         if not safe_options:
             best_idx = max(option_scores.items(), key=lambda x: x[1])[0]
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-HARD] WARNING: All options are lethal! Choosing least bad option.\033[0m"
-                )
+            if self.tracing(WARNING):
+                self.trace(WARNING, f"[AI-HARD] WARNING: All options are lethal! Choosing least bad option.")
         else:
             best_idx = max(safe_options.items(), key=lambda x: x[1])[0]
         
         choice = valid_options[best_idx]
         
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-HARD] {caster.name} chose option {best_idx+1} (score: {option_scores[best_idx]})\033[0m"
-            )
+        if self.tracing(INFO):
+            self.trace(INFO, f"[AI-HARD] {caster.name} chose option {best_idx+1} (score: {option_scores[best_idx]})")
         
         return choice
     
@@ -1100,6 +1065,11 @@ class HardAI(BaseAI):
         if not available_sets:
             return None
         
+        # Opening book first; positions it doesn't cover are evaluated live
+        book_pick = self.draft_book_pick(player, gs, available_sets)
+        if book_pick:
+            return book_pick
+        
         # Analyze what we already have (if this is second draft)
         current_cards = player.discard_pile  # Cards from first draft
         
@@ -1159,11 +1129,11 @@ class HardAI(BaseAI):
             # Store normalized weight
             set_weights[set_idx] = max(weight, 0.1)  # Minimum weight of 0.1
             
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
+            if self.tracing(DEBUG):
                 win_rate = self.get_element_win_rate(element) if self.element_win_rates.get('total_games', 0) >= 50 else 0.5
                 selection_rate = self.element_win_rates.get('selection_rates', {}).get(element, 0)
-                self.engine.ai_decision_logs.append(
-                    f"\\033[90m[AI-DRAFT] {element}: weight={weight:.2f}, win_rate={win_rate:.1%}, selection_rate={selection_rate:.1%}\\033[0m"
+                self.trace(DEBUG,
+                    f"[AI-DRAFT] {element}: weight={weight:.2f}, win_rate={win_rate:.1%}, selection_rate={selection_rate:.1%}"
                 )
         
         # Use weighted random selection
@@ -1188,13 +1158,13 @@ class HardAI(BaseAI):
         # Track our pick
         self.element_pick_history.append(chosen_set[0].element)
         
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
+        if self.tracing(INFO):
             element = chosen_set[0].element
             final_weight = set_weights[best_idx]
             win_rate = self.get_element_win_rate(element) if self.element_win_rates.get('total_games', 0) >= 50 else 0.5
-            self.engine.ai_decision_logs.append(
-                f"\\033[90m[AI-DRAFT] Chose {chosen_set[0].elephant} ({element}) "
-                f"with weight {final_weight:.2f} (win_rate: {win_rate:.1%})\\033[0m"
+            self.trace(INFO,
+                f"[AI-DRAFT] Chose {chosen_set[0].elephant} ({element}) "
+                f"with weight {final_weight:.2f} (win_rate: {win_rate:.1%})"
             )
         
         return chosen_set
@@ -1525,18 +1495,18 @@ class HardAI(BaseAI):
                     score += 20
         
         # Log decision
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
+        if self.tracing(DEBUG):
             if self.element_win_rates.get('total_games', 0) >= 50:
                 win_rate = self.get_element_win_rate(set_element)
-                self.engine.ai_decision_logs.append(
-                    f"\\033[90m[AI-DRAFT] {set_element} ({set_category}): "
-                    f"win_rate={win_rate:.1%}, score={score:.0f}\\033[0m"
+                self.trace(DEBUG,
+                    f"[AI-DRAFT] {set_element} ({set_category}): "
+                    f"win_rate={win_rate:.1%}, score={score:.0f}"
                 )
             else:
                 draft_priority = self.get_element_draft_priority(set_element)
-                self.engine.ai_decision_logs.append(
-                    f"\\033[90m[AI-DRAFT] {set_element} ({set_category}): "
-                    f"priority={draft_priority:.1f}, score={score:.0f}\\033[0m"
+                self.trace(DEBUG,
+                    f"[AI-DRAFT] {set_element} ({set_category}): "
+                    f"priority={draft_priority:.1f}, score={score:.0f}"
                 )
         
         return score
@@ -1690,10 +1660,8 @@ class HardAI(BaseAI):
                 reasons.append("healthy and better sets available")
         
         # Log decision if in debug mode
-        if should_clear_hand and self.engine and hasattr(self.engine, 'ai_decision_logs'):
-            self.engine.ai_decision_logs.append(
-                f"\\033[90m[AI-HARD] {player.name} clearing entire hand: {', '.join(reasons)}\\033[0m"
-            )
+        if should_clear_hand and self.tracing(INFO):
+            self.trace(INFO, f"[AI-HARD] {player.name} clearing entire hand: {', '.join(reasons)}")
         
         # If clearing hand, return empty list
         if should_clear_hand:
@@ -1720,9 +1688,9 @@ class HardAI(BaseAI):
         
         # If we're keeping very few cards, might as well clear for new set
         if len(cards_to_keep) <= 1 and available_sets_count >= 2:
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                self.engine.ai_decision_logs.append(
-                    f"\\033[90m[AI-HARD] {player.name} clearing hand - only {len(cards_to_keep)} cards worth keeping\\033[0m"
+            if self.tracing(INFO):
+                self.trace(INFO,
+                    f"[AI-HARD] {player.name} clearing hand - only {len(cards_to_keep)} cards worth keeping"
                 )
             return []
         
@@ -1821,19 +1789,17 @@ class HardAI(BaseAI):
                 threat_scores[target] = score
             
             # Log threat evaluation
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
+            if self.tracing(DEBUG):
                 sorted_threats = sorted(threat_scores.items(), key=lambda x: x[1], reverse=True)[:3]
                 threat_info = ", ".join([f"{t.card.name}:{s}" for t, s in sorted_threats])
-                self.engine.ai_decision_logs.append(
-                    f"\\033[90m[AI-HARD] Threat scores: {threat_info}\\033[0m"
-                )
+                self.trace(DEBUG, f"[AI-HARD] Threat scores: {threat_info}")
             
             # Pick the highest threat
             best_target = max(threat_scores.items(), key=lambda x: x[1])[0]
             
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                self.engine.ai_decision_logs.append(
-                    f"\\033[90m[AI-HARD] {caster.name} chose to cancel {best_target.card.name} (threat: {threat_scores[best_target]})\\033[0m"
+            if self.tracing(INFO):
+                self.trace(INFO,
+                    f"[AI-HARD] {caster.name} chose to cancel {best_target.card.name} (threat: {threat_scores[best_target]})"
                 )
             
             return best_target
@@ -2,6 +2,7 @@
 
 import random
 from .base import BaseAI
+from .trace import DEBUG, INFO
 
 
 class MediumAI(BaseAI):
@@ -9,10 +10,8 @@ class MediumAI(BaseAI):
     
     def _select_card(self, player, gs, valid_indices):
         """Select card based on basic heuristics"""
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-MEDIUM] {player.name} analyzed options\033[0m"
-            )
+        if self.tracing(DEBUG):
+            self.trace(DEBUG, f"[AI-MEDIUM] {player.name} analyzed options")
         
         # Categorize cards by preference based on clash timing
         preferred_indices = []
@@ -43,9 +42,9 @@ class MediumAI(BaseAI):
                 # Sort by priority (lower is better)
                 heal_options.sort(key=lambda x: int(x[1].priority) if str(x[1].priority).isdigit() else 99)
                 chosen = heal_options[0]
-                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-MEDIUM] {player.name} chose healing due to low health ({player.health}): {chosen[1].name}\033[0m"
+                if self.tracing(INFO):
+                    self.trace(INFO,
+                        f"[AI-MEDIUM] {player.name} chose healing due to low health ({player.health}): {chosen[1].name}"
                     )
                 return chosen[0]
 
@@ -58,10 +57,8 @@ class MediumAI(BaseAI):
                 damage_options.sort(key=lambda x: int(x[1].priority) if str(x[1].priority).isdigit() else 99)
                 chosen = damage_options[0]
                 enemy_names = ", ".join([e.name for e in low_health_enemies])
-                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-MEDIUM] {player.name} chose attack (enemy low health): {chosen[1].name}\033[0m"
-                    )
+                if self.tracing(INFO):
+                    self.trace(INFO, f"[AI-MEDIUM] {player.name} chose attack (enemy low health): {chosen[1].name}")
                 return chosen[0]
         
         # Aggression: Be aggressive when enemy has empty hand
@@ -74,18 +71,16 @@ class MediumAI(BaseAI):
             if aggressive_options:
                 aggressive_options.sort(key=lambda x: int(x[1].priority) if str(x[1].priority).isdigit() else 99)
                 chosen = aggressive_options[0]
-                if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                    self.engine.ai_decision_logs.append(
-                        f"\033[90m[AI-MEDIUM] {player.name} chose aggressive play (enemy hand empty): {chosen[1].name}\033[0m"
+                if self.tracing(INFO):
+                    self.trace(INFO,
+                        f"[AI-MEDIUM] {player.name} chose aggressive play (enemy hand empty): {chosen[1].name}"
                     )
                 return chosen[0]
         
         # Default to a random candidate card
         choice = random.choice(candidate_indices)
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-MEDIUM] {player.name} chose: {player.hand[choice].name}\033[0m"
-            )
+        if self.tracing(INFO):
+            self.trace(INFO, f"[AI-MEDIUM] {player.name} chose: {player.hand[choice].name}")
         return choice
     
     def make_choice(self, valid_options, caster, gs, current_card):
@@ -93,10 +88,8 @@ class MediumAI(BaseAI):
         if not valid_options:
             return None
             
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-MEDIUM] {caster.name} evaluating {len(valid_options)} options\033[0m"
-            )
+        if self.tracing(DEBUG):
+            self.trace(DEBUG, f"[AI-MEDIUM] {caster.name} evaluating {len(valid_options)} options")
         
         # Categorize options
         attack_options = []
@@ -125,10 +118,8 @@ class MediumAI(BaseAI):
         # Critical health - prioritize healing
         if caster.health <= 2 and remedy_options:
             choice = remedy_options[0]
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-MEDIUM] {caster.name} chose healing (low health)\033[0m"
-                )
+            if self.tracing(INFO):
+                self.trace(INFO, f"[AI-MEDIUM] {caster.name} chose healing (low health)")
             return choice
         
         # Avoid risky options at low health
@@ -141,28 +132,22 @@ class MediumAI(BaseAI):
         if low_health_enemies and attack_options:
             # Pick the highest damage attack option
             best_attack = self._get_best_attack_option(attack_options)
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-MEDIUM] {caster.name} chose attack (enemy low health)\033[0m"
-                )
+            if self.tracing(INFO):
+                self.trace(INFO, f"[AI-MEDIUM] {caster.name} chose attack (enemy low health)")
             return best_attack
         
         # High health - prefer attacks over healing
         if caster.health >= 4 and attack_options:
             choice = self._get_best_attack_option(attack_options)
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-MEDIUM] {caster.name} chose attack (high health)\033[0m"
-                )
+            if self.tracing(INFO):
+                self.trace(INFO, f"[AI-MEDIUM] {caster.name} chose attack (high health)")
             return choice
         
         # Advance options are generally good in mid-game
         if gs.round_num >= 2 and advance_options:
             choice = advance_options[0]
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                self.engine.ai_decision_logs.append(
-                    f"\033[90m[AI-MEDIUM] {caster.name} chose advance option\033[0m"
-                )
+            if self.tracing(INFO):
+                self.trace(INFO, f"[AI-MEDIUM] {caster.name} chose advance option")
             return choice
         
         # Default to first valid option that's not risky
@@ -172,11 +157,9 @@ class MediumAI(BaseAI):
         else:
             choice = valid_options[0]
             
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
+        if self.tracing(INFO):
             option_desc = self._describe_option(choice)
-            self.engine.ai_decision_logs.append(
-                f"\033[90m[AI-MEDIUM] {caster.name} chose: {option_desc}\033[0m"
-            )
+            self.trace(INFO, f"[AI-MEDIUM] {caster.name} chose: {option_desc}")
         
         return choice
     
@@ -282,6 +265,11 @@ class MediumAI(BaseAI):
         if not available_sets:
             return None
         
+        # Opening book first; positions it doesn't cover are evaluated live
+        book_pick = self.draft_book_pick(player, gs, available_sets)
+        if book_pick:
+            return book_pick
+        
         # Analyze what we already have (if this is second draft)
         current_cards = player.discard_pile
         
@@ -378,10 +366,8 @@ class MediumAI(BaseAI):
             self.element_pick_history = []
         self.element_pick_history.append(chosen_set[0].element)
         
-        if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-            self.engine.ai_decision_logs.append(
-                f"\\033[90m[AI-MEDIUM] Drafted {chosen_set[0].elephant} ({chosen_set[0].element})\\033[0m"
-            )
+        if self.tracing(INFO):
+            self.trace(INFO, f"[AI-MEDIUM] Drafted {chosen_set[0].elephant} ({chosen_set[0].element})")
         
         return chosen_set
     
@@ -416,9 +402,9 @@ class MediumAI(BaseAI):
             # Pick the highest threat
             best_target = max(threat_scores.items(), key=lambda x: x[1])[0]
             
-            if self.engine and hasattr(self.engine, 'ai_decision_logs'):
-                self.engine.ai_decision_logs.append(
-                    f"\\033[90m[AI-MEDIUM] {caster.name} chose to cancel {best_target.card.name} (threat score: {threat_scores[best_target]})\\033[0m"
+            if self.tracing(INFO):
+                self.trace(INFO,
+                    f"[AI-MEDIUM] {caster.name} chose to cancel {best_target.card.name} (threat score: {threat_scores[best_target]})"
                 )
             
             return best_target
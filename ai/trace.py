@@ -0,0 +1,77 @@
+"""Level-gated decision trace for the AIs
+
+The AIs explain their choices (card scores, response risks, the option
+picked) through their engine's DecisionTrace. Nothing is built unless the
+trace records that level: call sites check BaseAI.tracing(level) before
+formatting a message, and a message may also be a callable that is only
+called once the level is known to be on. Engines start with the trace off,
+so batch games pay one comparison per call site.
+
+Entries are small dicts (sequence number, level, round, clash, AI class,
+message) kept in a ring buffer of the last `capacity` entries, and can be
+written out as JSON for offline analysis.
+"""
+
+import json
+from collections import deque
+
+DEBUG = 10      # Per-card and per-option scoring detail
+INFO = 20       # The decision taken
+WARNING = 30    # Risks the AI accepted, missing data
+OFF = 100
+
+LEVELS = {'debug': DEBUG, 'info': INFO, 'warning': WARNING, 'off': OFF}
+LEVEL_NAMES = {value: name for name, value in LEVELS.items()}
+DEFAULT_CAPACITY = 5000
+
+
+def parse_level(name):
+    """Level constant for 'debug'/'info'/'warning'/'off' (any case)"""
+    try:
+        return LEVELS[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown trace level {name!r}; choose from {', '.join(LEVELS)}") from None
+
+
+class DecisionTrace:
+    """Bounded record of AI decision explanations at or above a level"""
+
+    def __init__(self, level=OFF, capacity=DEFAULT_CAPACITY):
+        self.level = level
+        self.entries = deque(maxlen=capacity)
+        self.recorded = 0   # Entries ever recorded; older ones have dropped out of the buffer
+        self._shown = 0     # Sequence number of the last entry handed to take_new()
+
+    def enabled(self, level):
+        return level >= self.level
+
+    def record(self, level, message, **context):
+        """Store a message (or the result of calling it) if the level is on"""
+        if level < self.level:
+            return
+        if callable(message):
+            message = message()
+        self.recorded += 1
+        entry = {'seq': self.recorded, 'level': LEVEL_NAMES.get(level, level), 'message': message}
+        entry.update(context)
+        self.entries.append(entry)
+
+    def take_new(self):
+        """Entries recorded since the last call, oldest first"""
+        new = [entry for entry in self.entries if entry['seq'] > self._shown]
+        self._shown = self.recorded
+        return new
+
+    def clear(self):
+        self.entries.clear()
+        self._shown = self.recorded
+
+    def to_dict(self):
+        return {'level': LEVEL_NAMES.get(self.level, self.level), 'recorded': self.recorded,
+                'dropped': self.recorded - len(self.entries), 'entries': list(self.entries)}
+
+    def export(self, path):
+        """Write the buffered entries as JSON; returns the path"""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=1)
+        return path
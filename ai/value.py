@@ -0,0 +1,153 @@
+"""Value AI - card and draft choices scored by a learned linear value model"""
+
+import hashlib
+import json
+import math
+import os
+from collections import namedtuple
+from operator import mul
+
+from .features import (DRAFT_CONTEXT, FEATURE_NAMES, PLAY_CONTEXT, draft_context, encode_state,
+                       play_context, set_code)
+from .hard import HardAI
+from .trace import INFO
+
+DEFAULT_MODEL = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'value_model.json')
+
+
+class ValueModel:
+    """Logistic win-probability model trained from self-play data by value_model.py
+
+    log-odds = bias + state_weights . features + option_weights[option] . context
+
+    The state term is shared by every option of a decision, so options are
+    ranked by a single short dot product each: their own weight row against
+    the decision's context vector.
+    """
+
+    def __init__(self, bias, state_weights, play_weights, draft_weights, version=None):
+        self.bias = bias
+        self.state_weights = state_weights
+        self.play_weights = play_weights  # spell id -> weights over PLAY_CONTEXT
+        self.draft_weights = draft_weights  # set code -> weights over DRAFT_CONTEXT
+        self.version = version or 'm-' + hashlib.sha1(
+            json.dumps([bias, state_weights, sorted(play_weights.items()), sorted(draft_weights.items())]).encode()
+        ).hexdigest()[:8]
+
+    @classmethod
+    def load(cls, path=DEFAULT_MODEL):
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if (data['feature_names'] != FEATURE_NAMES or data['play_context'] != PLAY_CONTEXT
+                or data['draft_context'] != DRAFT_CONTEXT):
+            raise ValueError("trained on a different feature layout; retrain it")
+        return cls(data['bias'], data['state_weights'],
+                   {int(k): v for k, v in data['play_weights'].items()},
+                   {int(k): v for k, v in data['draft_weights'].items()}, data.get('version'))
+
+    def to_dict(self):
+        return {'version': self.version, 'feature_names': FEATURE_NAMES, 'play_context': PLAY_CONTEXT,
+                'draft_context': DRAFT_CONTEXT, 'bias': self.bias, 'state_weights': self.state_weights,
+                'play_weights': self.play_weights, 'draft_weights': self.draft_weights}
+
+    def state_score(self, features):
+        return self.bias + sum(w * x for w, x in zip(self.state_weights, features) if x)
+
+    def win_probability(self, gs, player):
+        return 1 / (1 + math.exp(-self.state_score(encode_state(gs, player))))
+
+    def play_value(self, context, card):
+        """Log-odds contribution of preparing a card, given play_context() of the decision"""
+        weights = self.play_weights.get(card.id)
+        return sum(w * x for w, x in zip(weights, context)) if weights else 0.0
+
+    def play_values(self, batch):
+        """play_value() of every card of many decisions at once: [(context, cards)] -> [[value per card]]"""
+        weights = self.play_weights
+        return [[sum(map(mul, weights[card.id], context)) if card.id in weights else 0.0 for card in cards]
+                for context, cards in batch]
+
+    def draft_value(self, features, spell_set):
+        """Log-odds contribution of drafting a set, given the drafter's encoded state"""
+        code = set_code(spell_set)
+        weights = self.draft_weights.get(code)
+        return sum(w * x for w, x in zip(weights, draft_context(features, code))) if weights else 0.0
+
+
+# A prepare decision handed out to be scored in a batch (see ValueAI.play_request)
+PlayRequest = namedtuple('PlayRequest', 'ai player valid_indices context')
+
+_loaded = {}
+
+
+def load_value_model(path=DEFAULT_MODEL):
+    """Shared ValueModel for a model file, or None if none has been trained yet"""
+    if path not in _loaded:
+        try:
+            _loaded[path] = ValueModel.load(path) if os.path.exists(path) else None
+        except (IOError, ValueError, KeyError, json.JSONDecodeError) as e:
+            print(f"Warning: ignoring value model {path}: {e}")
+            _loaded[path] = None
+    return _loaded[path]
+
+
+class ValueAI(HardAI):
+    """Prepares and drafts by the learned value model; other decisions are HardAI's
+
+    Without a trained model (value_model.json) it plays exactly like HardAI.
+    """
+
+    def __init__(self, model=None):
+        super().__init__()
+        self.model = model or load_value_model()
+
+    @property
+    def model_version(self):
+        return self.model.version if self.model else None
+
+    def _select_card(self, player, gs, valid_indices):
+        if not self.model:
+            return super()._select_card(player, gs, valid_indices)
+        return self.decide_play_requests([self._play_request(player, gs, valid_indices)])[0]
+
+    def play_request(self, player, gs):
+        if not self.model:
+            return None
+        valid_indices = self._get_valid_card_indices(player, gs)
+        return self._play_request(player, gs, valid_indices) if valid_indices else None
+
+    def _play_request(self, player, gs, valid_indices):
+        self.update_opponent_history(gs)
+        return PlayRequest(self, player, valid_indices, play_context(encode_state(gs, player)))
+
+    @staticmethod
+    def decide_play_requests(requests):
+        """The hand index chosen for each PlayRequest; requests sharing a model are scored in one call"""
+        by_model = {}
+        for n, request in enumerate(requests):
+            by_model.setdefault(id(request.ai.model), []).append(n)
+        choices = [None] * len(requests)
+        for numbers in by_model.values():
+            batch = [(requests[n].context, [requests[n].player.hand[i] for i in requests[n].valid_indices])
+                     for n in numbers]
+            for n, values in zip(numbers, requests[numbers[0]].ai.model.play_values(batch)):
+                choices[n] = requests[n].ai._choose_scored(requests[n], values)
+        return choices
+
+    def _choose_scored(self, request, values):
+        best = max(range(len(values)), key=values.__getitem__)
+        idx = request.valid_indices[best]
+        if self.tracing(INFO):
+            player = request.player
+            self.trace(INFO, f"[AI-VALUE] {player.name} chose: {player.hand[idx].name} ({values[best]:+.3f})")
+        return idx
+
+    def choose_draft_set(self, player, gs, available_sets):
+        if not self.model:
+            return super().choose_draft_set(player, gs, available_sets)
+        self._update_opponent_draft_tracking(gs)
+        offered = [s for s in available_sets if s]
+        if not offered:
+            return None
+        features = encode_state(gs, player)
+        return max(offered, key=lambda s: self.model.draft_value(features, s))
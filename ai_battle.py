@@ -7,6 +7,9 @@ import os
 from datetime import datetime
 from collections import defaultdict
 
+from game_logger import NullGameLogger
+from ai.trace import DecisionTrace
+
 # Create a modified game engine that skips all pauses
 class AutoGameEngine:
     def __init__(self):
@@ -48,7 +51,8 @@ class AutoGameEngine:
             'gs': gs,
             'display': display,
             'condition_checker': condition_checker,
-            'ai_decision_logs': [],
+            'decision_trace': DecisionTrace(),
+            'logger': NullGameLogger(),
             '_pause': lambda self, msg="": None,  # No-op pause
             '_handle_trunk_loss': self._mock_handle_trunk_loss
         })()
@@ -3,11 +3,12 @@
 
 import sys
 import time
+import asyncio
 import threading
 from queue import Queue, Empty
 
 # Import game components
-from elephants_prototype import GameEngine, GameState, PlayedCard
+from elephants_prototype import GameEngine, GameState, PlayedCard, DashboardDisplay
 from ai.easy import EasyAI
 from ai.medium import MediumAI
 from ai.hard import HardAI
@@ -36,14 +37,20 @@ class AutoPlayEngine(GameEngine):
     def _prompt_for_choice(self, player, options, prompt_message, view_key='name'):
         """Override to make AI choices automatically"""
         if not player.is_human:
-            # Let AI make the choice
             ai = self.ai_strategies.get(self.gs.players.index(player))
             if ai and hasattr(ai, 'make_choice'):
                 # Show the prompt briefly
                 if self.verbose:
                     self.display.draw(self.gs, self.gs.players.index(player), prompt=prompt_message)
                     time.sleep(self.delay * 0.5)  # Shorter delay for choices
-                
+        return self._auto_choose(player, options)
+    
+    def _auto_choose(self, player, options):
+        """Let the player's AI pick one of the options, returning its key"""
+        if not player.is_human:
+            # Let AI make the choice
+            ai = self.ai_strategies.get(self.gs.players.index(player))
+            if ai and hasattr(ai, 'make_choice'):
                 # AI makes choice
                 choice = ai.make_choice(list(options.values()), player, self.gs, None)
                 if choice in options.values():
@@ -51,16 +58,13 @@ class AutoPlayEngine(GameEngine):
                     for k, v in options.items():
                         if v == choice:
                             return k
-                
-                # Fallback to first option
-                return list(options.keys())[0] if options else None
         
-        # Should not reach here in AI vs AI
+        # Fallback to first option (should not be needed in AI vs AI)
         return list(options.keys())[0] if options else None
     
     def _setup_game(self):
         """Override setup to handle drafting automatically"""
-        self.gs.action_log.append("--- Game Setup ---")
+        self.gs.action_log.add('setup')
         
         # Draft phase
         for draft_round in range(2):
@@ -91,7 +95,7 @@ class AutoPlayEngine(GameEngine):
                 for card in chosen_set:
                     player.discard_pile.append(card)
                 
-                self.gs.action_log.append(f"{player.name} drafted the '{chosen_set[0].elephant}' ({chosen_set[0].element}) set.")
+                self.gs.action_log.add('drafted', player=player.name, elephant=chosen_set[0].elephant, element=chosen_set[0].element)
                 
                 if self.verbose:
                     self._pause()
@@ -100,7 +104,7 @@ class AutoPlayEngine(GameEngine):
         for player in self.gs.players:
             player.hand = player.discard_pile[:]
             player.discard_pile = []
-            self.gs.action_log.append(f"{player.name} shuffled their deck.")
+            self.gs.action_log.add('shuffled', player=player.name)
         
         self._pause("Setup complete! Starting game...")
 
@@ -121,26 +125,7 @@ class SpectatorMode:
         print(f"Delay: {self.delay}s | Verbose: {self.verbose}")
         print('='*60)
         
-        # Create player names
-        player_names = [f"{self.ai1_type.upper()}_AI", f"{self.ai2_type.upper()}_AI"]
-        
-        # Create auto-play engine
-        engine = AutoPlayEngine(player_names, ai_difficulty=self.ai1_type, 
-                               delay=self.delay, verbose=self.verbose)
-        
-        # Make both players AI
-        engine.gs.players[0].is_human = False
-        engine.gs.players[1].is_human = False
-        
-        # Set up AI strategies
-        ai1 = self._create_ai(self.ai1_type)
-        ai2 = self._create_ai(self.ai2_type)
-        
-        ai1.engine = engine
-        ai2.engine = engine
-        
-        engine.ai_strategies[0] = ai1
-        engine.ai_strategies[1] = ai2
+        engine = self._create_engine(AutoPlayEngine, delay=self.delay, verbose=self.verbose)
         
         # Run the game
         try:
@@ -162,6 +147,29 @@ class SpectatorMode:
         
         return engine.gs
     
+    def _create_engine(self, engine_class, **engine_kwargs):
+        """Create an engine of the given class with both seats driven by AI"""
+        # Create player names
+        player_names = [f"{self.ai1_type.upper()}_AI", f"{self.ai2_type.upper()}_AI"]
+        
+        # Create auto-play engine
+        engine = engine_class(player_names, ai_difficulty=self.ai1_type, **engine_kwargs)
+        
+        # Make both players AI
+        engine.gs.players[0].is_human = False
+        engine.gs.players[1].is_human = False
+        
+        # Set up AI strategies
+        ai1 = self._create_ai(self.ai1_type)
+        ai2 = self._create_ai(self.ai2_type)
+        
+        ai1.engine = engine
+        ai2.engine = engine
+        
+        engine.ai_strategies[0] = ai1
+        engine.ai_strategies[1] = ai2
+        return engine
+    
     def _create_ai(self, ai_type):
         """Create AI instance"""
         if ai_type == 'easy':
@@ -213,7 +221,194 @@ class SpectatorMode:
         print(f"Draws: {results['draws']}")
 
 
+class HeadlessSpectatorEngine(AutoPlayEngine):
+    """Auto-play engine that never sleeps or draws; each pause becomes a frame snapshot"""
+    
+    def __init__(self, player_names, ai_difficulty='medium', on_frame=None):
+        super().__init__(player_names, ai_difficulty, delay=0, verbose=True)
+        self.on_frame = on_frame  # Called with each composed frame (a tuple of screen rows)
+    
+    def _pause(self, message=""):
+        """Snapshot the dashboard instead of drawing it"""
+        if self.on_frame:
+            self.on_frame(tuple(self.display._compose(self.gs, prompt=message)))
+    
+    def _prompt_for_choice(self, player, options, prompt_message, view_key='name'):
+        """Snapshot the prompt, then let the AI choose without waiting"""
+        if self.on_frame:
+            self.on_frame(tuple(self.display._compose(self.gs, self.gs.players.index(player), prompt=prompt_message)))
+        return self._auto_choose(player, options)
+
+
+class AsyncSpectator(SpectatorMode):
+    """Spectate with simulation and rendering decoupled through asyncio.
+    
+    A producer runs the games headlessly in a worker thread and streams frame
+    snapshots through a bounded queue. The renderer plays them back at a fixed
+    frame rate and keeps every frame it has shown in a timeline, so pause, step
+    and seek never re-run the simulation.
+    """
+    
+    CONTROLS_HELP = "[p] pause/resume  [n] step  [b] back  [g N] seek  [+/-] speed  [q] quit"
+    
+    def __init__(self, ai1_type='expert', ai2_type='expert', fps=2.0, queue_size=256):
+        super().__init__(ai1_type, ai2_type, delay=0, verbose=True)
+        self.fps = fps
+        self.queue_size = queue_size
+        self.timeline = []  # Every frame pulled from the queue, in order
+        self.cursor = -1  # Index of the frame currently on screen
+        self.paused = False
+        self.finished = False  # Producer has delivered its last frame
+        self.quit = False
+        self.results = {f'{ai1_type}_wins': 0, f'{ai2_type}_wins': 0, 'draws': 0}
+        self._rows = {}  # Intern identical rows so consecutive frames share memory
+    
+    def run(self, num_games=1):
+        """Play num_games and spectate them; blocks until playback is quit or complete"""
+        asyncio.run(self._main(num_games))
+        return self.results
+    
+    async def _main(self, num_games):
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self.commands = asyncio.Queue()
+        self.display = DashboardDisplay()
+        
+        # stdin is read on a daemon thread so an idle prompt never blocks shutdown
+        threading.Thread(target=self._read_commands, daemon=True).start()
+        
+        producer = asyncio.create_task(asyncio.to_thread(self._produce, num_games))
+        try:
+            await self._render_loop()
+        finally:
+            self.quit = True
+            # Unblock a producer waiting on a full queue so its thread can exit
+            while not producer.done():
+                while not self.queue.empty():
+                    self.queue.get_nowait()
+                await asyncio.sleep(0.01)
+        
+        print(f"\n\n{'='*60}")
+        print("SERIES COMPLETE" if self.finished else "SPECTATING STOPPED")
+        print('='*60)
+        print(f"{self.ai1_type.upper()} Wins: {self.results[f'{self.ai1_type}_wins']}")
+        print(f"{self.ai2_type.upper()} Wins: {self.results[f'{self.ai2_type}_wins']}")
+        print(f"Draws: {self.results['draws']}")
+    
+    def _produce(self, num_games):
+        """Worker thread: run every game headlessly, pushing frames into the bounded queue"""
+        for game_num in range(num_games):
+            if self.quit:
+                break
+            engine = self._create_engine(HeadlessSpectatorEngine,
+                                         on_frame=lambda rows, g=game_num: self._emit(g, rows))
+            engine.run_game()
+            
+            alive = [i for i, p in enumerate(engine.gs.players) if p.trunks > 0]
+            if len(alive) == 1:
+                winner_type = self.ai1_type if alive[0] == 0 else self.ai2_type
+                self.results[f'{winner_type}_wins'] += 1
+            else:
+                self.results['draws'] += 1
+        self._emit(None, None)  # End of stream
+    
+    def _emit(self, game_num, rows):
+        """Hand a frame to the event loop, blocking the simulation while the queue is full"""
+        if self.quit and rows is not None:
+            return
+        if rows is not None:
+            rows = tuple(self._rows.setdefault(row, row) for row in rows)
+        frame = None if rows is None else {'game': game_num, 'rows': rows}
+        asyncio.run_coroutine_threadsafe(self.queue.put(frame), self.loop).result()
+    
+    def _read_commands(self):
+        """Daemon thread: forward each line typed on stdin to the command queue"""
+        for line in sys.stdin:
+            self.loop.call_soon_threadsafe(self.commands.put_nowait, line.strip())
+    
+    async def _pull_frame(self):
+        """Move the next frame from the queue into the timeline; False once the stream is over"""
+        if self.finished:
+            return False
+        frame = await self.queue.get()
+        if frame is None:
+            self.finished = True
+            return False
+        self.timeline.append(frame)
+        return True
+    
+    async def _seek(self, index):
+        """Move the cursor to index, pulling frames from the producer if it lies ahead"""
+        index = max(0, index)
+        while index >= len(self.timeline) and await self._pull_frame():
+            pass
+        self.cursor = min(index, len(self.timeline) - 1)
+    
+    async def _handle_command(self, command):
+        if command in ('p', ''):
+            self.paused = not self.paused
+        elif command == 'n':
+            self.paused = True
+            await self._seek(self.cursor + 1)
+        elif command == 'b':
+            self.paused = True
+            await self._seek(self.cursor - 1)
+        elif command.startswith('g'):
+            try:
+                await self._seek(int(command[1:]))
+                self.paused = True
+            except ValueError:
+                pass
+        elif command in ('+', '-'):
+            self.fps = self.fps * 2 if command == '+' else max(0.25, self.fps / 2)
+        elif command == 'q':
+            self.quit = True
+    
+    async def _render_loop(self):
+        """Draw the frame under the cursor at the configured frame rate"""
+        last_drawn = None
+        while not self.quit:
+            frame_start = self.loop.time()
+            while not self.commands.empty():
+                await self._handle_command(self.commands.get_nowait())
+            
+            if not self.paused:
+                if self.cursor + 1 < len(self.timeline) or await self._pull_frame():
+                    self.cursor += 1
+                elif self.finished:
+                    break
+            
+            if self.cursor >= 0:
+                frame = self.timeline[self.cursor]
+                state = "PAUSED" if self.paused else f"{self.fps:g} fps"
+                status = (f"Game {frame['game'] + 1} | Frame {self.cursor}/{len(self.timeline) - 1}"
+                          f"{'' if self.finished else '+'} | {state} | {self.CONTROLS_HELP}")
+                # Skip identical redraws so a paused screen doesn't wipe a command being typed
+                if (self.cursor, status) != last_drawn:
+                    self.display._render(list(frame['rows']) + ["", status])
+                    last_drawn = (self.cursor, status)
+            
+            # Wait out the rest of the frame, waking early for typed commands
+            remaining = 1.0 / self.fps - (self.loop.time() - frame_start)
+            if remaining > 0:
+                try:
+                    command = await asyncio.wait_for(self.commands.get(), remaining)
+                    await self._handle_command(command)
+                except asyncio.TimeoutError:
+                    pass
+
+
 def main():
+    # Pull out flags before reading positional arguments
+    use_async = '--async' in sys.argv
+    fps = None
+    if '--fps' in sys.argv:
+        flag_index = sys.argv.index('--fps')
+        fps = float(sys.argv[flag_index + 1])
+        del sys.argv[flag_index:flag_index + 2]
+        use_async = True
+    sys.argv = [arg for arg in sys.argv if arg != '--async']
+    
     # Parse arguments
     ai1 = sys.argv[1] if len(sys.argv) > 1 else 'expert'
     ai2 = sys.argv[2] if len(sys.argv) > 2 else 'expert'
@@ -241,6 +436,15 @@ def main():
     print("- Set delay to 0 for maximum speed")
     print("- Ctrl+C to stop")
     
+    if use_async:
+        # Frame rate defaults to one frame per configured delay
+        if fps is None:
+            fps = 1.0 / delay if delay > 0 else 30.0
+        print(f"\nAsync playback at {fps:g} fps. Type a command and press Enter:")
+        print(f"  {AsyncSpectator.CONTROLS_HELP}")
+        AsyncSpectator(ai1, ai2, fps=fps).run(num_games)
+        return
+    
     # Create and run spectator
     spectator = SpectatorMode(ai1, ai2, delay=delay, verbose=True)
     
@@ -252,11 +456,13 @@ def main():
 
 if __name__ == "__main__":
     if len(sys.argv) == 1:
-        print("Usage: python ai_spectator.py [ai1] [ai2] [delay] [num_games]")
+        print("Usage: python ai_spectator.py [ai1] [ai2] [delay] [num_games] [--async] [--fps N]")
         print("\nExample:")
         print("  python ai_spectator.py hard easy 0.5      # Fast game")
         print("  python ai_spectator.py hard medium 2.0 5  # 5 slower games")
         print("  python ai_spectator.py hard hard 0        # Maximum speed")
+        print("  python ai_spectator.py hard medium 1.0 5 --async     # Simulate ahead, pause/step/seek")
+        print("  python ai_spectator.py hard medium 1.0 5 --fps 10    # Async playback at 10 frames/s")
         print("\nAI types: easy, medium, hard, expert")
         print("Delay: seconds between actions (default 1.0)")
     else:
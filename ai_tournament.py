@@ -7,15 +7,20 @@ Uses the complete game engine (not simplified) but runs without display for spee
 import os
 import sys
 import json
+import random
 from datetime import datetime
 from collections import defaultdict
 import time
+import traceback
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from elephants_prototype import GameEngine, GameState, RoundOverException
 from ai import EasyAI, MediumAI, HardAI, ExpertAI
+from match_stats import MatchupTracker, PairedTracker, run_sequential
+from crash_corpus import CrashCorpus
+from rating_ladder import DEFAULT_DB, RatingLadder
 
 
 class SilentGameEngine(GameEngine):
@@ -86,25 +91,65 @@ class SilentGameEngine(GameEngine):
         return list(options.keys())[0] if options else None
 
 
+def replay_crash(record):
+    """Re-run a crash recorded by AITournament; returns the traceback, or None if the game finished"""
+    tournament = AITournament(crash_dir=None, rating_db=None)
+    try:
+        tournament._run_single_game(record['player_names'], record['ai_types'], record['seed'])
+    except Exception:
+        return traceback.format_exc()
+    return None
+
+
 class AITournament:
     """Run tournaments between all AI types"""
     
-    def __init__(self, games_per_matchup=50):
+    def __init__(self, games_per_matchup=50, adaptive=False, target_half_width=0.05, min_games=10,
+                 paired=False, seed=None, crash_dir="crash_corpus", rating_db=None):
         self.games_per_matchup = games_per_matchup
+        # Paired mode: every seed is played twice with the same deck order and the AIs' seats swapped
+        self.paired = paired
+        self.seed = seed if seed is not None else random.randrange(2**31)
+        self.next_seed = self.seed  # Unpaired games each take the next seed, so crashes can be replayed
+        self.crash_corpus = CrashCorpus(crash_dir) if crash_dir else None
+        self.ladder = RatingLadder(rating_db) if rating_db else None  # Every finished game updates the ladder; close() when done
+        # Adaptive mode: games_per_matchup becomes an average budget shared by all matchups
+        self.adaptive = adaptive
+        self.target_half_width = target_half_width
+        self.min_games = min_games
+        self.trackers = []
+        self.games_played = defaultdict(lambda: defaultdict(lambda: self.games_per_matchup))
         self.results = defaultdict(lambda: defaultdict(int))
         self.game_lengths = defaultdict(list)
         self.element_usage = defaultdict(lambda: defaultdict(int))
         self.start_time = None
         
+    def close(self):
+        if self.ladder:
+            self.ladder.close()
+            self.ladder = None
+    
     def run_tournament(self):
         """Run all matchups between AI types"""
         ai_types = ['easy', 'medium', 'hard', 'expert']
         
         print(f"{'='*80}")
-        print(f"AI TOURNAMENT - {self.games_per_matchup} games per matchup")
+        if self.adaptive:
+            print(f"AI TOURNAMENT (ADAPTIVE) - budget of {self.games_per_matchup} games per matchup")
+        else:
+            print(f"AI TOURNAMENT - {self.games_per_matchup} games per matchup")
         print(f"{'='*80}\n")
         
         self.start_time = time.time()
+        if self.paired:
+            self._run_paired_matchups(ai_types)
+            self._generate_report()
+            return
+        if self.adaptive:
+            self._run_adaptive_matchups(ai_types)
+            self._generate_report()
+            return
+        
         # Calculate total matchups excluding self-matches
         total_matchups = len(ai_types) * (len(ai_types) - 1)
         matchup_count = 0
@@ -121,24 +166,15 @@ class AITournament:
                 wins = {ai1: 0, ai2: 0, 'draws': 0}
                 
                 for game_num in range(self.games_per_matchup):
-                    # Alternate who goes first
-                    if game_num % 2 == 0:
-                        player_names = [f"{ai1.upper()}_AI_1", f"{ai2.upper()}_AI_2"]
-                        ai_order = [ai1, ai2]
-                    else:
-                        player_names = [f"{ai2.upper()}_AI_1", f"{ai1.upper()}_AI_2"]
-                        ai_order = [ai2, ai1]
-                    
                     # Run game
                     try:
-                        winner_ai = self._run_single_game(player_names, ai_order)
+                        winner_ai = self._run_seated_game(ai1, ai2, game_num)
                         if winner_ai:
                             wins[winner_ai] += 1
                         else:
                             wins['draws'] += 1
                     except Exception as e:
                         print(f"\n  Error in game {game_num + 1}: {str(e)}")
-                        import traceback
                         traceback.print_exc()
                         continue
                     
@@ -157,11 +193,85 @@ class AITournament:
         # Generate report
         self._generate_report()
     
-    def _run_single_game(self, player_names, ai_difficulties):
-        """Run a single game and return winner AI type"""
-        engine = SilentGameEngine(player_names, ai_difficulties)
+    def _run_adaptive_matchups(self, ai_types):
+        """Play every ordered matchup sequentially, stopping each once its win rate is settled"""
+        self.trackers = [MatchupTracker(ai1, ai2, target_half_width=self.target_half_width,
+                                        min_games=self.min_games)
+                         for ai1 in ai_types for ai2 in ai_types if ai1 != ai2]
+        budget = self.games_per_matchup * len(self.trackers)
+        
+        def on_game(tracker):
+            if tracker.is_done():
+                elapsed = time.time() - self.start_time
+                print(f"  {tracker.summary()} [{elapsed:.1f}s]")
+        
+        played = run_sequential(self.trackers, lambda t, n: self._run_seated_game(t.ai1, t.ai2, n),
+                                budget, on_game=on_game)
+        print(f"\nUsed {played}/{budget} games")
+        
+        for tracker in self.trackers:
+            if tracker.stop_reason in ('budget', 'failures'):
+                print(f"  {tracker.summary()}")
+            self.results[tracker.ai1][tracker.ai2] = tracker.win_rate
+            self.games_played[tracker.ai1][tracker.ai2] = tracker.games
+    
+    def _run_paired_matchups(self, ai_types):
+        """Play each unordered matchup as seat-swapped pairs on shared seeds"""
+        # A pair already covers both seatings, so A-vs-B and B-vs-A would be the same experiment
+        self.trackers = [PairedTracker(ai1, ai2, target_half_width=self.target_half_width,
+                                       min_games=self.min_games if self.adaptive else 2 * self.games_per_matchup,
+                                       max_games=None if self.adaptive else 2 * self.games_per_matchup)
+                         for i, ai1 in enumerate(ai_types) for ai2 in ai_types[i + 1:]]
+        # Same total number of games as the unpaired tournament over ordered matchups
+        budget = self.games_per_matchup * len(ai_types) * (len(ai_types) - 1)
+        print(f"Paired games on seeds {self.seed}..{self.seed + budget // 2 - 1}\n")
+        
+        def play_pair(tracker, game_num):
+            # Pair k uses the same seed for every matchup, so all matchups see the same decks
+            seed = self.seed + game_num // 2
+            return (self._run_seated_game(tracker.ai1, tracker.ai2, 0, seed),
+                    self._run_seated_game(tracker.ai1, tracker.ai2, 1, seed))
+        
+        def on_pair(tracker):
+            if tracker.is_done() or tracker.pairs % 10 == 0:
+                elapsed = time.time() - self.start_time
+                print(f"  {tracker.summary()} [{elapsed:.1f}s]")
+        
+        played = run_sequential(self.trackers, play_pair, budget, on_game=on_pair)
+        print(f"\nUsed {played}/{budget} games")
+        
+        for tracker in self.trackers:
+            for ai, opponent in ((tracker.ai1, tracker.ai2), (tracker.ai2, tracker.ai1)):
+                self.results[ai][opponent] = tracker.wins[ai] / tracker.games if tracker.games else 0
+                self.games_played[ai][opponent] = tracker.games
+    
+    def _run_seated_game(self, ai1, ai2, game_num, seed=None):
+        """Run game number game_num of a matchup, alternating who goes first"""
+        if game_num % 2 == 0:
+            player_names = [f"{ai1.upper()}_AI_1", f"{ai2.upper()}_AI_2"]
+            ai_order = [ai1, ai2]
+        else:
+            player_names = [f"{ai2.upper()}_AI_1", f"{ai1.upper()}_AI_2"]
+            ai_order = [ai2, ai1]
+        return self._run_single_game(player_names, ai_order, seed)
+    
+    def _run_single_game(self, player_names, ai_difficulties, seed=None):
+        """Run a single game and return winner AI type
+        
+        The shared random stream is reseeded before the engine is built (with
+        the next unused seed if none is given). Seat order, ringleader and deck
+        order then depend only on the seed, not on which AI sits where, and a
+        crashing game is recorded in the crash corpus for replay.
+        """
+        if seed is None:
+            seed = self.next_seed
+            self.next_seed += 1
+        random.seed(seed)
+        engine = None
         
         try:
+            engine = SilentGameEngine(player_names, ai_difficulties)
+            
             # Run setup
             engine._setup_game()
             
@@ -177,6 +287,8 @@ class AITournament:
             
             # Track game length
             self.game_lengths[f"{ai_difficulties[0]}_vs_{ai_difficulties[1]}"].append(engine.gs.round_num - 1)
+            if self.ladder:
+                self.ladder.record_engine(engine, ai_difficulties, 'ai_tournament', seed)
             
             # Determine winner
             winner = next((p for p in engine.gs.players if p.trunks > 0), None)
@@ -197,8 +309,12 @@ class AITournament:
             
             return None  # Draw
             
-        except Exception as e:
-            # Re-raise the error so we can see what's happening
+        except Exception:
+            # Record the crash, then re-raise so the caller counts it as a failed game
+            if self.crash_corpus:
+                path = self.crash_corpus.record('ai_tournament', seed, player_names, ai_difficulties,
+                                                traceback.format_exc(), engine.gs if engine else None)
+                print(f"  Crash recorded: {path}")
             raise
     
     def _generate_report(self):
@@ -212,7 +328,14 @@ class AITournament:
             f.write("="*80 + "\n")
             f.write("AI TOURNAMENT REPORT\n")
             f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Games per matchup: {self.games_per_matchup}\n")
+            if self.paired:
+                f.write(f"Mode: paired seat-swapped games, base seed {self.seed}"
+                        f"{' (adaptive)' if self.adaptive else ''}\n")
+            elif self.adaptive:
+                f.write(f"Mode: adaptive (budget {self.games_per_matchup} games per matchup, "
+                        f"target +/-{self.target_half_width:.0%}, min {self.min_games} games)\n")
+            else:
+                f.write(f"Games per matchup: {self.games_per_matchup}\n")
             f.write(f"Total time: {time.time() - self.start_time:.1f} seconds\n")
             f.write("="*80 + "\n\n")
             
@@ -247,8 +370,9 @@ class AITournament:
                 
                 for opponent in ai_types:
                     if ai != opponent:
-                        total_wins += self.results[ai][opponent] * self.games_per_matchup
-                        total_games += self.games_per_matchup
+                        games = self.games_played[ai][opponent]
+                        total_wins += self.results[ai][opponent] * games
+                        total_games += games
                 
                 if total_games > 0:
                     overall_win_rate = total_wins / total_games
@@ -260,6 +384,16 @@ class AITournament:
             for rank, (ai, win_rate, wins, games) in enumerate(overall_stats, 1):
                 f.write(f"{rank}. {ai.upper():>8}: {win_rate:>6.1%} ({wins}/{games} games)\n")
             
+            if self.trackers:
+                f.write("\n" + "-"*60 + "\n")
+                if self.paired:
+                    f.write("PAIRED RESULTS (win rate from paired differences, 95% CI)\n")
+                else:
+                    f.write("WIN RATES WITH 95% CONFIDENCE INTERVALS\n")
+                f.write("-"*60 + "\n")
+                for tracker in self.trackers:
+                    f.write(f"  {tracker.summary()}\n")
+            
             # Average game lengths
             f.write("\n" + "-"*60 + "\n")
             f.write("AVERAGE GAME LENGTH\n")
@@ -314,6 +448,13 @@ class AITournament:
         json_data = {
             'timestamp': datetime.now().isoformat(),
             'games_per_matchup': self.games_per_matchup,
+            'adaptive': self.adaptive,
+            'paired': self.paired,
+            'seed': self.seed,
+            'paired_differences': {f"{t.ai1}_vs_{t.ai2}": t.differences
+                                   for t in self.trackers if isinstance(t, PairedTracker)},
+            'games_played': {ai: dict(opponents) for ai, opponents in self.games_played.items()},
+            'confidence_intervals': {f"{t.ai1}_vs_{t.ai2}": list(t.interval) for t in self.trackers},
             'total_time_seconds': time.time() - self.start_time,
             'win_rates': dict(self.results),
             'game_lengths': dict(self.game_lengths),
@@ -330,26 +471,45 @@ class AITournament:
         print(f"\nQUICK SUMMARY:")
         for rank, (ai, win_rate, _, _) in enumerate(overall_stats, 1):
             print(f"  {rank}. {ai.upper()}: {win_rate:.1%}")
+        
+        if self.crash_corpus:
+            self.crash_corpus.report_summary()
 
 
 def main():
     """Run the tournament"""
     games = 20  # Default
+    adaptive = '--adaptive' in sys.argv
+    paired = '--paired' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg not in ('--adaptive', '--paired')]
+    rating_db = None
+    if '--ladder' in args:
+        # --ladder [DB]: add the games to the rating ladder
+        flag_index = args.index('--ladder')
+        has_path = flag_index + 1 < len(args) and not args[flag_index + 1].isdigit()
+        rating_db = args[flag_index + 1] if has_path else DEFAULT_DB
+        del args[flag_index:flag_index + 1 + has_path]
     
-    if len(sys.argv) > 1:
+    if args:
         try:
-            games = int(sys.argv[1])
+            games = int(args[0])
         except ValueError:
-            print(f"Usage: {sys.argv[0]} [games_per_matchup]")
+            print(f"Usage: {sys.argv[0]} [games_per_matchup] [--adaptive] [--paired] [--ladder [DB]]")
             print(f"Example: {sys.argv[0]} 50")
+            print(f"         {sys.argv[0]} 50 --adaptive  # Stop settled matchups early")
+            print(f"         {sys.argv[0]} 50 --paired    # Seat-swapped pairs on shared seeds")
             sys.exit(1)
     
     print(f"Running AI Tournament with {games} games per matchup...")
     print("This will run the FULL game engine (all rules included)")
     print("Estimated time: ~{:.1f} minutes\n".format(games * 16 * 0.5 / 60))
     
-    tournament = AITournament(games_per_matchup=games)
-    tournament.run_tournament()
+    tournament = AITournament(games_per_matchup=games, adaptive=adaptive, paired=paired,
+                              rating_db=rating_db)
+    try:
+        tournament.run_tournament()
+    finally:
+        tournament.close()
 
 
 if __name__ == "__main__":
@@ -3,118 +3,177 @@
 Simple AI Win Rate Test - Uses the proven SilentGameEngine from analytics.py
 """
 
+import io
 import sys
+import random
+import traceback
+from contextlib import redirect_stdout
 from datetime import datetime
 from collections import defaultdict
 
-# Import the working SilentGameEngine from analytics
-from analytics import SilentGameEngine
+# Build games with the proven SilentGameEngine from analytics
+from analytics import create_engine
+from crash_corpus import CrashCorpus, error_signature
+from match_stats import GAME_FAILED, MatchupTracker, run_sequential
 
+crash_corpus = CrashCorpus()
 
-def test_ai_matchup(ai1_type, ai2_type, num_games=20):
-    """Test a specific AI matchup"""
+
+def _seat_players(ai1_type, ai2_type, game_num):
+    """Player names and AI types in seat order; ai1 sits first in even-numbered games"""
+    if game_num % 2 == 0:
+        first_ai, second_ai = ai1_type, ai2_type
+    else:
+        first_ai, second_ai = ai2_type, ai1_type
+    return [f"{first_ai.upper()}_1", f"{second_ai.upper()}_2"], [first_ai, second_ai]
+
+
+def _play_game(ai1_type, ai2_type, game_num, seed):
+    """Play one seeded game, alternating who goes first
+
+    Returns the winning AI type, None for a draw, or GAME_FAILED if the game
+    crashed; crashes are recorded in the crash corpus for replay.
+    """
+    player_names, ai_types = _seat_players(ai1_type, ai2_type, game_num)
+    random.seed(seed)
+    engine = None
+    try:
+        engine = create_engine(player_names, *ai_types)
+        engine.run_game()
+        # run_game reports its own errors instead of raising
+        crash = engine.crash
+    except Exception:
+        crash = traceback.format_exc()
+    
+    if crash:
+        path = crash_corpus.record('ai_winrate_test', seed, player_names, ai_types,
+                                   crash, engine.gs if engine else None)
+        print(f"  Crash in game {game_num + 1} (seed {seed}): {error_signature(crash)} -> {path}")
+        return GAME_FAILED
+    
+    # Determine winner
+    winner = next((p for p in engine.gs.players if p.trunks > 0), None)
+    if winner:
+        return ai_types[engine.gs.players.index(winner)]
+    return None
+
+
+def replay_crash(record):
+    """Re-run a crash recorded by _play_game; returns the traceback, or None if the game finished"""
+    random.seed(record['seed'])
+    engine = create_engine(record['player_names'], *record['ai_types'])
+    with redirect_stdout(io.StringIO()):
+        engine.run_game()
+    return engine.crash
+
+
+def test_ai_matchup(ai1_type, ai2_type, num_games=20, adaptive=False, target_half_width=0.05, min_games=10,
+                    seed=None):
+    """Test a specific AI matchup
+    
+    Game i is played on seed + i (a random base seed if none is given). Crashed
+    games are recorded in the crash corpus and left out of the results.
+    
+    With adaptive=True, num_games is an upper bound: the matchup stops as soon as
+    the Wilson interval on ai1's win rate (widened for the number of looks, see
+    match_stats) excludes 50%, or the 95% interval is narrower than
+    +/- target_half_width.
+    """
     wins = {ai1_type: 0, ai2_type: 0, 'draws': 0}
+    tracker = MatchupTracker(ai1_type, ai2_type, target_half_width=target_half_width,
+                             min_games=min_games, max_games=num_games)
     
-    print(f"\nTesting {ai1_type.upper()} vs {ai2_type.upper()} ({num_games} games)...")
+    if seed is None:
+        seed = random.randrange(2**31)
+    limit = f"adaptive, up to {num_games}" if adaptive else f"{num_games}"
+    print(f"\nTesting {ai1_type.upper()} vs {ai2_type.upper()} ({limit} games, seeds from {seed})...")
     
     for game_num in range(num_games):
-        # Alternate who goes first
-        if game_num % 2 == 0:
-            player_names = [f"{ai1_type.upper()}_1", f"{ai2_type.upper()}_2"]
-            first_ai = ai1_type
-            second_ai = ai2_type
-        else:
-            player_names = [f"{ai2_type.upper()}_1", f"{ai1_type.upper()}_2"]
-            first_ai = ai2_type
-            second_ai = ai1_type
+        winner_ai = _play_game(ai1_type, ai2_type, game_num, seed + game_num)
+        tracker.record(winner_ai)
+        if winner_ai != GAME_FAILED:
+            wins[winner_ai if winner_ai else 'draws'] += 1
         
-        try:
-            # Create silent game engine with 'hard' as default
-            engine = SilentGameEngine(player_names, ai_difficulty='hard')
-            
-            # Import all AI types
-            from ai import EasyAI, MediumAI, HardAI, ExpertAI
-            
-            # Set up first AI
-            if first_ai == 'easy':
-                engine.ai_strategies[0] = EasyAI()
-            elif first_ai == 'medium':
-                engine.ai_strategies[0] = MediumAI()
-            elif first_ai == 'hard':
-                engine.ai_strategies[0] = HardAI()
-            elif first_ai == 'expert':
-                engine.ai_strategies[0] = ExpertAI()
-            
-            # Set up second AI
-            if second_ai == 'easy':
-                engine.ai_strategies[1] = EasyAI()
-            elif second_ai == 'medium':
-                engine.ai_strategies[1] = MediumAI()
-            elif second_ai == 'hard':
-                engine.ai_strategies[1] = HardAI()
-            elif second_ai == 'expert':
-                engine.ai_strategies[1] = ExpertAI()
-            
-            # Set engine references
-            if 0 in engine.ai_strategies:
-                engine.ai_strategies[0].engine = engine
-            if 1 in engine.ai_strategies:
-                engine.ai_strategies[1].engine = engine
-            
-            # Run the game
-            engine.run_game()
-            
-            # Determine winner
-            winner = next((p for p in engine.gs.players if p.trunks > 0), None)
-            if winner:
-                if winner == engine.gs.players[0]:
-                    wins[first_ai] += 1
-                else:
-                    wins[second_ai] += 1
-            else:
-                wins['draws'] += 1
-                
-            # Progress update
-            if (game_num + 1) % 5 == 0:
-                print(f"  Progress: {game_num + 1}/{num_games} - "
-                      f"{ai1_type}: {wins[ai1_type]}, {ai2_type}: {wins[ai2_type]}")
-                
-        except Exception as e:
-            print(f"  Error in game {game_num + 1}: {str(e)}")
-            continue
+        # Progress update
+        if (game_num + 1) % 5 == 0:
+            print(f"  Progress: {game_num + 1}/{num_games} - "
+                  f"{ai1_type}: {wins[ai1_type]}, {ai2_type}: {wins[ai2_type]}")
+        
+        if adaptive and tracker.is_done():
+            print(f"  Stopped early: {tracker.summary()}")
+            break
     
     # Calculate win rates
-    if num_games > 0:
-        ai1_rate = wins[ai1_type] / num_games * 100
-        ai2_rate = wins[ai2_type] / num_games * 100
-        draw_rate = wins['draws'] / num_games * 100
+    games_played = tracker.games
+    if games_played > 0:
+        ai1_rate = wins[ai1_type] / games_played * 100
+        ai2_rate = wins[ai2_type] / games_played * 100
+        draw_rate = wins['draws'] / games_played * 100
+        low, high = tracker.interval
         
         print(f"\nResults:")
-        print(f"  {ai1_type.upper()}: {wins[ai1_type]}/{num_games} ({ai1_rate:.1f}%)")
-        print(f"  {ai2_type.upper()}: {wins[ai2_type]}/{num_games} ({ai2_rate:.1f}%)")
-        print(f"  Draws: {wins['draws']}/{num_games} ({draw_rate:.1f}%)")
+        print(f"  {ai1_type.upper()}: {wins[ai1_type]}/{games_played} ({ai1_rate:.1f}%, 95% CI {low:.1%}-{high:.1%})")
+        print(f"  {ai2_type.upper()}: {wins[ai2_type]}/{games_played} ({ai2_rate:.1f}%)")
+        print(f"  Draws: {wins['draws']}/{games_played} ({draw_rate:.1f}%)")
+    if tracker.failures:
+        print(f"  Crashed: {tracker.failures} game(s), not counted")
+    crash_corpus.report_summary()
     
     return wins
 
 
-def run_all_matchups(games_per_matchup=10):
-    """Run all AI matchups"""
+def run_all_matchups(games_per_matchup=10, adaptive=False, target_half_width=0.05, min_games=10, seed=None):
+    """Run all AI matchups
+    
+    Every matchup plays game i on seed + i (a random base seed if none is
+    given), so all matchups see the same decks.
+    
+    With adaptive=True the whole run shares a budget of games_per_matchup games
+    per matchup. Each matchup stops early once its result is clear, and the games
+    it saves go to the matchups that are still close.
+    """
     ai_types = ['easy', 'medium', 'hard', 'expert']
     all_results = defaultdict(lambda: defaultdict(int))
+    all_games = defaultdict(lambda: defaultdict(lambda: games_per_matchup))
+    trackers = []
+    if seed is None:
+        seed = random.randrange(2**31)
     
     print("="*60)
-    print("AI WIN RATE TEST")
+    print("AI WIN RATE TEST" + (" (ADAPTIVE)" if adaptive else ""))
     print("="*60)
     
-    # Test each combination
-    for i, ai1 in enumerate(ai_types):
-        for j, ai2 in enumerate(ai_types):
-            if ai1 != ai2:  # Skip mirror matches - they don't provide useful data
-                results = test_ai_matchup(ai1, ai2, games_per_matchup)
-                
-                # Store results
-                all_results[ai1][ai2] = results[ai1]
-                all_results[ai2][ai1] = results[ai2]
+    if adaptive:
+        # Each game already alternates seats, so one tracker per unordered pair is enough
+        trackers = [MatchupTracker(ai1, ai2, target_half_width=target_half_width, min_games=min_games)
+                    for i, ai1 in enumerate(ai_types) for ai2 in ai_types[i + 1:]]
+        budget = games_per_matchup * len(ai_types) * (len(ai_types) - 1)
+        
+        def report_progress(tracker):
+            if tracker.is_done():
+                print(f"  Done: {tracker.summary()}")
+        
+        played = run_sequential(trackers, lambda t, n: _play_game(t.ai1, t.ai2, n, seed + n), budget,
+                                on_game=report_progress)
+        print(f"\nUsed {played}/{budget} games (seeds from {seed})")
+        crash_corpus.report_summary()
+        
+        for tracker in trackers:
+            print(f"  {tracker.summary()}")
+            all_results[tracker.ai1][tracker.ai2] = tracker.wins[tracker.ai1]
+            all_results[tracker.ai2][tracker.ai1] = tracker.wins[tracker.ai2]
+            all_games[tracker.ai1][tracker.ai2] = all_games[tracker.ai2][tracker.ai1] = tracker.games
+    else:
+        # Test each combination
+        for i, ai1 in enumerate(ai_types):
+            for j, ai2 in enumerate(ai_types):
+                if ai1 != ai2:  # Skip mirror matches - they don't provide useful data
+                    results = test_ai_matchup(ai1, ai2, games_per_matchup, seed=seed)
+                    
+                    # Store results; crashed games are not in them
+                    all_results[ai1][ai2] = results[ai1]
+                    all_results[ai2][ai1] = results[ai2]
+                    all_games[ai1][ai2] = all_games[ai2][ai1] = sum(results.values())
     
     # Calculate overall win rates
     print("\n" + "="*60)
@@ -128,7 +187,7 @@ def run_all_matchups(games_per_matchup=10):
         for opponent in ai_types:
             if ai != opponent:
                 total_wins += all_results[ai][opponent]
-                total_games += games_per_matchup
+                total_games += all_games[ai][opponent]
         
         if total_games > 0:
             win_rate = total_wins / total_games * 100
@@ -141,7 +200,11 @@ def run_all_matchups(games_per_matchup=10):
     with open(filename, 'w') as f:
         f.write("AI Win Rate Test Results\n")
         f.write(f"Generated: {datetime.now()}\n")
-        f.write(f"Games per matchup: {games_per_matchup}\n\n")
+        if adaptive:
+            f.write(f"Mode: adaptive (budget {games_per_matchup} games per matchup, "
+                    f"target +/-{target_half_width:.0%}, min {min_games} games)\n\n")
+        else:
+            f.write(f"Games per matchup: {games_per_matchup}\n\n")
         
         # Win matrix
         f.write("Win Matrix (row beats column):\n")
@@ -156,28 +219,49 @@ def run_all_matchups(games_per_matchup=10):
                 wins = all_results[ai1][ai2]
                 f.write(f"{wins:>8}")
             f.write("\n")
+        
+        if trackers:
+            f.write("\nWin rates with 95% confidence intervals:\n")
+            for tracker in trackers:
+                f.write(f"  {tracker.summary()}\n")
     
     print(f"\nResults saved to: {filename}")
 
 
 def main():
+    # --adaptive: stop each matchup early once its result is clear
+    # --precision P: the interval half-width that counts as clear (0 < P < 0.5)
+    adaptive = '--adaptive' in sys.argv
+    if adaptive:
+        sys.argv.remove('--adaptive')
+    precision = 0.05
+    if '--precision' in sys.argv:
+        flag_index = sys.argv.index('--precision')
+        try:
+            precision = float(sys.argv[flag_index + 1])
+        except (IndexError, ValueError):
+            sys.exit("--precision needs a number, e.g. --precision 0.03")
+        if not 0 < precision < 0.5:
+            sys.exit(f"--precision must be between 0 and 0.5, got {precision}")
+        del sys.argv[flag_index:flag_index + 2]
+    
     if len(sys.argv) > 2:
         # Test specific matchup
         ai1 = sys.argv[1]
         ai2 = sys.argv[2]
         games = int(sys.argv[3]) if len(sys.argv) > 3 else 20
-        test_ai_matchup(ai1, ai2, games)
+        test_ai_matchup(ai1, ai2, games, adaptive=adaptive, target_half_width=precision)
     elif len(sys.argv) > 1:
         # Run all matchups with specified games
         games = int(sys.argv[1])
-        run_all_matchups(games)
+        run_all_matchups(games, adaptive=adaptive, target_half_width=precision)
     else:
         # Default: quick test
         print("Usage:")
-        print("  python ai_winrate_test.py [games_per_matchup]")
-        print("  python ai_winrate_test.py ai1 ai2 [num_games]")
+        print("  python ai_winrate_test.py [games_per_matchup] [--adaptive [--precision P]]")
+        print("  python ai_winrate_test.py ai1 ai2 [num_games] [--adaptive [--precision P]]")
         print("\nRunning quick test with 5 games per matchup...")
-        run_all_matchups(5)
+        run_all_matchups(5, adaptive=adaptive, target_half_width=precision)
 
 
 if __name__ == "__main__":
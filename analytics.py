@@ -9,31 +9,38 @@ import os
 import sys
 import argparse
 from datetime import datetime
-from collections import defaultdict
 import random
+import traceback
 from typing import Dict, List, Tuple, Any
 from contextlib import redirect_stdout
 import io
 
 # Import game components
 from elephants_prototype import GameEngine, GameState, DashboardDisplay
-from ai import EasyAI, MediumAI, HardAI, ExpertAI
-from game_logger import game_logger
+from ai import EasyAI, MediumAI, HardAI, ExpertAI, ValueAI
+from ai.trace import OFF, DecisionTrace, parse_level
+from game_logger import GameLogger
+from crash_corpus import CrashCorpus, error_signature
+from analytics_pipeline import default_pipeline, format_snapshot
+from rating_ladder import DEFAULT_DB, RatingLadder
+
+TRACE_DIR = 'decision_traces'
 
 
 class SilentGameEngine(GameEngine):
     """Game engine that doesn't pause for AI games"""
     
-    def __init__(self, player_names, ai_difficulty='hard'):
+    def __init__(self, player_names, ai_difficulty='hard', logger=None):
         """Initialize without any prompts"""
         # Initialize game state directly without prompting
+        self.logger = logger if logger is not None else GameLogger()
         self.gs = GameState(player_names)
         self.ai_strategies = {}
         self.display = DashboardDisplay()
         self.ai_difficulty = ai_difficulty
         self.condition_checker = None  # Will be set properly below
         self.action_handler = None  # Will be set properly below
-        self.ai_decision_logs = []
+        self.decision_trace = DecisionTrace()
         
         # Import these here to avoid circular imports
         from elephants_prototype import ConditionChecker, ActionHandler
@@ -59,70 +66,100 @@ class SilentGameEngine(GameEngine):
         return super()._prompt_for_choice(player, options, prompt_message, view_key)
 
 
+AI_CLASSES = {'easy': EasyAI, 'medium': MediumAI, 'hard': HardAI, 'expert': ExpertAI, 'value': ValueAI}
+
+
+def create_engine(player_names, ai1_type, ai2_type, logger=None, trace=None):
+    """Build a silent AI-vs-AI engine
+    
+    Each AI is a type name (unknown names default to HardAI) or a ready-made
+    AI instance, e.g. an ExpertAI with custom weights. logger defaults to a
+    fresh GameLogger; pass a NullGameLogger when the game log is not needed.
+    trace is a DecisionTrace to record the AIs' reasoning in (default: off).
+    """
+    difficulty = ai1_type if isinstance(ai1_type, str) else type(ai1_type).__name__.replace('AI', '').lower()
+    engine = SilentGameEngine(player_names, ai_difficulty=difficulty, logger=logger)
+    if trace is not None:
+        engine.decision_trace = trace
+    
+    for i, ai_type in enumerate([ai1_type, ai2_type]):
+        # Set both players as AI
+        engine.gs.players[i].is_human = False
+        engine.ai_strategies[i] = AI_CLASSES.get(ai_type, HardAI)() if isinstance(ai_type, str) else ai_type
+        if hasattr(engine.ai_strategies[i], 'engine'):
+            engine.ai_strategies[i].engine = engine
+    
+    return engine
+
+
+def replay_crash(record):
+    """Re-run a crash recorded by run_games; returns the traceback, or None if the game finished"""
+    random.seed(record['seed'])
+    engine = create_engine(record['player_names'], *record['ai_types'])
+    with redirect_stdout(io.StringIO()):
+        engine.run_game()
+    return engine.crash
+
+
 class UnifiedAnalytics:
-    def __init__(self):
+    def __init__(self, crash_dir: str = "crash_corpus", stream: bool = False, snapshot_every: int = 0,
+                 rating_db: str = None, trace_level: int = OFF, trace_dir: str = TRACE_DIR):
+        """
+        Args:
+            crash_dir: Where crashed games are recorded
+            rating_db: Rating ladder database every finished game is added to (None = off);
+                call close() when done
+            stream: Aggregate each game as it finishes instead of keeping every log in
+                self.game_logs, so memory stays flat however many games are run
+            snapshot_every: In stream mode, print a snapshot report every N games (0 = never)
+            trace_level: Record the AIs' decision trace at this level and write one
+                JSON file per game to trace_dir (OFF = no trace)
+        """
+        self.trace_level = trace_level
+        self.trace_dir = trace_dir
         self.game_logs = []
+        self.pipeline = default_pipeline() if stream else None
+        self.snapshot_every = snapshot_every
+        self.ladder = RatingLadder(rating_db) if rating_db else None
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.report_lines = []
+        self.crash_corpus = CrashCorpus(crash_dir)
+        self.failed_games = 0
         
-    def run_games(self, num_games: int, ai1_type: str = 'hard', ai2_type: str = 'hard', silent: bool = True) -> None:
-        """Run specified number of games and collect analytics"""
+    def close(self) -> None:
+        if self.ladder:
+            self.ladder.close()
+            self.ladder = None
+    
+    def run_games(self, num_games: int, ai1_type: str = 'hard', ai2_type: str = 'hard', silent: bool = True,
+                  seed: int = None) -> None:
+        """Run specified number of games and collect analytics
+        
+        Game i is played on seed + i (a random base seed if none is given), so
+        any crash can be replayed from its record in the crash corpus.
+        """
+        if seed is None:
+            seed = random.randrange(2**31)
         print(f"\n{'='*60}")
-        print(f"Running {num_games} games: {ai1_type} vs {ai2_type}")
+        print(f"Running {num_games} games: {ai1_type} vs {ai2_type} (seeds {seed}..{seed + num_games - 1})")
         print(f"{'='*60}")
         
+        # Make sure player names are unique even if same AI type
+        if ai1_type == ai2_type:
+            player_names = [f"{ai1_type.upper()}_AI_1", f"{ai2_type.upper()}_AI_2"]
+        else:
+            player_names = [f"{ai1_type.upper()}_AI", f"{ai2_type.upper()}_AI"]
+        
         for i in range(num_games):
             if not silent and i % 10 == 0:
                 print(f"Progress: {i}/{num_games} games completed...")
             
-            # Clear any existing game data
-            game_logger.reset()
-            
-            # Run a game
-            # Make sure player names are unique even if same AI type
-            if ai1_type == ai2_type:
-                player_names = [f"{ai1_type.upper()}_AI_1", f"{ai2_type.upper()}_AI_2"]
-            else:
-                player_names = [f"{ai1_type.upper()}_AI", f"{ai2_type.upper()}_AI"]
-            engine = SilentGameEngine(player_names, ai_difficulty=ai1_type)
-            
-            # Set both players as AI
-            engine.gs.players[0].is_human = False
-            engine.gs.players[1].is_human = False
-            
-            # Set AI strategies for both players
-            # Player 1
-            if ai1_type == 'easy':
-                engine.ai_strategies[0] = EasyAI()
-            elif ai1_type == 'medium':
-                engine.ai_strategies[0] = MediumAI()
-            elif ai1_type == 'hard':
-                engine.ai_strategies[0] = HardAI()
-            elif ai1_type == 'expert':
-                engine.ai_strategies[0] = ExpertAI()
-            else:
-                engine.ai_strategies[0] = HardAI()  # Default
-            
-            if hasattr(engine.ai_strategies[0], 'engine'):
-                engine.ai_strategies[0].engine = engine
-                
-            # Player 2
-            if ai2_type == 'easy':
-                engine.ai_strategies[1] = EasyAI()
-            elif ai2_type == 'medium':
-                engine.ai_strategies[1] = MediumAI()
-            elif ai2_type == 'hard':
-                engine.ai_strategies[1] = HardAI()
-            elif ai2_type == 'expert':
-                engine.ai_strategies[1] = ExpertAI()
-            else:
-                engine.ai_strategies[1] = HardAI()  # Default
-            
-            if hasattr(engine.ai_strategies[1], 'engine'):
-                engine.ai_strategies[1].engine = engine
-            
-            # Run the game (suppress output if silent)
+            game_seed = seed + i
+            random.seed(game_seed)
+            engine = None
+            trace = DecisionTrace(self.trace_level) if self.trace_level < OFF else None
             try:
+                engine = create_engine(player_names, ai1_type, ai2_type, trace=trace)
                 if silent:
                     # Redirect stdout to suppress game output
                     f = io.StringIO()
@@ -130,16 +167,36 @@ class UnifiedAnalytics:
                         engine.run_game()
                 else:
                     engine.run_game()
-            except Exception as e:
+                # run_game reports its own errors instead of raising
+                crash = engine.crash
+            except Exception:
+                crash = traceback.format_exc()
+            
+            if trace and engine:
+                os.makedirs(self.trace_dir, exist_ok=True)
+                trace.export(os.path.join(self.trace_dir, f"{engine.logger.game_id or f'seed_{game_seed}'}.json"))
+            
+            if crash:
+                self.failed_games += 1
+                path = self.crash_corpus.record('analytics', game_seed, player_names, [ai1_type, ai2_type],
+                                                crash, engine.gs if engine else None)
                 if not silent:
-                    print(f"Error in game {i+1}: {e}")
+                    print(f"Error in game {i+1} (seed {game_seed}): {error_signature(crash)} -> {path}")
                 continue
             
+            if self.ladder:
+                self.ladder.record_engine(engine, [ai1_type, ai2_type], 'analytics', game_seed)
+            
             # Collect the game log
-            if game_logger.current_game:
-                self.game_logs.append(game_logger.current_game)
+            if engine.logger.current_game:
+                if self.pipeline:
+                    self._stream_game(engine.logger.current_game)
+                else:
+                    self.game_logs.append(engine.logger.current_game)
         
-        print(f"\nCompleted {len(self.game_logs)} games successfully!")
+        completed = self.pipeline.games_seen if self.pipeline else len(self.game_logs)
+        print(f"\nCompleted {completed} games successfully!")
+        self.crash_corpus.report_summary()
     
     def run_tournament(self, games_per_matchup: int = 20) -> None:
         """Run a full tournament between all AI types"""
@@ -154,8 +211,29 @@ class UnifiedAnalytics:
                 print(f"\n{ai1.upper()} vs {ai2.upper()}:")
                 self.run_games(games_per_matchup, ai1, ai2)
     
+    def _stream_game(self, game: Dict[str, Any]) -> None:
+        """Aggregate one finished game and print a snapshot when one is due"""
+        self.pipeline.feed(game)
+        if self.snapshot_every and self.pipeline.games_seen % self.snapshot_every == 0:
+            print(format_snapshot(self._streamed_analysis()))
+    
+    def _streamed_analysis(self) -> Dict[str, Any]:
+        analysis = {'total_games': self.pipeline.games_seen}
+        analysis.update(self.pipeline.results())
+        return analysis
+    
     def analyze_games(self) -> Dict[str, Any]:
         """Comprehensive analysis of all game logs"""
+        if self.pipeline:
+            # Streaming runs were aggregated as they went; there are no logs to rescan
+            if not self.pipeline.games_seen:
+                print("No games to analyze!")
+                return {}
+            analysis = self._streamed_analysis()
+            analysis['balance_issues'] = self._detect_balance_issues(analysis['element_stats'],
+                                                                     analysis['spell_stats'])
+            return analysis
+        
         if not self.game_logs:
             print("No game logs to analyze!")
             return {}
@@ -164,474 +242,18 @@ class UnifiedAnalytics:
         with open('game_logs.json', 'w') as f:
             json.dump(self.game_logs, f)
         
-        analysis = {
-            'total_games': len(self.game_logs),
-            'element_stats': self._analyze_elements(),
-            'spell_stats': self._analyze_spells(),
-            'game_stats': self._analyze_game_metrics(),
-            'action_stats': self._analyze_actions(),
-            'conjury_stats': self._analyze_conjuries(),
-            'theme_stats': self._analyze_themes(),
-            'playstyle_stats': self._analyze_playstyles(),
-            'trunk_survival': self._analyze_trunk_survival(),
-            'trunk_destroyers': self._analyze_trunk_destroyers(),
-            'response_effectiveness': self._analyze_response_spells(),
-            'balance_issues': self._detect_balance_issues()
-        }
+        # One pass over all events feeds every analysis
+        analysis = {'total_games': len(self.game_logs)}
+        analysis.update(default_pipeline().run(self.game_logs))
+        analysis['balance_issues'] = self._detect_balance_issues(analysis['element_stats'], analysis['spell_stats'])
         
         return analysis
     
-    def _analyze_elements(self) -> Dict[str, Any]:
-        """Analyze element performance and win rates"""
-        element_wins = defaultdict(int)
-        element_games = defaultdict(int)
-        element_damage = defaultdict(list)
-        element_healing = defaultdict(list)
-        element_selections = defaultdict(int)  # Track how often each element is selected
-        
-        for game in self.game_logs:
-            winner = game.get('winner')
-            
-            # Track all elements that participated in this game
-            for player, elements in game['player_elements'].items():
-                for element in elements:
-                    element_games[element] += 1
-                    element_selections[element] += 1  # Count each selection
-                    # Only count wins if this player won
-                    if player == winner:
-                        element_wins[element] += 1
-            
-            # Track damage/healing by element
-            for event in game.get('events', []):
-                if event['type'] == 'damage_dealt':
-                    element = event.get('element', 'Unknown')
-                    damage = event.get('amount', 0)
-                    if element and damage > 0:
-                        element_damage[element].append(damage)
-                elif event['type'] == 'healing_done':
-                    element = event.get('element', 'Unknown')
-                    heal = event.get('amount', 0)
-                    if element and heal > 0:
-                        element_healing[element].append(heal)
-        
-        # Calculate win rates
-        element_win_rates = {}
-        for element in element_games:
-            if element_games[element] > 0:
-                # Win rate is wins / total games played with that element
-                element_win_rates[element] = element_wins[element] / element_games[element]
-        
-        # Calculate category win rates
-        category_win_rates = self._calculate_category_win_rates(element_win_rates)
-        
-        return {
-            'win_rates': element_win_rates,
-            'category_win_rates': category_win_rates,
-            'total_games': element_games,
-            'wins': element_wins,
-            'selections': dict(element_selections),
-            'avg_damage': {e: sum(dmg)/len(dmg) if dmg else 0 for e, dmg in element_damage.items()},
-            'avg_healing': {e: sum(heal)/len(heal) if heal else 0 for e, heal in element_healing.items()}
-        }
-    
-    def _calculate_category_win_rates(self, element_win_rates: Dict[str, float]) -> Dict[str, float]:
-        """Calculate average win rates by element category"""
-        import json
-        import os
-        
-        # Load element categories
-        try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            categories_path = os.path.join(current_dir, 'element_categories.json')
-            with open(categories_path, 'r') as f:
-                categories_data = json.load(f)
-        except:
-            return {}
-        
-        category_win_rates = {}
-        
-        for category_name, category_info in categories_data.get('categories', {}).items():
-            elements = category_info.get('elements', [])
-            
-            # Get win rates for elements in this category
-            category_rates = []
-            for element in elements:
-                if element in element_win_rates:
-                    category_rates.append(element_win_rates[element])
-            
-            # Calculate average win rate for the category
-            if category_rates:
-                category_win_rates[category_name] = sum(category_rates) / len(category_rates)
-            else:
-                category_win_rates[category_name] = 0.0
-        
-        return category_win_rates
-    
-    def _analyze_spells(self) -> Dict[str, Any]:
-        """Analyze individual spell performance"""
-        spell_stats = defaultdict(lambda: {
-            'times_played': 0,
-            'total_damage': 0,
-            'total_damage_weighted': 0,
-            'total_healing': 0,
-            'total_healing_weighted': 0,
-            'total_weaken': 0,
-            'total_bolster': 0,
-            'times_advanced': 0,
-            'times_cancelled': 0,
-            'element': None
-        })
-        
-        for game in self.game_logs:
-            for event in game.get('events', []):
-                if event['type'] == 'spell_played':
-                    spell_name = event.get('spell', event.get('spell_name', 'Unknown'))
-                    spell_stats[spell_name]['times_played'] += 1
-                    spell_stats[spell_name]['element'] = event.get('element', 'Unknown')
-                
-                elif event['type'] == 'damage_dealt':
-                    spell_name = event.get('spell', event.get('spell_name', 'Unknown'))
-                    if spell_name:
-                        spell_stats[spell_name]['total_damage'] += event.get('amount', 0)
-                        spell_stats[spell_name]['total_damage_weighted'] += event.get('amount', 0)
-                
-                elif event['type'] == 'weaken_dealt':
-                    spell_name = event.get('spell', event.get('spell_name', 'Unknown'))
-                    if spell_name:
-                        spell_stats[spell_name]['total_weaken'] += event.get('amount', 0)
-                        # Weighted: weaken counts as 2x damage
-                        spell_stats[spell_name]['total_damage_weighted'] += event.get('amount', 0) * 2
-                
-                elif event['type'] == 'healing_done':
-                    spell_name = event.get('spell', event.get('spell_name', 'Unknown'))
-                    if spell_name:
-                        spell_stats[spell_name]['total_healing'] += event.get('amount', 0)
-                        spell_stats[spell_name]['total_healing_weighted'] += event.get('amount', 0)
-                
-                elif event['type'] == 'bolster_done':
-                    spell_name = event.get('spell', event.get('spell_name', 'Unknown'))
-                    if spell_name:
-                        spell_stats[spell_name]['total_bolster'] += event.get('amount', 0)
-                        # Weighted: bolster counts as 2x healing
-                        spell_stats[spell_name]['total_healing_weighted'] += event.get('amount', 0) * 2
-                
-                elif event['type'] == 'spell_advanced':
-                    # Need to track which spell advanced
-                    for played_event in game.get('events', []):
-                        if played_event['type'] == 'spell_played' and played_event.get('clash') == event.get('clash'):
-                            if played_event.get('player') == event.get('player'):
-                                spell_stats[played_event['spell_name']]['times_advanced'] += 1
-                                break
-                
-                elif event['type'] == 'spell_cancelled':
-                    # Track cancellations
-                    pass  # TODO: Need to track which spell was cancelled
-        
-        # Calculate averages
-        spell_analysis = {}
-        for spell, stats in spell_stats.items():
-            if stats['times_played'] > 0:
-                spell_analysis[spell] = {
-                    'element': stats['element'],
-                    'times_played': stats['times_played'],
-                    'avg_damage': stats['total_damage'] / stats['times_played'],
-                    'avg_damage_weighted': stats['total_damage_weighted'] / stats['times_played'],
-                    'max_damage': stats['total_damage'],  # TODO: Track actual max
-                    'avg_healing': stats['total_healing'] / stats['times_played'],
-                    'avg_healing_weighted': stats['total_healing_weighted'] / stats['times_played'],
-                    'avg_weaken': stats['total_weaken'] / stats['times_played'],
-                    'avg_bolster': stats['total_bolster'] / stats['times_played'],
-                    'advance_rate': stats['times_advanced'] / stats['times_played']
-                }
-        
-        return spell_analysis
-    
-    def _analyze_game_metrics(self) -> Dict[str, Any]:
-        """Analyze overall game metrics"""
-        total_rounds = []
-        game_lengths = []
-        
-        for game in self.game_logs:
-            total_rounds.append(game.get('total_rounds', 0))
-            # Calculate game length in terms of clashes
-            game_lengths.append(game.get('total_rounds', 0) * 4)  # 4 clashes per round
-        
-        return {
-            'avg_rounds': sum(total_rounds) / len(total_rounds) if total_rounds else 0,
-            'min_rounds': min(total_rounds) if total_rounds else 0,
-            'max_rounds': max(total_rounds) if total_rounds else 0,
-            'avg_clashes': sum(game_lengths) / len(game_lengths) if game_lengths else 0
-        }
-    
-    def _analyze_actions(self) -> Dict[str, Any]:
-        """Analyze action usage (advance, recall, cancel, move, discard, reveal)"""
-        action_counts = defaultdict(int)
-        
-        for game in self.game_logs:
-            for event in game.get('events', []):
-                event_type = event['type']
-                if event_type == 'spell_advanced':
-                    action_counts['advance'] += 1
-                elif event_type == 'spell_recalled':
-                    action_counts['recall'] += 1
-                elif event_type == 'spell_cancelled':
-                    action_counts['cancel'] += 1
-                elif event_type == 'spell_moved':
-                    action_counts['move'] += 1
-                elif event_type == 'spell_discarded':
-                    action_counts['discard'] += 1
-                elif event_type == 'spell_revealed':
-                    action_counts['reveal'] += 1
-                # Count damage/healing as actions too
-                elif event_type == 'damage_dealt':
-                    action_counts['damage'] += 1
-                elif event_type == 'healing_done':
-                    action_counts['heal'] += 1
-        
-        total_actions = sum(action_counts.values())
-        action_rates = {}
-        if total_actions > 0:
-            for action, count in action_counts.items():
-                action_rates[action] = count / total_actions
-        
-        return {
-            'counts': dict(action_counts),
-            'rates': action_rates,
-            'total': total_actions
-        }
-    
-    def _analyze_conjuries(self) -> Dict[str, Any]:
-        """Analyze conjury performance"""
-        conjury_played = 0
-        conjury_cancelled = 0
-        conjuries_by_spell = defaultdict(lambda: {'played': 0, 'cancelled': 0})
-        
-        # First pass: identify all conjury spells
-        conjury_spell_names = set()
-        for game in self.game_logs:
-            for event in game.get('events', []):
-                if event['type'] == 'spell_played' and event.get('is_conjury', False):
-                    spell_name = event.get('spell', event.get('spell_name'))
-                    conjury_spell_names.add(spell_name)
-        
-        # Second pass: count plays and cancellations
-        for game in self.game_logs:
-            for event in game.get('events', []):
-                if event['type'] == 'spell_played':
-                    spell_name = event.get('spell', event.get('spell_name'))
-                    if spell_name in conjury_spell_names:
-                        conjury_played += 1
-                        conjuries_by_spell[spell_name]['played'] += 1
-                
-                elif event['type'] == 'spell_cancelled':
-                    # The cancelled spell is in the 'spell' field
-                    cancelled_spell = event.get('spell')
-                    if cancelled_spell in conjury_spell_names:
-                        conjury_cancelled += 1
-                        conjuries_by_spell[cancelled_spell]['cancelled'] += 1
-        
-        # Calculate cancellation rates per spell
-        spell_cancel_rates = {}
-        for spell, stats in conjuries_by_spell.items():
-            if stats['played'] > 0:
-                spell_cancel_rates[spell] = stats['cancelled'] / stats['played']
-        
-        return {
-            'total_played': conjury_played,
-            'total_cancelled': conjury_cancelled,
-            'cancellation_rate': conjury_cancelled / conjury_played if conjury_played > 0 else 0,
-            'by_spell': dict(conjuries_by_spell),
-            'spell_cancel_rates': spell_cancel_rates
-        }
-    
-    def _analyze_themes(self) -> Dict[str, Any]:
-        """Analyze elephant theme effectiveness"""
-        # Map elephants to themes based on HOWTOPLAY.md
-        elephant_themes = {
-            'Elé Phlambé': 'offense',
-            'Spout Snout': 'defense',
-            'Dumblo': 'mobility',
-            'Columnfoot': 'control',
-            'Trunxie': 'growth',
-            'General Guardjendra': 'protection',
-            'Tick-tock Tusker': 'speed',
-            'Elephantus Infinitum': 'manipulation',
-            'Gold Dust': 'retaliation',
-            'Luna Doze': 'recuperation',
-            'Twinkle Tyke': 'momentum',
-            'Dawnotheridusk': 'choice',
-            'The Matriarch': 'preservation',
-            'Godesha': 'siphon',
-            'Toxic Tai': 'affliction',
-            'Onyx Oliphant': 'mimicry',
-            'Beelzebabar': 'sacrifice',
-            'Electrophantine': 'disruption',
-            'Rolling Rolo': 'disruption'
-        }
-        
-        theme_performance = defaultdict(lambda: {'games': 0, 'wins': 0})
-        
-        # TODO: Track elephant usage and success rates
-        
-        return theme_performance
-    
-    def _analyze_playstyles(self) -> Dict[str, Any]:
-        """Analyze aggressive vs analytical playstyles"""
-        playstyle_indicators = {
-            'aggressive': 0,
-            'defensive': 0,
-            'balanced': 0
-        }
-        
-        for game in self.game_logs:
-            # Count attack vs remedy spell usage
-            attack_count = 0
-            remedy_count = 0
-            
-            for event in game.get('events', []):
-                if event['type'] == 'spell_played':
-                    # TODO: Need spell type information in events
-                    pass
-            
-            # Classify based on ratios
-            # TODO: Implement classification logic
-        
-        return playstyle_indicators
-    
-    def _analyze_trunk_survival(self) -> Dict[str, Any]:
-        """Analyze how long trunks survive"""
-        trunk_lifetimes = []
-        trunk_losses_by_player = defaultdict(list)
-        
-        for game in self.game_logs:
-            for event in game.get('events', []):
-                if event['type'] == 'trunk_lost':
-                    player = event['player']
-                    lifetime = event.get('trunk_lifetime_rounds', 0)
-                    if lifetime > 0:
-                        trunk_lifetimes.append(lifetime)
-                        trunk_losses_by_player[player].append(lifetime)
-        
-        # Calculate statistics
-        avg_lifetime = sum(trunk_lifetimes) / len(trunk_lifetimes) if trunk_lifetimes else 0
-        min_lifetime = min(trunk_lifetimes) if trunk_lifetimes else 0
-        max_lifetime = max(trunk_lifetimes) if trunk_lifetimes else 0
-        
-        # Calculate per-player averages
-        player_avg_lifetimes = {}
-        for player, lifetimes in trunk_losses_by_player.items():
-            if lifetimes:
-                player_avg_lifetimes[player] = sum(lifetimes) / len(lifetimes)
-        
-        return {
-            'avg_trunk_lifetime_rounds': avg_lifetime,
-            'min_trunk_lifetime': min_lifetime,
-            'max_trunk_lifetime': max_lifetime,
-            'total_trunk_losses': len(trunk_lifetimes),
-            'player_averages': player_avg_lifetimes
-        }
-    
-    def _analyze_trunk_destroyers(self) -> Dict[str, Any]:
-        """Analyze which spells are most likely to destroy trunks"""
-        trunk_destroyers = defaultdict(int)
-        damage_before_trunk_loss = defaultdict(list)
-        
-        for game in self.game_logs:
-            recent_damage_events = []  # Track recent damage events
-            
-            for event in game.get('events', []):
-                # Track damage events
-                if event['type'] == 'damage_dealt':
-                    recent_damage_events.append({
-                        'spell': event.get('spell', event.get('spell_name', 'Unknown')),
-                        'target': event.get('target_player'),  # Use target_player field
-                        'amount': event.get('amount', 0),
-                        'timestamp': event.get('timestamp')
-                    })
-                    # Keep only last 10 damage events
-                    recent_damage_events = recent_damage_events[-10:]
-                
-                # When a trunk is lost, attribute it to recent damage
-                elif event['type'] == 'trunk_lost':
-                    lost_player = event.get('player')
-                    
-                    # Find damage that killed this player
-                    for damage_event in reversed(recent_damage_events):
-                        if damage_event['target'] == lost_player:
-                            spell_name = damage_event['spell']
-                            trunk_destroyers[spell_name] += 1
-                            damage_before_trunk_loss[spell_name].append(damage_event['amount'])
-                            break  # Only credit the killing blow
-        
-        # Calculate statistics
-        trunk_destroyer_stats = {}
-        for spell, count in trunk_destroyers.items():
-            avg_damage = sum(damage_before_trunk_loss[spell]) / len(damage_before_trunk_loss[spell]) if damage_before_trunk_loss[spell] else 0
-            trunk_destroyer_stats[spell] = {
-                'trunk_kills': count,
-                'avg_damage_for_kill': avg_damage
-            }
-        
-        return trunk_destroyer_stats
-    
-    def _analyze_response_spells(self) -> Dict[str, Any]:
-        """Analyze how often response spell conditions are met using logged condition evaluations"""
-        response_spell_stats = defaultdict(lambda: {'played': 0, 'condition_met': 0})
-        
-        # Identify response spells from spell data
-        import json
-        import os
-        response_spells = set()
-        try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            spells_path = os.path.join(current_dir, 'spells.json')
-            with open(spells_path, 'r') as f:
-                spell_data = json.load(f)
-                for spell in spell_data:
-                    if 'response' in spell.get('spell_types', []):
-                        response_spells.add(spell.get('card_name'))
-        except:
-            pass
-        
-        # Track response spell effectiveness using the logged condition evaluations
-        for game in self.game_logs:
-            response_spell_evaluations = defaultdict(lambda: {'evaluated': 0, 'met': 0})
-            
-            for event in game.get('events', []):
-                if event['type'] == 'response_condition_evaluated':
-                    # Count every evaluation - each clash is a separate opportunity
-                    spell_name = event.get('spell')
-                    condition_met = event.get('condition_met', False)
-                    
-                    if spell_name in response_spells:
-                        response_spell_evaluations[spell_name]['evaluated'] += 1
-                        if condition_met:
-                            response_spell_evaluations[spell_name]['met'] += 1
-            
-            # Add the evaluations to our stats
-            for spell_name, eval_stats in response_spell_evaluations.items():
-                response_spell_stats[spell_name]['played'] += eval_stats['evaluated']
-                response_spell_stats[spell_name]['condition_met'] += eval_stats['met']
-        
-        # Calculate effectiveness rates
-        response_effectiveness = {}
-        for spell, stats in response_spell_stats.items():
-            if stats['played'] > 0:
-                effectiveness = stats['condition_met'] / stats['played']
-                response_effectiveness[spell] = {
-                    'times_played': stats['played'],
-                    'times_triggered': stats['condition_met'],
-                    'effectiveness_rate': effectiveness
-                }
-        
-        return response_effectiveness
-    
-    def _detect_balance_issues(self) -> List[str]:
+    def _detect_balance_issues(self, element_stats: Dict[str, Any], spell_stats: Dict[str, Any]) -> List[str]:
         """Detect potential balance issues"""
         issues = []
         
         # Analyze element win rates
-        element_stats = self._analyze_elements()
         for element, win_rate in element_stats['win_rates'].items():
             if win_rate < 0.35:
                 issues.append(f"{element} appears underpowered (win rate: {win_rate:.1%})")
@@ -639,7 +261,6 @@ class UnifiedAnalytics:
                 issues.append(f"{element} appears overpowered (win rate: {win_rate:.1%})")
         
         # Analyze spell usage
-        spell_stats = self._analyze_spells()
         total_plays = sum(s['times_played'] for s in spell_stats.values())
         avg_plays = total_plays / len(spell_stats) if spell_stats else 0
         
@@ -725,6 +346,14 @@ class UnifiedAnalytics:
         for spell, stats in healing_spells[:10]:
             self._add_line(f"  {spell:20} ({stats['element']:10}) - {stats['avg_healing']:5.2f} healing")
         
+        # Advances per play can exceed 1: a spell may advance several times after one cast
+        advancing_spells = [(s, stats) for s, stats in spell_stats.items() if stats['advances_per_play'] > 0]
+        advancing_spells.sort(key=lambda x: x[1]['advances_per_play'], reverse=True)
+        
+        self._add_line("\nMost Advances per Play (can exceed 1; a spell may advance more than once per cast):")
+        for spell, stats in advancing_spells[:10]:
+            self._add_line(f"  {spell:20} ({stats['element']:10}) - {stats['advances_per_play']:5.2f} advances")
+        
         # Action Usage
         self._add_section("ACTION USAGE")
         action_stats = analysis['action_stats']
@@ -851,43 +480,60 @@ def main():
     parser.add_argument('mode', nargs='?', default='100', 
                        help='Number of games or mode (quick/tournament)')
     parser.add_argument('--games', type=int, help='Games per matchup for tournament')
-    parser.add_argument('--ai1', default='expert', choices=['easy', 'medium', 'hard', 'expert'])
-    parser.add_argument('--ai2', default='expert', choices=['easy', 'medium', 'hard', 'expert'])
+    parser.add_argument('--ai1', default='expert', choices=list(AI_CLASSES))
+    parser.add_argument('--ai2', default='expert', choices=list(AI_CLASSES))
     parser.add_argument('--silent', action='store_true', help='Suppress progress messages')
+    parser.add_argument('--seed', type=int, help='Base seed; game i is played on seed + i')
+    parser.add_argument('--ladder', nargs='?', const=DEFAULT_DB, metavar='DB',
+                        help=f'Add the games to the rating ladder (default database {DEFAULT_DB})')
+    parser.add_argument('--stream', action='store_true',
+                        help='Aggregate games as they finish (flat memory, no game_logs.json)')
+    parser.add_argument('--snapshot-every', type=int, default=100, metavar='N',
+                        help='With --stream, print a snapshot report every N games (default 100, 0 = off)')
+    parser.add_argument('--trace', default='off', metavar='LEVEL',
+                        help=f"Write each game's AI decision trace at LEVEL (debug/info/warning) to {TRACE_DIR}/")
     
     args = parser.parse_args()
+    try:
+        trace_level = parse_level(args.trace)
+    except ValueError as e:
+        parser.error(str(e))
     
-    analytics = UnifiedAnalytics()
+    analytics = UnifiedAnalytics(stream=args.stream, snapshot_every=args.snapshot_every,
+                                 rating_db=args.ladder, trace_level=trace_level)
     
-    # Determine mode
-    if args.mode == 'quick':
-        analytics.run_games(10, args.ai1, args.ai2, args.silent)
-    elif args.mode == 'tournament':
-        games_per_matchup = args.games or 20
-        analytics.run_tournament(games_per_matchup)
-    else:
-        try:
-            num_games = int(args.mode)
-            analytics.run_games(num_games, args.ai1, args.ai2, args.silent)
-        except ValueError:
-            print(f"Invalid mode: {args.mode}")
-            sys.exit(1)
+    try:
+        # Determine mode
+        if args.mode == 'quick':
+            analytics.run_games(10, args.ai1, args.ai2, args.silent, args.seed)
+        elif args.mode == 'tournament':
+            games_per_matchup = args.games or 20
+            analytics.run_tournament(games_per_matchup)
+        else:
+            try:
+                num_games = int(args.mode)
+                analytics.run_games(num_games, args.ai1, args.ai2, args.silent, args.seed)
+            except ValueError:
+                print(f"Invalid mode: {args.mode}")
+                sys.exit(1)
     
-    # Analyze and report
-    print("\nAnalyzing games...")
-    analysis = analytics.analyze_games()
+        # Analyze and report
+        print("\nAnalyzing games...")
+        analysis = analytics.analyze_games()
     
-    print("Generating report...")
-    analytics.generate_report(analysis)
+        print("Generating report...")
+        analytics.generate_report(analysis)
     
-    # Display and save
-    analytics.display_report()
-    filename = analytics.save_report()
+        # Display and save
+        analytics.display_report()
+        filename = analytics.save_report()
     
-    # Save win rate data for AI
-    analytics.save_win_rates(analysis)
+        # Save win rate data for AI
+        analytics.save_win_rates(analysis)
     
-    print(f"\nReport saved to: {filename}")
+        print(f"\nReport saved to: {filename}")
+    finally:
+        analytics.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+"""
+Single-pass aggregation pipeline for game logs.
+
+Each analysis is a visitor. AnalyticsPipeline walks every event of every
+game exactly once and dispatches it to the visitors that handle that event
+type, so adding an analysis does not add another pass over the logs.
+
+A visitor handles an event type by defining on_<event type>(event, ctx),
+e.g. on_damage_dealt. ctx is the GameContext of the current game, which
+holds lookup maps built as the events stream past (who played which spell
+in which clash, ...) so visitors never need to rescan a game.
+
+Visitors keep running totals rather than per-event lists, so the pipeline
+can also consume games one at a time while a simulation runs (feed()) and
+report snapshots at any point (results()) in bounded memory.
+"""
+
+import json
+import os
+from collections import defaultdict
+from typing import Any, Dict
+
+from match_stats import wilson_interval
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _load_json(filename):
+    with open(os.path.join(BASE_DIR, filename), 'r') as f:
+        return json.load(f)
+
+
+class RunningStat:
+    """Count, sum, min and max of a stream of numbers"""
+
+    __slots__ = ('count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None or value < self.min else self.min
+        self.max = value if self.max is None or value > self.max else self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+
+def _spell_name(event, default='Unknown'):
+    return event.get('spell', event.get('spell_name', default))
+
+
+class GameContext:
+    """Per-game state shared by all visitors while a game's events are dispatched"""
+
+    def __init__(self, game, index):
+        self.game = game
+        self.index = index
+        self.winner = game.get('winner')
+        self.plays_by_clash = {}  # (player, clash) -> first spell_played event in that clash slot
+
+    def note(self, event):
+        """Update the lookup maps; called before the visitors see the event"""
+        if event['type'] == 'spell_played':
+            self.plays_by_clash.setdefault((event.get('player'), event.get('clash')), event)
+
+
+class AnalysisVisitor:
+    """Base class for analyses; key is the entry the result is stored under"""
+
+    key = None
+
+    def start_game(self, ctx: GameContext) -> None:
+        pass
+
+    def end_game(self, ctx: GameContext) -> None:
+        pass
+
+    def result(self) -> Any:
+        raise NotImplementedError
+
+
+class AnalyticsPipeline:
+    """Feeds every event of every game once to all registered visitors"""
+
+    def __init__(self, visitors=None):
+        self.visitors = []
+        self.games_seen = 0
+        self.handlers = defaultdict(list)  # event type -> bound on_<type> methods
+        for visitor in visitors or []:
+            self.register(visitor)
+
+    def register(self, visitor: AnalysisVisitor) -> AnalysisVisitor:
+        self.visitors.append(visitor)
+        for attr in dir(visitor):
+            if attr.startswith('on_'):
+                self.handlers[attr[3:]].append(getattr(visitor, attr))
+        return visitor
+
+    def feed(self, game) -> None:
+        """Aggregate one finished game; the game dict is not kept"""
+        handlers = self.handlers
+        ctx = GameContext(game, self.games_seen)
+        for visitor in self.visitors:
+            visitor.start_game(ctx)
+        for event in game.get('events', []):
+            ctx.note(event)
+            for handler in handlers.get(event['type'], ()):
+                handler(event, ctx)
+        for visitor in self.visitors:
+            visitor.end_game(ctx)
+        self.games_seen += 1
+
+    def results(self) -> Dict[str, Any]:
+        """Current {visitor.key: visitor.result()}; safe to call between games"""
+        return {visitor.key: visitor.result() for visitor in self.visitors}
+
+    def run(self, games) -> Dict[str, Any]:
+        """Aggregate all the games and return the results"""
+        for game in games:
+            self.feed(game)
+        return self.results()
+
+
+class ElementStats(AnalysisVisitor):
+    """Element performance and win rates"""
+
+    key = 'element_stats'
+
+    def __init__(self):
+        self.wins = defaultdict(int)
+        self.games = defaultdict(int)
+        self.selections = defaultdict(int)  # Track how often each element is selected
+        self.damage = defaultdict(RunningStat)
+        self.healing = defaultdict(RunningStat)
+
+    def start_game(self, ctx):
+        # Track all elements that participated in this game
+        for player, elements in ctx.game['player_elements'].items():
+            for element in elements:
+                self.games[element] += 1
+                self.selections[element] += 1
+                # Only count wins if this player won
+                if player == ctx.winner:
+                    self.wins[element] += 1
+
+    def on_damage_dealt(self, event, ctx):
+        element = event.get('element', 'Unknown')
+        if element and event.get('amount', 0) > 0:
+            self.damage[element].add(event['amount'])
+
+    def on_healing_done(self, event, ctx):
+        element = event.get('element', 'Unknown')
+        if element and event.get('amount', 0) > 0:
+            self.healing[element].add(event['amount'])
+
+    def result(self):
+        # Win rate is wins / total games played with that element
+        win_rates = {e: self.wins[e] / n for e, n in self.games.items() if n > 0}
+        return {
+            'win_rates': win_rates,
+            'category_win_rates': category_win_rates(win_rates),
+            'total_games': dict(self.games),
+            'wins': dict(self.wins),
+            'selections': dict(self.selections),
+            'avg_damage': {e: dmg.mean for e, dmg in self.damage.items()},
+            'avg_healing': {e: heal.mean for e, heal in self.healing.items()}
+        }
+
+
+def category_win_rates(element_win_rates: Dict[str, float]) -> Dict[str, float]:
+    """Average win rate of each element category in element_categories.json"""
+    try:
+        categories_data = _load_json('element_categories.json')
+    except (OSError, ValueError):
+        return {}
+
+    rates = {}
+    for category_name, category_info in categories_data.get('categories', {}).items():
+        category_rates = [element_win_rates[e] for e in category_info.get('elements', []) if e in element_win_rates]
+        rates[category_name] = sum(category_rates) / len(category_rates) if category_rates else 0.0
+    return rates
+
+
+class SpellStats(AnalysisVisitor):
+    """Per-spell averages of damage, healing, weaken, bolster and advances"""
+
+    key = 'spell_stats'
+
+    def __init__(self):
+        self.stats = defaultdict(lambda: {
+            'times_played': 0,
+            'total_damage': 0,
+            'total_damage_weighted': 0,
+            'total_healing': 0,
+            'total_healing_weighted': 0,
+            'total_weaken': 0,
+            'total_bolster': 0,
+            'times_advanced': 0,
+            'element': None
+        })
+
+    def on_spell_played(self, event, ctx):
+        stats = self.stats[_spell_name(event)]
+        stats['times_played'] += 1
+        stats['element'] = event.get('element', 'Unknown')
+
+    def on_damage_dealt(self, event, ctx):
+        spell_name = _spell_name(event)
+        if spell_name:
+            self.stats[spell_name]['total_damage'] += event.get('amount', 0)
+            self.stats[spell_name]['total_damage_weighted'] += event.get('amount', 0)
+
+    def on_weaken_dealt(self, event, ctx):
+        spell_name = _spell_name(event)
+        if spell_name:
+            self.stats[spell_name]['total_weaken'] += event.get('amount', 0)
+            # Weighted: weaken counts as 2x damage
+            self.stats[spell_name]['total_damage_weighted'] += event.get('amount', 0) * 2
+
+    def on_healing_done(self, event, ctx):
+        spell_name = _spell_name(event)
+        if spell_name:
+            self.stats[spell_name]['total_healing'] += event.get('amount', 0)
+            self.stats[spell_name]['total_healing_weighted'] += event.get('amount', 0)
+
+    def on_bolster_done(self, event, ctx):
+        spell_name = _spell_name(event)
+        if spell_name:
+            self.stats[spell_name]['total_bolster'] += event.get('amount', 0)
+            # Weighted: bolster counts as 2x healing
+            self.stats[spell_name]['total_healing_weighted'] += event.get('amount', 0) * 2
+
+    def on_spell_advanced(self, event, ctx):
+        # Advance events name the spell; older logs only give the player and clash
+        spell_name = event.get('spell')
+        if spell_name is None:
+            played = ctx.plays_by_clash.get((event.get('player'), event.get('clash')))
+            spell_name = played and played['spell_name']
+        if spell_name:
+            self.stats[spell_name]['times_advanced'] += 1
+
+    def result(self):
+        spell_analysis = {}
+        for spell, stats in self.stats.items():
+            played = stats['times_played']
+            if played > 0:
+                spell_analysis[spell] = {
+                    'element': stats['element'],
+                    'times_played': played,
+                    'avg_damage': stats['total_damage'] / played,
+                    'avg_damage_weighted': stats['total_damage_weighted'] / played,
+                    'max_damage': stats['total_damage'],  # TODO: Track actual max
+                    'avg_healing': stats['total_healing'] / played,
+                    'avg_healing_weighted': stats['total_healing_weighted'] / played,
+                    'avg_weaken': stats['total_weaken'] / played,
+                    'avg_bolster': stats['total_bolster'] / played,
+                    # Not a rate: a spell can advance more than once per play
+                    'advances_per_play': stats['times_advanced'] / played
+                }
+        return spell_analysis
+
+
+class GameMetrics(AnalysisVisitor):
+    """Game length statistics"""
+
+    key = 'game_stats'
+
+    def __init__(self):
+        self.rounds = RunningStat()
+
+    def end_game(self, ctx):
+        self.rounds.add(ctx.game.get('total_rounds', 0))
+
+    def result(self):
+        return {
+            'avg_rounds': self.rounds.mean,
+            'min_rounds': self.rounds.min or 0,
+            'max_rounds': self.rounds.max or 0,
+            'avg_clashes': self.rounds.mean * 4  # 4 clashes per round
+        }
+
+
+class ActionStats(AnalysisVisitor):
+    """Action usage (advance, recall, cancel, move, discard, reveal, damage, heal)"""
+
+    key = 'action_stats'
+    ACTIONS = {
+        'spell_advanced': 'advance',
+        'spell_recalled': 'recall',
+        'spell_cancelled': 'cancel',
+        'spell_moved': 'move',
+        'spell_discarded': 'discard',
+        'spell_revealed': 'reveal',
+        # Count damage/healing as actions too
+        'damage_dealt': 'damage',
+        'healing_done': 'heal',
+    }
+
+    def __init__(self):
+        self.counts = defaultdict(int)
+
+    def _count(self, event, ctx):
+        self.counts[self.ACTIONS[event['type']]] += 1
+
+    on_spell_advanced = on_spell_recalled = on_spell_cancelled = on_spell_moved = _count
+    on_spell_discarded = on_spell_revealed = on_damage_dealt = on_healing_done = _count
+
+    def result(self):
+        total = sum(self.counts.values())
+        return {
+            'counts': dict(self.counts),
+            'rates': {action: count / total for action, count in self.counts.items()} if total else {},
+            'total': total
+        }
+
+
+class ConjuryStats(AnalysisVisitor):
+    """Conjury plays and cancellations"""
+
+    key = 'conjury_stats'
+
+    def __init__(self):
+        self.conjury_names = set()
+        # Counted for every spell; only conjuries are reported, once all games have shown which those are
+        self.by_spell = defaultdict(lambda: {'played': 0, 'cancelled': 0})
+
+    def on_spell_played(self, event, ctx):
+        spell_name = event.get('spell', event.get('spell_name'))
+        if event.get('is_conjury', False):
+            self.conjury_names.add(spell_name)
+        self.by_spell[spell_name]['played'] += 1
+
+    def on_spell_cancelled(self, event, ctx):
+        # The cancelled spell is in the 'spell' field
+        self.by_spell[event.get('spell')]['cancelled'] += 1
+
+    def result(self):
+        conjuries = {spell: dict(stats) for spell, stats in self.by_spell.items() if spell in self.conjury_names}
+        played = sum(stats['played'] for stats in conjuries.values())
+        cancelled = sum(stats['cancelled'] for stats in conjuries.values())
+        return {
+            'total_played': played,
+            'total_cancelled': cancelled,
+            'cancellation_rate': cancelled / played if played > 0 else 0,
+            'by_spell': conjuries,
+            'spell_cancel_rates': {spell: stats['cancelled'] / stats['played']
+                                   for spell, stats in conjuries.items() if stats['played'] > 0}
+        }
+
+
+class ThemeStats(AnalysisVisitor):
+    """Elephant theme effectiveness"""
+
+    key = 'theme_stats'
+
+    def result(self):
+        # TODO: Track elephant usage and success rates
+        return defaultdict(lambda: {'games': 0, 'wins': 0})
+
+
+class PlaystyleStats(AnalysisVisitor):
+    """Aggressive vs analytical playstyles"""
+
+    key = 'playstyle_stats'
+
+    def result(self):
+        # TODO: Need spell type information in events to classify attack vs remedy usage
+        return {'aggressive': 0, 'defensive': 0, 'balanced': 0}
+
+
+class TrunkSurvival(AnalysisVisitor):
+    """How long trunks survive"""
+
+    key = 'trunk_survival'
+
+    def __init__(self):
+        self.lifetimes = RunningStat()
+        self.losses_by_player = defaultdict(RunningStat)
+
+    def on_trunk_lost(self, event, ctx):
+        lifetime = event.get('trunk_lifetime_rounds', 0)
+        if lifetime > 0:
+            self.lifetimes.add(lifetime)
+            self.losses_by_player[event['player']].add(lifetime)
+
+    def result(self):
+        return {
+            'avg_trunk_lifetime_rounds': self.lifetimes.mean,
+            'min_trunk_lifetime': self.lifetimes.min or 0,
+            'max_trunk_lifetime': self.lifetimes.max or 0,
+            'total_trunk_losses': self.lifetimes.count,
+            'player_averages': {player: stat.mean for player, stat in self.losses_by_player.items()}
+        }
+
+
+class TrunkDestroyers(AnalysisVisitor):
+    """Which spells deal the killing blow that costs a trunk"""
+
+    key = 'trunk_destroyers'
+    RECENT_DAMAGE = 10  # Damage events remembered when attributing a trunk loss
+
+    def __init__(self):
+        self.kill_damage = defaultdict(RunningStat)
+        self.recent_damage = []
+
+    def start_game(self, ctx):
+        self.recent_damage = []
+
+    def on_damage_dealt(self, event, ctx):
+        self.recent_damage.append(event)
+        if len(self.recent_damage) > self.RECENT_DAMAGE:
+            del self.recent_damage[0]
+
+    def on_trunk_lost(self, event, ctx):
+        lost_player = event.get('player')
+        # Only credit the killing blow: the latest damage to this player
+        for damage_event in reversed(self.recent_damage):
+            if damage_event.get('target_player') == lost_player:
+                spell_name = _spell_name(damage_event)
+                self.kill_damage[spell_name].add(damage_event.get('amount', 0))
+                break
+
+    def result(self):
+        return {spell: {'trunk_kills': stat.count, 'avg_damage_for_kill': stat.mean}
+                for spell, stat in self.kill_damage.items()}
+
+
+class ResponseEffectiveness(AnalysisVisitor):
+    """How often response spell conditions are met, from the logged condition evaluations"""
+
+    key = 'response_effectiveness'
+
+    def __init__(self):
+        self.stats = defaultdict(lambda: {'played': 0, 'condition_met': 0})
+        try:
+            self.response_spells = {spell.get('card_name') for spell in _load_json('spells.json')
+                                    if 'response' in spell.get('spell_types', [])}
+        except (OSError, ValueError):
+            self.response_spells = set()
+
+    def on_response_condition_evaluated(self, event, ctx):
+        # Count every evaluation - each clash is a separate opportunity
+        spell_name = event.get('spell')
+        if spell_name in self.response_spells:
+            self.stats[spell_name]['played'] += 1
+            if event.get('condition_met', False):
+                self.stats[spell_name]['condition_met'] += 1
+
+    def result(self):
+        return {spell: {'times_played': stats['played'],
+                        'times_triggered': stats['condition_met'],
+                        'effectiveness_rate': stats['condition_met'] / stats['played']}
+                for spell, stats in self.stats.items() if stats['played'] > 0}
+
+
+DEFAULT_VISITORS = [ElementStats, SpellStats, GameMetrics, ActionStats, ConjuryStats, ThemeStats,
+                    PlaystyleStats, TrunkSurvival, TrunkDestroyers, ResponseEffectiveness]
+
+
+def default_pipeline():
+    """Pipeline with every analysis used by UnifiedAnalytics.analyze_games"""
+    return AnalyticsPipeline([visitor() for visitor in DEFAULT_VISITORS])
+
+
+def format_snapshot(analysis: Dict[str, Any], top: int = 5) -> str:
+    """Short progress report of streaming results, for printing mid-run"""
+    element_stats = analysis['element_stats']
+    game_stats = analysis['game_stats']
+    lines = [f"--- Snapshot after {analysis['total_games']} games ---",
+             f"Rounds: avg {game_stats['avg_rounds']:.2f} (min {game_stats['min_rounds']}, "
+             f"max {game_stats['max_rounds']}) | trunk lifetime "
+             f"{analysis['trunk_survival']['avg_trunk_lifetime_rounds']:.2f} rounds"]
+
+    # Win rate with its 95% interval half-width, so convergence is visible as the +/- shrinks
+    elements = []
+    for element, games in element_stats['total_games'].items():
+        low, high = wilson_interval(element_stats['wins'].get(element, 0), games)
+        elements.append((element_stats['win_rates'][element], (high - low) / 2, element))
+    elements.sort(reverse=True)
+    if elements:
+        fmt = lambda entries: ", ".join(f"{e} {rate:.1%}±{hw:.1%}" for rate, hw, e in entries)
+        lines.append(f"Best elements:  {fmt(elements[:top])}")
+        lines.append(f"Worst elements: {fmt(elements[-top:][::-1])}")
+        lines.append(f"Widest element interval: ±{max(hw for _, hw, _ in elements):.1%}")
+
+    spells = sorted(analysis['spell_stats'].items(), key=lambda item: -item[1]['avg_damage_weighted'])
+    if spells:
+        lines.append("Top damage/cast: " + ", ".join(f"{spell} {stats['avg_damage_weighted']:.2f}"
+                                                   for spell, stats in spells[:top]))
+
+    responses = analysis['response_effectiveness']
+    if responses:
+        rates = sorted(responses.items(), key=lambda item: -item[1]['effectiveness_rate'])
+        lines.append("Response triggers: " + ", ".join(f"{spell} {stats['effectiveness_rate']:.0%}"
+                                                      for spell, stats in rates[:top]))
+    return "\n".join(lines)
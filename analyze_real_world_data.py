@@ -2,13 +2,13 @@
 """Analyze real-world game data and generate reports"""
 
 from game_logger import GameLogger
-import os
+from log_archive import count_logged_games, iter_logged_games
 
 def main():
     logger = GameLogger()
     
     # Check if we have game logs
-    if not os.path.exists('game_logs') or not os.listdir('game_logs'):
+    if not count_logged_games('game_logs'):
         print("No game logs found!")
         print("\nTo generate real-world data:")
         print("1. Play some games using: python elephants_prototype.py")
@@ -52,23 +52,18 @@ def main():
     element_games = {}
     spell_usage = {}
     
-    for filename in os.listdir('game_logs'):
-        if filename.endswith('.json'):
-            import json
-            with open(os.path.join('game_logs', filename), 'r') as f:
-                game_data = json.load(f)
-                
-                # Count elements
-                for player_key in ['player1', 'player2']:
-                    elements = game_data['players'][player_key].get('elements', [])
-                    for elem in elements:
-                        element_games[elem] = element_games.get(elem, 0) + 1
-                
-                # Count spell usage
-                for event in game_data.get('events', []):
-                    if event['type'] == 'spell_played':
-                        spell_name = event['spell']
-                        spell_usage[spell_name] = spell_usage.get(spell_name, 0) + 1
+    for game_data in iter_logged_games('game_logs'):
+        # Count elements
+        for player_key in ['player1', 'player2']:
+            elements = game_data['players'][player_key].get('elements', [])
+            for elem in elements:
+                element_games[elem] = element_games.get(elem, 0) + 1
+        
+        # Count spell usage
+        for event in game_data.get('events', []):
+            if event['type'] == 'spell_played':
+                spell_name = event['spell']
+                spell_usage[spell_name] = spell_usage.get(spell_name, 0) + 1
     
     print("\nElement representation in games:")
     for elem, count in sorted(element_games.items(), key=lambda x: x[1], reverse=True):
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Balance what-if sweeps over spells.json variants.
+
+Each variant is a set of overrides against spell ids, applied to an
+in-memory copy of the catalogue (spells.json is never touched). Every
+variant plays the same seeds as the baseline, spread over a process pool,
+and the report compares element and spell win rates against the baseline.
+
+Override syntax: <spell id>:<key>=<value>
+    1:priority=5           Top-level field (priority, notfirst, is_conjury, ...)
+    1:damage=3             Every 'damage' action of the spell gets parameters.value = 3
+                           (any action type works: heal, weaken, bolster, ...)
+    1:resolve_effects.0.action.parameters.value=3
+                           Dotted path into the spell's JSON
+A variant is one argument with comma-separated overrides: "1:damage=3,1:priority=5"
+
+Usage:
+    python balance_sweep.py VARIANT [VARIANT ...] [--games 100] [--ai1 expert] [--ai2 expert]
+                            [--workers N] [--seed S]
+    python balance_sweep.py 1:damage=3 "1:priority=5,14:heal=2" --games 200 --workers 4
+"""
+
+import argparse
+import copy
+import io
+import json
+import math
+import os
+import random
+import sys
+import time
+import traceback
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from datetime import datetime
+
+import elephants_prototype
+from analytics import AI_CLASSES, create_engine
+from analytics_pipeline import AnalysisVisitor, AnalyticsPipeline
+from crash_corpus import CrashCorpus
+from game_logger import GameLogger
+
+BASELINE = 'baseline'
+CHUNK_SIZE = 10  # Seeds per pool task
+BASE_CATALOGUE = copy.deepcopy(elephants_prototype.SPELL_DATA)
+
+
+def parse_overrides(text):
+    """'1:damage=3,1:priority=5' -> [(1, 'damage', 3), (1, 'priority', 5)]"""
+    overrides = []
+    for part in text.split(','):
+        spell, sep, assignment = part.strip().partition(':')
+        key, eq, value = assignment.partition('=')
+        if not sep or not eq or not spell.strip().isdigit():
+            raise ValueError(f"Bad override {part!r}; expected <spell id>:<key>=<value>")
+        try:
+            value = json.loads(value)
+        except ValueError:
+            pass  # Plain strings don't need quoting
+        overrides.append((int(spell), key.strip(), value))
+    return overrides
+
+
+def _iter_actions(effects):
+    """Every action dict in an effect tree, including nested choice options"""
+    if isinstance(effects, dict):
+        if isinstance(effects.get('type'), str) and 'parameters' in effects:
+            yield effects
+        for value in effects.values():
+            yield from _iter_actions(value)
+    elif isinstance(effects, list):
+        for item in effects:
+            yield from _iter_actions(item)
+
+
+def build_catalogue(overrides, base=BASE_CATALOGUE):
+    """Deep copy of the spell catalogue with the overrides applied"""
+    catalogue = copy.deepcopy(base)
+    by_id = {spell['id']: spell for spell in catalogue}
+    for spell_id, key, value in overrides:
+        if spell_id not in by_id:
+            raise ValueError(f"No spell with id {spell_id}")
+        spell = by_id[spell_id]
+        if '.' in key:
+            *path, last = key.split('.')
+            target = spell
+            for step in path:
+                target = target[int(step)] if isinstance(target, list) else target[step]
+            target[int(last) if isinstance(target, list) else last] = value
+        elif key in spell:
+            spell[key] = value
+        else:
+            actions = [a for a in _iter_actions([spell['resolve_effects'], spell.get('advance_effects', [])])
+                       if a['type'] == key and 'value' in a['parameters']]
+            if not actions:
+                raise ValueError(f"{spell['card_name']} (id {spell_id}) has no field or valued '{key}' action")
+            for action in actions:
+                action['parameters']['value'] = value
+    return catalogue
+
+
+def use_catalogue(catalogue):
+    """Swap the engine's spell data in place; GameState reads it when a game is built"""
+    elephants_prototype.SPELL_DATA[:] = catalogue
+
+
+class WinCounts(AnalysisVisitor):
+    """Mergeable element and spell win counts (a spell counts for the player who played it)"""
+
+    key = 'win_counts'
+
+    def __init__(self):
+        self.counts = {'element_games': defaultdict(int), 'element_wins': defaultdict(int),
+                       'spell_games': defaultdict(int), 'spell_wins': defaultdict(int)}
+        self.played = set()
+
+    def start_game(self, ctx):
+        self.played = set()
+        for player, elements in ctx.game['player_elements'].items():
+            for element in elements:
+                self.counts['element_games'][element] += 1
+                if player == ctx.winner:
+                    self.counts['element_wins'][element] += 1
+
+    def on_spell_played(self, event, ctx):
+        self.played.add((event.get('player'), event.get('spell_name')))
+
+    def end_game(self, ctx):
+        for player, spell in self.played:
+            self.counts['spell_games'][spell] += 1
+            if player == ctx.winner:
+                self.counts['spell_wins'][spell] += 1
+
+    def result(self):
+        return {name: dict(counter) for name, counter in self.counts.items()}
+
+
+def _player_names(ai1, ai2):
+    if ai1 == ai2:
+        return [f"{ai1.upper()}_AI_1", f"{ai2.upper()}_AI_2"]
+    return [f"{ai1.upper()}_AI", f"{ai2.upper()}_AI"]
+
+
+def play_chunk(variant, overrides, ai1, ai2, seeds):
+    """Pool task: play seeds under one catalogue variant and return mergeable counts"""
+    use_catalogue(build_catalogue(overrides))
+    pipeline = AnalyticsPipeline([WinCounts()])
+    crashes = CrashCorpus()
+    failed = 0
+    for game_num, seed in enumerate(seeds):
+        # Alternate seats so neither AI always sits first
+        seats = [ai1, ai2] if seed % 2 == 0 else [ai2, ai1]
+        player_names = _player_names(*seats)
+        random.seed(seed)
+        engine = None
+        try:
+            engine = create_engine(player_names, *seats, logger=GameLogger(persist=False))
+            with redirect_stdout(io.StringIO()):
+                engine.run_game()
+            crash = engine.crash
+        except Exception:
+            crash = traceback.format_exc()
+        if crash:
+            failed += 1
+            crashes.record('balance_sweep', seed, player_names, seats, crash, engine.gs if engine else None,
+                           extra={'variant': variant, 'overrides': overrides})
+        elif engine.logger.current_game:
+            pipeline.feed(engine.logger.current_game)
+    use_catalogue(BASE_CATALOGUE)
+    return variant, pipeline.results()['win_counts'], pipeline.games_seen, failed
+
+
+def replay_crash(record):
+    """Re-run a crash recorded by a sweep under the same catalogue variant"""
+    use_catalogue(build_catalogue([tuple(o) for o in record['overrides']]))
+    try:
+        random.seed(record['seed'])
+        engine = create_engine(record['player_names'], *record['ai_types'], logger=GameLogger(persist=False))
+        with redirect_stdout(io.StringIO()):
+            engine.run_game()
+        return engine.crash
+    finally:
+        use_catalogue(BASE_CATALOGUE)
+
+
+class BalanceSweep:
+    """Play the baseline and each variant on shared seeds and compare win rates"""
+
+    def __init__(self, variants, games=100, ai1='expert', ai2='expert', workers=None, seed=None):
+        # variants: {name: [(spell id, key, value), ...]}
+        self.variants = {BASELINE: [], **variants}
+        for overrides in self.variants.values():
+            build_catalogue(overrides)  # Fail fast on bad overrides, before any worker starts
+        self.games = games
+        self.ai1 = ai1
+        self.ai2 = ai2
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed if seed is not None else random.randrange(2**31)
+        self.counts = {name: defaultdict(lambda: defaultdict(int)) for name in self.variants}
+        self.games_played = defaultdict(int)
+        self.failed = defaultdict(int)
+
+    def run(self):
+        seeds = list(range(self.seed, self.seed + self.games))
+        chunks = [seeds[i:i + CHUNK_SIZE] for i in range(0, len(seeds), CHUNK_SIZE)]
+        tasks = [(name, overrides, self.ai1, self.ai2, chunk)
+                 for chunk in chunks for name, overrides in self.variants.items()]
+        print(f"Balance sweep: {len(self.variants) - 1} variant(s) + baseline, {self.games} games each "
+              f"({self.ai1} vs {self.ai2}), seeds {self.seed}..{seeds[-1]}, {self.workers} worker(s)")
+        start = time.time()
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(play_chunk, *task) for task in tasks]
+            for done, future in enumerate(futures, 1):
+                variant, counts, played, failed = future.result()
+                for name, counter in counts.items():
+                    for key, value in counter.items():
+                        self.counts[variant][name][key] += value
+                self.games_played[variant] += played
+                self.failed[variant] += failed
+                if done % len(self.variants) == 0:
+                    print(f"  {done // len(self.variants)}/{len(chunks)} seed chunks [{time.time() - start:.1f}s]")
+        if any(self.failed.values()):
+            print(f"Crashed games: {dict(self.failed)} (see python crash_corpus.py)")
+
+    def _rates(self, variant, kind):
+        games = self.counts[variant][f'{kind}_games']
+        wins = self.counts[variant][f'{kind}_wins']
+        return {key: (wins[key] / n, n) for key, n in games.items() if n > 0}
+
+    def comparison(self, kind):
+        """{key: {variant: (win rate, games)}} for 'element' or 'spell'"""
+        table = defaultdict(dict)
+        for variant in self.variants:
+            for key, rate in self._rates(variant, kind).items():
+                table[key][variant] = rate
+        return table
+
+    def touched_spells(self):
+        names = {spell['id']: spell['card_name'] for spell in BASE_CATALOGUE}
+        return {names[spell_id] for overrides in self.variants.values() for spell_id, _, _ in overrides}
+
+    def format_report(self, top_spells=15):
+        lines = ["=" * 80, "BALANCE SWEEP",
+                 f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                 f"{self.ai1} vs {self.ai2}, {self.games} games per variant on seeds "
+                 f"{self.seed}..{self.seed + self.games - 1}", "=" * 80]
+        variants = [v for v in self.variants if v != BASELINE]
+        labels = {variant: f"v{i}" for i, variant in enumerate(variants, 1)}
+        for variant in variants:
+            lines.append(f"{labels[variant]}: " + ", ".join(f"{s}:{k}={json.dumps(v)}" for s, k, v in self.variants[variant])
+                         + f"  ({self.games_played[variant]} games)")
+        lines.append(f"baseline: {self.games_played[BASELINE]} games")
+        lines.append("Deltas are percentage points vs baseline; * = more than 2 standard errors")
+
+        for kind, title in (('element', 'ELEMENT WIN RATES'), ('spell', 'SPELL WIN RATES (games where played)')):
+            table = self.comparison(kind)
+            keys = sorted(table)
+            if kind == 'spell':
+                # Changed spells first, then the biggest movers
+                touched = self.touched_spells()
+                movers = sorted((k for k in keys if k not in touched),
+                                key=lambda k: -max((abs(self._delta(table[k], v)[0]) for v in variants), default=0))
+                keys = sorted(k for k in keys if k in touched) + movers[:top_spells]
+            lines.append("")
+            lines.append(title)
+            lines.append(f"{'':<16}{'baseline':>10}" + "".join(f"{labels[v]:>10}" for v in variants))
+            for key in keys:
+                base = table[key].get(BASELINE)
+                row = f"{key[:15]:<16}" + (f"{base[0]:>10.1%}" if base else f"{'-':>10}")
+                for variant in variants:
+                    delta, significant = self._delta(table[key], variant)
+                    row += f"{delta * 100:>+9.1f}{'*' if significant else ' '}" if variant in table[key] else f"{'-':>10}"
+                lines.append(row)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _delta(row, variant):
+        """(variant - baseline win rate, whether it exceeds two standard errors)
+
+        The standard error uses the pooled win rate (a two-proportion z-test), so
+        a flip between 0% and 100% is still measured against a nonzero spread.
+        """
+        if variant not in row or BASELINE not in row:
+            return 0.0, False
+        (p1, n1), (p0, n0) = row[variant], row[BASELINE]
+        pooled = (p1 * n1 + p0 * n0) / (n1 + n0)
+        se = math.sqrt(pooled * (1 - pooled) * (1 / n1 + 1 / n0))
+        return p1 - p0, se > 0 and abs(p1 - p0) > 2 * se
+
+    def save(self):
+        os.makedirs('balance_sweeps', exist_ok=True)
+        stem = f"balance_sweeps/sweep_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        with open(f"{stem}.txt", 'w') as f:
+            f.write(self.format_report() + "\n")
+        with open(f"{stem}.json", 'w') as f:
+            json.dump({'seed': self.seed, 'games': self.games, 'ai1': self.ai1, 'ai2': self.ai2,
+                       'variants': self.variants, 'games_played': dict(self.games_played),
+                       'failed': dict(self.failed),
+                       'element_win_rates': self.comparison('element'),
+                       'spell_win_rates': self.comparison('spell')}, f, indent=2)
+        return f"{stem}.txt"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Balance what-if sweeps over spell catalogue variants')
+    parser.add_argument('variants', nargs='+', metavar='VARIANT',
+                        help='Comma-separated overrides, e.g. "1:damage=3,1:priority=5"')
+    parser.add_argument('--games', type=int, default=100, help='Games per variant (default 100)')
+    parser.add_argument('--ai1', default='expert', choices=list(AI_CLASSES))
+    parser.add_argument('--ai2', default='expert', choices=list(AI_CLASSES))
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--seed', type=int, help='Base seed shared by every variant')
+    args = parser.parse_args()
+
+    try:
+        variants = {text: parse_overrides(text) for text in args.variants}
+        sweep = BalanceSweep(variants, args.games, args.ai1, args.ai2, args.workers, args.seed)
+    except (ValueError, KeyError, IndexError) as e:
+        print(f"Invalid override: {e}")
+        sys.exit(1)
+    sweep.run()
+    print()
+    print(sweep.format_report())
+    print(f"\nReport saved to: {sweep.save()}")
+
+
+if __name__ == "__main__":
+    main()
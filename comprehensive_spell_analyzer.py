@@ -4,108 +4,26 @@
 import json
 from collections import defaultdict
 
+from spell_properties import load_spell_properties, spells_by_element
+
 def analyze_all_damage_spells():
     """Analyze all spells and identify damage dealers"""
     
-    with open('spells.json', 'r') as f:
-        spells = json.load(f)
+    properties = load_spell_properties()
     
     with open('element_categories.json', 'r') as f:
         element_categories = json.load(f)
     
-    # Manual damage data for complex spells
-    known_damage_spells = {
-        # Fire
-        'Combust': {'element': 'Fire', 'min': 1, 'max': 1, 'typical': 1},
-        'Blaze': {'element': 'Fire', 'min': 2, 'max': 2, 'typical': 2},
-        'Ignite': {'element': 'Fire', 'min': 1, 'max': 4, 'typical': 2},
-        
-        # Water
-        'Flow': {'element': 'Water', 'min': 1, 'max': 1, 'typical': 1},
-        
-        # Wind
-        'Turbulence': {'element': 'Wind', 'min': 1, 'max': 2, 'typical': 1.5},
-        
-        # Earth
-        'Rumble': {'element': 'Earth', 'min': 1, 'max': 1, 'typical': 1},
-        'Aftershocks': {'element': 'Earth', 'min': 2, 'max': 2, 'typical': 2},
-        
-        # Wood
-        'Seed': {'element': 'Wood', 'min': 1, 'max': 1, 'typical': 1},
-        'Prickle': {'element': 'Wood', 'min': 1, 'max': 6, 'typical': 3},
-        
-        # Metal
-        'Defend': {'element': 'Metal', 'min': 1, 'max': 1, 'typical': 1},
-        
-        # Time
-        'Quickshot': {'element': 'Time', 'min': 1, 'max': 1, 'typical': 1},
-        'Impact': {'element': 'Time', 'min': 0, 'max': 9, 'typical': 2},
-        
-        # Space
-        'Void': {'element': 'Space', 'min': 1, 'max': 1, 'typical': 1},
-        
-        # Sunbeam
-        'Shine': {'element': 'Sunbeam', 'min': 1, 'max': 1, 'typical': 1},
-        'Illuminate': {'element': 'Sunbeam', 'min': 1, 'max': 3, 'typical': 2},
-        'Glare': {'element': 'Sunbeam', 'min': 1, 'max': 1, 'typical': 1},
-        
-        # Moonshine
-        'Slumber': {'element': 'Moonshine', 'min': 1, 'max': 1, 'typical': 1},
-        
-        # Shadow
-        'Obscure': {'element': 'Shadow', 'min': 1, 'max': 1, 'typical': 1},
-        
-        # Aster
-        'Meteorite': {'element': 'Aster', 'min': 1, 'max': 1, 'typical': 1},
-        
-        # Blood
-        'Offering': {'element': 'Blood', 'min': 2, 'max': 2, 'typical': 2},
-        'Ritual': {'element': 'Blood', 'min': 1, 'max': 6, 'typical': 3},
-        'Overexert': {'element': 'Blood', 'min': 4, 'max': 4, 'typical': 4},
-        
-        # Ichor
-        # No damage spells
-        
-        # Venom
-        'Sting': {'element': 'Venom', 'min': 1, 'max': 1, 'typical': 1},
-        'Poison': {'element': 'Venom', 'min': 1, 'max': 1, 'typical': 1},
-        
-        # Nectar
-        'Absorb': {'element': 'Nectar', 'min': 1, 'max': 1, 'typical': 1},
-        
-        # Lightning
-        'Bolt': {'element': 'Lightning', 'min': 1, 'max': 1, 'typical': 1},
-        
-        # Thunder
-        'Stun': {'element': 'Thunder', 'min': 1, 'max': 1, 'typical': 1},
-        
-        # Twilight
-        'Dusk': {'element': 'Twilight', 'min': 2, 'max': 2, 'typical': 2},
-        'Crepuscule': {'element': 'Twilight', 'min': 1, 'max': 2, 'typical': 1.5},
-    }
-    
-    # Check all spells to ensure we have complete data
+    # Damage ranges come from each spell's effect tree, so every damage dealer is counted
     element_damage = defaultdict(list)
-    
-    for spell in spells:
-        spell_name = spell['card_name']
-        element = spell['element']
-        
-        # Check if it's a known damage spell
-        if spell_name in known_damage_spells:
-            damage_data = known_damage_spells[spell_name]
+    for element, damage_spells in spells_by_element('damage', properties).items():
+        for props in damage_spells:
             element_damage[element].append({
-                'name': spell_name,
-                'min': damage_data['min'],
-                'max': damage_data['max'],
-                'typical': damage_data['typical']
+                'name': props['name'],
+                'min': props['damage']['min'],
+                'max': props['damage']['max'],
+                'typical': props['damage']['typical']
             })
-        else:
-            # Check if spell has damage in its effects
-            effects_str = str(spell.get('resolve_effects', [])) + str(spell.get('advance_effects', []))
-            if "'type': 'damage'" in effects_str and 'self-damage' not in spell_name.lower():
-                # Unknown damage spell - should investigate
-                print(f"WARNING: Unknown damage spell found: {spell_name} ({element})")
     
     # Calculate statistics
     print("\nELEMENTAL ELEPHANTS - COMPREHENSIVE SPELL ANALYSIS")
@@ -179,8 +97,8 @@ def analyze_all_damage_spells():
     print("-" * 80)
     
     element_total_spells = defaultdict(int)
-    for spell in spells:
-        element_total_spells[spell['element']] += 1
+    for props in properties.values():
+        element_total_spells[props['element']] += 1
     
     print(f"{'Element':<15} {'Total Spells':<15} {'Damage Spells':<15} {'% Damage'}")
     print("-" * 80)
@@ -1,84 +1,16 @@
 #!/usr/bin/env python3
-"""Correct spell analysis with manually verified data"""
+"""Correct spell analysis with damage ranges derived from the spell effects"""
 
 import json
 
-# Manually verified damage spell data
-DAMAGE_SPELLS = {
-    'Fire': [
-        ('Fireball', 1, 1),  # Deals 1 damage
-        ('Blaze', 2, 2),     # Deals 2 damage
-        ('Ignite', 1, 4)     # Can advance 3 times for 4 total
-    ],
-    'Water': [
-        ('Flow', 1, 1)       # Deals 1 damage
-    ],
-    'Wind': [
-        ('Turbulence', 1, 2) # 1-2 damage based on condition
-    ],
-    'Earth': [
-        ('Rumble', 1, 1),    # Deals 1 damage
-        ('Aftershocks', 2, 2) # Deals 2 damage
-    ],
-    'Wood': [
-        ('Seed', 1, 1),      # Deals 1 damage
-        ('Grow', 0, 0),      # Healing only
-        ('Prickle', 1, 6)    # 1 or up to 6 damage
-    ],
-    'Metal': [
-        ('Defend', 1, 1),    # Deals 1 damage
-        ('Besiege', 1, 1)    # Deals 1 damage
-    ],
-    'Time': [
-        ('Quickshot', 1, 1), # Deals 1 damage
-        ('Impact', 0, 9)     # 0-9 based on other clashes
-    ],
-    'Space': [
-        ('Void', 1, 1)       # Deals 1 damage
-    ],
-    'Sunbeam': [
-        ('Illuminate', 1, 3), # 1 or 3 damage
-        ('Glare', 1, 1)      # Deals 1 damage to all
-    ],
-    'Moonshine': [
-        ('Slumber', 1, 1),   # Deals 1 damage
-        ('Bedim', 1, 1)      # Deals 1 damage
-    ],
-    'Shadow': [
-        ('Obscure', 1, 1)    # Deals 1 damage
-    ],
-    'Aster': [
-        ('Meteorite', 1, 1), # Deals 1 damage
-        ('Starfall', 1, 2)   # Deals 1 or 2 damage
-    ],
-    'Blood': [
-        ('Offering', 2, 2),  # Deals 2 damage
-        ('Ritual', 1, 6),    # 1-6 damage
-        ('Overexert', 4, 4)  # Deals 4 damage
-    ],
-    'Ichor': [
-        ('Dominion', 1, 3)   # Damage per enemy boost spell
-    ],
-    'Venom': [
-        ('Sting', 1, 1),     # Deals 1 damage
-        ('Poison', 1, 1),    # Deals 1 damage
-        ('Enfeeble', 1, 2)   # Deals 1 or 2 damage
-    ],
-    'Nectar': [
-        ('Absorb', 1, 1)     # Deals 1 damage
-    ],
-    'Lightning': [
-        ('Bolt', 1, 1),      # Deals 1 damage
-        ('Surge', 1, 1)      # Deals 1 damage
-    ],
-    'Thunder': [
-        ('Stupefy', 1, 2)    # Deals 1 or 2 damage
-    ],
-    'Twilight': [
-        ('Dusk', 2, 2),      # Deals 2 damage
-        ('Crepuscule', 1, 2) # 1-2 damage
-    ]
-}
+from spell_properties import spells_by_element
+
+
+def damage_spells_by_element():
+    """{element: [(spell name, min damage, max damage)]}, derived from the spells' effects"""
+    return {element: [(props['name'], props['damage']['min'], props['damage']['max']) for props in spells]
+            for element, spells in spells_by_element('damage').items()}
+
 
 def generate_correct_report():
     """Generate report with correct data"""
@@ -95,9 +27,8 @@ def generate_correct_report():
     
     element_stats = []
     
-    for element, spells in DAMAGE_SPELLS.items():
+    for element, spells in damage_spells_by_element().items():
         if spells:
-            # Filter out non-damage spells (like Grow)
             damage_spells = [(name, min_d, max_d) for name, min_d, max_d in spells if max_d > 0]
             
             if damage_spells:
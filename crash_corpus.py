@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Crash corpus for batch game runners.
+
+Every game a batch runner plays is seeded, so when one crashes the runner
+stores everything needed to reproduce it: the seed, the seat order and AI
+types, the traceback and a JSON snapshot of the GameState at the moment of
+the crash. Records live in crash_corpus/, one file per distinct crash.
+
+Usage:
+    python crash_corpus.py                  # List recorded crashes, grouped by error
+    python crash_corpus.py show <file>      # Print a crash record and its state snapshot
+    python crash_corpus.py replay <file>    # Re-run the crashed game from its seed
+"""
+
+import importlib
+import json
+import os
+import re
+import sys
+import traceback
+from collections import defaultdict
+from datetime import datetime
+
+ANSI_ESCAPE = re.compile(r'\033\[[0-9;]*m')
+ACTION_LOG_TAIL = 40  # Action log lines kept in a snapshot
+
+
+def _card_ref(card):
+    return {'id': card.id, 'name': card.name}
+
+
+def snapshot_game_state(gs):
+    """JSON-safe snapshot of a GameState: players, boards, deck order and recent logs"""
+    players = []
+    for player in gs.players:
+        players.append({
+            'name': player.name,
+            'health': player.health,
+            'max_health': player.max_health,
+            'trunks': player.trunks,
+            'is_invulnerable': player.is_invulnerable,
+            'knocked_out_this_turn': player.knocked_out_this_turn,
+            'hand': [_card_ref(c) for c in player.hand],
+            'discard_pile': [_card_ref(c) for c in player.discard_pile],
+            'board': [[{**_card_ref(pc.card), 'status': pc.status, 'has_resolved': pc.has_resolved,
+                        'advances_this_round': pc.advances_this_round}
+                       for pc in clash] for clash in player.board],
+        })
+    return {
+        'round_num': gs.round_num,
+        'clash_num': gs.clash_num,
+        'ringleader_index': gs.ringleader_index,
+        'game_over': gs.game_over,
+        'players': players,
+        'main_deck': [[c.id for c in elephant_set] for elephant_set in gs.main_deck],
+        'resolution_queue': [repr(item) for item in gs.resolution_queue],
+        'action_log_tail': [ANSI_ESCAPE.sub('', line) for line in gs.action_log.lines(gs.all_cards, ACTION_LOG_TAIL)],
+        'event_log': gs.event_log,
+    }
+
+
+def error_signature(tb_text):
+    """Last line of a traceback, e.g. "KeyError: 'target'" - used to group and match crashes"""
+    lines = [line for line in (tb_text or '').strip().splitlines() if line.strip()]
+    return lines[-1].strip() if lines else ''
+
+
+class CrashCorpus:
+    """Directory of crash records written by batch runners"""
+
+    def __init__(self, crash_dir="crash_corpus"):
+        self.crash_dir = crash_dir
+        self.recorded = []  # Paths written since the last report_summary()
+
+    def record(self, runner, seed, player_names, ai_types, tb_text, gs=None, extra=None, key=None):
+        """Store one crash and return the record's path
+
+        Args:
+            runner: Module that played the game; it must provide replay_crash(record)
+            seed: Seed passed to random.seed() before the engine was built
+            player_names: Player names in seat order
+            ai_types: AI difficulty per seat
+            tb_text: Formatted traceback
+            gs: GameState at the time of the crash, if the engine was built
+            extra: Optional runner-specific fields (matchup, game number, ...)
+            key: Optional tag for the file name when seed and seating alone don't
+                identify the game (e.g. the tuner's candidate weights)
+        """
+        os.makedirs(self.crash_dir, exist_ok=True)
+        record = {
+            'runner': runner,
+            'seed': seed,
+            'player_names': list(player_names),
+            'ai_types': list(ai_types),
+            'error': error_signature(tb_text),
+            'traceback': tb_text,
+            'recorded_at': datetime.now().isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'state': snapshot_game_state(gs) if gs is not None else None,
+        }
+        if extra:
+            record.update(extra)
+        # The seed and seating identify the game, so re-running a batch overwrites instead of duplicating
+        filename = f"crash_{runner}_{seed}_{'_vs_'.join(ai_types)}{f'_{key}' if key else ''}.json"
+        path = os.path.join(self.crash_dir, filename)
+        with open(path, 'w') as f:
+            json.dump(record, f, indent=2, default=repr)
+        self.recorded.append(path)
+        return path
+
+    def records(self):
+        """Yield (path, record) for every crash in the corpus, oldest first"""
+        if not os.path.isdir(self.crash_dir):
+            return
+        for filename in sorted(os.listdir(self.crash_dir)):
+            if filename.endswith('.json'):
+                path = os.path.join(self.crash_dir, filename)
+                yield path, load_record(path)
+
+    def report_summary(self):
+        """Print the crashes recorded since the last summary and how to replay them"""
+        if not self.recorded:
+            return
+        print(f"\n{len(self.recorded)} game(s) crashed; records saved to {self.crash_dir}/")
+        for path in self.recorded[:5]:
+            print(f"  python crash_corpus.py replay {path}")
+        if len(self.recorded) > 5:
+            print(f"  ... and {len(self.recorded) - 5} more (python crash_corpus.py)")
+        self.recorded = []
+
+
+def load_record(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def replay(record):
+    """Re-run a recorded game from its seed; returns the new traceback, or None if it finished cleanly"""
+    runner = importlib.import_module(record['runner'])
+    return runner.replay_crash(record)
+
+
+def _list_crashes(corpus):
+    groups = defaultdict(list)
+    for path, record in corpus.records():
+        groups[record['error']].append((path, record))
+    if not groups:
+        print(f"No crashes recorded in {corpus.crash_dir}/")
+        return
+    for error, entries in sorted(groups.items(), key=lambda item: -len(item[1])):
+        print(f"\n{len(entries)}x {error}")
+        for path, record in entries:
+            print(f"  {os.path.basename(path)}  ({record['runner']}, seed {record['seed']}, "
+                  f"{' vs '.join(record['ai_types'])})")
+
+
+def _show_crash(path):
+    record = load_record(path)
+    print(f"{record['runner']} | seed {record['seed']} | {' vs '.join(record['ai_types'])} | {record['recorded_at']}")
+    print(record['traceback'])
+    state = record.get('state')
+    if not state:
+        print("(no state snapshot: the engine was not built)")
+        return
+    print(f"Round {state['round_num']}, clash {state['clash_num']}, "
+          f"ringleader {state['players'][state['ringleader_index']]['name']}")
+    for player in state['players']:
+        print(f"  {player['name']}: {player['health']}/{player['max_health']} HP, {player['trunks']} trunks, "
+              f"hand {[c['name'] for c in player['hand']]}")
+        for clash, played in enumerate(player['board'], 1):
+            if played:
+                print(f"    clash {clash}: " + ", ".join(f"{c['name']} ({c['status']})" for c in played))
+    print("Last actions:")
+    for line in state['action_log_tail'][-15:]:
+        print(f"  {line}")
+
+
+def _replay_crash(path):
+    record = load_record(path)
+    print(f"Replaying seed {record['seed']}: {' vs '.join(record['ai_types'])} ({record['runner']})")
+    try:
+        tb_text = replay(record)
+    except Exception:
+        tb_text = traceback.format_exc()
+    if tb_text is None:
+        print("Game finished without an error - the crash did not reproduce (already fixed?)")
+        return 1
+    print(tb_text)
+    if error_signature(tb_text) == record['error']:
+        print(f"Reproduced: {record['error']}")
+        return 0
+    print(f"Crashed differently; recorded error was: {record['error']}")
+    return 1
+
+
+def main():
+    args = sys.argv[1:]
+    corpus = CrashCorpus()
+    if not args or args[0] == 'list':
+        _list_crashes(corpus)
+    elif args[0] in ('show', 'replay') and len(args) == 2:
+        if args[0] == 'show':
+            _show_crash(args[1])
+        else:
+            sys.exit(_replay_crash(args[1]))
+    else:
+        print(f"Usage: {sys.argv[0]} [list | show <file> | replay <file>]")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,96 +4,35 @@
 import json
 from collections import defaultdict
 
+from spell_properties import load_spell_properties
+
 class DamagePotentialCalculator:
     """Calculate damage potential for spells with proper conditional handling"""
     
     def __init__(self):
-        with open('spells.json', 'r') as f:
-            self.spells = json.load(f)
+        self.properties = load_spell_properties()
         
         with open('element_categories.json', 'r') as f:
             self.element_categories = json.load(f)
     
     def calculate_spell_damage(self, spell):
-        """Calculate min/max/typical damage for a spell"""
-        spell_name = spell['card_name']
-        
-        # Special case handling for known complex spells
-        if spell_name == 'Turbulence':
-            return {'min': 1, 'max': 2, 'typical': 1.5, 
-                   'notes': '2 damage if active in 2+ other clashes, else 1'}
-        
-        elif spell_name == 'Impact':
-            return {'min': 0, 'max': 9, 'typical': 2,
-                   'notes': '1 damage per spell from other clashes (0-9)'}
-        
-        elif spell_name == 'Ignite':
-            return {'min': 1, 'max': 4, 'typical': 2,
-                   'notes': 'Can advance up to 3 times for 4 total damage'}
-        
-        elif spell_name == 'Prickle':
-            return {'min': 1, 'max': 6, 'typical': 3,
-                   'notes': 'Auto-optimal: 1 damage or 1 per active spell'}
-        
-        elif spell_name == 'Ritual':
-            return {'min': 1, 'max': 6, 'typical': 3,
-                   'notes': 'Choice: 1 damage or up to 6 (1 per attack spell)'}
-        
-        elif spell_name == 'Illuminate':
-            return {'min': 1, 'max': 3, 'typical': 2,
-                   'notes': 'Choice: 1 damage or 3 damage + 1 self-damage'}
-        
-        elif spell_name == 'Crepuscule':
-            return {'min': 1, 'max': 2, 'typical': 2,
-                   'notes': '1 damage + 1 heal, +1 damage if other remedy'}
-        
-        # Standard damage detection for simpler spells
-        damage_found = False
-        base_damage = 0
-        
-        # Check resolve effects
-        for effect in spell.get('resolve_effects', []):
-            damage = self._extract_damage_from_effect(effect)
-            if damage > 0:
-                damage_found = True
-                base_damage = max(base_damage, damage)
-        
-        # Check advance effects
-        advance_damage = 0
-        for effect in spell.get('advance_effects', []):
-            damage = self._extract_damage_from_effect(effect)
-            if damage > 0:
-                advance_damage = max(advance_damage, damage)
-        
-        if damage_found or advance_damage > 0:
-            total = base_damage + advance_damage
-            return {'min': total, 'max': total, 'typical': total,
-                   'notes': 'Flat damage'}
-        
-        return {'min': 0, 'max': 0, 'typical': 0, 'notes': 'No damage'}
-    
-    def _extract_damage_from_effect(self, effect):
-        """Extract damage value from a single effect"""
-        action = effect.get('action', {})
-        
-        if isinstance(action, dict):
-            if action.get('type') == 'damage' and action.get('target') != 'self':
-                return action.get('parameters', {}).get('value', 0)
-            elif action.get('type') == 'damage_multi_target':
-                return action.get('parameters', {}).get('value', 0)
-        
-        return 0
+        """Calculate min/max/typical damage for a spell (derived from its effects by spell_properties)"""
+        props = self.properties[spell['card_name']]
+        damage = props['damage']
+        notes = props['notes'] or (['Flat damage'] if damage['max'] else ['No damage'])
+        return {'min': damage['min'], 'max': damage['max'], 'typical': damage['typical'],
+                'notes': '; '.join(notes)}
     
     def analyze_all_spells(self):
         """Analyze damage potential for all spells"""
         element_damage = defaultdict(list)
         
-        for spell in self.spells:
-            damage_info = self.calculate_spell_damage(spell)
+        for name, props in self.properties.items():
+            damage_info = self.calculate_spell_damage({'card_name': name})
             
             if damage_info['max'] > 0:
-                element_damage[spell['element']].append({
-                    'name': spell['card_name'],
+                element_damage[props['element']].append({
+                    'name': name,
                     'min': damage_info['min'],
                     'max': damage_info['max'],
                     'typical': damage_info['typical'],
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Draft opening book builder.
+
+The opening draft is four picks from the same 19 sets: the ringleader
+picks, the other player picks, and so on once more. This tool plays
+simulated games in which those four picks are made at random (the rest of
+the game is played by the chosen AIs as usual), fits a team-strength model
+to the results - a strength per element, a synergy per element pair and a
+first-drafter edge - and then solves the draft by minimax over that
+model. The best pick for every opening position is written to
+draft_book.json, which the Medium, Hard and Expert AIs consult before
+evaluating sets live. Keys are "<my elements>|<opponent elements>", each
+sorted and comma-separated.
+
+Usage:
+    python draft_book.py build [--games 4000] [--ai1 expert] [--ai2 expert] [--workers N] [--seed S]
+    python draft_book.py show                # Best openings and element strengths
+"""
+
+import argparse
+import io
+import itertools
+import json
+import math
+import os
+import random
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from datetime import datetime
+
+from analytics import AI_CLASSES, create_engine
+from crash_corpus import CrashCorpus
+from elephants_prototype import SPELL_DATA
+from game_logger import NullGameLogger
+
+BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'draft_book.json')
+ELEMENTS = sorted({spell['element'] for spell in SPELL_DATA})
+OPENING_PICKS = 2  # Sets each player drafts at setup
+
+
+def _key(mine, theirs):
+    return f"{','.join(sorted(mine))}|{','.join(sorted(theirs))}"
+
+
+def _player_names(ai1, ai2):
+    if ai1 == ai2:
+        return [f"{ai1.upper()}_AI_1", f"{ai2.upper()}_AI_2"]
+    return [f"{ai1.upper()}_AI", f"{ai2.upper()}_AI"]
+
+
+def _randomise_opening(ai, rng, opening):
+    """Make an AI's opening picks uniformly at random, appending (player, element) to opening
+
+    Later redrafts are left to the AI itself.
+    """
+    choose_draft_set = ai.choose_draft_set
+    picks = [0]
+
+    def random_opening(player, gs, available_sets):
+        if picks[0] < OPENING_PICKS:
+            picks[0] += 1
+            pick = rng.choice([s for s in available_sets if s])
+            opening.append((player.name, pick[0].element))
+            return pick
+        return choose_draft_set(player, gs, available_sets)
+
+    ai.choose_draft_set = random_opening
+
+
+def play_chunk(ai1, ai2, seeds):
+    """Pool task: play seeds with random openings; returns [(first drafter's elements, second's, winner)]
+
+    winner is 0 for the first drafter, 1 for the second, None for a draw.
+    """
+    results = []
+    for seed in seeds:
+        seats = [ai1, ai2] if seed % 2 == 0 else [ai2, ai1]
+        player_names = _player_names(*seats)
+        random.seed(seed)
+        engine = None
+        opening = []
+        try:
+            engine = create_engine(player_names, *seats, logger=NullGameLogger())
+            for seat, ai in engine.ai_strategies.items():
+                _randomise_opening(ai, random.Random(seed * 2 + seat), opening)
+            with redirect_stdout(io.StringIO()):
+                engine.run_game()
+            crash = engine.crash
+        except Exception:
+            crash = traceback.format_exc()
+        if crash:
+            CrashCorpus().record('draft_book', seed, player_names, seats, crash, engine.gs if engine else None)
+            continue
+        first = opening[0][0]
+        elements = [[e for name, e in opening if (name == first) == is_first] for is_first in (True, False)]
+        survivors = [p.name for p in engine.gs.players if p.trunks > 0]
+        winner = None if len(survivors) != 1 else (0 if survivors[0] == first else 1)
+        results.append((elements[0], elements[1], winner))
+    return results
+
+
+def replay_crash(record):
+    """Re-run a crash recorded while building the book"""
+    random.seed(record['seed'])
+    engine = create_engine(record['player_names'], *record['ai_types'], logger=NullGameLogger())
+    for seat, ai in engine.ai_strategies.items():
+        _randomise_opening(ai, random.Random(record['seed'] * 2 + seat), [])
+    with redirect_stdout(io.StringIO()):
+        engine.run_game()
+    return engine.crash
+
+
+class TeamModel:
+    """P(first drafter wins) = sigmoid(edge + team(first pair) - team(second pair))
+
+    team(pair) is the sum of its elements' strengths plus the pair's synergy.
+    """
+
+    def __init__(self, edge=0.0, strength=None, synergy=None):
+        self.edge = edge
+        self.strength = strength or {e: 0.0 for e in ELEMENTS}
+        self.synergy = synergy or {}  # "A,B" (sorted) -> synergy
+
+    def team(self, pair):
+        a, b = sorted(pair)
+        return self.strength[a] + self.strength[b] + self.synergy.get(f"{a},{b}", 0.0)
+
+    def win_probability(self, first_pair, second_pair):
+        return 1 / (1 + math.exp(-(self.edge + self.team(first_pair) - self.team(second_pair))))
+
+    def fit(self, results, iterations=400, lr=1.0, l2_strength=1e-3, l2_synergy=1e-2):
+        """Full-batch gradient descent on the log loss of (first pair, second pair, winner) results"""
+        data = [(sorted(first), sorted(second), 0.5 if winner is None else 1.0 - winner)
+                for first, second, winner in results]
+        n = len(data)
+        for _ in range(iterations):
+            g_edge = 0.0
+            g_strength = dict.fromkeys(self.strength, 0.0)
+            g_synergy = {}
+            for first, second, y in data:
+                g = self.win_probability(first, second) - y
+                g_edge += g
+                for sign, pair in ((1, first), (-1, second)):
+                    for e in pair:
+                        g_strength[e] += sign * g
+                    key = ','.join(pair)
+                    g_synergy[key] = g_synergy.get(key, 0.0) + sign * g
+            self.edge -= lr * g_edge / n
+            for e in self.strength:
+                self.strength[e] -= lr * (g_strength[e] / n + l2_strength * self.strength[e])
+            for key in set(g_synergy) | set(self.synergy):
+                value = self.synergy.get(key, 0.0)
+                self.synergy[key] = value - lr * (g_synergy.get(key, 0.0) / n + l2_synergy * value)
+        return self
+
+
+def solve_book(model):
+    """Minimax over the four opening picks; returns ({position: element}, {position: mover's win chance})"""
+    book, values = {}, {}
+
+    def decide(key, mover_first, options, outcome):
+        # outcome(option) is the first drafter's win chance; each drafter maximises its own
+        scored = [(outcome(o) if mover_first else 1 - outcome(o), o) for o in options]
+        value, best = max(scored)
+        book[key], values[key] = best, value
+        return value if mover_first else 1 - value
+
+    fourth = {}
+    for a1, a2 in itertools.combinations(ELEMENTS, 2):
+        for b1 in ELEMENTS:
+            if b1 in (a1, a2):
+                continue
+            options = [e for e in ELEMENTS if e not in (a1, a2, b1)]
+            fourth[(a1, a2, b1)] = decide(_key([b1], [a1, a2]), False, options,
+                                          lambda b2: model.win_probability((a1, a2), (b1, b2)))
+    third = {}
+    for a1 in ELEMENTS:
+        for b1 in ELEMENTS:
+            if b1 != a1:
+                options = [e for e in ELEMENTS if e not in (a1, b1)]
+                third[(a1, b1)] = decide(_key([a1], [b1]), True, options,
+                                         lambda a2: fourth[tuple(sorted((a1, a2))) + (b1,)])
+    second = {}
+    for a1 in ELEMENTS:
+        second[a1] = decide(_key([], [a1]), False, [e for e in ELEMENTS if e != a1],
+                            lambda b1: third[(a1, b1)])
+    decide(_key([], []), True, ELEMENTS, lambda a1: second[a1])
+    return book, values
+
+
+class DraftBookBuilder:
+    """Simulate random openings, fit a TeamModel and solve it into an opening book"""
+
+    CHUNK_SIZE = 25
+
+    def __init__(self, games=4000, ai1='expert', ai2='expert', workers=None, seed=None):
+        self.games = games
+        self.ai1 = ai1
+        self.ai2 = ai2
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed if seed is not None else random.randrange(2**31)
+        self.results = []
+
+    def simulate(self):
+        seeds = list(range(self.seed, self.seed + self.games))
+        chunks = [seeds[i:i + self.CHUNK_SIZE] for i in range(0, len(seeds), self.CHUNK_SIZE)]
+        print(f"Simulating {self.games} random openings ({self.ai1} vs {self.ai2}), "
+              f"seeds {self.seed}..{seeds[-1]}, {self.workers} worker(s)")
+        start = time.time()
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(play_chunk, self.ai1, self.ai2, chunk) for chunk in chunks]
+            for done, future in enumerate(futures, 1):
+                self.results += future.result()
+                if done % 10 == 0 or done == len(chunks):
+                    print(f"  {done}/{len(chunks)} chunks [{time.time() - start:.1f}s]")
+        if len(self.results) < self.games:
+            print(f"{self.games - len(self.results)} game(s) crashed (see python crash_corpus.py)")
+
+    def build(self, path=BOOK_PATH):
+        self.simulate()
+        model = TeamModel().fit(self.results)
+        book, values = solve_book(model)
+        first_wins = sum(1 for _, _, winner in self.results if winner == 0) / max(len(self.results), 1)
+        with open(path, 'w') as f:
+            json.dump({'built': datetime.now().isoformat(timespec='seconds'), 'games': len(self.results),
+                       'ai_types': [self.ai1, self.ai2], 'seed': self.seed,
+                       'first_drafter_win_rate': first_wins,
+                       'model': {'edge': model.edge, 'strength': model.strength, 'synergy': model.synergy},
+                       'book': book, 'values': values}, f, indent=2)
+        print(f"Opening book with {len(book)} positions saved to {path}")
+        return path
+
+
+def show(path=BOOK_PATH):
+    with open(path) as f:
+        data = json.load(f)
+    model = data['model']
+    opening = _key([], [])
+    print(f"Draft book: {data['games']} simulated games ({' vs '.join(data['ai_types'])}), built {data['built']}")
+    print(f"First drafter won {data['first_drafter_win_rate']:.1%}; model edge {model['edge']:+.3f}")
+    print(f"Best first pick: {data['book'][opening]} (first drafter wins {data['values'][opening]:.1%} "
+          f"if both follow the book)")
+    print("\nElement strengths:")
+    for element, value in sorted(model['strength'].items(), key=lambda item: -item[1]):
+        print(f"  {element:<12} {value:+.3f}")
+    print("\nStrongest pairs (strengths + synergy):")
+    teams = TeamModel(model['edge'], model['strength'], model['synergy'])
+    pairs = sorted(itertools.combinations(ELEMENTS, 2), key=lambda pair: -teams.team(pair))
+    for pair in pairs[:8]:
+        print(f"  {' + '.join(pair):<24} {teams.team(pair):+.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or inspect the draft opening book')
+    sub = parser.add_subparsers(dest='command', required=True)
+    build_parser = sub.add_parser('build', help='Simulate random openings and write draft_book.json')
+    build_parser.add_argument('--games', type=int, default=4000)
+    build_parser.add_argument('--ai1', default='expert', choices=list(AI_CLASSES))
+    build_parser.add_argument('--ai2', default='expert', choices=list(AI_CLASSES))
+    build_parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    build_parser.add_argument('--seed', type=int)
+    sub.add_parser('show', help='Summarise draft_book.json')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        DraftBookBuilder(args.games, args.ai1, args.ai2, args.workers, args.seed).build()
+    elif not os.path.exists(BOOK_PATH):
+        print(f"No draft book at {BOOK_PATH}; run: python draft_book.py build")
+        sys.exit(1)
+    else:
+        show()
+
+
+if __name__ == "__main__":
+    main()
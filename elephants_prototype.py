@@ -2,15 +2,17 @@ import json
 import os
 import sys
 import random
+import shutil
 import traceback
 from collections import defaultdict
 from typing import Any
 
 # Import AI classes from separate module
-from ai import EasyAI, MediumAI, HardAI, ExpertAI
+from ai import EasyAI, MediumAI, HardAI, ExpertAI, ValueAI
 
 # Import game logger for analytics
-from game_logger import game_logger
+from game_logger import GameLogger
+from ai.trace import DecisionTrace, DEBUG, OFF
 
 # --- CONSTANTS ---
 DEBUG_AI = False  # Set to False to disable AI decision logging
@@ -33,7 +35,8 @@ def load_spell_data():
 SPELL_DATA = load_spell_data()
 
 # --- UTILITIES ---
-def clear_screen(): os.system('cls' if os.name == 'nt' else 'clear')
+ANSI_CLEAR_SCREEN = '\033[H\033[2J\033[3J'  # Home cursor, clear screen and scrollback
+def clear_screen(): sys.stdout.write(ANSI_CLEAR_SCREEN); sys.stdout.flush()
 class Colors:
     HEADER='\033[95m'; BLUE='\033[94m'; CYAN='\033[96m'; GREEN='\033[92m'
     WARNING='\033[93m'; FAIL='\033[91m'; ENDC='\033[0m'; BOLD='\033[1m'
@@ -301,28 +304,208 @@ class GameState:
         for data in SPELL_DATA: sets[data['elephant']].append(self.all_cards[data['id']])
         self.main_deck: list[list[Card]] = list(sets.values()); random.shuffle(self.main_deck)
         self.round_num: int = 1; self.clash_num: int = 1; self.ringleader_index: int = random.randint(0, len(self.players) - 1)
-        self.action_log: list[str] = ["Game has started!"]
+        self.action_log: ActionLog = ActionLog([('game_started', {})])
         self.event_log: list[dict] = []
         self.game_over: bool = False
         self.resolution_queue: list[dict] = []
 
+# --- ACTION LOG ---
+# Log entries are (kind, values) records; the text below is only built when the log is displayed.
+# Values hold player names, card ids (under CARD_KEYS) and numbers, never pre-formatted text.
+ACTION_TEXT = {
+    # Game flow
+    'game_started': "Game has started!",
+    'setup': "--- Game Setup ---",
+    'starting_ringleader': "The starting Ringleader is: {player}",
+    'drafted': "{player} drafted the '{elephant}' ({element_emoji} {element}) set.",
+    'shuffled': "{player} shuffled their deck.",
+    'round_begins': "--- Round {round} Begins ---",
+    'round_end': "--- End of Round {round} ---",
+    'phase': "--- Clash {clash}: {phase} ---",
+    'game_ended': f"{Colors.WARNING}The game has ended!{Colors.ENDC}",
+    'round_ended_early': f"{Colors.WARNING}The round has ended early due to trunk loss!{Colors.ENDC}",
+    'game_over': "GAME OVER! The winner is {player}!",
+    'game_drawn': "GAME OVER! No winner.",
+    'board_cleared': "Board cleared. The new Ringleader is {player}.",
+    'trunk_loss': f"{Colors.FAIL}{{message}}{Colors.ENDC}",
+    'spells_cleared': "{player}'s spells were cleared from the board.",
+    'deck_empty': f"{Colors.WARNING}Main deck is empty! Rebuilding from discards...{Colors.ENDC}",
+    'deck_rebuilt': "Rebuilt main deck with {sets} complete sets.",
+    'hand_empty': "{player}'s hand is empty. They get a new spell set!",
+    'discarded_hand': "{player} discarded their entire hand and can draft a new spell set!",
+    'new_set_locked': f"{Colors.WARNING}Note: You cannot discard cards from this newly drafted set!{Colors.ENDC}",
+    'must_draft': "{player}'s hand is below 4 cards and discard pile is empty. They must draft a new set.",
+    # Prepare, cast and resolve
+    'cannot_play': "{player} cannot play a spell.",
+    'auto_prepare': "You only have one card in hand. Automatically preparing [{card}].",
+    'prepared': "{player} prepared [{card}] {type_icons}.",
+    'prepared_hidden': "{player} has prepared a spell.",
+    'no_spell_played': "{player} did not play a spell.",
+    'revealed_header': f"{Colors.BOLD}Spells Revealed:{Colors.ENDC}",
+    'revealed': "  {player}: {element_emoji} [{card}] {type_icons}{conjury} (P:{priority}, {types})",
+    'instructions': f"    {Colors.GREY}> {{instructions}}{Colors.ENDC}",
+    'ai_header': f"\n{Colors.BOLD}AI Decision Analysis:{Colors.ENDC}",
+    'ai_decision': f"{Colors.GREY}{{message}}{Colors.ENDC}",
+    'order_prompt': "You have multiple spells with priority {priority}. Choose resolution order:",
+    'resolution_order': f"{Colors.GREY}[DEBUG] Ringleader: {{player}} (index {{index}}){Colors.ENDC}",
+    'queued': f"{Colors.GREY}  {{player}}'s {{card}} (P:{{priority}}, turn:{{turn}}){Colors.ENDC}",
+    'moved_away': "[{card}] was moved to a future clash and will not resolve now.",
+    'resolving': f"--> Resolving {{player}}'s {Colors.BOLD}[{{card}}] {{type_icons}}{Colors.ENDC} (P:{{priority}})",
+    'advancing': "--> Advancing {player}'s [{card}] {type_icons}...",
+    'no_advances': "No spells to advance this clash.",
+    # Prompts
+    'no_options': f"{Colors.GREY}No options available.{Colors.ENDC}",
+    'no_valid_options': f"{Colors.GREY}No valid options available.{Colors.ENDC}",
+    'invalid_choice': f"{Colors.FAIL}Invalid choice.{Colors.ENDC}",
+    'invalid_input': f"{Colors.FAIL}Invalid input.{Colors.ENDC}",
+    'single_option': "Only one valid option - executing automatically.",
+    'optimal_option': "{player}'s [{card}] automatically chooses optimal option ({count} other active spells).",
+    'fixed_option': "{player}'s [{card}] chooses fixed option ({count} other active spells).",
+    'do_both': "{player}'s spell changes 'Choose one' to 'Do both'!",
+    'passed': "{player} chose to pass.",
+    # Effects on players
+    'damage': f"{Colors.FAIL}{ACTION_EMOJIS['damage']} {{player}}'s [{{card}}] dealt {{amount}} damage to {{target}}. ({{health}}/{{max_health}}){Colors.ENDC}",
+    'damage_per_spell': f"{Colors.FAIL}{ACTION_EMOJIS['damage']} {{player}}'s [{{card}}] dealt {{amount}} damage to {{target}} ({{count}} spell(s)). ({{health}}/{{max_health}}){Colors.ENDC}",
+    'damage_per_type': f"{Colors.FAIL}{ACTION_EMOJIS['damage']} {{player}}'s [{{card}}] dealt {{amount}} damage to {{target}} ({{count}} {{spell_type}} spell(s)). ({{health}}/{{max_health}}){Colors.ENDC}",
+    'damage_other_clashes': f"{Colors.FAIL}{ACTION_EMOJIS['damage']} {{player}}'s [{{card}}] dealt {{amount}} damage to {{target}} ({{amount}} spell(s) from other clashes). ({{health}}/{{max_health}}){Colors.ENDC}",
+    'damage_per_discard': f"{Colors.FAIL}{ACTION_EMOJIS['damage']} {{player}}'s [{{card}}] dealt {{amount}} damage to {{target}} ({{count}} cards discarded). ({{health}}/{{max_health}}){Colors.ENDC}",
+    'reflected': f"{Colors.FAIL}{ACTION_EMOJIS['damage']} {{player}}'s [{{card}}] reflected {{amount}} damage to {{target}} (from their attack spells). ({{health}}/{{max_health}}){Colors.ENDC}",
+    'heal': f"{Colors.BLUE}{ACTION_EMOJIS['heal']} {{player}}'s [{{card}}] healed {{target}} for {{amount}}. ({{health}}/{{max_health}}){Colors.ENDC}",
+    'heal_per_spell': "{player}'s [{card}] healed {target} for {amount} ({count} spell(s)). ({health}/{max_health})",
+    'weaken': f"{Colors.YELLOW}{ACTION_EMOJIS['weaken']} {{player}}'s [{{card}}] weakened {{target}} by {{amount}}. Max health now {{max_health}}.{Colors.ENDC}",
+    'weaken_per_type': "{player}'s [{card}] weakened {target} by {amount} ({amount} {spell_type} spell(s)). Max health now {max_health}.",
+    'bolster': f"{Colors.GREEN}{ACTION_EMOJIS['bolster']} {{player}}'s [{{card}}] bolstered {{target}}. Max health now {{max_health}}.{Colors.ENDC}",
+    'no_other_clash_spells': "{player}'s [{card}] found no spells from other clashes to count.",
+    'no_damage_boost': "{player} has no other active spells to boost the damage.",
+    'no_heal_boost': "{player} has no other active spells to boost the healing.",
+    'no_weaken_boost': "{player} has no active {spell_type} spells to boost the weakening.",
+    # Effects on spells and cards
+    'cancelled': "{player}'s [{card}] CANCELLED [{target_card}].",
+    'cancelled_by_damage': "{player}'s [{card}] CANCELLED [{target_card}] (1 damage used).",
+    'cancelled_by_weaken': "{player}'s [{card}] weakened and CANCELLED [{target_card}].",
+    'cancelled_spell': "{player}'s [{card}] cancelled {owner}'s [{target_card}]!",
+    'protected': "[{target_card}] is protected by {owner}'s [{protector}] and cannot be {action}!",
+    'revealed_from_hand': "Revealed from {owner}'s hand: [{card}]",
+    'recalled_from_hand': "{player} recalled [{card}] from {owner}'s hand!",
+    'recalled': "{player} recalled [{target_card}] from {source}!",
+    'recalled_from_clash': "{player} recalled [{target_card}] from Clash {clash}!",
+    'no_enemy_cards': "No cards to recall from enemy hands.",
+    'no_past_spells_to_recall': "{player} has no spells in past clashes to recall.",
+    'no_board_spells_to_recall': "{player} has no spells on the board to recall.",
+    'no_targets': f"{Colors.GREY}No valid targets for {{action}}.{Colors.ENDC}",
+    'no_spells_to_move': "No active spells to move.",
+    'moved_clash': "Moved {count} spell(s) from Clash {source} to Clash {dest}!",
+    'moved_spell': "{player} moved [{target_card}] from Clash {source} to Clash {dest}!",
+    'cannot_move': "Cannot move [{target_card}] to a future clash.",
+    'no_cards_to_cast': "{player} has no cards to cast.",
+    'extra_spell': "{player} casts an extra spell: [{card}]!",
+    'no_extra_spell': "{player} chose not to cast any extra spells.",
+    'discarded_card': "{player} discarded [{card}].",
+    'partial_discard': "Only discarded {count} of {required} required cards.",
+    'no_cards_to_discard': "{player} has no cards to discard.",
+    'no_discard': "{player} chose not to discard any cards.",
+    'spell_discarded': f"{Colors.GREY}{ACTION_EMOJIS['discard']} [{{card}}] was discarded.{Colors.ENDC}",
+    'discarded_past_spell': "{player} discarded [{target_card}] from past spells!",
+    'discarded_enemy_past_spell': "{player} discarded [{target_card}] from {owner}'s past spells into their own discard pile!",
+    'no_discard_target': "No valid target to discard.",
+    'copied': "{player} copies [{target_card}] from {owner}!",
+    'sapped': f"{Colors.YELLOW}{{player}} used Sap to steal [{{target_card}}] from {{owner}}'s Clash {{clash}}!{Colors.ENDC}",
+    'sequence_stopped': "Sequence stopped - no valid spells to {action}.",
+    'no_past_clashes': "No past clashes to choose from.",
+    'no_past_spells_to_advance': "No active spells in past clashes to advance.",
+    # Advancing
+    'advanced': f"{Colors.GREEN}{ACTION_EMOJIS['advance']} {{owner}}'s [{{target_card}}] advanced from Clash {{source}} to Clash {{dest}}.{Colors.ENDC}",
+    'advanced_from_hand': "{player} advanced [{card}] from hand to Clash {clash}!",
+    'advance_blocked': "[{target_card}] cannot advance because {owner}'s [{blocker}] prevents it!",
+    'hand_advance_blocked': "{player} cannot advance cards from hand because {owner}'s [{blocker}] prevents it!",
+    'advance_limit': "[{target_card}] can only advance itself {limit} time(s) per round and has already advanced {count} time(s).",
+    'advance_missing': "Error: Could not find [{target_card}] to advance.",
+    'advance_past_end': "[{target_card}] could not advance past Clash 4.",
+    'no_cards_to_advance': "{player} has no cards in hand to advance.",
+    'no_future_clashes': "Cannot advance from hand - no future clashes remaining.",
+    # Diagnostics
+    'debug_resolve_count': f"{Colors.GREY}[DEBUG] Impact has previously resolved {{count}} times, needs {{required}} to trigger weaken{Colors.ENDC}",
+    'debug_clash_count': f"{Colors.GREY}[DEBUG] {{card}} has been in clashes: {{clashes}}, total: {{count}}, needs {{required}}{Colors.ENDC}",
+    'debug_advance_count': f"{Colors.GREY}[DEBUG] {{card}} has advanced {{count}} times, needs {{required}}{Colors.ENDC}",
+    'debug_ai_option': f"{Colors.GREY}[DEBUG] Prickle AI chose option with {{amount}} damage{Colors.ENDC}",
+    'debug_no_advance_target': f"{Colors.FAIL}[DEBUG] Advance target is None for {{card}}{Colors.ENDC}",
+    'debug_bad_advance_target': f"{Colors.FAIL}[DEBUG] Advance target is not a PlayedCard: {{target_type}}{Colors.ENDC}",
+    'debug_no_this_spell': f"{Colors.FAIL}[DEBUG] Could not find 'this_spell' for {{card}} (ID: {{card_id}}){Colors.ENDC}",
+}
+CARD_KEYS = ('card', 'target_card', 'protector')  # Values holding card ids, shown as card names
+
+
+def spell_type_icons(card):
+    """Icons for a card's spell types, conjury first"""
+    icons = [SPELL_TYPE_EMOJIS['conjury']] if card.is_conjury else []
+    icons.extend(SPELL_TYPE_EMOJIS[t] for t in ('attack', 'response', 'remedy', 'boost') if t in card.types)
+    return ' '.join(icons)
+
+
+class _EntryFields(dict):
+    """A record's values for str.format_map, with details of its 'card' looked up only if the text uses them"""
+    def __init__(self, values, cards):
+        super().__init__(values)
+        self.card = cards.get(values.get('card'))
+        for key in CARD_KEYS:
+            if key in values:
+                card = cards.get(values[key])
+                self[key] = card.name if card else f"#{values[key]}"
+    def __missing__(self, key):
+        card = self.card
+        if key == 'element_emoji': return ELEMENT_EMOJIS.get(card.element if card else self.get('element'), '')
+        if key == 'type_icons': return spell_type_icons(card)
+        if key == 'types': return '/'.join(card.types) if card.types else 'None'
+        if key == 'priority': return card.priority
+        if key == 'conjury': return " [CONJURY]" if card.is_conjury else ""
+        if key == 'instructions': return card.get_instructions_text()
+        raise KeyError(key)
+
+
+def format_log_entry(entry, cards):
+    """Text of one action log record; cards maps card ids to Cards (GameState.all_cards)"""
+    if isinstance(entry, str):  # Plain lines appended by older tools
+        return entry
+    kind, values = entry
+    return ACTION_TEXT[kind].format_map(_EntryFields(values, cards))
+
+
+class ActionLog(list):
+    """The game's action log as (kind, values) records, formatted only when displayed"""
+    def add(self, kind: str, **values) -> None:
+        self.append((kind, values))
+    def lines(self, cards, last=None) -> list[str]:
+        """Text of the last `last` entries (all of them by default)"""
+        return [format_log_entry(entry, cards) for entry in (self if last is None else self[-last:])]
+
 # --- DISPLAY ENGINE ---
 class DashboardDisplay:
+    """Buffered terminal renderer: composes each frame into one string and only repaints rows that changed."""
+    FRAME_WIDTH = 150  # Widest line the board can produce
+
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stdout
+        self._last_frame: list[str] = []
+        self._needs_full_repaint: bool = True
+    def invalidate(self) -> None:
+        """Force the next draw to repaint the whole screen (e.g. after something else printed over it)."""
+        self._needs_full_repaint = True
+    def input(self, prompt: str = "") -> str:
+        """input() for prompts under a frame; the spare rows _render leaves hold the echoed answer (a frame that didn't fit repaints in full anyway)."""
+        return input(prompt)
     def _get_spell_type_icons(self, card):
         """Get icons representing the spell's types"""
-        icons = []
-        if card.is_conjury:
-            icons.append(SPELL_TYPE_EMOJIS['conjury'])
-        for spell_type in ['attack', 'response', 'remedy', 'boost']:
-            if spell_type in card.types:
-                icons.append(SPELL_TYPE_EMOJIS[spell_type])
-        return ' '.join(icons)  # Added space between icons
-    def draw(self, gs, pov_player_index=0, prompt=""):
-        clear_screen(); print(f"{Colors.HEADER}{'='*34}[ Elemental Elephants ]{'='*33}{Colors.ENDC}")
-        print(f"Round: {gs.round_num} | Clash: {gs.clash_num} | Ringleader: 🐘 {Colors.BOLD}{gs.players[gs.ringleader_index].name}{Colors.ENDC}")
-        print("-" * 150)
+        return spell_type_icons(card)
+    def draw(self, gs, pov_player_index=0, prompt="", options=None):
+        """Render the board, hand, log, prompt and any option lines as a single frame."""
+        self._render(self._compose(gs, pov_player_index, prompt, options))
+    def _compose(self, gs, pov_player_index=0, prompt="", options=None) -> list[str]:
+        """Build the frame as a list of screen rows without writing anything."""
+        out = [f"{Colors.HEADER}{'='*34}[ Elemental Elephants ]{'='*33}{Colors.ENDC}"]
+        out.append(f"Round: {gs.round_num} | Clash: {gs.clash_num} | Ringleader: 🐘 {Colors.BOLD}{gs.players[gs.ringleader_index].name}{Colors.ENDC}")
+        out.append("-" * 150)
         header = f"{'PLAYER'.ljust(15)} | {'HEALTH'.ljust(16)} | {'TRUNKS'} | {'DISCARD'} | {'CLASH I'.ljust(30)} | {'CLASH II'.ljust(30)} | {'CLASH III'.ljust(30)}| {'CLASH IV'.ljust(30)}"
-        print(Colors.BOLD + header + Colors.ENDC); print("-" * 150)
+        out.append(Colors.BOLD + header + Colors.ENDC); out.append("-" * 150)
         
         # Find the maximum number of spells in any clash for any player
         max_spells_per_clash = 0
@@ -375,22 +558,45 @@ class DashboardDisplay:
                     
                     row_str += slot_str.ljust(30) + " | "
                 
-                print(row_str.rstrip(" |"))
+                out.append(row_str.rstrip(" |"))
 
-        print("=" * 150); pov_player = gs.players[pov_player_index]
+        out.append("=" * 150); pov_player = gs.players[pov_player_index]
         if pov_player.is_human:
-            print(f"\n--- {Colors.CYAN}YOUR HAND ({pov_player.name}){Colors.ENDC}")
-            if not pov_player.hand: print(f"{Colors.GREY}Your hand is empty.{Colors.ENDC}")
+            out.append(f"\n--- {Colors.CYAN}YOUR HAND ({pov_player.name}){Colors.ENDC}")
+            if not pov_player.hand: out.append(f"{Colors.GREY}Your hand is empty.{Colors.ENDC}")
             else:
                 for i, card in enumerate(pov_player.hand):
                     emoji = ELEMENT_EMOJIS.get(card.element, '')
                     type_icons = self._get_spell_type_icons(card)
                     type_str = '/'.join(card.types) if card.types else 'None'
-                    print(f"[{i+1}] {emoji} {Colors.BOLD}{card.name}{Colors.ENDC} {type_icons} (P:{card.priority}, {type_str})"); 
-                    print(f"    {Colors.GREY}> {card.get_instructions_text()}{Colors.ENDC}")
-        print("-" * 89);
-        if gs.action_log: print(f"{Colors.BOLD}LOG:{Colors.ENDC}"); [print(f"  {entry}") for entry in gs.action_log[-20:]]
-        if prompt: print(f"\n>>> {Colors.WARNING}{prompt}{Colors.ENDC}")
+                    out.append(f"[{i+1}] {emoji} {Colors.BOLD}{card.name}{Colors.ENDC} {type_icons} (P:{card.priority}, {type_str})")
+                    out.append(f"    {Colors.GREY}> {card.get_instructions_text()}{Colors.ENDC}")
+        out.append("-" * 89)
+        if gs.action_log:
+            out.append(f"{Colors.BOLD}LOG:{Colors.ENDC}"); out.extend(f"  {line}" for line in gs.action_log.lines(gs.all_cards, 20))
+        if prompt: out.append(f"\n>>> {Colors.WARNING}{prompt}{Colors.ENDC}")
+        if options: out.extend(options)
+        # Entries may contain embedded newlines (instruction text, section breaks) - split into real rows
+        return "\n".join(out).split("\n")
+    def _render(self, frame: list[str]) -> None:
+        """Write a composed frame with one write() call, repainting only rows that differ from the last frame."""
+        columns, rows = shutil.get_terminal_size(fallback=(self.FRAME_WIDTH, 50))
+        # Absolute cursor positioning is only safe when nothing wraps or scrolls off screen;
+        # leave two rows spare for the input line printed under the frame.
+        fits = columns >= self.FRAME_WIDTH and len(frame) + 2 < rows
+        # DEBUG_AI prints between frames, so debug runs always repaint in full
+        if self._needs_full_repaint or not fits or DEBUG_AI:
+            buf = [ANSI_CLEAR_SCREEN, "\n".join(frame), "\n"]
+        else:
+            buf = []
+            for row, line in enumerate(frame):
+                if row >= len(self._last_frame) or self._last_frame[row] != line:
+                    buf.append(f"\033[{row + 1};1H{line}\033[K")
+            # Park the cursor below the frame and wipe old rows plus any option/input text left there
+            buf.append(f"\033[{len(frame) + 1};1H\033[J")
+        self.stream.write("".join(buf)); self.stream.flush()
+        self._last_frame = frame
+        self._needs_full_repaint = not fits
 
 
 # --- LOGIC ENGINES ---
@@ -425,7 +631,7 @@ class ConditionChecker:
                 
                 # Debug logging for Impact
                 if current_card.name == "Impact" and DEBUG_AI:
-                    gs.action_log.append(f"{Colors.GREY}[DEBUG] Impact has previously resolved {resolve_count} times, needs {required_count} to trigger weaken{Colors.ENDC}")
+                    gs.action_log.add('debug_resolve_count', count=resolve_count, required=required_count)
                 
                 return resolve_count >= required_count
 
@@ -570,7 +776,7 @@ class ConditionChecker:
             
             # Debug logging
             if DEBUG_AI and current_card.name == "Turbulence":
-                gs.action_log.append(f"{Colors.GREY}[DEBUG] {current_card.name} has been in clashes: {sorted(clashes_seen)}, total: {clash_count}, needs {required_count}{Colors.ENDC}")
+                gs.action_log.add('debug_clash_count', card=current_card.id, clashes=sorted(clashes_seen), count=clash_count, required=required_count)
             
             return clash_count >= required_count
         
@@ -589,7 +795,7 @@ class ConditionChecker:
             
             # Debug logging
             if DEBUG_AI:
-                gs.action_log.append(f"{Colors.GREY}[DEBUG] {current_card.name} has advanced {advance_count} times, needs {required_count}{Colors.ENDC}")
+                gs.action_log.add('debug_advance_count', card=current_card.id, count=advance_count, required=required_count)
             
             return advance_count >= required_count
         
@@ -615,7 +821,7 @@ class ActionHandler:
                             break
             
             if current_card:
-                game_logger.log_damage_dealt(
+                self.engine.logger.log_damage_dealt(
                     source_player=kwargs.get('player'),
                     target_player=kwargs.get('target'),
                     damage_amount=kwargs.get('value', 0),
@@ -637,7 +843,7 @@ class ActionHandler:
                             break
             
             if current_card:
-                game_logger.log_healing_done(
+                self.engine.logger.log_healing_done(
                     source_player=kwargs.get('player'),  # The healed player
                     target_player=kwargs.get('player'),   # Same for self-heal
                     heal_amount=kwargs.get('value', 0),
@@ -658,7 +864,7 @@ class ActionHandler:
                             break
             
             if current_card:
-                game_logger.log_weaken_dealt(
+                self.engine.logger.log_weaken_dealt(
                     source_player=kwargs.get('player'),
                     target_player=kwargs.get('target'),
                     weaken_amount=kwargs.get('value', 0),
@@ -679,7 +885,7 @@ class ActionHandler:
                             break
             
             if current_card:
-                game_logger.log_bolster_done(
+                self.engine.logger.log_bolster_done(
                     source_player=kwargs.get('player'),
                     target_player=kwargs.get('target'),
                     bolster_amount=kwargs.get('value', 0),
@@ -697,7 +903,7 @@ class ActionHandler:
                     spell_name = spell.get('card_name', 'Unknown')
                     break
             
-            game_logger.log_spell_advanced(
+            self.engine.logger.log_spell_advanced(
                 player_name=kwargs.get('player'),
                 spell_name=spell_name,
                 from_clash=gs.clash_num,
@@ -714,7 +920,7 @@ class ActionHandler:
                 if spell.get('id') == kwargs.get('card_id'):
                     canceller_spell_name = spell.get('card_name', 'Unknown')
             
-            game_logger.log_spell_cancelled(
+            self.engine.logger.log_spell_cancelled(
                 player_name=kwargs.get('player'),
                 spell_name=target_spell_name,
                 cancelled_by=canceller_spell_name
@@ -728,7 +934,7 @@ class ActionHandler:
                     spell_name = spell.get('card_name', 'Unknown')
                     break
             
-            game_logger.log_spell_recalled(
+            self.engine.logger.log_spell_recalled(
                 player_name=kwargs.get('player'),
                 spell_name=spell_name,
                 from_location='discard'  # Default, could be enhanced
@@ -799,7 +1005,7 @@ class ActionHandler:
                                         enemy_spells.append(f"{s.card.name}({','.join(s.card.types)})")
                         debug_info = f" [Looking for {spell_type}, found: {', '.join(enemy_spells) if enemy_spells else 'none'}]"
                     
-                    game_logger.log_response_condition_evaluated(
+                    self.engine.logger.log_response_condition_evaluated(
                         player_name=caster.name,
                         spell_name=current_card.name,
                         condition_met=condition_met,
@@ -858,9 +1064,9 @@ class ActionHandler:
                 if enemy.hand:
                     # For AI enemies, reveal a random card
                     revealed_card = random.choice(enemy.hand)
-                    gs.action_log.append(f"Revealed from {enemy.name}'s hand: [{revealed_card.name}]")
+                    gs.action_log.add('revealed_from_hand', owner=enemy.name, card=revealed_card.id)
                     # Log the reveal
-                    game_logger.log_spell_revealed(enemy.name, revealed_card.name, caster.name)
+                    self.engine.logger.log_spell_revealed(enemy.name, revealed_card.name, caster.name)
                     revealed_cards.append((enemy, revealed_card))
             
             # Let the caster choose which card to recall
@@ -871,7 +1077,7 @@ class ActionHandler:
                         enemy, card = revealed_cards[0]
                         enemy.hand.remove(card)
                         caster.hand.append(card)
-                        gs.action_log.append(f"{caster.name} recalled [{card.name}] from {enemy.name}'s hand!")
+                        gs.action_log.add('recalled_from_hand', player=caster.name, card=card.id, owner=enemy.name)
                     else:
                         # Let player choose
                         options = {}
@@ -879,29 +1085,28 @@ class ActionHandler:
                             options[i+1] = (enemy, card)
                         
                         prompt = "Choose a revealed card to recall:"
-                        self.engine.display.draw(gs, gs.players.index(caster), prompt=prompt)
-                        for key, (enemy, card) in options.items():
-                            emoji = ELEMENT_EMOJIS.get(card.element, '')
-                            print(f"  [{key}] {emoji} {card.name} from {enemy.name}")
+                        option_lines = [f"  [{key}] {ELEMENT_EMOJIS.get(card.element, '')} {card.name} from {enemy.name}"
+                                        for key, (enemy, card) in options.items()]
+                        self.engine.display.draw(gs, gs.players.index(caster), prompt=prompt, options=option_lines)
                         
-                        choice = input("\nYour choice: ").strip()
+                        choice = self.engine.display.input("\nYour choice: ").strip()
                         try:
                             choice_idx = int(choice)
                             if choice_idx in options:
                                 enemy, card = options[choice_idx]
                                 enemy.hand.remove(card)
                                 caster.hand.append(card)
-                                gs.action_log.append(f"{caster.name} recalled [{card.name}] from {enemy.name}'s hand!")
+                                gs.action_log.add('recalled_from_hand', player=caster.name, card=card.id, owner=enemy.name)
                         except ValueError:
-                            gs.action_log.append(f"{Colors.FAIL}Invalid choice.{Colors.ENDC}")
+                            gs.action_log.add('invalid_choice')
                 else:
                     # AI just takes the first revealed card
                     enemy, card = revealed_cards[0]
                     enemy.hand.remove(card)
                     caster.hand.append(card)
-                    gs.action_log.append(f"{caster.name} recalled [{card.name}] from {enemy.name}'s hand!")
+                    gs.action_log.add('recalled_from_hand', player=caster.name, card=card.id, owner=enemy.name)
             else:
-                gs.action_log.append("No cards to recall from enemy hands.")
+                gs.action_log.add('no_enemy_cards')
             return True
             
         elif action_type == 'move_clash_to_clash':
@@ -917,17 +1122,16 @@ class ActionHandler:
                         clash_options[i+1] = (i, spells_in_clash)
                 
                 if not clash_options:
-                    gs.action_log.append("No active spells to move.")
+                    gs.action_log.add('no_spells_to_move')
                     return True
                 
                 # Choose source clash
                 prompt = "Choose a clash to move spells FROM:"
-                self.engine.display.draw(gs, gs.players.index(caster), prompt=prompt)
-                for key, (clash_idx, spells) in clash_options.items():
-                    spell_names = [s.card.name for s in spells]
-                    print(f"  [{key}] Clash {clash_idx + 1}: {', '.join(spell_names)}")
+                option_lines = [f"  [{key}] Clash {clash_idx + 1}: {', '.join(s.card.name for s in spells)}"
+                                for key, (clash_idx, spells) in clash_options.items()]
+                self.engine.display.draw(gs, gs.players.index(caster), prompt=prompt, options=option_lines)
                 
-                source_choice = input("\nYour choice: ").strip()
+                source_choice = self.engine.display.input("\nYour choice: ").strip()
                 try:
                     source_key = int(source_choice)
                     if source_key in clash_options:
@@ -936,11 +1140,10 @@ class ActionHandler:
                         # Choose destination clash
                         dest_options = {i+1: i for i in range(4) if i != source_clash_idx}
                         prompt = "Choose a clash to move spells TO:"
-                        self.engine.display.draw(gs, gs.players.index(caster), prompt=prompt)
-                        for key, clash_idx in dest_options.items():
-                            print(f"  [{key}] Clash {clash_idx + 1}")
+                        option_lines = [f"  [{key}] Clash {clash_idx + 1}" for key, clash_idx in dest_options.items()]
+                        self.engine.display.draw(gs, gs.players.index(caster), prompt=prompt, options=option_lines)
                         
-                        dest_choice = input("\nYour choice: ").strip()
+                        dest_choice = self.engine.display.input("\nYour choice: ").strip()
                         dest_key = int(dest_choice)
                         if dest_key in dest_options:
                             dest_clash_idx = dest_options[dest_key]
@@ -954,16 +1157,16 @@ class ActionHandler:
                                 moved_count += 1
                                 
                                 # Log the move
-                                game_logger.log_spell_moved(owner.name, spell.card.name, source_clash_idx + 1, dest_clash_idx + 1)
+                                self.engine.logger.log_spell_moved(owner.name, spell.card.name, source_clash_idx + 1, dest_clash_idx + 1)
                                 
                                 # If moving to current clash, add to resolution queue
                                 if dest_clash_idx == gs.clash_num - 1:
                                     self.engine.add_to_resolution_queue(spell)
                             
-                            gs.action_log.append(f"Moved {moved_count} spell(s) from Clash {source_clash_idx + 1} to Clash {dest_clash_idx + 1}!")
+                            gs.action_log.add('moved_clash', count=moved_count, source=source_clash_idx + 1, dest=dest_clash_idx + 1)
                             self.engine._pause()
                 except ValueError:
-                    gs.action_log.append(f"{Colors.FAIL}Invalid choice.{Colors.ENDC}")
+                    gs.action_log.add('invalid_choice')
             else:
                 # AI logic - move from current clash to next clash if possible
                 for i in range(gs.clash_num - 1, 3):
@@ -980,7 +1183,7 @@ class ActionHandler:
                             # If moving to current clash, add to resolution queue
                             if i+1 == gs.clash_num - 1:
                                 self.engine.add_to_resolution_queue(spell)
-                        gs.action_log.append(f"Moved {len(spells_in_clash)} spell(s) from Clash {i + 1} to Clash {i + 2}!")
+                        gs.action_log.add('moved_clash', count=len(spells_in_clash), source=i + 1, dest=i + 2)
                         break
             return True
         
@@ -996,7 +1199,7 @@ class ActionHandler:
                             past_spells.append(spell)
                 
                 if not past_spells:
-                    gs.action_log.append(f"{caster.name} has no spells in past clashes to recall.")
+                    gs.action_log.add('no_past_spells_to_recall', player=caster.name)
                     return True
                 
                 if caster.is_human:
@@ -1028,7 +1231,7 @@ class ActionHandler:
                             available_spells.append(spell)
                 
                 if not available_spells:
-                    gs.action_log.append(f"{caster.name} has no spells on the board to recall.")
+                    gs.action_log.add('no_board_spells_to_recall', player=caster.name)
                     return True
                 
                 if caster.is_human:
@@ -1050,7 +1253,7 @@ class ActionHandler:
                 # Standard targeting for other recall types
                 targets = self._resolve_target(action_data, gs, caster, current_card)
                 if not targets:
-                    gs.action_log.append(f"{Colors.GREY}No valid targets for recall.{Colors.ENDC}")
+                    gs.action_log.add('no_targets', action='recall')
                     self.engine._pause()
                     return True
         else:
@@ -1063,7 +1266,7 @@ class ActionHandler:
                 targets = self._resolve_target(action_data, gs, caster, current_card)
                 
                 if not targets:
-                    gs.action_log.append(f"{Colors.GREY}No valid targets for {action_type}.{Colors.ENDC}"); self.engine._pause()
+                    gs.action_log.add('no_targets', action=action_type); self.engine._pause()
                     return
 
         if action_type == 'auto_optimal_choice':
@@ -1089,19 +1292,19 @@ class ActionHandler:
                     valid_options.append(option)
             
             if not valid_options:
-                gs.action_log.append(f"{Colors.GREY}No valid options available.{Colors.ENDC}")
+                gs.action_log.add('no_valid_options')
                 return True
                 
             # Choose based on threshold
             if comparison_value >= threshold and len(valid_options) >= 2:
                 # Choose the second option (typically the "per spell" option)
                 chosen_option = valid_options[1]
-                gs.action_log.append(f"{caster.name}'s [{current_card.name}] automatically chooses optimal option ({comparison_value} other active spells).")
+                gs.action_log.add('optimal_option', player=caster.name, card=current_card.id, count=comparison_value)
             else:
                 # Choose the first option (typically the fixed value option)
                 chosen_option = valid_options[0]
                 if comparison_value > 0:
-                    gs.action_log.append(f"{caster.name}'s [{current_card.name}] chooses fixed option ({comparison_value} other active spells).")
+                    gs.action_log.add('fixed_option', player=caster.name, card=current_card.id, count=comparison_value)
             
             self._execute_action(chosen_option, gs, caster, current_card)
             return True
@@ -1137,12 +1340,12 @@ class ActionHandler:
                     valid_options.append(option)
             
             if not valid_options:
-                gs.action_log.append(f"{Colors.GREY}No valid options available.{Colors.ENDC}")
+                gs.action_log.add('no_valid_options')
                 return True
             
               # If choice modifier is active, execute ALL valid options
             if has_choice_modifier:
-                gs.action_log.append(f"{caster.name}'s spell changes 'Choose one' to 'Do both'!")
+                gs.action_log.add('do_both', player=caster.name)
                 for option in valid_options:
                     self._execute_action(option, gs, caster, current_card)
                     self.engine._pause()
@@ -1150,7 +1353,7 @@ class ActionHandler:
             
             # If only one valid option, execute it automatically
             if len(valid_options) == 1:
-                gs.action_log.append(f"Only one valid option - executing automatically.")
+                gs.action_log.add('single_option')
                 self._execute_action(valid_options[0], gs, caster, current_card)
                 return True
             
@@ -1173,18 +1376,17 @@ class ActionHandler:
                 
                 # Display options to player
                 prompt = "Choose an option:"
-                self.engine.display.draw(gs, gs.players.index(caster), prompt=prompt)
-                for key, opt in options_dict.items():
-                    print(f"  [{key}] {opt['label']}")
+                option_lines = [f"  [{key}] {opt['label']}" for key, opt in options_dict.items()]
+                self.engine.display.draw(gs, gs.players.index(caster), prompt=prompt, options=option_lines)
                 
-                choice = input("\nYour choice: ").strip()
+                choice = self.engine.display.input("\nYour choice: ").strip()
                 try:
                     choice_idx = int(choice)
                     if choice_idx in options_dict:
                         chosen_action = options_dict[choice_idx]['action']
                         self._execute_action(chosen_action, gs, caster, current_card)
                 except ValueError:
-                    gs.action_log.append(f"{Colors.FAIL}Invalid choice.{Colors.ENDC}")
+                    gs.action_log.add('invalid_choice')
             else:
                 # Use the AI strategy system to make the choice
                 # Find the AI strategy for this player
@@ -1270,7 +1472,7 @@ class ActionHandler:
                         if best_attack and best_damage > 0:
                             attack_options = [best_attack]
                             if DEBUG_AI and current_card.name == "Prickle":
-                                gs.action_log.append(f"{Colors.GREY}[DEBUG] Prickle AI chose option with {best_damage} damage{Colors.ENDC}")
+                                gs.action_log.add('debug_ai_option', amount=best_damage)
                     
                     if caster.health <= 1:
                         # At 1 health - NEVER choose self-damage options
@@ -1322,7 +1524,7 @@ class ActionHandler:
             
             if caster.is_human:
                 if not caster.hand: 
-                    gs.action_log.append(f"{caster.name} has no cards to cast.")
+                    gs.action_log.add('no_cards_to_cast', player=caster.name)
                     self.engine._pause()
                     return
                 
@@ -1345,12 +1547,12 @@ class ActionHandler:
                         newly_played_card.status = 'revealed'  # Set to active since it's cast mid-resolution
                         gs.players[gs.players.index(caster)].board[gs.clash_num - 1].append(newly_played_card)
                         self.engine.add_to_resolution_queue(newly_played_card)
-                        gs.action_log.append(f"{caster.name} casts an extra spell: [{card_to_cast.name}]!")
+                        gs.action_log.add('extra_spell', player=caster.name, card=card_to_cast.id)
                         spells_cast += 1
                         self.engine._pause()
                 
                 if spells_cast == 0:
-                    gs.action_log.append(f"{caster.name} chose not to cast any extra spells.")
+                    gs.action_log.add('no_extra_spell', player=caster.name)
                     self.engine._pause()
             else:
                 # AI casts up to num_to_cast spells
@@ -1361,7 +1563,7 @@ class ActionHandler:
                         newly_played_card.status = 'revealed'
                         gs.players[gs.players.index(caster)].board[gs.clash_num - 1].append(newly_played_card)
                         self.engine.add_to_resolution_queue(newly_played_card)
-                        gs.action_log.append(f"{caster.name} casts an extra spell: [{card_to_cast.name}]!")
+                        gs.action_log.add('extra_spell', player=caster.name, card=card_to_cast.id)
             return
         
     #Action Types
@@ -1378,7 +1580,7 @@ class ActionHandler:
                         original_health = target.health
                         target.health = max(0, target.health - damage_to_apply)
                         damage_remaining = 0  # All damage applied to player
-                        gs.action_log.append(f"{Colors.FAIL}{ACTION_EMOJIS['damage']} {caster.name}'s [{current_card.name}] dealt {damage_to_apply} damage to {target.name}. ({target.health}/{target.max_health}){Colors.ENDC}")
+                        gs.action_log.add('damage', player=caster.name, card=current_card.id, amount=damage_to_apply, target=target.name, health=target.health, max_health=target.max_health)
                         self._fire_event('player_damaged', gs, player=caster.name, target=target.name, value=damage_to_apply, card_id=current_card.id)
                         if original_health > 0 and target.health <= 0:
                             death_result = self.engine._handle_trunk_loss(target)
@@ -1391,19 +1593,19 @@ class ActionHandler:
                     if target.status != 'cancelled': # Only cancel if not already cancelled
                         target.status = 'cancelled'
                         damage_remaining -= 1  # Conjury takes 1 damage to cancel
-                        gs.action_log.append(f"{caster.name}'s [{current_card.name}] CANCELLED [{target.card.name}] (1 damage used).")
+                        gs.action_log.add('cancelled_by_damage', player=caster.name, card=current_card.id, target_card=target.card.id)
                         self._fire_event('spell_cancelled', gs, player=caster.name, target_card_id=target.card.id, card_id=current_card.id)
 
             elif action_type == 'weaken':
                 if isinstance(target, PlayedCard) and target.card.is_conjury:
                     # Weakening a conjury cancels it
                     target.status = 'cancelled'
-                    gs.action_log.append(f"{caster.name}'s [{current_card.name}] weakened and CANCELLED [{target.card.name}].")
+                    gs.action_log.add('cancelled_by_weaken', player=caster.name, card=current_card.id, target_card=target.card.id)
                     break
                 elif isinstance(target, Player):
                     weaken_amount = params.get('value', 1)
                     target.max_health = max(0, target.max_health - weaken_amount); target.health = min(target.health, target.max_health)
-                    gs.action_log.append(f"{Colors.YELLOW}{ACTION_EMOJIS['weaken']} {caster.name}'s [{current_card.name}] weakened {target.name} by {weaken_amount}. Max health now {target.max_health}.{Colors.ENDC}")
+                    gs.action_log.add('weaken', player=caster.name, card=current_card.id, target=target.name, amount=weaken_amount, max_health=target.max_health)
                     # Log weaken event separately
                     self._fire_event('player_weakened', gs, player=caster.name, target=target.name, value=weaken_amount, card_id=current_card.id)
 
@@ -1412,7 +1614,7 @@ class ActionHandler:
                     if isinstance(t, Player):
                         if not t.is_invulnerable:
                             damage = params.get('value', 1); original_health = t.health; t.health = max(0, t.health - damage)
-                        gs.action_log.append(f"{Colors.FAIL}{ACTION_EMOJIS['damage']} {caster.name}'s [{current_card.name}] dealt {damage} damage to {t.name}. ({t.health}/{t.max_health}){Colors.ENDC}")
+                        gs.action_log.add('damage', player=caster.name, card=current_card.id, amount=damage, target=t.name, health=t.health, max_health=t.max_health)
                         self._fire_event('player_damaged', gs, player=caster.name, target=t.name, value=damage, card_id=current_card.id)
                         if original_health > 0 and t.health <= 0:
                             death_result = self.engine._handle_trunk_loss(t)
@@ -1421,16 +1623,16 @@ class ActionHandler:
                             elif death_result == 'round_over':
                                 raise RoundOverException()
                     elif isinstance(t, PlayedCard) and t.card.is_conjury:
-                        t.status = 'cancelled'; gs.action_log.append(f"{caster.name}'s [{current_card.name}] CANCELLED [{t.card.name}].")
+                        t.status = 'cancelled'; gs.action_log.add('cancelled', player=caster.name, card=current_card.id, target_card=t.card.id)
                         self._fire_event('spell_cancelled', gs, player=caster.name, target_card_id=t.card.id, card_id=current_card.id)
 
             elif action_type == 'heal':
-                target.health = min(target.max_health, target.health + params.get('value', 1)); gs.action_log.append(f"{Colors.BLUE}{ACTION_EMOJIS['heal']} {caster.name}'s [{current_card.name}] healed {target.name} for {params.get('value', 1)}. ({target.health}/{target.max_health}){Colors.ENDC}")
+                target.health = min(target.max_health, target.health + params.get('value', 1)); gs.action_log.add('heal', player=caster.name, card=current_card.id, target=target.name, amount=params.get('value', 1), health=target.health, max_health=target.max_health)
                 self._fire_event('player_healed', gs, player=target.name, value=params.get('value', 1), card_id=current_card.id)
             
             elif action_type == 'bolster':
                 bolster_amount = params.get('value', 1)
-                target.max_health += bolster_amount; gs.action_log.append(f"{Colors.GREEN}{ACTION_EMOJIS['bolster']} {caster.name}'s [{current_card.name}] bolstered {target.name}. Max health now {target.max_health}.{Colors.ENDC}")
+                target.max_health += bolster_amount; gs.action_log.add('bolster', player=caster.name, card=current_card.id, target=target.name, max_health=target.max_health)
                 # Log bolster event separately
                 self._fire_event('player_bolstered', gs, player=caster.name, target=target.name, value=bolster_amount, card_id=current_card.id)
             elif action_type == 'damage_per_spell_from_other_clashes':
@@ -1455,7 +1657,7 @@ class ActionHandler:
                 if damage > 0 and isinstance(target, Player) and not target.is_invulnerable:
                     original_health = target.health
                     target.health = max(0, target.health - damage)
-                    gs.action_log.append(f"{Colors.FAIL}{ACTION_EMOJIS['damage']} {caster.name}'s [{current_card.name}] dealt {damage} damage to {target.name} ({damage} spell(s) from other clashes). ({target.health}/{target.max_health}){Colors.ENDC}")
+                    gs.action_log.add('damage_other_clashes', player=caster.name, card=current_card.id, amount=damage, target=target.name, health=target.health, max_health=target.max_health)
                     self._fire_event('player_damaged', gs, player=caster.name, target=target.name, value=damage, card_id=current_card.id)
                     if target.health == 0:
                         death_result = self.engine._handle_trunk_loss(target)
@@ -1464,7 +1666,7 @@ class ActionHandler:
                             if caster.trunks > 0:
                                 raise RoundOverException()
                 elif damage == 0:
-                    gs.action_log.append(f"{caster.name}'s [{current_card.name}] found no spells from other clashes to count.")
+                    gs.action_log.add('no_other_clash_spells', player=caster.name, card=current_card.id)
                     
             elif action_type == 'damage_per_spell':
                 # Count active spells matching criteria
@@ -1485,7 +1687,7 @@ class ActionHandler:
                         damage = count
                         original_health = target.health
                         target.health = max(0, target.health - damage)
-                        gs.action_log.append(f"{Colors.FAIL}{ACTION_EMOJIS['damage']} {caster.name}'s [{current_card.name}] dealt {damage} damage to {target.name} ({count} spell(s)). ({target.health}/{target.max_health}){Colors.ENDC}")
+                        gs.action_log.add('damage_per_spell', player=caster.name, card=current_card.id, amount=damage, target=target.name, count=count, health=target.health, max_health=target.max_health)
                         self._fire_event('player_damaged', gs, player=caster.name, target=target.name, value=damage, card_id=current_card.id)
                         if original_health > 0 and target.health <= 0:
                             death_result = self.engine._handle_trunk_loss(target)
@@ -1495,9 +1697,9 @@ class ActionHandler:
                                 raise RoundOverException()
                     elif isinstance(target, PlayedCard) and target.card.is_conjury:
                         target.status = 'cancelled'
-                        gs.action_log.append(f"{caster.name}'s [{current_card.name}] CANCELLED [{target.card.name}].")
+                        gs.action_log.add('cancelled', player=caster.name, card=current_card.id, target_card=target.card.id)
                 else:
-                    gs.action_log.append(f"{caster.name} has no other active spells to boost the damage.")
+                    gs.action_log.add('no_damage_boost', player=caster.name)
             
             elif action_type == 'heal_per_spell':
                 # Count active spells matching criteria
@@ -1516,10 +1718,10 @@ class ActionHandler:
                 if count > 0:
                     healing = count
                     target.health = min(target.max_health, target.health + healing)
-                    gs.action_log.append(f"{caster.name}'s [{current_card.name}] healed {target.name} for {healing} ({count} spell(s)). ({target.health}/{target.max_health})")
+                    gs.action_log.add('heal_per_spell', player=caster.name, card=current_card.id, target=target.name, amount=healing, count=count, health=target.health, max_health=target.max_health)
                     self._fire_event('player_healed', gs, player=target.name, value=healing, card_id=current_card.id)
                 else:
-                    gs.action_log.append(f"{caster.name} has no other active spells to boost the healing.")
+                    gs.action_log.add('no_heal_boost', player=caster.name)
             
             elif action_type == 'discard_from_hand':
                 if isinstance(target, Player) and target.hand:
@@ -1534,7 +1736,7 @@ class ActionHandler:
                                 if choice is not None:
                                     discarded = target.hand.pop(choice-1)
                                     target.discard_pile.append(discarded)
-                                    gs.action_log.append(f"{target.name} discarded [{discarded.name}].")
+                                    gs.action_log.add('discarded_card', player=target.name, card=discarded.id)
                                     discarded_count += 1
                         else:
                             # AI discards randomly
@@ -1543,20 +1745,20 @@ class ActionHandler:
                                     discarded = random.choice(target.hand)
                                     target.hand.remove(discarded)
                                     target.discard_pile.append(discarded)
-                                    gs.action_log.append(f"{target.name} discarded [{discarded.name}].")
+                                    gs.action_log.add('discarded_card', player=target.name, card=discarded.id)
                                     discarded_count += 1
                         # Log if we couldn't discard the required number
                         if discarded_count < num_to_discard:
-                            gs.action_log.append(f"Only discarded {discarded_count} of {num_to_discard} required cards.")
+                            gs.action_log.add('partial_discard', count=discarded_count, required=num_to_discard)
                 else:
-                    gs.action_log.append(f"{target.name} has no cards to discard.")
+                    gs.action_log.add('no_cards_to_discard', player=target.name)
 
             elif action_type == 'discard_from_hand_for_damage':
                 damage_per_card = params.get('damage_per_card', 1)
                 max_cards = params.get('max_cards', float('inf'))  # Default to unlimited if not specified
 
                 if not caster.hand:
-                    gs.action_log.append(f"{caster.name} has no cards to discard.")
+                    gs.action_log.add('no_cards_to_discard', player=caster.name)
                     return
 
                 discarded_count = 0
@@ -1585,7 +1787,7 @@ class ActionHandler:
                     total_damage = discarded_count * damage_per_card
                     original_health = target.health
                     target.health = max(0, target.health - total_damage)
-                    gs.action_log.append(f"{Colors.FAIL}{ACTION_EMOJIS['damage']} {caster.name}'s [{current_card.name}] dealt {total_damage} damage to {target.name} ({discarded_count} cards discarded). ({target.health}/{target.max_health}){Colors.ENDC}")
+                    gs.action_log.add('damage_per_discard', player=caster.name, card=current_card.id, amount=total_damage, target=target.name, count=discarded_count, health=target.health, max_health=target.max_health)
                     self._fire_event('player_damaged', gs, player=caster.name, target=target.name, value=total_damage, card_id=current_card.id)
                     if original_health > 0 and target.health <= 0:
                         death_result = self.engine._handle_trunk_loss(target)
@@ -1594,7 +1796,7 @@ class ActionHandler:
                         elif death_result == 'round_over':
                             raise RoundOverException()
                 else:
-                    gs.action_log.append(f"{caster.name} chose not to discard any cards.")
+                    gs.action_log.add('no_discard', player=caster.name)
             
 # End of action types that require target looping (TODO: shfit around)
 
@@ -1608,9 +1810,9 @@ class ActionHandler:
                 else:
                     # Single spell advance
                     if target is None:
-                        gs.action_log.append(f"{Colors.FAIL}[DEBUG] Advance target is None for {current_card.name}{Colors.ENDC}")
+                        gs.action_log.add('debug_no_advance_target', card=current_card.id)
                     elif not isinstance(target, PlayedCard):
-                        gs.action_log.append(f"{Colors.FAIL}[DEBUG] Advance target is not a PlayedCard: {type(target)}{Colors.ENDC}")
+                        gs.action_log.add('debug_bad_advance_target', target_type=type(target).__name__)
                     else:
                         self._advance_single_spell(target, gs, caster, current_card, action_data)
             
@@ -1624,9 +1826,9 @@ class ActionHandler:
                                 spell.status = 'cancelled'
                                 clash_list.remove(spell)
                                 caster.discard_pile.append(spell.card)
-                                gs.action_log.append(f"{Colors.GREY}{ACTION_EMOJIS['discard']} [{spell.card.name}] was discarded.{Colors.ENDC}")
+                                gs.action_log.add('spell_discarded', card=spell.card.id)
                                 # Log the discard
-                                game_logger.log_spell_discarded(caster.name, spell.card.name, "self")
+                                self.engine.logger.log_spell_discarded(caster.name, spell.card.name, "self")
                                 return
                 elif isinstance(target, PlayedCard):
                     # Discard a specific spell (used by Electrocute, Daybreak)
@@ -1638,16 +1840,16 @@ class ActionHandler:
                     # Important: For Daybreak, put enemy spell in caster's discard
                     if owner != caster:
                         caster.discard_pile.append(target.card)
-                        gs.action_log.append(f"{caster.name} discarded [{target.card.name}] from {owner.name}'s past spells into their own discard pile!")
+                        gs.action_log.add('discarded_enemy_past_spell', player=caster.name, target_card=target.card.id, owner=owner.name)
                         # Log the discard
-                        game_logger.log_spell_discarded(owner.name, target.card.name, caster.name)
+                        self.engine.logger.log_spell_discarded(owner.name, target.card.name, caster.name)
                     else:
                         owner.discard_pile.append(target.card)
-                        gs.action_log.append(f"{caster.name} discarded [{target.card.name}] from past spells!")
+                        gs.action_log.add('discarded_past_spell', player=caster.name, target_card=target.card.id)
                         # Log the discard
-                        game_logger.log_spell_discarded(owner.name, target.card.name, caster.name)
+                        self.engine.logger.log_spell_discarded(owner.name, target.card.name, caster.name)
                 else:
-                    gs.action_log.append(f"No valid target to discard.")
+                    gs.action_log.add('no_discard_target')
             
             elif action_type == 'copy_spell':
                 # Imitate - copy an enemy spell
@@ -1657,7 +1859,7 @@ class ActionHandler:
                     copied_card.status = 'revealed'
                     caster.board[gs.clash_num - 1].append(copied_card)
                     self.engine.add_to_resolution_queue(copied_card)
-                    gs.action_log.append(f"{caster.name} copies [{target.card.name}] from {target.owner.name}!")
+                    gs.action_log.add('copied', player=caster.name, target_card=target.card.id, owner=target.owner.name)
                     self.engine._pause()
             
             elif action_type == 'recall_from_board':
@@ -1673,7 +1875,7 @@ class ActionHandler:
                                 if effect.get('type') == 'protect_from_enemy_effects':
                                     protected_effects = effect.get('parameters', {}).get('effects', [])
                                     if 'recall' in protected_effects:
-                                        gs.action_log.append(f"[{target.card.name}] is protected by {owner.name}'s [{spell.card.name}] and cannot be recalled!")
+                                        gs.action_log.add('protected', target_card=target.card.id, owner=owner.name, protector=spell.card.id, action='recalled')
                                         return
                     
                     # Remove from board
@@ -1685,7 +1887,7 @@ class ActionHandler:
                             break
                     # Add to caster's hand
                     caster.hand.append(target.card)
-                    gs.action_log.append(f"{Colors.YELLOW}{caster.name} used Sap to steal [{target.card.name}] from {owner.name}'s Clash {clash_num}!{Colors.ENDC}")
+                    gs.action_log.add('sapped', player=caster.name, target_card=target.card.id, owner=owner.name, clash=clash_num)
                     self._fire_event('spell_recalled_from_board', gs, player=caster.name, target=owner.name, card_id=target.card.id)
             
             elif action_type == 'damage_per_enemy_spell_type':
@@ -1704,7 +1906,7 @@ class ActionHandler:
                         damage = count
                         original_health = enemy.health
                         enemy.health = max(0, enemy.health - damage)
-                        gs.action_log.append(f"{Colors.FAIL}{ACTION_EMOJIS['damage']} {caster.name}'s [{current_card.name}] dealt {damage} damage to {enemy.name} ({count} {spell_type} spell(s)). ({enemy.health}/{enemy.max_health}){Colors.ENDC}")
+                        gs.action_log.add('damage_per_type', player=caster.name, card=current_card.id, amount=damage, target=enemy.name, count=count, spell_type=spell_type, health=enemy.health, max_health=enemy.max_health)
                         self._fire_event('player_damaged', gs, player=caster.name, target=enemy.name, value=damage, card_id=current_card.id)
                         if original_health > 0 and enemy.health <= 0:
                             death_result = self.engine._handle_trunk_loss(enemy)
@@ -1729,7 +1931,7 @@ class ActionHandler:
                     if total_damage > 0 and not enemy.is_invulnerable:
                         original_health = enemy.health
                         enemy.health = max(0, enemy.health - total_damage)
-                        gs.action_log.append(f"{Colors.FAIL}{ACTION_EMOJIS['damage']} {caster.name}'s [Familiar] reflected {total_damage} damage to {enemy.name} (from their attack spells). ({enemy.health}/{enemy.max_health}){Colors.ENDC}")
+                        gs.action_log.add('reflected', player=caster.name, card=current_card.id, amount=total_damage, target=enemy.name, health=enemy.health, max_health=enemy.max_health)
                         self._fire_event('player_damaged', gs, player=caster.name, target=enemy.name, value=total_damage, card_id=current_card.id)
                         if original_health > 0 and enemy.health <= 0:
                             death_result = self.engine._handle_trunk_loss(enemy)
@@ -1750,11 +1952,11 @@ class ActionHandler:
                                 if effect.get('type') == 'protect_from_enemy_effects':
                                     protected_effects = effect.get('parameters', {}).get('effects', [])
                                     if 'cancel' in protected_effects:
-                                        gs.action_log.append(f"[{target.card.name}] is protected by {owner.name}'s [{spell.card.name}] and cannot be cancelled!")
+                                        gs.action_log.add('protected', target_card=target.card.id, owner=owner.name, protector=spell.card.id, action='cancelled')
                                         return
                     
                     target.status = 'cancelled'
-                    gs.action_log.append(f"{caster.name}'s [{current_card.name}] cancelled {target.owner.name}'s [{target.card.name}]!")
+                    gs.action_log.add('cancelled_spell', player=caster.name, card=current_card.id, owner=target.owner.name, target_card=target.card.id)
                 elif isinstance(target, list):
                     # For mass cancel effects
                     for spell in target:
@@ -1769,7 +1971,7 @@ class ActionHandler:
                                         if effect.get('type') == 'protect_from_enemy_effects':
                                             protected_effects = effect.get('parameters', {}).get('effects', [])
                                             if 'cancel' in protected_effects:
-                                                gs.action_log.append(f"[{spell.card.name}] is protected by {owner.name}'s [{protect_spell.card.name}] and cannot be cancelled!")
+                                                gs.action_log.add('protected', target_card=spell.card.id, owner=owner.name, protector=protect_spell.card.id, action='cancelled')
                                                 protected = True
                                                 break
                                     if protected:
@@ -1777,7 +1979,7 @@ class ActionHandler:
                             
                             if not protected:
                                 spell.status = 'cancelled'
-                                gs.action_log.append(f"{caster.name}'s [{current_card.name}] cancelled {spell.owner.name}'s [{spell.card.name}]!")
+                                gs.action_log.add('cancelled_spell', player=caster.name, card=current_card.id, owner=spell.owner.name, target_card=spell.card.id)
             
             elif action_type == 'move_to_future_clash':
                 # Gravitate - move a spell to a future clash
@@ -1799,11 +2001,10 @@ class ActionHandler:
                             # Player chooses which future clash
                             options = {i+1: clash_idx for i, clash_idx in enumerate(available_clashes)}
                             prompt = f"Choose which clash to move [{target.card.name}] to:"
-                            self.engine.display.draw(gs, gs.players.index(caster), prompt=prompt)
-                            for key, clash_idx in options.items():
-                                print(f"  [{key}] Clash {clash_idx + 1}")
+                            option_lines = [f"  [{key}] Clash {clash_idx + 1}" for key, clash_idx in options.items()]
+                            self.engine.display.draw(gs, gs.players.index(caster), prompt=prompt, options=option_lines)
                             
-                            choice = input("\nYour choice: ").strip()
+                            choice = self.engine.display.input("\nYour choice: ").strip()
                             try:
                                 choice_idx = int(choice)
                                 if choice_idx in options:
@@ -1819,12 +2020,12 @@ class ActionHandler:
                         # Move the spell
                         owner.board[current_clash].remove(target)
                         owner.board[target_clash].append(target)
-                        gs.action_log.append(f"{caster.name} moved [{target.card.name}] from Clash {current_clash + 1} to Clash {target_clash + 1}!")
+                        gs.action_log.add('moved_spell', player=caster.name, target_card=target.card.id, source=current_clash + 1, dest=target_clash + 1)
                         # Log the move
-                        game_logger.log_spell_moved(owner.name, target.card.name, current_clash + 1, target_clash + 1)
+                        self.engine.logger.log_spell_moved(owner.name, target.card.name, current_clash + 1, target_clash + 1)
                         self.engine._pause()
                     else:
-                        gs.action_log.append(f"Cannot move [{target.card.name}] to a future clash.")
+                        gs.action_log.add('cannot_move', target_card=target.card.id)
             
             elif action_type == 'recall':
                 # Constellation - recall a spell from past clashes
@@ -1837,7 +2038,7 @@ class ActionHandler:
                             clash_list.remove(target)
                             break
                     caster.hand.append(target.card)
-                    gs.action_log.append(f"{caster.name} recalled [{target.card.name}] from the board!")
+                    gs.action_log.add('recalled', player=caster.name, target_card=target.card.id, source='the board')
                     self._fire_event('spell_recalled', gs, player=caster.name, card_id=target.card.id)
 
                 if source == 'friendly_past_spells' and isinstance(target, PlayedCard):
@@ -1849,7 +2050,7 @@ class ActionHandler:
                             break
                     # Add to hand
                     caster.hand.append(target.card)
-                    gs.action_log.append(f"{caster.name} recalled [{target.card.name}] from past clashes!")
+                    gs.action_log.add('recalled', player=caster.name, target_card=target.card.id, source='past clashes')
                     self._fire_event('spell_recalled', gs, player=caster.name, card_id=target.card.id)
                 elif source == 'friendly_active_or_past_spells' and isinstance(target, PlayedCard):
                     # Remove from board
@@ -1863,9 +2064,9 @@ class ActionHandler:
                     # Add to hand
                     caster.hand.append(target.card)
                     if clash_num == gs.clash_num:
-                        gs.action_log.append(f"{caster.name} recalled [{target.card.name}] from the current clash!")
+                        gs.action_log.add('recalled', player=caster.name, target_card=target.card.id, source='the current clash')
                     else:
-                        gs.action_log.append(f"{caster.name} recalled [{target.card.name}] from Clash {clash_num}!")
+                        gs.action_log.add('recalled_from_clash', player=caster.name, target_card=target.card.id, clash=clash_num)
                     self._fire_event('spell_recalled', gs, player=caster.name, card_id=target.card.id)
             
             elif action_type == 'advance_from_hand':
@@ -1873,12 +2074,12 @@ class ActionHandler:
                 num_to_play = params.get('value', 1)
                 
                 if not caster.hand:
-                    gs.action_log.append(f"{caster.name} has no cards in hand to advance.")
+                    gs.action_log.add('no_cards_to_advance', player=caster.name)
                     return
                 
                 # Check if we can advance to next clash
                 if gs.clash_num >= 4:
-                    gs.action_log.append(f"Cannot advance from hand - no future clashes remaining.")
+                    gs.action_log.add('no_future_clashes')
                     return
                 
                   # Check if any opponent spell HAD prevent_action effects during resolve phase
@@ -1888,7 +2089,7 @@ class ActionHandler:
                             if effect.get('type') == 'prevent_action':
                                 params = effect.get('parameters', {})
                                 if params.get('action_type') == 'advance':
-                                    gs.action_log.append(f"{caster.name} cannot advance cards from hand because {effect_data['owner'].name}'s [{effect_data['spell_name']}] prevents it!")
+                                    gs.action_log.add('hand_advance_blocked', player=caster.name, owner=effect_data['owner'].name, blocker=effect_data['spell_name'])
                                     return  # Prevent the advance from happening
 
                 
@@ -1913,7 +2114,7 @@ class ActionHandler:
                             played_card = PlayedCard(card, caster)
                             played_card.status = 'prepared'  # Will be revealed in that clash
                             caster.board[target_clash].append(played_card)
-                            gs.action_log.append(f"{caster.name} advanced [{card.name}] from hand to Clash {target_clash + 1}!")
+                            gs.action_log.add('advanced_from_hand', player=caster.name, card=card.id, clash=target_clash + 1)
                             self._fire_event('spell_advanced', gs, player=caster.name, card_id=card.id, round=gs.round_num)
                     else:
                         # AI just plays first card to next clash
@@ -1922,7 +2123,7 @@ class ActionHandler:
                             played_card = PlayedCard(card, caster)
                             played_card.status = 'prepared'
                             caster.board[target_clash].append(played_card)
-                            gs.action_log.append(f"{caster.name} advanced [{card.name}] from hand to Clash {target_clash + 1}!")
+                            gs.action_log.add('advanced_from_hand', player=caster.name, card=card.id, clash=target_clash + 1)
                             self._fire_event('spell_advanced', gs, player=caster.name, card_id=card.id, round=gs.round_num)
             elif action_type == 'sequence':
                 # Execute a sequence of actions in order
@@ -1933,18 +2134,18 @@ class ActionHandler:
                         # For sequences requiring discard from the board, check if we can actually discard
                         targets = self._resolve_target(act, gs, caster, current_card)
                         if not targets:
-                            gs.action_log.append(f"Sequence stopped - no valid spells to discard.")
+                            gs.action_log.add('sequence_stopped', action='discard')
                             break
                     elif act.get('type') == 'recall' and i == 0:
                         # For Electrocute-like sequence, check if there are valid targets to recall
                         targets = self._resolve_target(act, gs, caster, current_card)
                         if not targets:
-                            gs.action_log.append(f"Sequence stopped - no valid spells to recall.")
+                            gs.action_log.add('sequence_stopped', action='recall')
                             break
                     elif act.get('type') == 'discard_from_hand' and act.get('target') == 'self' and i == 0:
                         # For Surge's sequence, check if caster has cards to discard
                         if not caster.hand:
-                            gs.action_log.append(f"Sequence stopped - no valid spells to discard.")
+                            gs.action_log.add('sequence_stopped', action='discard')
                             break
                     
                     self._execute_action(act, gs, caster, current_card)
@@ -1967,16 +2168,16 @@ class ActionHandler:
                 if count > 0 and isinstance(target, Player):
                     target.max_health = max(0, target.max_health - count)
                     target.health = min(target.health, target.max_health)
-                    gs.action_log.append(f"{caster.name}'s [{current_card.name}] weakened {target.name} by {count} ({count} {spell_type} spell(s)). Max health now {target.max_health}.")
+                    gs.action_log.add('weaken_per_type', player=caster.name, card=current_card.id, target=target.name, amount=count, spell_type=spell_type, max_health=target.max_health)
                     # Log weaken_per_spell event separately
                     self._fire_event('player_weakened', gs, player=caster.name, target=target.name, value=count, card_id=current_card.id)
                 else:
-                    gs.action_log.append(f"{caster.name} has no active {spell_type} spells to boost the weakening.")
+                    gs.action_log.add('no_weaken_boost', player=caster.name, spell_type=spell_type)
             
             elif action_type == 'advance_from_past_clash':
                 # Blow spell - advance a spell from a past clash
                 if gs.clash_num <= 1:
-                    gs.action_log.append(f"No past clashes to choose from.")
+                    gs.action_log.add('no_past_clashes')
                     return
                 
                 # Find all spells in past clashes
@@ -1991,7 +2192,7 @@ class ActionHandler:
                         past_clash_spells[i] = clash_spells
                 
                 if not past_clash_spells:
-                    gs.action_log.append(f"No active spells in past clashes to advance.")
+                    gs.action_log.add('no_past_spells_to_advance')
                     return
                 
                 # Choose which clash
@@ -2007,21 +2208,22 @@ class ActionHandler:
                             clash_options[clash_idx + 1] = (clash_idx, spells)
                         
                         prompt = "Choose a past clash to advance a spell from:"
-                        self.engine.display.draw(gs, gs.players.index(caster), prompt=prompt)
+                        option_lines = []
                         for key, (clash_idx, spells) in clash_options.items():
                             spell_names = [f"{s.owner.name}'s [{s.card.name}]" for s in spells]
-                            print(f"  [{key}] Clash {key}: {', '.join(spell_names)}")
+                            option_lines.append(f"  [{key}] Clash {key}: {', '.join(spell_names)}")
+                        self.engine.display.draw(gs, gs.players.index(caster), prompt=prompt, options=option_lines)
                         
-                        choice = input("\nYour choice: ").strip()
+                        choice = self.engine.display.input("\nYour choice: ").strip()
                         try:
                             choice_num = int(choice)
                             if choice_num in clash_options:
                                 chosen_clash, spells_in_clash = clash_options[choice_num]
                             else:
-                                gs.action_log.append(f"{Colors.FAIL}Invalid choice.{Colors.ENDC}")
+                                gs.action_log.add('invalid_choice')
                                 return
                         except ValueError:
-                            gs.action_log.append(f"{Colors.FAIL}Invalid choice.{Colors.ENDC}")
+                            gs.action_log.add('invalid_choice')
                             return
                     
                     # Now choose which spell from that clash
@@ -2030,21 +2232,20 @@ class ActionHandler:
                     else:
                         spell_options = {i+1: s for i, s in enumerate(spells_in_clash)}
                         prompt = f"Choose a spell from Clash {chosen_clash + 1} to advance:"
-                        self.engine.display.draw(gs, gs.players.index(caster), prompt=prompt)
-                        for key, spell in spell_options.items():
-                            emoji = ELEMENT_EMOJIS.get(spell.card.element, '')
-                            print(f"  [{key}] {spell.owner.name}'s {emoji} [{spell.card.name}]")
+                        option_lines = [f"  [{key}] {spell.owner.name}'s {ELEMENT_EMOJIS.get(spell.card.element, '')} [{spell.card.name}]"
+                                        for key, spell in spell_options.items()]
+                        self.engine.display.draw(gs, gs.players.index(caster), prompt=prompt, options=option_lines)
                         
-                        choice = input("\nYour choice: ").strip()
+                        choice = self.engine.display.input("\nYour choice: ").strip()
                         try:
                             choice_idx = int(choice)
                             if choice_idx in spell_options:
                                 spell_to_advance = spell_options[choice_idx]
                             else:
-                                gs.action_log.append(f"{Colors.FAIL}Invalid choice.{Colors.ENDC}")
+                                gs.action_log.add('invalid_choice')
                                 return
                         except ValueError:
-                            gs.action_log.append(f"{Colors.FAIL}Invalid choice.{Colors.ENDC}")
+                            gs.action_log.add('invalid_choice')
                             return
                 else:
                     # AI logic - advance a random spell from the earliest past clash
@@ -2056,7 +2257,7 @@ class ActionHandler:
             
             elif action_type == 'pass':
                 # Do nothing
-                gs.action_log.append(f"{caster.name} chose to pass.")
+                gs.action_log.add('passed', player=caster.name)
 
     def _check_if_targets_exist(self, action_data: dict, gs: 'GameState', caster: 'Player', current_card: 'Card') -> bool:
         """Check if valid targets exist for an action without prompting the player"""
@@ -2115,7 +2316,7 @@ class ActionHandler:
                     if spell.card.id == current_card.id: 
                         return [spell]
             # Debug: spell not found
-            gs.action_log.append(f"{Colors.FAIL}[DEBUG] Could not find 'this_spell' for {current_card.name} (ID: {current_card.id}){Colors.ENDC}")
+            gs.action_log.add('debug_no_this_spell', card=current_card.id, card_id=current_card.id)
             return []
         enemies = [p for p in gs.players if p != caster]; valid_enemies = [p for p in enemies if not p.is_invulnerable]
         # Only look for active conjuries in the current clash
@@ -2153,7 +2354,7 @@ class ActionHandler:
                         print("2. Target player only")
                         print("3. Choose specific target")
 
-                        choice = input("Your choice (1-3): ").strip()
+                        choice = self.engine.display.input("Your choice (1-3): ").strip()
                         if choice == '1':
                             return conjury_targets + player_targets  # Return conjuries first, then players
                         elif choice == '2':
@@ -2568,7 +2769,7 @@ class ActionHandler:
                     if effect.get('type') == 'prevent_action':
                         params = effect.get('parameters', {})
                         if params.get('action_type') == 'advance':
-                            gs.action_log.append(f"[{target.card.name}] cannot advance because {effect_data['owner'].name}'s [{effect_data['spell_name']}] prevents it!")
+                            gs.action_log.add('advance_blocked', target_card=target.card.id, owner=effect_data['owner'].name, blocker=effect_data['spell_name'])
                             return  # Prevent the advance from happening
                                 
         # Check if this is a self-advance with a limit
@@ -2577,7 +2778,7 @@ class ActionHandler:
             # This spell is trying to advance itself - check for limits
             advance_params = params
             if 'limit' in advance_params and target.advances_this_round >= advance_params['limit']:
-                gs.action_log.append(f"[{target.card.name}] can only advance itself {advance_params['limit']} time(s) per round and has already advanced {target.advances_this_round} time(s).")
+                gs.action_log.add('advance_limit', target_card=target.card.id, limit=advance_params['limit'], count=target.advances_this_round)
                 return
         
         owner = target.owner
@@ -2589,27 +2790,28 @@ class ActionHandler:
                     owner.board[i].remove(target)
                     owner.board[next_clash_idx].append(target)
                     target.advances_this_round += 1  # Increment advance count
-                    gs.action_log.append(f"{Colors.GREEN}{ACTION_EMOJIS['advance']} {owner.name}'s [{target.card.name}] advanced from Clash {i+1} to Clash {next_clash_idx + 1}.{Colors.ENDC}")
+                    gs.action_log.add('advanced', owner=owner.name, target_card=target.card.id, source=i + 1, dest=next_clash_idx + 1)
                     self._fire_event('spell_advanced', gs, player=owner.name, card_id=target.card.id, round=gs.round_num)
                     found_and_moved = True
                     break
             if not found_and_moved:
-                gs.action_log.append(f"Error: Could not find [{target.card.name}] to advance.")
+                gs.action_log.add('advance_missing', target_card=target.card.id)
         else:
-            gs.action_log.append(f"[{target.card.name}] could not advance past Clash 4.")
+            gs.action_log.add('advance_past_end', target_card=target.card.id)
 
 # AI classes moved to ai/ module
 
 # --- MAIN GAME ENGINE ---
 class GameEngine:
-    def __init__(self, player_names, ai_difficulty='expert'):
+    def __init__(self, player_names, ai_difficulty='expert', logger=None):
         # Randomize player order for fair drafting
         randomized_players = player_names[:]
         random.shuffle(randomized_players)
         
+        self.logger = logger if logger is not None else GameLogger()  # Per-game, so engines can run concurrently
         self.gs = GameState(randomized_players); self.display = DashboardDisplay()
         self.condition_checker = ConditionChecker(); self.action_handler = ActionHandler(self)
-        self.ai_decision_logs = []  # Store AI logs to show after reveal
+        self.decision_trace = DecisionTrace(DEBUG if DEBUG_AI else OFF)  # AI reasoning, shown after reveal
         self.ai_difficulty = ai_difficulty  # Store for logging
         
         # Create AI strategies based on difficulty
@@ -2628,6 +2830,10 @@ class GameEngine:
                     ai = ExpertAI()
                     if DEBUG_AI:
                         print(f"Created ExpertAI for player {i}: {name}")
+                elif ai_difficulty == 'value':
+                    ai = ValueAI()
+                    if DEBUG_AI:
+                        print(f"Created ValueAI for player {i}: {name}")
                 else:  # medium (default)
                     ai = MediumAI()
                     if DEBUG_AI:
@@ -2641,11 +2847,6 @@ class GameEngine:
         if self.ai_player and not hasattr(self.ai_player, 'engine'):
             self.ai_player.engine = self
     
-    def _format_spell_name(self, card):
-        """Format spell name with type icons"""
-        type_icons = self.display._get_spell_type_icons(card)
-        return f"[{card.name}] {type_icons}"
-    
     def _is_spell_active(self, spell, clash_num=None):
         """Check if a spell is truly active (revealed and in current clash)"""
         if clash_num is None:
@@ -2667,71 +2868,80 @@ class GameEngine:
         # Always show from human player's perspective
         human_index = next((i for i, p in enumerate(self.gs.players) if p.is_human), 0)
         self.display.draw(self.gs, pov_player_index=human_index, prompt=prompt)
-        input()
+        self.display.input()
     def _prompt_for_choice(self, player, options, prompt_message, view_key='name'):
         while True:
-            self.display.draw(self.gs, self.gs.players.index(player), prompt=prompt_message)
-            if not options: self.gs.action_log.append(f"{Colors.GREY}No options available.{Colors.ENDC}"); return 'done' if 'done' in prompt_message.lower() else None
+            if not options:
+                self.display.draw(self.gs, self.gs.players.index(player), prompt=prompt_message)
+                self.gs.action_log.add('no_options'); return 'done' if 'done' in prompt_message.lower() else None
+            option_lines = []
             for key, item in options.items():
                 if isinstance(item, list): 
                     emoji = ELEMENT_EMOJIS.get(item[0].element, '')
                     theme = item[0].theme if hasattr(item[0], 'theme') else ''
                     display_name = f"The '{item[0].elephant}' Set ({emoji} {item[0].element} | {len(item)} spells)"
                     if theme:
-                        print(f"  [{key}] {display_name}")
-                        print(f"    {Colors.GREY}Theme: {theme}{Colors.ENDC}")
+                        option_lines.append(f"  [{key}] {display_name}")
+                        option_lines.append(f"    {Colors.GREY}Theme: {theme}{Colors.ENDC}")
                         continue
                     # If no theme, fall through to normal display
                 elif isinstance(item, Card): 
                     emoji = ELEMENT_EMOJIS.get(item.element, '')
                     display_name = f"{emoji} {item.name} (P:{item.priority})"; 
-                    print(f"  [{key}] {display_name}"); 
-                    print(f"    {Colors.GREY}> {item.get_instructions_text()}{Colors.ENDC}"); 
+                    option_lines.append(f"  [{key}] {display_name}"); 
+                    option_lines.append(f"    {Colors.GREY}> {item.get_instructions_text()}{Colors.ENDC}"); 
                     continue
                 elif isinstance(item, PlayedCard): 
                     display_name = f"{item.owner.name}'s [{item.card.name}]"
                 else: 
                     display_name = getattr(item, view_key, str(item))
-                print(f"  [{key}] {display_name}")
-            if 'done' in prompt_message.lower(): print("\n  [done] Finish selection")
-            choice = input("\nYour choice: ").lower().strip()
+                option_lines.append(f"  [{key}] {display_name}")
+            if 'done' in prompt_message.lower(): option_lines.append("\n  [done] Finish selection")
+            self.display.draw(self.gs, self.gs.players.index(player), prompt=prompt_message, options=option_lines)
+            choice = self.display.input("\nYour choice: ").lower().strip()
             if choice == 'done': return 'done'
             try:
                 choice_idx = int(choice)
                 if choice_idx in options: return choice_idx
-                else: self.gs.action_log.append(f"{Colors.FAIL}Invalid choice.{Colors.ENDC}")
-            except ValueError: self.gs.action_log.append(f"{Colors.FAIL}Invalid input.{Colors.ENDC}")
+                else: self.gs.action_log.add('invalid_choice')
+            except ValueError: self.gs.action_log.add('invalid_input')
     def run_game(self) -> None:
+        self.crash = None  # Traceback text if the game died, so batch runners can record it
         try:
             self._setup_game()
-            while len([p for p in self.gs.players if p.trunks > 0]) > 1 and not self.gs.game_over:
+            while self._game_continues():
                 self._run_round()
                 if not self.gs.game_over:
                     self.gs.round_num += 1
-            
-            winner = next((p for p in self.gs.players if p.trunks > 0), None)
-            self.gs.action_log.append(f"GAME OVER! The winner is {winner.name}!" if winner else "GAME OVER! No winner.")
-            
-            # Log game end
-            if winner:
-                loser = next((p for p in self.gs.players if p != winner), None)
-                game_logger.log_game_end(
-                    winner_name=winner.name,
-                    winner_health=winner.health,
-                    loser_health=0 if loser else 0,
-                    total_rounds=self.gs.round_num - 1
-                )
-            
-            self._pause()
+            self._finish_game()
         except Exception:
+            self.crash = traceback.format_exc()
+            self.display.invalidate()
             clear_screen(); print("\n\n--- A CRITICAL ERROR OCCURRED ---")
             traceback.print_exc(); print("---------------------------------")
             print("\nPlease copy this error report for debugging.")
 
+    def _game_continues(self) -> bool:
+        return len([p for p in self.gs.players if p.trunks > 0]) > 1 and not self.gs.game_over
+    def _finish_game(self) -> None:
+        winner = next((p for p in self.gs.players if p.trunks > 0), None)
+        self.gs.action_log.add('game_over', player=winner.name) if winner else self.gs.action_log.add('game_drawn')
+        
+        # Log game end
+        if winner:
+            loser = next((p for p in self.gs.players if p != winner), None)
+            self.logger.log_game_end(
+                winner_name=winner.name,
+                winner_health=winner.health,
+                loser_health=0 if loser else 0,
+                total_rounds=self.gs.round_num - 1
+            )
+        
+        self._pause()
     def _setup_game(self):
         self._check_and_rebuild_deck()
-        self.gs.action_log.clear(); self.gs.action_log.append("--- Game Setup ---")
-        self.gs.action_log.append(f"The starting Ringleader is: {self.gs.players[self.gs.ringleader_index].name}")
+        self.gs.action_log.clear(); self.gs.action_log.add('setup')
+        self.gs.action_log.add('starting_ringleader', player=self.gs.players[self.gs.ringleader_index].name)
         # Draft in turn order starting from ringleader
         turn_order_indices = [(self.gs.ringleader_index + i) % len(self.gs.players) for i in range(len(self.gs.players))]
         
@@ -2753,8 +2963,7 @@ class GameEngine:
                         drafted_set = random.choice(self.gs.main_deck)
                     self.gs.main_deck.remove(drafted_set)
                 p.discard_pile.extend(drafted_set); 
-                emoji = ELEMENT_EMOJIS.get(drafted_set[0].element, '')
-                self.gs.action_log.append(f"{p.name} drafted the '{drafted_set[0].elephant}' ({emoji} {drafted_set[0].element}) set.")
+                self.gs.action_log.add('drafted', player=p.name, elephant=drafted_set[0].elephant, element=drafted_set[0].element)
         for p in self.gs.players:
             if p.is_human:
                 options = {i+1: c for i, c in enumerate(p.discard_pile)}; hand_choices = []
@@ -2770,7 +2979,7 @@ class GameEngine:
             elements = list(set(card.element for card in p.hand + p.discard_pile))
             player_elements[p.name] = elements
         
-        game_logger.start_game(
+        self.logger.start_game(
             self.gs.players[0].name, 
             self.gs.players[1].name,
             player_elements[self.gs.players[0].name],
@@ -2780,31 +2989,35 @@ class GameEngine:
         
         self._pause("Setup complete. The first round is about to begin.")
     def _run_round(self) -> None:
-        self.gs.action_log.clear()
-        self.gs.action_log.append(f"--- Round {self.gs.round_num} Begins ---")
-        self.gs.event_log.clear()
-        for p in self.gs.players: 
-            p.is_invulnerable = False
-            p.knocked_out_this_turn = False
-            # Reset advancement counts for all spells on the board
-            for clash_list in p.board:
-                for spell in clash_list:
-                    spell.advances_this_round = 0
-        
+        self._start_round()
         try:
             for i in range(1, 5):
                 self.gs.clash_num = i
                 self._run_clash()
         except RoundOverException:
-            if self.gs.game_over:
-                self.gs.action_log.append(f"{Colors.WARNING}The game has ended!{Colors.ENDC}")
-            else:
-                self.gs.action_log.append(f"{Colors.WARNING}The round has ended early due to trunk loss!{Colors.ENDC}")
-                self._pause("Proceeding to the end of the round.")
+            self._end_round_early()
 
         # Only run end of round if game isn't over
         if not self.gs.game_over:
             self._run_end_of_round()
+    def _start_round(self) -> None:
+        self.gs.action_log.clear()
+        self.gs.action_log.add('round_begins', round=self.gs.round_num)
+        self.gs.event_log.clear()
+        for p in self.gs.players: 
+            p.is_invulnerable = False
+            p.knocked_out_this_turn = False
+            # Reset advancement counts for all spells on the board
+            for clash_list in p.board:
+                for spell in clash_list:
+                    spell.advances_this_round = 0
+    def _end_round_early(self) -> None:
+        """Called when a RoundOverException cut the round's clashes short"""
+        if self.gs.game_over:
+            self.gs.action_log.add('game_ended')
+        else:
+            self.gs.action_log.add('round_ended_early')
+            self._pause("Proceeding to the end of the round.")
     def _run_clash(self):
         self._run_prepare_phase()
         if self.gs.game_over: return # Check after prepare phase in case a player couldn't play
@@ -2822,66 +3035,74 @@ class GameEngine:
 
     def _run_prepare_phase(self) -> None:
         #self.gs.action_log.clear()
-        self.gs.action_log.append(f"--- Clash {self.gs.clash_num}: PREPARE ---")
-        
-        turn_order_indices = [(self.gs.ringleader_index + i) % len(self.gs.players) for i in range(len(self.gs.players))]
+        self.gs.action_log.add('phase', clash=self.gs.clash_num, phase='PREPARE')
+        for player_index in self._turn_order():
+            self._prepare_spell(player_index)
 
-        for player_index in turn_order_indices:
-            player: Player = self.gs.players[player_index]
-            
-            if player.is_invulnerable or not player.hand:
-                self.gs.action_log.append(f"{player.name} cannot play a spell.")
-                self._pause()
-                continue
+    def _turn_order(self) -> list[int]:
+        """Player indices in turn order, starting with the ringleader"""
+        return [(self.gs.ringleader_index + i) % len(self.gs.players) for i in range(len(self.gs.players))]
 
-            card_to_play: Card | None = None
-            if player.is_human:
-                if len(player.hand) == 1:
-                    card_to_play = player.hand.pop(0)
-                    self.gs.action_log.append(f"You only have one card in hand. Automatically preparing [{card_to_play.name}].")
-                else:
-                    options = {i+1: c for i, c in enumerate(player.hand)}
-                    choice = self._prompt_for_choice(player, options, f"{player.name}, choose a card to prepare:")
-                    if choice is not None:
-                        card_to_play = player.hand.pop(choice-1)
-            else: # AI logic
+    def _prepare_spell(self, player_index: int, chosen_index: int | None = None) -> None:
+        """One player's turn of the prepare phase
+        
+        chosen_index is an AI's hand index decided beforehand (the lockstep
+        simulator scores many games' choices in one batch); by default the AI
+        is asked here.
+        """
+        player: Player = self.gs.players[player_index]
+        
+        if player.is_invulnerable or not player.hand:
+            self.gs.action_log.add('cannot_play', player=player.name)
+            self._pause()
+            return
+
+        card_to_play: Card | None = None
+        if player.is_human:
+            if len(player.hand) == 1:
+                card_to_play = player.hand.pop(0)
+                self.gs.action_log.add('auto_prepare', card=card_to_play.id)
+            else:
+                options = {i+1: c for i, c in enumerate(player.hand)}
+                choice = self._prompt_for_choice(player, options, f"{player.name}, choose a card to prepare:")
+                if choice is not None:
+                    card_to_play = player.hand.pop(choice-1)
+        else: # AI logic
+            if chosen_index is None:
                 # Get the AI strategy for this player
                 ai_strategy = self.ai_strategies.get(player_index, self.ai_player)
                 if DEBUG_AI:
                     print(f"\n{Colors.GREY}[DEBUG] Using AI strategy for player {player_index}: {type(ai_strategy).__name__}{Colors.ENDC}")
                 chosen_index = ai_strategy.choose_card_to_play(player, self.gs)
-                if chosen_index is not None:
-                    card_to_play = player.hand.pop(chosen_index)
-
-            if card_to_play:
-                # --- THIS IS THE KEY FIX ---
-                # Create the played card and add to board
-                played_card = PlayedCard(card_to_play, player)
-                player.board[self.gs.clash_num - 1].append(played_card)
-                
-                # Log opponent's play generically, but your play specifically.
-                if player.is_human:
-                    formatted_name = self._format_spell_name(card_to_play)
-                    log_message = f"{player.name} prepared {formatted_name}."
-                else:
-                    log_message = f"{player.name} has prepared a spell."
-                    
-                self.gs.action_log.append(log_message)
+            if chosen_index is not None:
+                card_to_play = player.hand.pop(chosen_index)
+
+        if card_to_play:
+            # --- THIS IS THE KEY FIX ---
+            # Create the played card and add to board
+            played_card = PlayedCard(card_to_play, player)
+            player.board[self.gs.clash_num - 1].append(played_card)
+            
+            # Log opponent's play generically, but your play specifically.
+            if player.is_human:
+                self.gs.action_log.add('prepared', player=player.name, card=card_to_play.id)
             else:
-                self.gs.action_log.append(f"{player.name} did not play a spell.")
+                self.gs.action_log.add('prepared_hidden', player=player.name)
+        else:
+            self.gs.action_log.add('no_spell_played', player=player.name)
 
-            self._pause()
+        self._pause()
 
     def _run_cast_phase(self):
         #self.gs.action_log.clear(); 
-        self.gs.action_log.append(f"--- Clash {self.gs.clash_num}: CAST ---")
+        self.gs.action_log.add('phase', clash=self.gs.clash_num, phase='CAST')
         # --- NEW: Flip all prepared cards to active ---
         for p in self.gs.players:
             for spell in p.board[self.gs.clash_num - 1]:
                 if spell.status == 'prepared':
                     spell.status = 'revealed'
                     # Log spell played
-                    game_logger.log_spell_played(
+                    self.logger.log_spell_played(
                         player_name=p.name,
                         spell_name=spell.card.name,
                         element=spell.card.element,
@@ -2892,23 +3113,19 @@ class GameEngine:
                     )
         
         # Show all revealed spells with instructions
-        self.gs.action_log.append(f"{Colors.BOLD}Spells Revealed:{Colors.ENDC}")
+        self.gs.action_log.add('revealed_header')
         for p in self.gs.players:
             for spell in p.board[self.gs.clash_num - 1]:
                 if spell.status == 'revealed':
-                    emoji = ELEMENT_EMOJIS.get(spell.card.element, '')
-                    type_icons = self.display._get_spell_type_icons(spell.card)
-                    type_str = '/'.join(spell.card.types) if spell.card.types else 'None'
-                    conjury_str = " [CONJURY]" if spell.card.is_conjury else ""
-                    self.gs.action_log.append(f"  {p.name}: {emoji} [{spell.card.name}] {type_icons}{conjury_str} (P:{spell.card.priority}, {type_str})")
-                    self.gs.action_log.append(f"    {Colors.GREY}> {spell.card.get_instructions_text()}{Colors.ENDC}")
+                    self.gs.action_log.add('revealed', player=p.name, card=spell.card.id)
+                    self.gs.action_log.add('instructions', card=spell.card.id)
         
         # Show AI decision logs after reveal
-        if DEBUG_AI and self.ai_decision_logs:
-            self.gs.action_log.append(f"\n{Colors.BOLD}AI Decision Analysis:{Colors.ENDC}")
-            for log in self.ai_decision_logs:
-                self.gs.action_log.append(log)
-            self.ai_decision_logs.clear()  # Clear for next clash
+        decisions = self.decision_trace.take_new()
+        if decisions:
+            self.gs.action_log.add('ai_header')
+            for entry in decisions:
+                self.gs.action_log.add('ai_decision', message=entry['message'])
         
         self._pause("All spells are revealed simultaneously!")
     
@@ -2935,7 +3152,7 @@ class GameEngine:
             group = priority_groups[key]
             if len(group) > 1 and self.gs.players[key[1]].is_human:
                 # Human player has multiple spells at same priority
-                self.gs.action_log.append(f"You have multiple spells with priority {key[0]}. Choose resolution order:")
+                self.gs.action_log.add('order_prompt', priority=key[0])
                 remaining = group.copy()
                 ordered = []
                 
@@ -2979,7 +3196,7 @@ class GameEngine:
 
     def _run_resolve_phase(self) -> None:
         #self.gs.action_log.clear(); 
-        self.gs.action_log.append(f"--- Clash {self.gs.clash_num}: RESOLVE ---")
+        self.gs.action_log.add('phase', clash=self.gs.clash_num, phase='RESOLVE')
         
         active_spells = [s for p in self.gs.players for s in p.board[self.gs.clash_num-1] if s.status == 'revealed']
         self.gs.resolution_queue = []
@@ -3039,12 +3256,12 @@ class GameEngine:
         self.gs.resolution_queue.sort(key=lambda x: (x['p_val'], get_turn_order_position(x['caster_idx'])))
         
         # Debug: Log the resolution order
-        if DEBUG_AI or True:  # Always show for debugging
-            self.gs.action_log.append(f"{Colors.GREY}[DEBUG] Ringleader: {self.gs.players[self.gs.ringleader_index].name} (index {self.gs.ringleader_index}){Colors.ENDC}")
+        if DEBUG_AI:
+            self.gs.action_log.add('resolution_order', player=self.gs.players[self.gs.ringleader_index].name, index=self.gs.ringleader_index)
             for item in self.gs.resolution_queue[:3]:  # Show first 3
                 spell = item['played_card']
                 turn_pos = get_turn_order_position(item['caster_idx'])
-                self.gs.action_log.append(f"{Colors.GREY}  {spell.owner.name}'s {spell.card.name} (P:{item['p_val']}, turn:{turn_pos}){Colors.ENDC}")
+                self.gs.action_log.add('queued', player=spell.owner.name, card=spell.card.id, priority=item['p_val'], turn=turn_pos)
                 
         # Let human players choose order for same-priority spells
         self._handle_priority_choices()
@@ -3068,14 +3285,13 @@ class GameEngine:
                     break
             
             if not spell_still_in_current_clash:
-                self.gs.action_log.append(f"[{played_card.card.name}] was moved to a future clash and will not resolve now.")
+                self.gs.action_log.add('moved_away', card=played_card.card.id)
                 self._pause()
                 continue
 
             #self.gs.action_log.clear()
-            formatted_name = self._format_spell_name(played_card.card)
-            self.gs.action_log.append(f"--> Resolving {caster.name}'s {Colors.BOLD}{formatted_name}{Colors.ENDC} (P:{played_card.card.priority})")
-            self.gs.action_log.append(f"    {Colors.GREY}{played_card.card.get_instructions_text()}{Colors.ENDC}")
+            self.gs.action_log.add('resolving', player=caster.name, card=played_card.card.id)
+            self.gs.action_log.add('instructions', card=played_card.card.id)
             self._pause("Executing effect...")
 
             self.action_handler.execute_effects(played_card.card.resolve_effects, self.gs, caster, played_card.card, played_card)
@@ -3100,7 +3316,7 @@ class GameEngine:
 
     def _run_advance_phase(self) -> None:
         # Don't clear logs here - we want to see damage from the last resolved spell
-        self.gs.action_log.append(f"--- Clash {self.gs.clash_num}: ADVANCE ---"); self._pause()
+        self.gs.action_log.add('phase', clash=self.gs.clash_num, phase='ADVANCE'); self._pause()
 
         # Track which spells were active at start of advance phase
         self.gs.advance_phase_active_spells = []
@@ -3117,7 +3333,7 @@ class GameEngine:
         advancing_spells = [s for p in self.gs.players for s in p.board[self.gs.clash_num - 1] if s.status == 'revealed' and s.card.advance_effects]
         
         if not advancing_spells:
-            self.gs.action_log.append("No spells to advance this clash.")
+            self.gs.action_log.add('no_advances')
             return
 
         for played_card in advancing_spells:
@@ -3135,8 +3351,7 @@ class GameEngine:
             if not spell_still_in_current_clash:
                 continue  # Skip spells that were moved to future clashes
             #self.gs.action_log.clear()
-            formatted_name = self._format_spell_name(played_card.card)
-            self.gs.action_log.append(f"--> Advancing {caster.name}'s {formatted_name}...")
+            self.gs.action_log.add('advancing', player=caster.name, card=played_card.card.id)
             self._pause()
             for effect in played_card.card.advance_effects:
                 condition_type = effect['condition'].get('type')
@@ -3144,7 +3359,7 @@ class GameEngine:
                 # Log response spell condition evaluation for advance effects
                 if 'response' in played_card.card.types and condition_type not in ['always', 'otherwise']:
                     condition_met = self.condition_checker.check(effect['condition'], self.gs, caster, played_card.card)
-                    game_logger.log_response_condition_evaluated(
+                    self.logger.log_response_condition_evaluated(
                         player_name=caster.name,
                         spell_name=played_card.card.name,
                         condition_met=condition_met,
@@ -3160,20 +3375,20 @@ class GameEngine:
                     self._pause()
 
     def _run_end_of_round(self) -> None:
-        self.gs.action_log.clear(); self.gs.action_log.append(f"--- End of Round {self.gs.round_num} ---")
+        self.gs.action_log.clear(); self.gs.action_log.add('round_end', round=self.gs.round_num)
         for p in self.gs.players:
             for clash_list in p.board:
                 for spell in clash_list: p.discard_pile.append(spell.card)
             p.board = [[] for _ in range(4)]
         self.gs.ringleader_index = (self.gs.ringleader_index + 1) % len(self.gs.players)
-        self.gs.action_log.append(f"Board cleared. The new Ringleader is {self.gs.players[self.gs.ringleader_index].name}."); self._pause()
+        self.gs.action_log.add('board_cleared', player=self.gs.players[self.gs.ringleader_index].name); self._pause()
         
         for p in self.gs.players:
             drew_new_set = False  # Track if player drew a new set this turn
             
             # Step 1: Check for empty hand FIRST
             if not p.hand:
-                self.gs.action_log.append(f"{p.name}'s hand is empty. They get a new spell set!"); self._pause()
+                self.gs.action_log.add('hand_empty', player=p.name); self._pause()
                 self._check_and_rebuild_deck()
                 if self.gs.main_deck:
                     if p.is_human:
@@ -3185,7 +3400,7 @@ class GameEngine:
                         new_set = random.choice(self.gs.main_deck)
                         self.gs.main_deck.remove(new_set)
                     p.hand.extend(new_set)
-                    self.gs.action_log.append(f"{p.name} drafted the '{new_set[0].elephant}' ({new_set[0].element}) set.")
+                    self.gs.action_log.add('drafted', player=p.name, elephant=new_set[0].elephant, element=new_set[0].element)
                     drew_new_set = True
             else:
                 # Step 2: Handle Keep/Discard phase (only if hand not empty)
@@ -3200,14 +3415,14 @@ class GameEngine:
                     
                     # If they discarded everything, they can get a new set
                     if not p.hand and self.gs.main_deck:
-                        self.gs.action_log.append(f"{p.name} discarded their entire hand and can draft a new spell set!")
+                        self.gs.action_log.add('discarded_hand', player=p.name)
                         self._pause()
                         options = {i+1: s for i, s in enumerate(self.gs.main_deck) if s}
                         choice = self._prompt_for_choice(p, options, f"{p.name}, choose a new spell set:")
                         new_set = options[choice]; self.gs.main_deck.remove(new_set)
                         p.hand.extend(new_set)
-                        self.gs.action_log.append(f"{p.name} drafted the '{new_set[0].elephant}' ({new_set[0].element}) set.")
-                        self.gs.action_log.append(f"{Colors.WARNING}Note: You cannot discard cards from this newly drafted set!{Colors.ENDC}")
+                        self.gs.action_log.add('drafted', player=p.name, elephant=new_set[0].elephant, element=new_set[0].element)
+                        self.gs.action_log.add('new_set_locked')
                         drew_new_set = True
                 else: # AI Logic
                     # Get the AI strategy for this player
@@ -3223,12 +3438,11 @@ class GameEngine:
                         
                         # Check if AI is clearing entire hand
                         if not p.hand and self.gs.main_deck:
-                            self.gs.action_log.append(f"{p.name} discarded their entire hand and can draft a new spell set!")
+                            self.gs.action_log.add('discarded_hand', player=p.name)
                             new_set = ai_strategy.choose_draft_set(p, self.gs, self.gs.main_deck)
                             self.gs.main_deck.remove(new_set)
                             p.hand.extend(new_set)
-                            emoji = ELEMENT_EMOJIS.get(new_set[0].element, '')
-                            self.gs.action_log.append(f"{p.name} drafted the '{new_set[0].elephant}' ({emoji} {new_set[0].element}) set.")
+                            self.gs.action_log.add('drafted', player=p.name, elephant=new_set[0].elephant, element=new_set[0].element)
                             drew_new_set = True
                     else:
                         # Fallback to original simple logic
@@ -3273,7 +3487,7 @@ class GameEngine:
             
             # Step 4: Final check - only if they didn't draw a set and still below 4 cards with empty discard
             if not drew_new_set and len(p.hand) < 4 and not p.discard_pile:
-                self.gs.action_log.append(f"{p.name}'s hand is below 4 cards and discard pile is empty. They must draft a new set."); self._pause()
+                self.gs.action_log.add('must_draft', player=p.name); self._pause()
                 self._check_and_rebuild_deck()
                 if self.gs.main_deck:
                     if p.is_human:
@@ -3281,7 +3495,7 @@ class GameEngine:
                         new_set = options[choice]; self.gs.main_deck.remove(new_set)
                     else: new_set = self.gs.main_deck.pop(0)
                     p.hand.extend(new_set)
-                    self.gs.action_log.append(f"{p.name} drafted the '{new_set[0].elephant}' set.")
+                    self.gs.action_log.add('drafted', player=p.name, elephant=new_set[0].elephant, element=new_set[0].element)
                     drew_new_set = True
                     
                     # Must fill to max from discard if available
@@ -3302,16 +3516,16 @@ class GameEngine:
 
     def _handle_trunk_loss(self, player: Player) -> str:
         message = player.lose_trunk()
-        self.gs.action_log.append(f"{Colors.FAIL}{message}{Colors.ENDC}")
+        self.gs.action_log.add('trunk_loss', message=message)
         
         # Log trunk loss for analytics
-        game_logger.log_trunk_lost(player.name, self.gs.round_num, player.trunks)
+        self.logger.log_trunk_lost(player.name, self.gs.round_num, player.trunks)
         
         for clash_list in player.board:
             for spell in clash_list:
                 player.discard_pile.append(spell.card)
         player.board = [[] for _ in range(4)]
-        self.gs.action_log.append(f"{player.name}'s spells were cleared from the board.")
+        self.gs.action_log.add('spells_cleared', player=player.name)
         
         # Check if this player just lost their last trunk
         if player.trunks == 0:
@@ -3337,7 +3551,7 @@ class GameEngine:
         return False
     def _check_and_rebuild_deck(self):
         if not self.gs.main_deck:
-            self.gs.action_log.append(f"{Colors.WARNING}Main deck is empty! Rebuilding from discards...{Colors.ENDC}"); self._pause()
+            self.gs.action_log.add('deck_empty'); self._pause()
             all_discards = defaultdict(list)
             for p in self.gs.players:
                 for card in p.discard_pile: all_discards[card.elephant].append(card)
@@ -3353,7 +3567,7 @@ class GameEngine:
             for p in self.gs.players: p.discard_pile = [c for c in remaining_discards if c in p.discard_pile] # This is a simplification
             
             random.shuffle(new_deck); self.gs.main_deck = new_deck
-            self.gs.action_log.append(f"Rebuilt main deck with {len(new_deck)} complete sets.")
+            self.gs.action_log.add('deck_rebuilt', sets=len(new_deck))
 
 if __name__ == "__main__":
     try:
@@ -3365,14 +3579,16 @@ if __name__ == "__main__":
         print("[2] Medium (Basic strategy)")
         print("[3] Hard (Strategic)")
         print("[4] Expert (Overthinks everything)")
+        print("[5] Value (Learned from self-play; needs value_model.json)")
         
-        difficulty_choice = input("\nYour choice (1-4): ").strip()
+        difficulty_choice = input("\nYour choice (1-5): ").strip()
         
         difficulty_map = {
             '1': 'easy',
             '2': 'medium',
             '3': 'hard',
-            '4': 'expert'
+            '4': 'expert',
+            '5': 'value'
         }
         
         ai_difficulty = difficulty_map.get(difficulty_choice, 'expert')
@@ -4,12 +4,13 @@
 import json
 from collections import defaultdict
 
+from spell_properties import format_range, load_spell_properties, spells_by_element
+
 def analyze_spells():
     """Analyze all spells and generate report"""
     
-    # Load spell data
-    with open('spells.json', 'r') as f:
-        spells = json.load(f)
+    # Spell properties derived from the effect trees
+    properties = load_spell_properties()
     
     # Load element categories
     with open('element_categories.json', 'r') as f:
@@ -26,64 +27,15 @@ def analyze_spells():
     
     element_damage = defaultdict(list)
     
-    # Manually analyze key spells for accurate damage ranges
-    damage_data = {
-        'Turbulence': {'element': 'Wind', 'min': 1, 'max': 2, 'typical': 1.5, 
-                      'notes': 'Does 2 damage if active in 2+ other clashes, otherwise 1'},
-        'Combust': {'element': 'Fire', 'min': 1, 'max': 1, 'typical': 1,
-                   'notes': 'Flat 1 damage'},
-        'Blaze': {'element': 'Fire', 'min': 2, 'max': 2, 'typical': 2,
-                 'notes': 'Flat 2 damage'},
-        'Ignite': {'element': 'Fire', 'min': 1, 'max': 4, 'typical': 2,
-                  'notes': 'Can advance up to 3 times for 4 total damage'},
-        'Prickle': {'element': 'Wood', 'min': 1, 'max': 6, 'typical': 3,
-                   'notes': 'Auto-chooses between 1 damage or damage per spell (up to 6)'},
-        'Grow': {'element': 'Wood', 'min': 0, 'max': 0, 'typical': 0,
-                'notes': 'Healing spell, no damage'},
-        'Impact': {'element': 'Time', 'min': 0, 'max': 9, 'typical': 2,
-                  'notes': 'Damage equals spells from other clashes (0-9 possible)'},
-        'Illuminate': {'element': 'Sunbeam', 'min': 1, 'max': 3, 'typical': 2,
-                      'notes': 'Player choice: 1 damage or 3 damage + 1 self-damage'},
-        'Glare': {'element': 'Sunbeam', 'min': 1, 'max': 1, 'typical': 1,
-                 'notes': 'Flat 1 damage to all enemies'},
-        'Offering': {'element': 'Blood', 'min': 2, 'max': 2, 'typical': 2,
-                    'notes': '2 damage but costs 1 self-damage'},
-        'Ritual': {'element': 'Blood', 'min': 1, 'max': 6, 'typical': 3,
-                  'notes': 'Choice: 1 damage or up to 6 per attack spell + 1 self-damage'},
-        'Overexert': {'element': 'Blood', 'min': 4, 'max': 4, 'typical': 4,
-                     'notes': '4 damage but costs 1 self-damage'},
-        'Crepuscule': {'element': 'Twilight', 'min': 1, 'max': 2, 'typical': 2,
-                      'notes': '1 damage, 1 heal, +1 damage if other remedy spells'},
-        'Seed': {'element': 'Wood', 'min': 1, 'max': 1, 'typical': 1,
-                'notes': 'Flat 1 damage'}
-    }
-    
-    # Add damage data to elements
-    for spell_name, data in damage_data.items():
-        element_damage[data['element']].append({
-            'name': spell_name,
-            'min': data['min'],
-            'max': data['max'],
-            'typical': data['typical'],
-            'notes': data['notes']
-        })
-    
-    # Process remaining spells from JSON
-    for spell in spells:
-        spell_name = spell['card_name']
-        if spell_name not in damage_data:
-            # Check if spell has damage
-            all_effects = str(spell.get('resolve_effects', [])) + str(spell.get('advance_effects', []))
-            if 'damage' in all_effects and 'self-damage' not in spell_name.lower():
-                # Basic damage spell not analyzed above
-                element = spell['element']
-                element_damage[element].append({
-                    'name': spell_name,
-                    'min': 1,
-                    'max': 1,
-                    'typical': 1,
-                    'notes': 'Standard damage spell'
-                })
+    for element, spell_list in spells_by_element('damage', properties).items():
+        for props in spell_list:
+            element_damage[element].append({
+                'name': props['name'],
+                'min': props['damage']['min'],
+                'max': props['damage']['max'],
+                'typical': props['damage']['typical'],
+                'notes': '; '.join(props['notes']) or 'Flat damage'
+            })
     
     # Calculate element averages and display
     element_stats = []
@@ -133,17 +85,7 @@ def analyze_spells():
     print("\n\n=== HEALING SPELLS BY ELEMENT ===")
     print("-" * 40)
     
-    healing_spells = {
-        'Water': ['Nourish (2 heal)', 'Flow (1 heal)', 'Cleanse (1 heal per remedy)'],
-        'Wood': ['Grow (1 heal or 1 per spell)'],
-        'Metal': ['Defend (1 heal if attack spell active)'],
-        'Moonshine': ['Slumber (1 heal)'],
-        'Ichor': ['Renew (1 heal passive)', 'Shrine (1 heal)'],
-        'Nectar': ['Absorb (1 heal)'],
-        'Twilight': ['Crepuscule (1 heal + 1 damage)']
-    }
-    
-    for element, spells in healing_spells.items():
+    for element, spell_list in spells_by_element('heal', properties).items():
         # Get category
         category = None
         for cat, data in element_categories['categories'].items():
@@ -151,33 +93,34 @@ def analyze_spells():
                 category = cat
                 break
         print(f"\n{element} [{category}]:")
-        for spell in spells:
-            print(f"  - {spell}")
+        for props in spell_list:
+            print(f"  - {props['name']} ({format_range(props['heal'])} heal, typical {props['heal']['typical']:g})")
     
     # Key findings
     print("\n\n=== KEY FINDINGS ===")
     print("-" * 40)
+    all_damage = [spell for stat in element_stats for spell in stat['spells']]
     print("1. HIGHEST DAMAGE POTENTIAL:")
-    print("   - Blood: Overexert (4 damage) and Ritual (up to 6)")
-    print("   - Wood: Prickle (up to 6 damage with auto-optimal)")  
-    print("   - Time: Impact (up to 9 damage from other clashes)")
-    print("   - Fire: Ignite (up to 4 damage through advancing)")
+    for spell in sorted(all_damage, key=lambda s: (-s['max'], -s['typical']))[:4]:
+        element = properties[spell['name']]['element']
+        print(f"   - {element}: {spell['name']} (up to {spell['max']} damage; {spell['notes']})")
     
+    def averages(stats):
+        return ", ".join(f"{stat['element']} ({stat['avg_typical']:.1f})" for stat in stats)
+    
+    third = max(len(element_stats) // 3, 1)
     print("\n2. ELEMENT DAMAGE AVERAGES:")
-    print("   - Highest: Blood (3.0), Wood (2.0), Time (2.0)")
-    print("   - Mid-tier: Fire (1.3), Twilight (2.0), Sunbeam (1.5)")
-    print("   - Lowest: Most defense/mobility elements (1.0)")
-    
-    print("\n3. TURBULENCE CLARIFICATION:")
-    print("   - Does 1-2 damage (average 1.5), not 3")
-    print("   - Condition: 2 damage if active in 2+ other clashes")
-    print("   - Otherwise: 1 damage")
-    
-    print("\n4. CONDITIONAL DAMAGE SPELLS:")
-    print("   - Many spells have if/else structures")
-    print("   - Auto-optimal spells (Grow/Prickle) choose best option")
-    print("   - Scaling damage (per spell) can reach high numbers")
-
+    print(f"   - Highest: {averages(element_stats[:third])}")
+    print(f"   - Mid-tier: {averages(element_stats[third:-third])}")
+    print(f"   - Lowest: {averages(element_stats[-third:])}")
+    
+    conditional = [props['name'] for props in properties.values() if props['conditional'] and props['damage']['max']]
+    choices = [props['name'] for props in properties.values() if props['choice'] and props['damage']['max']]
+    scaling = [props['name'] for props in properties.values() if props['scaling'] and props['damage']['max']]
+    print("\n3. CONDITIONAL DAMAGE SPELLS:")
+    print(f"   - Conditional effects ({len(conditional)}): {', '.join(conditional)}")
+    print(f"   - Choice between options ({len(choices)}): {', '.join(choices)}")
+    print(f"   - Scaling damage ({len(scaling)}): {', '.join(scaling)}")
 
 if __name__ == "__main__":
     analyze_spells()
\ No newline at end of file
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+ExpertAI weight tuner.
+
+Searches ExpertAI.DEFAULT_WEIGHTS with a diagonal CMA-style evolution
+strategy. Each generation samples a population of weight vectors around
+the current mean (in log space, so every weight keeps its sign and scale)
+and scores each one by seat-swapped self-play against a fixed opponent
+pool. The search and the 'expert' opponent both use
+ExpertAI.DEFAULT_WEIGHTS, never an installed expert_weights.json, so
+installing a result does not move the target of later runs. All
+candidates in a generation play the same seeds, so their scores are
+directly comparable. The mean moves towards the best half and each
+weight's step size adapts to how much the winners spread out.
+
+Games run on a process pool. After every generation the run directory
+(expert_tuning/<timestamp>/) gets a checkpoint and a leaderboard. A run
+can be resumed from its directory, and the best leaderboard entry can be
+installed as expert_weights.json, which ExpertAI loads on startup.
+
+Usage:
+    python expert_tuner.py [--generations 10] [--population 8] [--pairs 4]
+                           [--opponents expert,hard] [--workers N] [--seed S]
+    python expert_tuner.py --resume expert_tuning/<run>    # Continue a run
+    python expert_tuner.py --install expert_tuning/<run>   # Use its best weights
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import math
+import os
+import random
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from datetime import datetime
+
+from ai import ExpertAI
+from analytics import AI_CLASSES, create_engine
+from crash_corpus import CrashCorpus
+from game_logger import NullGameLogger
+from match_stats import wilson_interval
+
+PARAMETERS = list(ExpertAI.DEFAULT_WEIGHTS)
+LEADERBOARD_SIZE = 20
+MIN_SIGMA, MAX_SIGMA = 0.02, 1.0  # Step size bounds in log space (0.3 ~ +/-35%)
+
+
+def make_opponent(opponent):
+    """A fixed opponent; ExpertAI plays its default weights, whatever is installed"""
+    if opponent == 'expert':
+        return ExpertAI(ExpertAI.DEFAULT_WEIGHTS)
+    return AI_CLASSES[opponent]()
+
+
+def weights_key(weights):
+    """Short hash identifying a weight vector, e.g. in crash file names"""
+    return hashlib.sha1(json.dumps(weights, sort_keys=True).encode()).hexdigest()[:8]
+
+
+def play_pair(candidate, weights, opponent, seed):
+    """Pool task: play one seed from both seats; returns (candidate, points, games)"""
+    points = games = 0
+    for tuned_seat in (0, 1):
+        ais = [ExpertAI(weights), make_opponent(opponent)]
+        names = ['TUNED_AI', f"{opponent.upper()}_AI"]
+        if tuned_seat == 1:
+            ais.reverse()
+            names.reverse()
+        random.seed(seed)
+        engine = None
+        try:
+            engine = create_engine(names, *ais, logger=NullGameLogger())
+            with redirect_stdout(io.StringIO()):
+                engine.run_game()
+            crash = engine.crash
+        except Exception:
+            crash = traceback.format_exc()
+        if crash:
+            # Not scored; recorded so it can be replayed with the same weights
+            CrashCorpus().record('expert_tuner', seed, names, [type(ai).__name__ for ai in ais], crash,
+                                 engine.gs if engine else None,
+                                 extra={'weights': weights, 'opponent': opponent, 'tuned_seat': tuned_seat},
+                                 key=weights_key(weights))
+            continue
+        winner = next((p for p in engine.gs.players if p.trunks > 0), None)
+        games += 1
+        if winner is None:
+            points += 0.5  # Draw
+        elif winner.name == 'TUNED_AI':
+            points += 1
+    return candidate, points, games
+
+
+def replay_crash(record):
+    """Re-run a crash recorded by the tuner with the same weights and seating"""
+    ais = [ExpertAI(record['weights']), make_opponent(record['opponent'])]
+    if record['tuned_seat'] == 1:
+        ais.reverse()
+    random.seed(record['seed'])
+    engine = create_engine(record['player_names'], *ais, logger=NullGameLogger())
+    with redirect_stdout(io.StringIO()):
+        engine.run_game()
+    return engine.crash
+
+
+class WeightTuner:
+    """Diagonal CMA-style search over ExpertAI weights with checkpoints and a leaderboard"""
+
+    def __init__(self, population=8, pairs=4, opponents=('expert', 'hard'), workers=None, seed=None,
+                 run_dir=None):
+        self.population = population
+        self.pairs = pairs  # Seat-swapped pairs per opponent per candidate
+        self.opponents = list(opponents)
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed if seed is not None else random.randrange(2**31)
+        self.run_dir = run_dir or os.path.join('expert_tuning', datetime.now().strftime('%Y%m%d_%H%M%S'))
+        # Search starts from the defaults, not an installed expert_weights.json (see module docstring)
+        self.base = dict(ExpertAI.DEFAULT_WEIGHTS)
+        self.mean = [0.0] * len(PARAMETERS)  # Log-ratio to self.base
+        self.sigma = [0.3] * len(PARAMETERS)
+        self.generation = 0
+        self.leaderboard = []
+        self.history = []
+        self.rng = random.Random(self.seed)
+
+    # --- parameter vector ---
+
+    def to_weights(self, z):
+        return {name: round(self.base[name] * math.exp(zi), 6) for name, zi in zip(PARAMETERS, z)}
+
+    def sample(self):
+        """Mirrored samples around the mean; the mean itself is always candidate 0"""
+        candidates = [list(self.mean)]
+        while len(candidates) < self.population:
+            step = [self.rng.gauss(0, s) for s in self.sigma]
+            candidates.append([m + d for m, d in zip(self.mean, step)])
+            if len(candidates) < self.population:
+                candidates.append([m - d for m, d in zip(self.mean, step)])
+        return candidates
+
+    # --- search ---
+
+    def evaluate(self, candidates):
+        """Score every candidate on this generation's shared seeds; returns (points, games) per candidate"""
+        first_seed = self.seed + self.generation * self.pairs
+        seeds = range(first_seed, first_seed + self.pairs)
+        results = [[0, 0] for _ in candidates]
+        tasks = [(i, self.to_weights(z), opponent, seed)
+                 for i, z in enumerate(candidates) for opponent in self.opponents for seed in seeds]
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for candidate, points, games in pool.map(play_pair, *zip(*tasks)):
+                results[candidate][0] += points
+                results[candidate][1] += games
+        return results
+
+    def update(self, candidates, results):
+        """Move the mean to the weighted mean of the best half and adapt each step size"""
+        scores = [points / games if games else 0.0 for points, games in results]
+        order = sorted(range(len(candidates)), key=lambda i: -scores[i])
+        mu = max(1, len(candidates) // 2)
+        raw = [math.log(mu + 0.5) - math.log(rank + 1) for rank in range(mu)]
+        recombination = [r / sum(raw) for r in raw]
+        selected = [candidates[i] for i in order[:mu]]
+
+        old_mean = self.mean
+        self.mean = [sum(w * z[d] for w, z in zip(recombination, selected)) for d in range(len(PARAMETERS))]
+        # Rank-mu variance update: shrink along weights the winners agree on, grow where they differ
+        learning_rate = 0.3
+        for d in range(len(PARAMETERS)):
+            spread = sum(w * (z[d] - old_mean[d]) ** 2 for w, z in zip(recombination, selected))
+            variance = (1 - learning_rate) * self.sigma[d] ** 2 + learning_rate * spread
+            self.sigma[d] = min(MAX_SIGMA, max(MIN_SIGMA, math.sqrt(variance)))
+        return scores, order
+
+    def record(self, candidates, results, scores):
+        for i, (z, (points, games)) in enumerate(zip(candidates, results)):
+            low, high = wilson_interval(points, games)
+            self.leaderboard.append({'weights': self.to_weights(z), 'score': scores[i], 'games': games,
+                                     'interval': [low, high], 'generation': self.generation,
+                                     'incumbent': i == 0})
+        # Rank by the interval's lower bound so a lucky short run doesn't top the board
+        self.leaderboard.sort(key=lambda entry: -entry['interval'][0])
+        del self.leaderboard[LEADERBOARD_SIZE:]
+
+    def run(self, generations):
+        os.makedirs(self.run_dir, exist_ok=True)
+        games_per_candidate = 2 * self.pairs * len(self.opponents)
+        print(f"Tuning ExpertAI: population {self.population}, {games_per_candidate} games per candidate "
+              f"vs {', '.join(self.opponents)}, {self.workers} worker(s), run dir {self.run_dir}")
+        target = self.generation + generations
+        while self.generation < target:
+            start = time.time()
+            candidates = self.sample()
+            results = self.evaluate(candidates)
+            scores, order = self.update(candidates, results)
+            self.record(candidates, results, scores)
+            self.history.append({'generation': self.generation, 'incumbent_score': scores[0],
+                                 'best_score': scores[order[0]],
+                                 'mean_sigma': sum(self.sigma) / len(self.sigma)})
+            print(f"Generation {self.generation}: incumbent {scores[0]:.1%}, best {scores[order[0]]:.1%}, "
+                  f"mean step {self.history[-1]['mean_sigma']:.3f} [{time.time() - start:.1f}s]")
+            self.generation += 1
+            self.save()
+        print(self.format_leaderboard())
+
+    # --- persistence ---
+
+    def save(self):
+        """Write checkpoint.json and leaderboard.json to the run directory"""
+        state = {
+            'population': self.population, 'pairs': self.pairs, 'opponents': self.opponents,
+            'seed': self.seed, 'base': self.base, 'mean': self.mean, 'sigma': self.sigma,
+            'generation': self.generation, 'history': self.history, 'leaderboard': self.leaderboard,
+            'rng_state': self.rng.getstate(),
+        }
+        path = os.path.join(self.run_dir, 'checkpoint.json')
+        with open(path + '.tmp', 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(path + '.tmp', path)  # Never leave a half-written checkpoint behind
+        with open(os.path.join(self.run_dir, 'leaderboard.json'), 'w') as f:
+            json.dump(self.leaderboard, f, indent=2)
+
+    @classmethod
+    def resume(cls, run_dir, workers=None):
+        with open(os.path.join(run_dir, 'checkpoint.json')) as f:
+            state = json.load(f)
+        tuner = cls(state['population'], state['pairs'], state['opponents'], workers, state['seed'], run_dir)
+        for key in ('base', 'mean', 'sigma', 'generation', 'history', 'leaderboard'):
+            setattr(tuner, key, state[key])
+        version, internal, gauss_next = state['rng_state']
+        tuner.rng.setstate((version, tuple(internal), gauss_next))
+        return tuner
+
+    def format_leaderboard(self, top=10):
+        lines = ["", "LEADERBOARD (ranked by 95% lower bound)",
+                 f"{'#':>3} {'score':>7} {'low':>7} {'games':>6} {'gen':>4}"]
+        for rank, entry in enumerate(self.leaderboard[:top], 1):
+            lines.append(f"{rank:>3} {entry['score']:>7.1%} {entry['interval'][0]:>7.1%} {entry['games']:>6} "
+                         f"{entry['generation']:>4}{'  (incumbent)' if entry['incumbent'] else ''}")
+        if self.leaderboard:
+            lines.append("Best weights (vs current):")
+            for name, value in self.leaderboard[0]['weights'].items():
+                lines.append(f"  {name:<28} {value:>9.4f}  ({value / self.base[name] - 1:+.0%})")
+        return "\n".join(lines)
+
+
+def install(run_dir):
+    """Copy the run's top leaderboard entry to expert_weights.json"""
+    with open(os.path.join(run_dir, 'leaderboard.json')) as f:
+        best = json.load(f)[0]
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'expert_weights.json')
+    with open(path, 'w') as f:
+        json.dump({'weights': best['weights'], 'source': run_dir, 'score': best['score'],
+                   'games': best['games'], 'installed': datetime.now().isoformat(timespec='seconds')}, f, indent=2)
+    print(f"Installed weights from {run_dir} (score {best['score']:.1%} over {best['games']} games) to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Tune ExpertAI weights by parallel self-play')
+    parser.add_argument('--generations', type=int, default=10)
+    parser.add_argument('--population', type=int, default=8, help='Candidates per generation (default 8)')
+    parser.add_argument('--pairs', type=int, default=4, help='Seat-swapped pairs per opponent per candidate')
+    parser.add_argument('--opponents', default='expert,hard', help='Comma-separated opponent pool')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--seed', type=int, help='Seed for sampling and game seeds')
+    parser.add_argument('--resume', metavar='RUN_DIR', help='Continue a checkpointed run')
+    parser.add_argument('--install', metavar='RUN_DIR', help="Install a run's best weights and exit")
+    args = parser.parse_args()
+
+    if args.install:
+        install(args.install)
+        return
+    if args.resume:
+        tuner = WeightTuner.resume(args.resume, args.workers)
+    else:
+        opponents = [o.strip() for o in args.opponents.split(',') if o.strip()]
+        unknown = [o for o in opponents if o not in AI_CLASSES]
+        if unknown or not opponents:
+            print(f"Unknown opponent(s): {', '.join(unknown) or '(none given)'}; choose from {', '.join(AI_CLASSES)}")
+            sys.exit(1)
+        tuner = WeightTuner(args.population, args.pairs, opponents, args.workers, args.seed)
+    tuner.run(args.generations)
+
+
+if __name__ == "__main__":
+    main()
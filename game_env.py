@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Step-by-step environment over the game engine, for training and evaluating policies.
+
+ElephantsEnv plays one game against a fixed AI and stops at each of the
+agent's prepare decisions:
+
+    env = ElephantsEnv(opponent='hard')
+    observation, mask = env.reset(seed=7)
+    while True:
+        observation, mask, reward, done = env.step(action)
+        if done:
+            break
+
+An observation is ai.features.encode_state from the agent's seat (see
+FEATURE_NAMES). Actions are spell indices (ai.features.SPELL_IDS) and the
+mask marks the spells in hand that may be prepared this clash. The reward
+is +1 for a win, -1 for a loss and 0 otherwise, paid when the game ends.
+Every other decision of the agent's seat (drafting, responses, targets) is
+made by its fallback AI, and the engine's rules decide when there is
+nothing to choose. Each game keeps its own random state, as in the
+lockstep simulator, so a seed and a sequence of actions always replay the
+same game.
+
+VectorEnv runs many such games in worker processes. Observations and masks
+are written into shared memory (one row per game) rather than pickled back,
+and finished games reset themselves on their next seed.
+
+Usage (plays random legal actions to measure throughput):
+    python game_env.py 1000 [--envs 16] [--workers 4] [--opponent hard] [--agent-ai hard] [--seed S]
+"""
+
+import argparse
+import io
+import os
+import random
+import time
+import traceback
+from collections import Counter
+from contextlib import redirect_stdout
+from multiprocessing import Pipe, Process
+from multiprocessing.sharedctypes import RawArray
+
+from ai.features import FEATURE_NAMES, SPELL_IDS, SPELL_INDEX, encode_state
+from analytics import AI_CLASSES
+from elephants_prototype import RoundOverException
+from lockstep_sim import PHASES, LockstepGame
+
+OBSERVATION_SIZE = len(FEATURE_NAMES)
+NUM_ACTIONS = len(SPELL_IDS)
+AGENT_NAME = 'AGENT'
+MAX_DEAD_STARTS = 100  # Games in a row a VectorEnv slot may lose before the agent's first decision
+
+
+class ElephantsEnv:
+    """One game against a fixed AI, stepped at the agent's prepare decisions"""
+
+    def __init__(self, opponent='hard', agent_ai='hard', seat=0):
+        self.seat = seat
+        self.names = [AGENT_NAME, f"{opponent.upper()}_AI"]
+        self.ai_types = [agent_ai, opponent]
+        if seat == 1:
+            self.names.reverse()
+            self.ai_types.reverse()
+        self.game = None
+        self.seed = None
+        self._play = None
+        self._legal = []  # Hand indices the agent may prepare, at the pending decision
+
+    @property
+    def engine(self):
+        return self.game.engine
+
+    @property
+    def done(self):
+        return self.game is not None and self.game.done
+
+    @property
+    def crash(self):
+        """Traceback text if the game died"""
+        return self.engine.crash if self.game else None
+
+    def reset(self, seed=None):
+        """Start a new game and play to the agent's first decision; returns (observation, mask)
+
+        A game can end (or crash) before the agent has anything to choose;
+        env.done is then already True and the mask is all zeros.
+        """
+        self.seed = random.randrange(2**31) if seed is None else seed
+        with redirect_stdout(io.StringIO()):
+            self.game = LockstepGame(self.seed, self.names, self.ai_types)
+            self._play = self._run_game()
+            self._advance(None)
+        return self._observe()
+
+    def step(self, action):
+        """Prepare the spell with index `action`; returns (observation, mask, reward, done)"""
+        if self._play is None or self.done:
+            raise RuntimeError("step() called without a game in progress; call reset() first")
+        chosen = next((i for i in self._legal if SPELL_INDEX[self.engine.gs.players[self.seat].hand[i].id] == action),
+                      None)
+        if chosen is None:
+            raise ValueError(f"Action {action} is not legal here; pick one the mask allows")
+        with redirect_stdout(io.StringIO()):
+            self._advance(chosen)
+        observation, mask = self._observe()
+        return observation, mask, self.reward(), self.done
+
+    def action_mask(self):
+        mask = [0] * NUM_ACTIONS
+        hand = self.engine.gs.players[self.seat].hand
+        for i in self._legal:
+            mask[SPELL_INDEX[hand[i].id]] = 1
+        return mask
+
+    def reward(self):
+        """+1 if the agent won, -1 if it lost, 0 for a draw, a crash or a game still running"""
+        if not self.done or self.crash:
+            return 0.0
+        survivors = [i for i, p in enumerate(self.engine.gs.players) if p.trunks > 0]
+        if len(survivors) != 1:
+            return 0.0
+        return 1.0 if survivors[0] == self.seat else -1.0
+
+    def winner(self):
+        """Winning seat, or None for a draw or crash"""
+        reward = self.reward()
+        return None if reward == 0 else (self.seat if reward > 0 else 1 - self.seat)
+
+    def _observe(self):
+        if self.done:
+            self._legal = []
+        return encode_state(self.engine.gs, self.engine.gs.players[self.seat]), self.action_mask()
+
+    def _advance(self, chosen):
+        """Run the game, under its own random state, until the agent's next decision or the end"""
+        self.game.step(self._resume, chosen)
+
+    def _resume(self, chosen):
+        try:
+            self._legal = self._play.send(chosen)
+        except StopIteration:
+            self.game.done = True
+
+    def _run_game(self):
+        """GameEngine.run_game, yielding the legal hand indices at each agent decision
+        and receiving the chosen one"""
+        engine = self.engine
+        engine._setup_game()
+        while engine._game_continues():
+            engine._start_round()
+            try:
+                for clash in range(1, 5):
+                    engine.gs.clash_num = clash
+                    yield from self._run_clash(clash)
+            except RoundOverException:
+                engine._end_round_early()
+            if not engine.gs.game_over:
+                engine._run_end_of_round()
+                engine.gs.round_num += 1
+        engine._finish_game()
+
+    def _run_clash(self, clash):
+        engine = self.engine
+        engine.gs.action_log.add('phase', clash=clash, phase='PREPARE')
+        for player_index in engine._turn_order():
+            chosen = None
+            if player_index == self.seat:
+                player = engine.gs.players[player_index]
+                legal = ([] if player.is_invulnerable or not player.hand else
+                         engine.ai_strategies[player_index]._get_valid_card_indices(player, engine.gs))
+                if legal:
+                    chosen = yield legal
+            engine._prepare_spell(player_index, chosen)
+        for phase in PHASES[:3 if clash < 4 else 2]:
+            if engine.gs.game_over:
+                return
+            getattr(engine, phase)()
+
+
+def _finished(env):
+    return {'seed': env.seed, 'winner': env.winner(), 'rounds': env.engine.gs.round_num, 'crash': env.crash}
+
+
+def _worker(conn, first, count, num_envs, opponent, agent_ai, observations, masks):
+    """Worker process: hosts envs first..first+count-1 and writes their rows into the shared buffers
+
+    Replies to each command with the finished games' records, or with a
+    RuntimeError carrying the traceback if the worker failed.
+    """
+    try:
+        _serve(conn, first, count, num_envs, opponent, agent_ai, observations, masks)
+    except Exception:
+        conn.send(RuntimeError(f"Worker for envs {first}..{first + count - 1} failed:\n{traceback.format_exc()}"))
+    conn.close()
+
+
+def _serve(conn, first, count, num_envs, opponent, agent_ai, observations, masks):
+    envs = [ElephantsEnv(opponent, agent_ai) for _ in range(count)]
+    next_seeds = [None] * count
+
+    def start(k):
+        """Reset env k on its next seeds until a game reaches an agent decision; returns the games
+        that ended before one"""
+        finished = []
+        for _ in range(MAX_DEAD_STARTS):
+            observation, mask = envs[k].reset(next_seeds[k])
+            next_seeds[k] += num_envs
+            if not envs[k].done:
+                write(k, observation, mask)
+                return finished
+            finished.append(_finished(envs[k]))
+        raise RuntimeError(f"{MAX_DEAD_STARTS} games in a row ended before the agent's first decision "
+                           f"(last seed {envs[k].seed}, crash: {envs[k].crash})")
+
+    def write(k, observation, mask):
+        row = first + k
+        observations[row * OBSERVATION_SIZE:(row + 1) * OBSERVATION_SIZE] = observation
+        masks[row * NUM_ACTIONS:(row + 1) * NUM_ACTIONS] = mask
+
+    while True:
+        command, payload = conn.recv()
+        if command == 'reset':
+            finished = []
+            for k in range(count):
+                next_seeds[k] = payload + first + k
+                finished += start(k)
+            conn.send(finished)
+        elif command == 'step':
+            replies = []
+            for k, action in enumerate(payload):
+                env = envs[k]
+                observation, mask, reward, done = env.step(action)
+                if done:
+                    finished = [_finished(env)] + start(k)  # The row now holds the next live game
+                else:
+                    finished = []
+                    write(k, observation, mask)
+                replies.append((reward, done, finished))
+            conn.send(replies)
+        elif command == 'close':
+            return
+
+
+class VectorEnv:
+    """num_envs ElephantsEnv games spread over worker processes, with shared observation buffers
+
+    observations[i] and masks[i] are views of game i's rows in shared memory;
+    they are overwritten by the next reset() or step(). A game that ends
+    during step() reports its reward and done=True, and its rows already
+    hold the first observation of its next game (seed + i + k * num_envs
+    for its k-th game). Games that end before the agent's first decision
+    are skipped the same way, so every row is always a live game. Finished
+    games, skipped ones included, are listed in `results`.
+    """
+
+    def __init__(self, num_envs, opponent='hard', agent_ai='hard', workers=None):
+        self.num_envs = num_envs
+        self.workers = max(1, min(workers or os.cpu_count() or 1, num_envs))
+        self.observation_buffer = RawArray('d', num_envs * OBSERVATION_SIZE)
+        self.mask_buffer = RawArray('b', num_envs * NUM_ACTIONS)
+        flat_observations = memoryview(self.observation_buffer).cast('B').cast('d')
+        flat_masks = memoryview(self.mask_buffer).cast('B').cast('b')
+        self.observations = [flat_observations[i * OBSERVATION_SIZE:(i + 1) * OBSERVATION_SIZE]
+                             for i in range(num_envs)]
+        self.masks = [flat_masks[i * NUM_ACTIONS:(i + 1) * NUM_ACTIONS] for i in range(num_envs)]
+        self.results = []  # {'seed', 'winner' (seat or None), 'rounds', 'crash'} per finished game
+
+        self._slices = []  # (first env, count) per worker
+        self._conns = []
+        self._processes = []
+        base, extra = divmod(num_envs, self.workers)
+        first = 0
+        for w in range(self.workers):
+            count = base + (w < extra)
+            parent, child = Pipe()
+            process = Process(target=_worker, daemon=True,
+                              args=(child, first, count, num_envs, opponent, agent_ai,
+                                    self.observation_buffer, self.mask_buffer))
+            process.start()
+            child.close()
+            self._slices.append((first, count))
+            self._conns.append(parent)
+            self._processes.append(process)
+            first += count
+
+    def reset(self, seed=None):
+        """Start every game (game i on seed + i); returns (observations, masks)"""
+        if seed is None:
+            seed = random.randrange(2**31)
+        for conn in self._conns:
+            conn.send(('reset', seed))
+        for conn in self._conns:
+            self.results += self._receive(conn)
+        return self.observations, self.masks
+
+    def step(self, actions):
+        """One action per game; returns (observations, masks, rewards, dones)"""
+        illegal = [i for i, action in enumerate(actions) if not self.masks[i][action]]
+        if illegal:
+            raise ValueError(f"Illegal actions for games {illegal}; pick ones their masks allow")
+        for conn, (first, count) in zip(self._conns, self._slices):
+            conn.send(('step', list(actions[first:first + count])))
+        rewards, dones = [], []
+        for conn in self._conns:
+            for reward, done, finished in self._receive(conn):
+                rewards.append(reward)
+                dones.append(done)
+                self.results += finished
+        return self.observations, self.masks, rewards, dones
+
+    @staticmethod
+    def _receive(conn):
+        reply = conn.recv()
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    def close(self):
+        for conn in self._conns:
+            try:
+                conn.send(('close', None))
+            except OSError:
+                pass  # The worker already failed
+            conn.close()
+        for process in self._processes:
+            process.join()
+        self._conns = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def random_action(mask):
+    return random.choice([a for a, legal in enumerate(mask) if legal])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Play random legal actions in vectorised environments')
+    parser.add_argument('games', type=int, nargs='?', default=1000)
+    parser.add_argument('--envs', type=int, default=16, help='Games played at once (default 16)')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--opponent', default='hard', choices=list(AI_CLASSES))
+    parser.add_argument('--agent-ai', default='hard', choices=list(AI_CLASSES),
+                        help="AI making the agent seat's other decisions (default hard)")
+    parser.add_argument('--seed', type=int, help='Base seed; game i is played on seed + i')
+    args = parser.parse_args()
+
+    start = time.time()
+    steps = 0
+    with VectorEnv(args.envs, args.opponent, args.agent_ai, args.workers) as envs:
+        observations, masks = envs.reset(args.seed)
+        while len(envs.results) < args.games:
+            observations, masks, rewards, dones = envs.step([random_action(mask) for mask in masks])
+            steps += args.envs
+        results = envs.results
+    elapsed = time.time() - start
+
+    wins = Counter(r['winner'] for r in results if not r['crash'])
+    print(f"{len(results)} games, {steps} steps in {elapsed:.1f}s = {steps / max(elapsed, 1e-9):.0f} steps/s "
+          f"({envs.workers} worker(s), {args.envs} envs)")
+    print(f"  Random agent  {wins[0]:>6} wins ({wins[0] / max(len(results), 1):.1%})")
+    print(f"  {args.opponent.upper()}_AI{'':<{max(0, 9 - len(args.opponent))}} {wins[1]:>6} wins")
+    print(f"  Draws         {wins[None]:>6}")
+    print(f"  Crashed       {sum(1 for r in results if r['crash']):>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Inverted index over every logged game (loose files in game_logs/ and its archive).
+
+Each game gets a number; every term maps to the sorted list of numbers of
+the games it occurs in. A query intersects the posting lists of its terms,
+shortest first, so balance questions such as "games where Fireball was cast
+in clash 1 by a Fire player" or "games Expert lost with Water" are answered
+from the index alone; only the games actually requested are read back.
+
+The index is kept in game_logs/archive/inverted_index.json and brought up to
+date on open: games logged since the last query are indexed, and it is
+rebuilt only if games it knew have disappeared.
+
+Terms (case-insensitive):
+    element:<element>             either player drafted the element
+    ai:<type>                     either player is that AI (easy/medium/hard/expert/value)
+    winner_ai:<type>, loser_ai:<type>
+    winner_element:<element>, loser_element:<element>
+    spell:<spell>                 cast by either player
+    spell:<spell>@<clash>         cast in that clash
+    spell:<spell>/element:<e>, spell:<spell>@<clash>/element:<e>
+                                  cast by a player who drafted that element
+    winner_spell:<spell>, loser_spell:<spell>
+    event:<type>                  at least one event of that type was logged
+    result:draw, result:decisive
+A term prefixed with '-' excludes the games it matches.
+
+Usage:
+    python game_index.py query spell:fireball@1/element:fire [--show N]
+    python game_index.py query loser_ai:expert loser_element:water -ai:easy
+    python game_index.py terms [prefix]
+    python game_index.py rebuild
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from log_archive import ARCHIVE_SUBDIR, LOG_DIR, LogArchive, ai_type_from_name, game_id_of
+
+INDEX_NAME = 'inverted_index.json'
+INDEX_VERSION = 2  # Bump when game_terms changes, so saved indexes are rebuilt
+
+
+def game_terms(game):
+    """Every term a game is indexed under"""
+    players = game.get('players', {})
+    sides = [players.get(key, {}) for key in ('player1', 'player2')]
+    winner = game.get('winner', game.get('result', {}).get('winner'))
+    terms = {'result:decisive' if winner else 'result:draw'}
+    outcome = {}
+    elements = {}
+    for side in sides:
+        name = side.get('name')
+        elements[name] = side.get('elements', [])
+        ai_type = ai_type_from_name(name) if side.get('is_ai', True) else None
+        role = None if not winner else ('winner' if name == winner else 'loser')
+        outcome[name] = role
+        if ai_type:
+            terms.add(f"ai:{ai_type}")
+            if role:
+                terms.add(f"{role}_ai:{ai_type}")
+        for element in side.get('elements', []):
+            terms.add(f"element:{element}")
+            if role:
+                terms.add(f"{role}_element:{element}")
+    for event in game.get('events', []):
+        terms.add(f"event:{event['type']}")
+        if event['type'] == 'spell_played':
+            spell = event.get('spell')
+            terms.add(f"spell:{spell}")
+            terms.add(f"spell:{spell}@{event.get('clash')}")
+            for element in elements.get(event.get('player'), []):
+                terms.add(f"spell:{spell}/element:{element}")
+                terms.add(f"spell:{spell}@{event.get('clash')}/element:{element}")
+            role = outcome.get(event.get('player'))
+            if role:
+                terms.add(f"{role}_spell:{spell}")
+    return {term.lower() for term in terms}
+
+
+class GameIndex:
+    """Posting lists from terms to game numbers, with the game ids and where each game is stored"""
+
+    def __init__(self, log_dir=LOG_DIR):
+        self.log_dir = log_dir
+        self.archive = LogArchive(os.path.join(log_dir, ARCHIVE_SUBDIR))
+        self.path = os.path.join(self.archive.path, INDEX_NAME)
+        self.game_ids = []      # game number -> game id
+        self.locations = {}     # game id -> {'file': name} or an archive index entry
+        self.postings = {}      # term -> sorted game numbers
+        self._sets = {}         # term -> set of game numbers, built on first use
+
+    @classmethod
+    def open(cls, log_dir=LOG_DIR):
+        """Load the saved index, add any games logged since, and save it if it changed"""
+        index = cls(log_dir)
+        index.load()
+        saved_locations = index.locations
+        if index.update() or index.locations != saved_locations:  # New games, or games packed since
+            index.save()
+        return index
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path) as f:
+            data = json.load(f)
+        if data.get('version') == INDEX_VERSION:
+            self.game_ids = data['game_ids']
+            self.locations = data['locations']
+            self.postings = data['postings']
+
+    def save(self):
+        os.makedirs(self.archive.path, exist_ok=True)
+        with open(self.path + '.tmp', 'w') as f:
+            json.dump({'version': INDEX_VERSION, 'game_ids': self.game_ids, 'locations': self.locations,
+                       'postings': self.postings}, f, separators=(',', ':'))
+        os.replace(self.path + '.tmp', self.path)
+
+    def _sources(self):
+        """{game id: location} of every game on disk; archived copies win over loose ones"""
+        sources = {}
+        if os.path.isdir(self.log_dir):
+            for filename in sorted(os.listdir(self.log_dir)):
+                if filename.startswith('game_') and filename.endswith('.json'):
+                    sources[game_id_of({}, filename)] = {'file': filename}
+        for entry in self.archive.entries():
+            sources[entry['game_id']] = {key: entry[key] for key in ('shard', 'offset', 'length')}
+        return sources
+
+    def update(self):
+        """Index games logged since the last update; returns how many were added"""
+        sources = self._sources()
+        if any(game_id not in sources for game_id in self.game_ids):
+            self.game_ids, self.postings = [], {}  # Games were removed: start over
+        self.locations = {game_id: sources[game_id] for game_id in self.game_ids}
+        known = set(self.game_ids)
+        added = 0
+        for game_id, location in sources.items():
+            if game_id in known:
+                continue
+            try:
+                game = self._read(location)
+            except (OSError, ValueError):
+                continue  # Unreadable loose file
+            number = len(self.game_ids)
+            self.game_ids.append(game_id)
+            self.locations[game_id] = location
+            for term in game_terms(game):
+                self.postings.setdefault(term, []).append(number)
+            added += 1
+        if added:
+            self._sets = {}
+        return added
+
+    def rebuild(self):
+        self.game_ids, self.locations, self.postings, self._sets = [], {}, {}, {}
+        return self.update()
+
+    def _read(self, location):
+        if 'file' in location:
+            with open(os.path.join(self.log_dir, location['file'])) as f:
+                return json.load(f)
+        return self.archive.read(location)
+
+    def _set(self, term):
+        if term not in self._sets:
+            self._sets[term] = set(self.postings.get(term, ()))
+        return self._sets[term]
+
+    def match(self, *terms):
+        """Sorted game numbers matching every term; '-term' excludes"""
+        include = [t.lower() for t in terms if not t.startswith('-')]
+        exclude = [t[1:].lower() for t in terms if t.startswith('-')]
+        if include:
+            include.sort(key=lambda term: len(self.postings.get(term, ())))
+            numbers = set(self.postings.get(include[0], ()))
+            for term in include[1:]:
+                if not numbers:
+                    break
+                numbers &= self._set(term)
+        else:
+            numbers = set(range(len(self.game_ids)))
+        for term in exclude:
+            numbers -= self._set(term)
+        return sorted(numbers)
+
+    def query(self, *terms):
+        """Ids of the games matching every term"""
+        return [self.game_ids[n] for n in self.match(*terms)]
+
+    def count(self, *terms):
+        return len(self.match(*terms))
+
+    def game(self, game_id):
+        """The full log of an indexed game"""
+        game = self._read(self.locations[game_id])
+        game['game_id'] = game_id
+        return game
+
+    def games(self, *terms):
+        """Yield the full logs of the games matching every term"""
+        for game_id in self.query(*terms):
+            yield self.game(game_id)
+
+    def terms(self, prefix=''):
+        """{term: number of games} for the terms starting with prefix"""
+        prefix = prefix.lower()
+        return {term: len(numbers) for term, numbers in sorted(self.postings.items()) if term.startswith(prefix)}
+
+
+def _summary(game):
+    players = game.get('players', {})
+    sides = [f"{p.get('name')} ({'/'.join(p.get('elements', []))})"
+             for p in (players.get('player1', {}), players.get('player2', {}))]
+    winner = game.get('winner', game.get('result', {}).get('winner'))
+    return f"{game['game_id']:<34} {' vs '.join(sides)}  -> {winner or 'draw'}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query the inverted index over logged games')
+    parser.add_argument('--log-dir', default=LOG_DIR)
+    sub = parser.add_subparsers(dest='command', required=True)
+    query_parser = sub.add_parser('query', help='Games matching every term (prefix a term with - to exclude)')
+    query_parser.add_argument('terms', nargs='*')
+    query_parser.add_argument('--show', type=int, default=0, metavar='N', help='Print the first N matching games')
+    terms_parser = sub.add_parser('terms', help='List indexed terms and their game counts')
+    terms_parser.add_argument('prefix', nargs='?', default='')
+    sub.add_parser('rebuild', help='Re-index every logged game from scratch')
+    # '-term' exclusions look like options to argparse, so they come back as unknown arguments
+    args, extra = parser.parse_known_args()
+    if extra and (args.command != 'query' or any(not t.startswith('-') or t.startswith('--') for t in extra)):
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    if args.command == 'query':
+        args.terms += extra
+        if not args.terms:
+            parser.error("query needs at least one term")
+
+    start = time.time()
+    if args.command == 'rebuild':
+        index = GameIndex(args.log_dir)
+        added = index.rebuild()
+        index.save()
+        print(f"Indexed {added} games under {len(index.postings)} terms in {time.time() - start:.2f}s "
+              f"-> {index.path}")
+        return
+    index = GameIndex.open(args.log_dir)
+    if not index.game_ids:
+        print(f"No logged games in {args.log_dir}")
+        sys.exit(1)
+    if args.command == 'terms':
+        for term, count in index.terms(args.prefix).items():
+            print(f"  {term:<40} {count:>6}")
+        return
+    loaded = time.time()
+    numbers = index.match(*args.terms)
+    elapsed = time.time() - loaded
+    total = len(index.game_ids)
+    print(f"{len(numbers)} of {total} games ({len(numbers) / total:.1%}) match {' '.join(args.terms)} "
+          f"[query {elapsed * 1000:.2f} ms, index load {(loaded - start) * 1000:.0f} ms]")
+    for n in numbers[:args.show]:
+        print("  " + _summary(index.game(index.game_ids[n])))
+
+
+if __name__ == "__main__":
+    main()
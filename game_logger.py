@@ -1,16 +1,63 @@
 #!/usr/bin/env python3
-"""Game logger for tracking real-world spell performance"""
+"""Game logger for tracking real-world spell performance
 
+Every GameEngine owns its own GameLogger (pass one in to choose where games
+go, or a NullGameLogger to skip logging altogether), so any number of games
+can run side by side in threads or processes. Finished games are written
+by a sink under a unique game id; by default they roll into the compressed
+shards of game_logs/archive/ (see log_archive.py).
+"""
+
+import itertools
 import json
 import os
 from datetime import datetime
 from collections import defaultdict
 
+from log_archive import ARCHIVE_SUBDIR, ArchiveSink, count_logged_games, iter_logged_games
+
+_game_counter = itertools.count()
+
+
+def new_game_id():
+    """Unique id for a game: timestamp to the microsecond, process id and a per-process counter"""
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{os.getpid()}_{next(_game_counter)}"
+
+
+class JsonFileSink:
+    """Writes each finished game to <log_dir>/game_<game id>.json
+    
+    Ids never repeat and each file is written under a temporary name and
+    renamed into place, so threads and processes can share one directory
+    without overwriting each other or leaving half-written logs behind.
+    """
+    
+    def __init__(self, log_dir="game_logs"):
+        self.log_dir = log_dir
+    
+    def write(self, game):
+        os.makedirs(self.log_dir, exist_ok=True)
+        path = os.path.join(self.log_dir, f"game_{game['game_id']}.json")
+        with open(path + '.tmp', 'w') as f:
+            json.dump(game, f, indent=2)
+        os.replace(path + '.tmp', path)
+        return path
+
+
 class GameLogger:
     """Logs game events for analytics"""
     
-    def __init__(self, log_dir="game_logs"):
+    def __init__(self, log_dir="game_logs", sink=None, persist=True):
+        """
+        Args:
+            log_dir: Where finished games are written and the report reads from
+            sink: Object whose write(game) stores a finished game (default: the archive in log_dir;
+                JsonFileSink(log_dir) keeps one loose file per game)
+            persist: False keeps games in memory only (current_game), e.g. for batch runners
+        """
         self.log_dir = log_dir
+        self.sink = (sink or ArchiveSink(os.path.join(log_dir, ARCHIVE_SUBDIR))) if persist else None
+        self.game_id = None
         self.current_game = None
         self.damage_events = []
         self.healing_events = []
@@ -19,10 +66,6 @@ class GameLogger:
         self.spell_plays = []
         self.game_metadata = {}
         self.trunk_start_times = {}  # Track when each trunk starts
-        
-        # Create log directory if it doesn't exist
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
     
     def reset(self):
         """Reset the logger for a new game"""
@@ -37,7 +80,9 @@ class GameLogger:
     
     def start_game(self, player1_name, player2_name, player1_elements, player2_elements, ai_difficulty=None):
         """Start logging a new game"""
+        self.game_id = new_game_id()
         self.current_game = {
+            'game_id': self.game_id,
             'timestamp': datetime.now().isoformat(),
             'players': {
                 'player1': {
@@ -288,13 +333,8 @@ class GameLogger:
             }
             
             # Save to file
-            filename = f"game_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            filepath = os.path.join(self.log_dir, filename)
-            
-            with open(filepath, 'w') as f:
-                json.dump(self.current_game, f, indent=2)
-            
-            return filepath
+            if self.sink:
+                return self.sink.write(self.current_game)
     
     def analyze_damage_by_spell(self, weighted=False):
         """Analyze damage statistics by spell from logged games
@@ -311,54 +351,50 @@ class GameLogger:
         })
         
         # Load all game logs
-        for filename in os.listdir(self.log_dir):
-            if filename.endswith('.json'):
-                with open(os.path.join(self.log_dir, filename), 'r') as f:
-                    game_data = json.load(f)
-                    
-                    # First pass: count spell plays to get times_played
-                    spell_plays = {}
-                    for event in game_data.get('events', []):
-                        if event['type'] == 'spell_played':
-                            spell_name = event['spell']
-                            element = event['element']
-                            clash = event['clash']
-                            key = f"{spell_name}_{clash}_{event['player']}"
-                            spell_plays[key] = {'spell': spell_name, 'element': element, 'damage': 0, 'weaken': 0}
+        for game_data in iter_logged_games(self.log_dir):
+            # First pass: count spell plays to get times_played
+            spell_plays = {}
+            for event in game_data.get('events', []):
+                if event['type'] == 'spell_played':
+                    spell_name = event['spell']
+                    element = event['element']
+                    clash = event['clash']
+                    key = f"{spell_name}_{clash}_{event['player']}"
+                    spell_plays[key] = {'spell': spell_name, 'element': element, 'damage': 0, 'weaken': 0}
                     
-                    # Second pass: accumulate damage and weaken for each spell play
-                    for event in game_data.get('events', []):
-                        if event['type'] == 'damage_dealt' and not event.get('is_self_damage', False):
-                            spell_name = event['spell']
-                            clash = event['clash']
-                            key = f"{spell_name}_{clash}_{event['source_player']}"
-                            if key in spell_plays:
-                                spell_plays[key]['damage'] += event['amount']
+            # Second pass: accumulate damage and weaken for each spell play
+            for event in game_data.get('events', []):
+                if event['type'] == 'damage_dealt' and not event.get('is_self_damage', False):
+                    spell_name = event['spell']
+                    clash = event['clash']
+                    key = f"{spell_name}_{clash}_{event['source_player']}"
+                    if key in spell_plays:
+                        spell_plays[key]['damage'] += event['amount']
                         
-                        elif event['type'] == 'weaken_dealt':
-                            spell_name = event['spell']
-                            clash = event['clash']
-                            key = f"{spell_name}_{clash}_{event['source_player']}"
-                            if key in spell_plays:
-                                spell_plays[key]['weaken'] += event['amount']
+                elif event['type'] == 'weaken_dealt':
+                    spell_name = event['spell']
+                    clash = event['clash']
+                    key = f"{spell_name}_{clash}_{event['source_player']}"
+                    if key in spell_plays:
+                        spell_plays[key]['weaken'] += event['amount']
                     
-                    # Now aggregate the data
-                    for play_data in spell_plays.values():
-                        spell_name = play_data['spell']
-                        element = play_data['element']
-                        damage_total = play_data['damage'] + play_data['weaken']  # Unweighted
+            # Now aggregate the data
+            for play_data in spell_plays.values():
+                spell_name = play_data['spell']
+                element = play_data['element']
+                damage_total = play_data['damage'] + play_data['weaken']  # Unweighted
                         
-                        # For weighted, count weaken as 2x
-                        if weighted:
-                            damage_weighted = play_data['damage'] + (play_data['weaken'] * 2)
-                        else:
-                            damage_weighted = damage_total
+                # For weighted, count weaken as 2x
+                if weighted:
+                    damage_weighted = play_data['damage'] + (play_data['weaken'] * 2)
+                else:
+                    damage_weighted = damage_total
                         
-                        spell_damage_stats[spell_name]['element'] = element
-                        spell_damage_stats[spell_name]['times_played'] += 1
-                        spell_damage_stats[spell_name]['total_damage'] += damage_total
-                        spell_damage_stats[spell_name]['total_damage_weighted'] += damage_weighted
-                        spell_damage_stats[spell_name]['damage_per_cast'].append(damage_total)
+                spell_damage_stats[spell_name]['element'] = element
+                spell_damage_stats[spell_name]['times_played'] += 1
+                spell_damage_stats[spell_name]['total_damage'] += damage_total
+                spell_damage_stats[spell_name]['total_damage_weighted'] += damage_weighted
+                spell_damage_stats[spell_name]['damage_per_cast'].append(damage_total)
         
         # Calculate averages and ranges
         results = []
@@ -404,34 +440,30 @@ class GameLogger:
         })
         
         # Load all game logs
-        for filename in os.listdir(self.log_dir):
-            if filename.endswith('.json'):
-                with open(os.path.join(self.log_dir, filename), 'r') as f:
-                    game_data = json.load(f)
-                    
-                    for event in game_data.get('events', []):
-                        if event['type'] == 'damage_dealt' and not event.get('is_self_damage', False):
-                            element = event['element']
-                            damage = event['amount']
-                            spell_name = event['spell']
+        for game_data in iter_logged_games(self.log_dir):
+            for event in game_data.get('events', []):
+                if event['type'] == 'damage_dealt' and not event.get('is_self_damage', False):
+                    element = event['element']
+                    damage = event['amount']
+                    spell_name = event['spell']
                             
-                            element_damage_stats[element]['total_damage'] += damage
-                            element_damage_stats[element]['total_damage_weighted'] += damage
-                            element_damage_stats[element]['damage_spells_used'] += 1
-                            element_damage_stats[element]['spell_damage'][spell_name].append(damage)
+                    element_damage_stats[element]['total_damage'] += damage
+                    element_damage_stats[element]['total_damage_weighted'] += damage
+                    element_damage_stats[element]['damage_spells_used'] += 1
+                    element_damage_stats[element]['spell_damage'][spell_name].append(damage)
                         
-                        elif event['type'] == 'weaken_dealt':
-                            element = event['element']
-                            weaken = event['amount']
-                            spell_name = event['spell']
+                elif event['type'] == 'weaken_dealt':
+                    element = event['element']
+                    weaken = event['amount']
+                    spell_name = event['spell']
                             
-                            element_damage_stats[element]['weaken_spells_used'] += 1
-                            element_damage_stats[element]['spell_weaken'][spell_name].append(weaken)
+                    element_damage_stats[element]['weaken_spells_used'] += 1
+                    element_damage_stats[element]['spell_weaken'][spell_name].append(weaken)
                             
-                            if weighted:
-                                element_damage_stats[element]['total_damage_weighted'] += weaken * 2
-                            else:
-                                element_damage_stats[element]['total_damage'] += weaken
+                    if weighted:
+                        element_damage_stats[element]['total_damage_weighted'] += weaken * 2
+                    else:
+                        element_damage_stats[element]['total_damage'] += weaken
         
         # Calculate element averages
         results = []
@@ -471,12 +503,12 @@ class GameLogger:
         print("=" * 80)
         
         # Check if we have data
-        log_files = [f for f in os.listdir(self.log_dir) if f.endswith('.json')]
-        if not log_files:
+        games = count_logged_games(self.log_dir)
+        if not games:
             print("No game logs found. Play some games to generate data!")
             return
         
-        print(f"\nAnalyzing {len(log_files)} logged games...")
+        print(f"\nAnalyzing {games} logged games...")
         
         # Spell damage analysis - UNWEIGHTED
         spell_stats = self.analyze_damage_by_spell(weighted=False)
@@ -561,8 +593,23 @@ class GameLogger:
             print(f"{element:<15} {theoretical:>11.1f} {real_avg:>11.1f} {diff:>+11.1f}")
 
 
-# Create global logger instance
-game_logger = GameLogger()
+class NullGameLogger(GameLogger):
+    """Records nothing; for batch runs that only need each game's result"""
+    
+    def __init__(self):
+        super().__init__(persist=False)
+    
+    def start_game(self, *args, **kwargs):
+        pass
+    
+    def _discard(self, *args, **kwargs):
+        return None
+
+
+# Every log_* event method, including ones added to GameLogger later
+for _name in [name for name in vars(GameLogger) if name.startswith('log_')]:
+    setattr(NullGameLogger, _name, NullGameLogger._discard)
+
 
 if __name__ == "__main__":
     # Generate report if run directly
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Lockstep batch simulator.
+
+Plays games in batches of N, moving every game of a batch through each
+phase together: all of them prepare, then all cast, resolve and advance,
+clash by clash and round by round. In the prepare phase the decisions of
+the whole batch are gathered seat by seat, and AIs that can score choices
+in bulk (ValueAI with a trained value_model.json: a dot product per option
+over an ai.features context) get every game's choice in one call, after
+which the choices are played back into their games. Other AIs, and every
+other decision, are made inline as usual.
+
+Each game keeps its own random state, so game i plays exactly the game
+analytics.py plays on seed + i: batching changes throughput, never results.
+Crashed games go to the crash corpus like any other batch runner's.
+
+Usage:
+    python lockstep_sim.py 1000 [--ai1 value] [--ai2 value] [--batch 64] [--seed S]
+"""
+
+import argparse
+import io
+import random
+import time
+import traceback
+from collections import Counter
+from contextlib import redirect_stdout
+
+from analytics import AI_CLASSES, create_engine, replay_crash  # replay_crash: games replay exactly as analytics'
+from crash_corpus import CrashCorpus
+from elephants_prototype import RoundOverException
+from game_logger import NullGameLogger
+
+DEFAULT_BATCH = 64
+PHASES = ('_run_cast_phase', '_run_resolve_phase', '_run_advance_phase')
+
+
+def player_names(ai1, ai2):
+    if ai1 == ai2:
+        return [f"{ai1.upper()}_AI_1", f"{ai2.upper()}_AI_2"]
+    return [f"{ai1.upper()}_AI", f"{ai2.upper()}_AI"]
+
+
+class LockstepGame:
+    """One game of a batch: its engine, its own random state and where it is in the round"""
+
+    def __init__(self, seed, names, ai_types):
+        random.seed(seed)
+        self.seed = seed
+        self.engine = create_engine(names, *ai_types, logger=NullGameLogger())
+        self.engine.crash = None
+        self.rng = random.getstate()
+        self.in_round = False
+        self.done = False
+
+    def step(self, fn, *args, in_clash=False):
+        """Run one piece of this game under its own random state; returns fn's result
+
+        A RoundOverException raised during a clash ends the round as in
+        GameEngine._run_round; any other exception ends the game as a crash.
+        """
+        random.setstate(self.rng)
+        try:
+            return fn(*args)
+        except RoundOverException:
+            if not in_clash:
+                raise
+            self.in_round = False
+            self.engine._end_round_early()
+        except Exception:
+            self.engine.crash = traceback.format_exc()
+            self.done = True
+        finally:
+            self.rng = random.getstate()
+
+
+class LockstepSimulator:
+    """Plays seeded AI-vs-AI games N at a time, batching the prepare decisions of each seat"""
+
+    def __init__(self, ai1='value', ai2='value', batch_size=DEFAULT_BATCH, crash_dir='crash_corpus'):
+        self.ai_types = [ai1, ai2]
+        self.names = player_names(ai1, ai2)
+        self.batch_size = batch_size
+        self.crash_corpus = CrashCorpus(crash_dir)
+        self.results = []        # {'seed', 'winner' (seat or None), 'rounds', 'crashed'} per game
+        self.batched = 0         # Decisions scored in batches
+        self.batch_calls = 0     # decide_play_requests calls
+        self.elapsed = 0.0
+
+    def run(self, num_games, seed=None):
+        if seed is None:
+            seed = random.randrange(2**31)
+        start = time.time()
+        with redirect_stdout(io.StringIO()):
+            for first in range(0, num_games, self.batch_size):
+                games = [LockstepGame(seed + i, self.names, self.ai_types)
+                         for i in range(first, min(first + self.batch_size, num_games))]
+                self.play_batch(games)
+                for game in games:
+                    self._collect(game)
+        self.elapsed += time.time() - start
+        return self.results
+
+    def play_batch(self, games):
+        """Play a batch of games to the end, in lockstep"""
+        for game in games:
+            game.step(game.engine._setup_game)
+        while True:
+            live = [g for g in games if not g.done and g.engine._game_continues()]
+            for game in games:
+                if not game.done and game not in live:
+                    game.step(game.engine._finish_game)
+                    game.done = True
+            if not live:
+                return
+            for game in live:
+                game.step(game.engine._start_round)
+                game.in_round = not game.done
+            for clash in range(1, 5):
+                self._play_clash([g for g in live if g.in_round and not g.done], clash)
+            for game in live:
+                if not game.done and not game.engine.gs.game_over:
+                    game.step(game.engine._run_end_of_round)
+                if not game.done and not game.engine.gs.game_over:
+                    game.engine.gs.round_num += 1
+            for game in live:
+                game.in_round = False
+
+    def _play_clash(self, games, clash):
+        """GameEngine._run_clash for every game, with the prepare decisions of each seat scored as one batch"""
+        choices = [None] * len(games)
+        for seat in range(len(self.names)):
+            requests = [game.step(self._take_turn, game, clash, seat, choice, in_clash=True) if not game.done else None
+                        for game, choice in zip(games, choices)]
+            pending = [n for n, request in enumerate(requests) if request is not None]
+            choices = [None] * len(games)
+            for n, choice in zip(pending, self._decide([requests[n] for n in pending])):
+                choices[n] = choice
+        for game, choice in zip(games, choices):
+            if not game.done:
+                game.step(self._finish_clash, game, clash, choice, in_clash=True)
+
+    @staticmethod
+    def _take_turn(game, clash, seat, previous_choice):
+        """Play the previous seat's batched choice, then this seat's prepare turn
+
+        Returns the AI's PlayRequest if it wants its choice scored in the
+        batch; otherwise the turn is played here and None is returned.
+        """
+        engine = game.engine
+        order = engine._turn_order()
+        if seat == 0:
+            engine.gs.clash_num = clash
+            engine.gs.action_log.add('phase', clash=clash, phase='PREPARE')
+        elif previous_choice is not None:
+            engine._prepare_spell(order[seat - 1], previous_choice)
+        player = engine.gs.players[order[seat]]
+        if not player.is_human and not player.is_invulnerable and player.hand:
+            request = engine.ai_strategies.get(order[seat], engine.ai_player).play_request(player, engine.gs)
+            if request is not None:
+                return request
+        engine._prepare_spell(order[seat])
+        return None
+
+    @staticmethod
+    def _finish_clash(game, clash, last_choice):
+        """Play the last seat's batched choice, then cast, resolve and advance as _run_clash does"""
+        engine = game.engine
+        if last_choice is not None:
+            engine._prepare_spell(engine._turn_order()[-1], last_choice)
+        for phase in PHASES[:3 if clash < 4 else 2]:
+            if engine.gs.game_over:
+                return
+            getattr(engine, phase)()
+
+    def _decide(self, requests):
+        """Chosen hand index per request; each AI class scores all of its requests in one call"""
+        choices = [None] * len(requests)
+        by_class = {}
+        for n, request in enumerate(requests):
+            by_class.setdefault(type(request.ai), []).append(n)
+        for ai_class, numbers in by_class.items():
+            for n, choice in zip(numbers, ai_class.decide_play_requests([requests[n] for n in numbers])):
+                choices[n] = choice
+            self.batched += len(numbers)
+            self.batch_calls += 1
+        return choices
+
+    def _collect(self, game):
+        engine = game.engine
+        if engine.crash:
+            self.crash_corpus.record('lockstep_sim', game.seed, self.names, self.ai_types, engine.crash, engine.gs)
+        survivors = [i for i, p in enumerate(engine.gs.players) if p.trunks > 0]
+        self.results.append({'seed': game.seed, 'winner': survivors[0] if len(survivors) == 1 else None,
+                             'rounds': engine.gs.round_num, 'crashed': bool(engine.crash)})
+
+    def summary(self):
+        played = [r for r in self.results if not r['crashed']]
+        wins = Counter(r['winner'] for r in played)
+        lines = [f"{len(self.results)} games ({len(self.results) - len(played)} crashed) in {self.elapsed:.1f}s "
+                 f"= {len(self.results) / max(self.elapsed, 1e-9):.1f} games/s, batch size {self.batch_size}"]
+        for seat, name in enumerate(self.names):
+            lines.append(f"  {name:<16} {wins[seat]:>6} wins ({wins[seat] / max(len(played), 1):.1%})")
+        lines.append(f"  {'Draws':<16} {wins[None]:>6}")
+        if played:
+            lines.append(f"  Average length: {sum(r['rounds'] for r in played) / len(played):.2f} rounds")
+        if self.batch_calls:
+            lines.append(f"  {self.batched} prepare decisions scored in {self.batch_calls} batches "
+                         f"(mean {self.batched / self.batch_calls:.1f} per batch)")
+        else:
+            lines.append("  No batched decisions (neither AI scores in bulk; ValueAI needs value_model.json)")
+        return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Play AI-vs-AI games in lockstep batches')
+    parser.add_argument('games', type=int, nargs='?', default=1000)
+    parser.add_argument('--ai1', default='value', choices=list(AI_CLASSES))
+    parser.add_argument('--ai2', default='value', choices=list(AI_CLASSES))
+    parser.add_argument('--batch', type=int, default=DEFAULT_BATCH, help=f'Games played side by side (default {DEFAULT_BATCH})')
+    parser.add_argument('--seed', type=int, help='Base seed; game i is played on seed + i')
+    args = parser.parse_args()
+
+    simulator = LockstepSimulator(args.ai1, args.ai2, args.batch)
+    simulator.run(args.games, args.seed)
+    print(simulator.summary())
+    simulator.crash_corpus.report_summary()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Sharded, compressed archive of game logs.
+
+Game logs used to be one pretty-printed JSON file per game in game_logs/.
+The archive (game_logs/archive/) packs them into shard files instead. Each
+game is one gzip member holding a single compact JSON line, so a shard is an
+ordinary .jsonl.gz file (zcat works), and one game can be read by seeking to
+its member without decompressing the rest. Each shard has a sidecar index,
+shard_NNNNN.idx.jsonl, with one line per game: game id, timestamp, players,
+AI types, elements, winner, rounds, byte offset and length. Filters run on
+the indexes; only the games they select are decompressed.
+
+New games roll in automatically: GameLogger writes finished games through an
+ArchiveSink, which appends to the newest shard and starts the next one once
+it holds SHARD_GAMES games. Writers hold an exclusive lock on the archive,
+so threads and processes can share it.
+
+Usage:
+    python log_archive.py pack [--log-dir game_logs] [--keep]   # Move loose game_*.json files into shards
+    python log_archive.py list [--element E] [--ai TYPE] [--winner-ai TYPE] [--player NAME] [--limit N]
+    python log_archive.py show <game id>
+    python log_archive.py stats
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers within one process are still serialised
+    fcntl = None
+
+LOG_DIR = 'game_logs'
+ARCHIVE_SUBDIR = 'archive'
+SHARD_GAMES = 500       # Games per shard before the next one is started
+COMPRESS_LEVEL = 6
+SHARD_PATTERN = re.compile(r'^shard_(\d+)\.jsonl\.gz$')
+
+
+def ai_type_from_name(name):
+    """AI type in a player name such as EXPERT_AI_1 or AI_hard_2, or None"""
+    match = re.search(r'(easy|medium|hard|expert|value)', name or '', re.IGNORECASE)
+    return match.group(1).lower() if match else None
+
+
+def game_id_of(game, filename=None):
+    """A game's id; logs written before ids existed use their file name (game_<id>.json)"""
+    if game.get('game_id'):
+        return game['game_id']
+    return os.path.basename(filename)[len('game_'):-len('.json')] if filename else None
+
+
+def index_entry(game, shard, offset, length):
+    """The sidecar index line for a game stored at shard[offset:offset + length]"""
+    players = game.get('players', {})
+    names = [players.get(key, {}).get('name') for key in ('player1', 'player2')]
+    winner = game.get('winner', game.get('result', {}).get('winner'))
+    return {
+        'game_id': game['game_id'],
+        'timestamp': game.get('timestamp'),
+        'players': names,
+        'ai_types': [ai_type_from_name(name) if players.get(key, {}).get('is_ai', True) else None
+                     for name, key in zip(names, ('player1', 'player2'))],
+        'elements': [players.get(key, {}).get('elements', []) for key in ('player1', 'player2')],
+        'winner': winner,
+        'rounds': game.get('total_rounds', game.get('result', {}).get('total_rounds')),
+        'shard': shard,
+        'offset': offset,
+        'length': length,
+    }
+
+
+def _shard_name(number):
+    return f"shard_{number:05d}.jsonl.gz"
+
+
+def _index_name(shard):
+    return shard[:-len('.jsonl.gz')] + '.idx.jsonl'
+
+
+class ArchiveSink:
+    """GameLogger sink that appends each finished game to the newest shard of an archive"""
+
+    _thread_lock = threading.Lock()
+
+    def __init__(self, path=os.path.join(LOG_DIR, ARCHIVE_SUBDIR), shard_games=SHARD_GAMES):
+        self.path = path
+        self.shard_games = shard_games
+
+    @contextmanager
+    def _locked(self):
+        os.makedirs(self.path, exist_ok=True)
+        with self._thread_lock, open(os.path.join(self.path, '.lock'), 'w') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def _current_shard(self):
+        """Newest shard with room for another game, or the name of the next one"""
+        numbers = sorted(int(m.group(1)) for m in map(SHARD_PATTERN.match, os.listdir(self.path)) if m)
+        if not numbers:
+            return _shard_name(0)
+        shard = _shard_name(numbers[-1])
+        index_path = os.path.join(self.path, _index_name(shard))
+        if os.path.exists(index_path):
+            with open(index_path) as f:
+                if sum(1 for _ in f) >= self.shard_games:
+                    return _shard_name(numbers[-1] + 1)
+        return shard
+
+    def write(self, game):
+        """Append a game; returns '<shard path>#<game id>'"""
+        data = gzip.compress((json.dumps(game, separators=(',', ':')) + '\n').encode(),
+                             compresslevel=COMPRESS_LEVEL, mtime=0)
+        with self._locked():
+            shard = self._current_shard()
+            shard_path = os.path.join(self.path, shard)
+            with open(shard_path, 'ab') as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(data)
+            # The index line goes last: a game only exists once its index entry does
+            with open(os.path.join(self.path, _index_name(shard)), 'a') as f:
+                f.write(json.dumps(index_entry(game, shard, offset, len(data))) + '\n')
+        return f"{shard_path}#{game['game_id']}"
+
+
+class LogArchive:
+    """Reads an archive through its sidecar indexes"""
+
+    def __init__(self, path=os.path.join(LOG_DIR, ARCHIVE_SUBDIR)):
+        self.path = path
+
+    def entries(self):
+        """Index entries of every archived game, oldest shard first"""
+        if not os.path.isdir(self.path):
+            return []
+        entries = []
+        for filename in sorted(os.listdir(self.path)):
+            if filename.endswith('.idx.jsonl'):
+                with open(os.path.join(self.path, filename)) as f:
+                    for line in f:
+                        try:
+                            entries.append(json.loads(line))
+                        except ValueError:
+                            pass  # Torn line from an interrupted writer
+        return entries
+
+    def select(self, element=None, ai_type=None, winner_ai=None, player=None, since=None, until=None,
+               entries=None):
+        """Index entries matching every filter given
+
+        element / ai_type / player match either side; winner_ai is the AI type
+        of the winner; since/until compare ISO timestamps.
+        """
+        selected = []
+        for entry in self.entries() if entries is None else entries:
+            if element and not any(element in elements for elements in entry['elements']):
+                continue
+            if ai_type and ai_type not in entry['ai_types']:
+                continue
+            if player and player not in entry['players']:
+                continue
+            if winner_ai and (entry['winner'] not in entry['players']
+                              or entry['ai_types'][entry['players'].index(entry['winner'])] != winner_ai):
+                continue
+            if since and (entry['timestamp'] or '') < since:
+                continue
+            if until and (entry['timestamp'] or '') > until:
+                continue
+            selected.append(entry)
+        return selected
+
+    def read(self, entry, f=None):
+        """Decompress the one game an index entry points to"""
+        if f is None:
+            with open(os.path.join(self.path, entry['shard']), 'rb') as shard:
+                return self.read(entry, shard)
+        f.seek(entry['offset'])
+        return json.loads(gzip.decompress(f.read(entry['length'])))
+
+    def get(self, game_id):
+        """An archived game by id, or None"""
+        entry = next((e for e in self.entries() if e['game_id'] == game_id), None)
+        return self.read(entry) if entry else None
+
+    def iter_games(self, entries=None, **filters):
+        """Yield the games of the given entries (default: select(**filters)), one open file per shard"""
+        if entries is None:
+            entries = self.select(**filters)
+        by_shard = {}
+        for entry in entries:
+            by_shard.setdefault(entry['shard'], []).append(entry)
+        for shard, shard_entries in by_shard.items():
+            with open(os.path.join(self.path, shard), 'rb') as f:
+                for entry in sorted(shard_entries, key=lambda e: e['offset']):
+                    yield self.read(entry, f)
+
+    def pack(self, log_dir=LOG_DIR, keep=False, shard_games=SHARD_GAMES):
+        """Move loose game_*.json files from log_dir into the archive; returns (packed, skipped)"""
+        archived = {entry['game_id'] for entry in self.entries()}
+        sink = ArchiveSink(self.path, shard_games)
+        packed = skipped = 0
+        for filename in sorted(os.listdir(log_dir)):
+            if not (filename.startswith('game_') and filename.endswith('.json')):
+                continue
+            path = os.path.join(log_dir, filename)
+            try:
+                with open(path) as f:
+                    game = json.load(f)
+            except (OSError, ValueError):
+                skipped += 1
+                continue
+            game['game_id'] = game_id_of(game, filename)
+            if game['game_id'] not in archived:
+                sink.write(game)
+                archived.add(game['game_id'])
+                packed += 1
+            if not keep:
+                os.remove(path)
+        return packed, skipped
+
+
+def iter_logged_games(log_dir=LOG_DIR):
+    """Every logged game: loose game_*.json files in log_dir (unreadable ones skipped), then the archive's"""
+    if os.path.isdir(log_dir):
+        for filename in sorted(os.listdir(log_dir)):
+            if filename.endswith('.json'):
+                try:
+                    with open(os.path.join(log_dir, filename)) as f:
+                        game = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                game['game_id'] = game_id_of(game, filename)
+                yield game
+    yield from LogArchive(os.path.join(log_dir, ARCHIVE_SUBDIR)).iter_games()
+
+
+def count_logged_games(log_dir=LOG_DIR):
+    loose = sum(1 for f in os.listdir(log_dir) if f.endswith('.json')) if os.path.isdir(log_dir) else 0
+    return loose + len(LogArchive(os.path.join(log_dir, ARCHIVE_SUBDIR)).entries())
+
+
+def _format_entry(entry):
+    sides = [f"{name} ({ai or 'human'}: {'/'.join(elements)})"
+             for name, ai, elements in zip(entry['players'], entry['ai_types'], entry['elements'])]
+    return (f"{entry['game_id']:<34} {(entry['timestamp'] or '')[:19]:<20} {' vs '.join(sides)}"
+            f"  -> {entry['winner'] or 'draw'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pack and query the sharded game log archive')
+    parser.add_argument('--log-dir', default=LOG_DIR)
+    sub = parser.add_subparsers(dest='command', required=True)
+    pack_parser = sub.add_parser('pack', help='Move loose game_*.json logs into compressed shards')
+    pack_parser.add_argument('--keep', action='store_true', help='Leave the loose files in place')
+    pack_parser.add_argument('--shard-games', type=int, default=SHARD_GAMES)
+    list_parser = sub.add_parser('list', help='List archived games matching filters')
+    list_parser.add_argument('--element')
+    list_parser.add_argument('--ai', dest='ai_type')
+    list_parser.add_argument('--winner-ai')
+    list_parser.add_argument('--player')
+    list_parser.add_argument('--since', help='ISO timestamp, e.g. 2025-09-01')
+    list_parser.add_argument('--until')
+    list_parser.add_argument('--limit', type=int, default=50)
+    show_parser = sub.add_parser('show', help='Print one archived game as JSON')
+    show_parser.add_argument('game_id')
+    sub.add_parser('stats', help='Shards, games and compression of the archive')
+    args = parser.parse_args()
+
+    archive = LogArchive(os.path.join(args.log_dir, ARCHIVE_SUBDIR))
+    if args.command == 'pack':
+        packed, skipped = archive.pack(args.log_dir, args.keep, args.shard_games)
+        print(f"Packed {packed} game(s) into {archive.path}" + (f"; skipped {skipped} unreadable" if skipped else ""))
+    elif args.command == 'list':
+        selected = archive.select(args.element, args.ai_type, args.winner_ai, args.player, args.since, args.until)
+        for entry in selected[-args.limit:]:
+            print(_format_entry(entry))
+        print(f"{len(selected)} matching game(s)")
+    elif args.command == 'show':
+        game = archive.get(args.game_id)
+        if game is None:
+            print(f"No archived game {args.game_id}")
+            sys.exit(1)
+        print(json.dumps(game, indent=2))
+    else:
+        entries = archive.entries()
+        shards = Counter(entry['shard'] for entry in entries)
+        size = sum(os.path.getsize(os.path.join(archive.path, shard)) for shard in shards)
+        print(f"{archive.path}: {len(entries)} games in {len(shards)} shard(s), {size / 1e6:.1f} MB compressed")
+        by_ai = Counter(ai for entry in entries for ai in entry['ai_types'] if ai)
+        print("Player slots by AI type: " + ", ".join(f"{ai} {n}" for ai, n in by_ai.most_common()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Win-rate statistics for AI matchups.
+
+Provides Wilson score confidence intervals and a sequential (early-stopping)
+scheduler: each matchup stops as soon as its winner is clear or its win rate
+is known precisely enough, and the games it didn't need are spent on the
+matchups that are still close.
+
+A matchup is checked after every game, so the "decided" test spends its
+error rate over the looks: look k (counted from min_games) uses
+alpha * 6 / (pi^2 k^2), which sums to alpha over any number of looks. A
+matchup between equal AIs is therefore wrongly called decided at most
+1 - confidence of the time, however long it runs.
+
+PairedTracker scores seat-swapped mirror games: each seed is played twice
+with the same deck order and the AIs in swapped seats. The two games'
+results are combined into one paired difference, so seat and draft luck
+cancel out.
+"""
+
+import math
+from statistics import NormalDist
+
+
+GAME_FAILED = 'failed'  # Returned by a play_game callable for a crashed game; never counted as a result
+
+
+def z_score(confidence=0.95):
+    """Two-sided normal critical value for a confidence level (0.95 -> 1.96)"""
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def wilson_interval(wins, games, confidence=0.95):
+    """Wilson score interval for a win rate; returns (low, high), (0.0, 1.0) with no games"""
+    if games <= 0:
+        return 0.0, 1.0
+    z = z_score(confidence)
+    p = wins / games
+    denominator = 1 + z * z / games
+    centre = (p + z * z / (2 * games)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games)) / denominator
+    return max(0.0, centre - half_width), min(1.0, centre + half_width)
+
+
+class MatchupTracker:
+    """Running record of one matchup, updated after every game"""
+
+    GAMES_PER_RECORD = 1  # Games consumed by each record() call
+    MAX_FAILURES = 3  # Stop a matchup after this many failed (crashed) records
+
+    def __init__(self, ai1, ai2, confidence=0.95, target_half_width=0.05, min_games=10, max_games=None):
+        self.ai1 = ai1
+        self.ai2 = ai2
+        self.confidence = confidence
+        self.target_half_width = target_half_width  # Stop once the interval is this tight
+        self.min_games = min_games  # Never stop before this many games
+        self.max_games = max_games  # Hard cap for this matchup (None = only the shared budget)
+        self.wins = {ai1: 0, ai2: 0, 'draws': 0}
+        self.games = 0
+        self.failures = 0  # Records that failed; their games are skipped, not replayed
+        self.stop_reason = None
+
+    def record(self, winner):
+        """Record one game; winner is ai1, ai2, None for a draw or GAME_FAILED"""
+        if winner == GAME_FAILED:
+            self.record_failure()
+            return
+        self.wins[winner if winner is not None else 'draws'] += 1
+        self.games += 1
+
+    def record_failure(self):
+        """Count a failed record so the next one moves on to new games (and seeds)"""
+        self.failures += 1
+
+    @property
+    def next_game(self):
+        """Index of the next game to play, counting failed games"""
+        return self.games + self.failures * self.GAMES_PER_RECORD
+
+    @property
+    def win_rate(self):
+        """ai1's win rate (draws count as games not won)"""
+        return self.wins[self.ai1] / self.games if self.games else 0.0
+
+    def interval_at(self, confidence):
+        return wilson_interval(self.wins[self.ai1], self.games, confidence)
+
+    @property
+    def interval(self):
+        return self.interval_at(self.confidence)
+
+    @property
+    def decision_confidence(self):
+        """Confidence the 'decided' check needs at this look (see the module docstring)"""
+        look = max(1, self.games - self.min_games + 1)
+        return 1 - (1 - self.confidence) * 6 / (math.pi ** 2 * look ** 2)
+
+    @property
+    def half_width(self):
+        low, high = self.interval
+        return (high - low) / 2
+
+    def is_decided(self):
+        """True once the look-corrected interval excludes 50%, i.e. one AI is clearly stronger"""
+        low, high = self.interval_at(self.decision_confidence)
+        return low > 0.5 or high < 0.5
+
+    def is_done(self):
+        """Check the stopping rule; sets stop_reason when the matchup should stop"""
+        if self.stop_reason:
+            return True
+        if self.failures >= self.MAX_FAILURES:
+            self.stop_reason = 'failures'
+        elif self.max_games is not None and self.games >= self.max_games:
+            self.stop_reason = 'max games'
+        elif self.games >= self.min_games:
+            if self.is_decided():
+                self.stop_reason = 'decided'
+            elif self.half_width <= self.target_half_width:
+                self.stop_reason = 'precise'
+        return self.stop_reason is not None
+
+    def summary(self):
+        """One-line description, e.g. 'hard vs easy: 78.6% [63.2%, 88.7%] after 28 games (decided)'"""
+        low, high = self.interval
+        reason = f" ({self.stop_reason})" if self.stop_reason else ""
+        return (f"{self.ai1} vs {self.ai2}: {self.win_rate:.1%} [{low:.1%}, {high:.1%}] "
+                f"after {self.games} games{reason}")
+
+
+class PairedTracker(MatchupTracker):
+    """Record of seat-swapped game pairs played on common seeds
+
+    record() takes the winners of both games of a pair. Each pair gives ai1 a
+    paired difference d = (ai1 wins - ai2 wins) / 2 in {-1, -0.5, 0, 0.5, 1}.
+    ai1's win rate is (1 + mean d) / 2, and its interval uses the
+    paired-difference variance. Seat and deck luck affect both games of a
+    pair equally, so this interval is usually much tighter than one over the
+    same number of independent games.
+    """
+
+    GAMES_PER_RECORD = 2
+
+    def __init__(self, ai1, ai2, confidence=0.95, target_half_width=0.05, min_games=10, max_games=None):
+        super().__init__(ai1, ai2, confidence, target_half_width, min_games, max_games)
+        self.differences = []
+        self.sweeps = {ai1: 0, ai2: 0}  # Pairs where one AI won from both seats
+        self.splits = 0  # Pairs won once by each AI, i.e. decided by seat/deck
+
+    def record(self, winners):
+        """Record one pair; winners is (winner with ai1 seated first, winner with ai2 seated first)
+
+        A pair with a failed game is counted as one failure, so both seeds' games are skipped.
+        """
+        if GAME_FAILED in winners:
+            self.record_failure()
+            return
+        for winner in winners:
+            super().record(winner)
+        ai1_wins = sum(1 for w in winners if w == self.ai1)
+        ai2_wins = sum(1 for w in winners if w == self.ai2)
+        self.differences.append((ai1_wins - ai2_wins) / 2)
+        if ai1_wins == 2:
+            self.sweeps[self.ai1] += 1
+        elif ai2_wins == 2:
+            self.sweeps[self.ai2] += 1
+        elif ai1_wins == ai2_wins == 1:
+            self.splits += 1
+
+    @property
+    def pairs(self):
+        return len(self.differences)
+
+    @property
+    def mean_difference(self):
+        return sum(self.differences) / self.pairs if self.pairs else 0.0
+
+    @property
+    def win_rate(self):
+        return (1 + self.mean_difference) / 2
+
+    @property
+    def decision_confidence(self):
+        look = max(1, (self.games - self.min_games) // self.GAMES_PER_RECORD + 1)
+        return 1 - (1 - self.confidence) * 6 / (math.pi ** 2 * look ** 2)
+
+    def is_decided(self):
+        """Sign test on the sweeps: with equal AIs each sweep is a coin flip
+
+        The paired-difference interval is too narrow to test on with only a
+        few pairs, so the decision counts the pairs one AI won from both seats.
+        """
+        sweeps = self.sweeps[self.ai1] + self.sweeps[self.ai2]
+        low, high = wilson_interval(self.sweeps[self.ai1], sweeps, self.decision_confidence)
+        return low > 0.5 or high < 0.5
+
+    def interval_at(self, confidence):
+        """Normal-approximation interval on the paired differences, mapped to a win rate"""
+        n = self.pairs
+        if n < 2:
+            return 0.0, 1.0
+        mean = self.mean_difference
+        variance = sum((d - mean) ** 2 for d in self.differences) / (n - 1)
+        # A few pairs can all agree (zero variance); floor the spread at one split's worth
+        variance = max(variance, 0.25 / n)
+        half_width = z_score(confidence) * math.sqrt(variance / n)
+        return max(0.0, (1 + mean - half_width) / 2), min(1.0, (1 + mean + half_width) / 2)
+
+    def summary(self):
+        return (f"{super().summary()} | {self.pairs} pairs: {self.ai1} swept {self.sweeps[self.ai1]}, "
+                f"{self.ai2} swept {self.sweeps[self.ai2]}, split {self.splits}, "
+                f"mean diff {self.mean_difference:+.3f}")
+
+
+def run_sequential(trackers, play_game, total_budget, on_game=None):
+    """Play games one at a time across matchups until each stops or the budget runs out
+
+    Args:
+        trackers: MatchupTrackers to fill
+        play_game: Callable (tracker, game_index) -> whatever tracker.record() takes:
+            the winning ai type (None for a draw), or a pair of winners for a
+            PairedTracker. GAME_FAILED results and exceptions are counted as failed
+            games: they are not recorded, the next call gets the following game
+            index, and a matchup stops after MatchupTracker.MAX_FAILURES of them.
+        total_budget: Maximum number of games across all matchups
+        on_game: Optional callback (tracker) after each recorded game
+
+    Returns:
+        Number of games played (including failed ones)
+    """
+    played = 0
+    open_trackers = [t for t in trackers if not t.is_done()]
+    while open_trackers and played < total_budget:
+        # Round-robin over the open matchups; closed ones free their budget for the rest
+        for tracker in list(open_trackers):
+            if played >= total_budget:
+                break
+            played += tracker.GAMES_PER_RECORD
+            try:
+                winner = play_game(tracker, tracker.next_game)
+            except Exception as e:
+                print(f"  Error in {tracker.ai1} vs {tracker.ai2} game {tracker.next_game + 1}: {e}")
+                tracker.record_failure()
+            else:
+                failures = tracker.failures
+                tracker.record(winner)
+                if on_game and tracker.failures == failures:
+                    on_game(tracker)
+            if tracker.is_done():
+                open_trackers.remove(tracker)
+    for tracker in open_trackers:
+        tracker.stop_reason = 'budget'
+    return played
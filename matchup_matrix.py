@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Element-vs-element matchup matrix.
+
+Tournaments draft by AI preference, so some element pairings are almost
+never played. This generator forces the opening draft instead, following
+a stratified plan: each round gives every pair of elements one game on
+opposite teams, and each element's partner set rotates from round to round,
+so the two-set teams are spread evenly as well. Every game counts towards
+the four element-vs-element cells its two teams cover.
+
+The result is element_matchups.json: win rates with 95% Wilson intervals
+for every element against every other element, for each element overall
+and for each two-set team. The AIs read it (see BaseAI.get_matchup_win_rate)
+in place of the marginal rates in element_win_rates.json.
+
+Usage:
+    python matchup_matrix.py build [--rounds 6] [--ai1 expert] [--ai2 expert] [--workers N] [--seed S]
+    python matchup_matrix.py show [element]
+"""
+
+import argparse
+import io
+import itertools
+import json
+import os
+import random
+import sys
+import time
+import traceback
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from datetime import datetime
+
+from analytics import AI_CLASSES, create_engine
+from crash_corpus import CrashCorpus
+from elephants_prototype import SPELL_DATA
+from game_logger import NullGameLogger
+from match_stats import wilson_interval
+
+MATRIX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'element_matchups.json')
+ELEMENTS = sorted({spell['element'] for spell in SPELL_DATA})
+CHUNK_SIZE = 20
+
+
+def stratified_plan(rounds, seed):
+    """[(seed, team A, team B)]: every element pair meets once per round, with rotating partners"""
+    rng = random.Random(seed)
+    partners = {}  # (element, opponent element) -> the other 17 elements in a fixed shuffled order
+    for i, j in itertools.permutations(ELEMENTS, 2):
+        others = [e for e in ELEMENTS if e not in (i, j)]
+        rng.shuffle(others)
+        partners[(i, j)] = others
+    plan = []
+    game_seed = seed
+    for r in range(rounds):
+        cells = list(itertools.combinations(ELEMENTS, 2))
+        rng.shuffle(cells)
+        for i, j in cells:
+            if r % 2:
+                i, j = j, i  # Alternate which side of the cell sits first
+            p = partners[(i, j)][r % len(partners[(i, j)])]
+            q_options = partners[(j, i)]
+            q = next(q_options[(r + k) % len(q_options)] for k in range(len(q_options))
+                     if q_options[(r + k) % len(q_options)] != p)
+            plan.append((game_seed, (i, p), (j, q)))
+            game_seed += 1
+    return plan
+
+
+def _player_names(ai1, ai2):
+    if ai1 == ai2:
+        return [f"{ai1.upper()}_AI_1", f"{ai2.upper()}_AI_2"]
+    return [f"{ai1.upper()}_AI", f"{ai2.upper()}_AI"]
+
+
+def _force_opening(ai, team):
+    """Make an AI draft the sets of the given elements at setup; later redrafts are its own"""
+    choose_draft_set = ai.choose_draft_set
+    remaining = list(team)
+
+    def forced_opening(player, gs, available_sets):
+        if remaining:
+            element = remaining.pop(0)
+            return next(s for s in available_sets if s and s[0].element == element)
+        return choose_draft_set(player, gs, available_sets)
+
+    ai.choose_draft_set = forced_opening
+
+
+def _play(seed, seats, team_a, team_b):
+    random.seed(seed)
+    engine = create_engine(_player_names(*seats), *seats, logger=NullGameLogger())
+    for seat, team in enumerate((team_a, team_b)):
+        _force_opening(engine.ai_strategies[seat], team)
+    with redirect_stdout(io.StringIO()):
+        engine.run_game()
+    return engine
+
+
+def play_chunk(ai1, ai2, assignments):
+    """Pool task: play (seed, team A, team B) assignments; returns [(team A, team B, winner)]
+
+    Team A is seat 0; winner is 0, 1 or None for a draw.
+    """
+    results = []
+    for seed, team_a, team_b in assignments:
+        seats = [ai1, ai2] if seed % 2 == 0 else [ai2, ai1]
+        engine = None
+        try:
+            engine = _play(seed, seats, team_a, team_b)
+            crash = engine.crash
+        except Exception:
+            crash = traceback.format_exc()
+        if crash:
+            CrashCorpus().record('matchup_matrix', seed, _player_names(*seats), seats, crash,
+                                 engine.gs if engine else None, extra={'teams': [team_a, team_b]})
+            continue
+        survivors = [i for i, p in enumerate(engine.gs.players) if p.trunks > 0]
+        results.append((team_a, team_b, survivors[0] if len(survivors) == 1 else None))
+    return results
+
+
+def replay_crash(record):
+    """Re-run a crash recorded while building the matrix"""
+    team_a, team_b = record['teams']
+    return _play(record['seed'], record['ai_types'], team_a, team_b).crash
+
+
+def _rate(wins, games):
+    low, high = wilson_interval(wins, games)
+    return {'wins': wins, 'games': games, 'rate': wins / games if games else None, 'low': low, 'high': high}
+
+
+class MatchupMatrix:
+    """Stratified forced-draft games aggregated into element, team and cell win rates"""
+
+    def __init__(self, rounds=6, ai1='expert', ai2='expert', workers=None, seed=None):
+        self.rounds = rounds
+        self.ai1 = ai1
+        self.ai2 = ai2
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed if seed is not None else random.randrange(2**31)
+        self.cells = defaultdict(lambda: [0.0, 0])  # (element, enemy element) -> [wins, games]
+        self.elements = defaultdict(lambda: [0.0, 0])
+        self.teams = defaultdict(lambda: [0.0, 0])
+        self.games = 0
+
+    def add(self, team_a, team_b, winner):
+        self.games += 1
+        for team, enemy, score in ((team_a, team_b, {0: 1.0, 1: 0.0}.get(winner, 0.5)),
+                                   (team_b, team_a, {0: 0.0, 1: 1.0}.get(winner, 0.5))):
+            counters = ([self.teams[','.join(sorted(team))]] + [self.elements[e] for e in team]
+                        + [self.cells[(e, f)] for e in team for f in enemy])
+            for stats in counters:
+                stats[0] += score
+                stats[1] += 1
+
+    def run(self):
+        plan = stratified_plan(self.rounds, self.seed)
+        chunks = [plan[i:i + CHUNK_SIZE] for i in range(0, len(plan), CHUNK_SIZE)]
+        print(f"Matchup matrix: {len(plan)} games ({self.rounds} per element pair, {self.ai1} vs {self.ai2}), "
+              f"{self.workers} worker(s)")
+        start = time.time()
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(play_chunk, self.ai1, self.ai2, chunk) for chunk in chunks]
+            for done, future in enumerate(futures, 1):
+                for result in future.result():
+                    self.add(*result)
+                if done % 10 == 0 or done == len(chunks):
+                    print(f"  {done}/{len(chunks)} chunks [{time.time() - start:.1f}s]")
+        if self.games < len(plan):
+            print(f"{len(plan) - self.games} game(s) crashed (see python crash_corpus.py)")
+
+    def to_dict(self):
+        return {
+            'built': datetime.now().isoformat(timespec='seconds'),
+            'ai_types': [self.ai1, self.ai2], 'rounds': self.rounds, 'seed': self.seed, 'games': self.games,
+            'elements': {e: _rate(*self.elements[e]) for e in ELEMENTS},
+            'matrix': {e: {f: _rate(*self.cells[(e, f)]) for f in ELEMENTS if f != e} for e in ELEMENTS},
+            'teams': {team: _rate(*stats) for team, stats in sorted(self.teams.items())},
+        }
+
+    def save(self, path=MATRIX_PATH):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+
+def format_matrix(data):
+    """Row element's win rate (%) against each column element"""
+    abbrev = {e: e[:3] for e in ELEMENTS}
+    lines = [f"ELEMENT MATCHUPS: row win % vs column ({data['games']} games, {' vs '.join(data['ai_types'])})",
+             f"{'':<10}" + "".join(f"{abbrev[e]:>4}" for e in ELEMENTS) + "   all"]
+    for e in ELEMENTS:
+        row = data['matrix'][e]
+        cells = "".join("   -" if f == e else f"{row[f]['rate'] * 100:>4.0f}" if row[f]['games'] else "   ?"
+                        for f in ELEMENTS)
+        overall = data['elements'][e]
+        lines.append(f"{e:<10}{cells}  " + (f"{overall['rate'] * 100:>4.0f}" if overall['games'] else "   ?"))
+    least = min(cell['games'] for row in data['matrix'].values() for cell in row.values())
+    lines.append(f"Every cell has at least {least} games")
+    return "\n".join(lines)
+
+
+def format_element(data, element):
+    row = data['matrix'][element]
+    overall = data['elements'][element]
+    if not overall['games']:
+        return f"{element}: no games yet"
+    lines = [f"{element}: {overall['rate']:.1%} overall [{overall['low']:.1%}, {overall['high']:.1%}] "
+             f"over {overall['games']} games"]
+    for enemy, cell in sorted(row.items(), key=lambda item: -(item[1]['rate'] or 0)):
+        if not cell['games']:
+            lines.append(f"  vs {enemy:<10} {'?':>6}  no games")
+            continue
+        lines.append(f"  vs {enemy:<10} {cell['rate']:>6.1%}  [{cell['low']:.1%}, {cell['high']:.1%}]  "
+                     f"{cell['games']:>4} games")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or inspect the element matchup matrix')
+    sub = parser.add_subparsers(dest='command', required=True)
+    build_parser = sub.add_parser('build', help='Play stratified forced-draft games and write element_matchups.json')
+    build_parser.add_argument('--rounds', type=int, default=6, help='Games per element pair (default 6)')
+    build_parser.add_argument('--ai1', default='expert', choices=list(AI_CLASSES))
+    build_parser.add_argument('--ai2', default='expert', choices=list(AI_CLASSES))
+    build_parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    build_parser.add_argument('--seed', type=int)
+    show_parser = sub.add_parser('show', help='Print the matrix, or one element with intervals')
+    show_parser.add_argument('element', nargs='?')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        matrix = MatchupMatrix(args.rounds, args.ai1, args.ai2, args.workers, args.seed)
+        matrix.run()
+        data = matrix.to_dict()
+        print(format_matrix(data))
+        print(f"\nSaved to {matrix.save()}")
+        return
+    if not os.path.exists(MATRIX_PATH):
+        print(f"No matchup matrix at {MATRIX_PATH}; run: python matchup_matrix.py build")
+        sys.exit(1)
+    with open(MATRIX_PATH) as f:
+        data = json.load(f)
+    if args.element and args.element not in data['matrix']:
+        print(f"Unknown element {args.element}; choose from {', '.join(ELEMENTS)}")
+        sys.exit(1)
+    print(format_element(data, args.element) if args.element else format_matrix(data))
+
+
+if __name__ == "__main__":
+    main()
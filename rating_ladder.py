@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Persistent rating ladder for AI versions and elements.
+
+Every completed game is ingested once into a local SQLite database
+(ratings.db) and updates the ratings it involves in place: nothing is ever
+recomputed from scratch. Each rating carries both an Elo score and a
+TrueSkill (mu, sigma) estimate; ladders are ranked by the conservative
+TrueSkill score mu - 3*sigma.
+
+Two kinds of rating are kept:
+    ai       - one per (AI type, version), e.g. expert / w-1a2b3c4d+5e6f7a8b
+    element  - one per element; a player's drafted elements play as a team
+
+An AI's version is its parameter version (weights or model) plus a hash of
+the code that plays the game (the ai package, the engine and spells.json),
+so a re-run after a code change is rated as a new version rather than
+skipped as a game already ingested.
+
+analytics.py and ai_tournament.py only add their games when run with
+--ladder; the database is ratings.db in the current directory by default.
+
+Usage:
+    python rating_ladder.py                  # AI ladder
+    python rating_ladder.py elements         # Element ladder
+    python rating_ladder.py ai expert        # All versions of one AI type
+    python rating_ladder.py import-logs [dir]   # Backfill from game_logs/ and its archive (skips games already ingested)
+    python rating_ladder.py --db path/to/ratings.db ...
+"""
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import sys
+from datetime import datetime
+from statistics import NormalDist
+
+from log_archive import ai_type_from_name, iter_logged_games
+
+DEFAULT_DB = 'ratings.db'
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CODE_FILES = ['elephants_prototype.py', 'spells.json']  # Plus every module of the ai package
+
+# TrueSkill defaults
+MU = 25.0
+SIGMA = MU / 3
+BETA = MU / 6  # Performance noise
+TAU = MU / 300  # Skill drift added before each game
+ELO_START = 1500.0
+ELO_K = 24
+
+_NORMAL = NormalDist()
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ratings (
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    version TEXT NOT NULL DEFAULT '',
+    mu REAL NOT NULL,
+    sigma REAL NOT NULL,
+    elo REAL NOT NULL,
+    games INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    draws INTEGER NOT NULL DEFAULT 0,
+    updated TEXT,
+    PRIMARY KEY (kind, name, version)
+);
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    game_key TEXT UNIQUE NOT NULL,
+    played_at TEXT,
+    source TEXT,
+    seed INTEGER,
+    ai1 TEXT, version1 TEXT, elements1 TEXT,
+    ai2 TEXT, version2 TEXT, elements2 TEXT,
+    winner INTEGER
+);
+"""
+
+
+_code_version = None
+
+
+def code_version():
+    """Short hash of the source that decides how AIs play (computed once per process)"""
+    global _code_version
+    if _code_version is None:
+        ai_dir = os.path.join(ROOT, 'ai')
+        paths = [os.path.join(ROOT, name) for name in CODE_FILES]
+        paths += sorted(os.path.join(ai_dir, name) for name in os.listdir(ai_dir) if name.endswith('.py'))
+        digest = hashlib.sha1()
+        for path in paths:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        _code_version = digest.hexdigest()[:8]
+    return _code_version
+
+
+def ai_version(ai):
+    """Version of an AI instance: its model's version, 'default' or a hash of its weights, plus code_version()"""
+    weights = getattr(ai, 'weights', None)
+    if getattr(ai, 'model_version', None):
+        params = ai.model_version
+    elif not weights or weights == getattr(ai, 'DEFAULT_WEIGHTS', None):
+        params = 'default'
+    else:
+        params = f"w-{hashlib.sha1(json.dumps(weights, sort_keys=True).encode()).hexdigest()[:8]}"
+    return f"{params}+{code_version()}"
+
+
+def player_elements(player):
+    """Elements a player drafted, from every card they own at the end of the game"""
+    cards = player.hand + player.discard_pile + [pc.card for clash in player.board for pc in clash]
+    return sorted({card.element for card in cards})
+
+
+def _trueskill_update(winner_team, loser_team):
+    """Two-team TrueSkill win update; teams are lists of (mu, sigma); returns the new lists
+
+    A team performs at the average of its members, so teams of different
+    sizes (e.g. two vs three drafted elements) compare fairly.
+    """
+    teams = [[(mu, math.sqrt(sigma ** 2 + TAU ** 2)) for mu, sigma in team] for team in (winner_team, loser_team)]
+    c = math.sqrt(2 * BETA ** 2 + sum(s ** 2 / len(team) ** 2 for team in teams for _, s in team))
+    t = (sum(m for m, _ in teams[0]) / len(teams[0]) - sum(m for m, _ in teams[1]) / len(teams[1])) / c
+    v = _NORMAL.pdf(t) / max(_NORMAL.cdf(t), 1e-12)
+    w = v * (v + t)
+
+    def update(team, sign):
+        a = 1 / len(team)  # Member's share of the team performance
+        return [(mu + sign * a * sigma ** 2 / c * v,
+                 sigma * math.sqrt(max(1 - a * a * sigma ** 2 / c ** 2 * w, 1e-6))) for mu, sigma in team]
+    return update(teams[0], 1), update(teams[1], -1)
+
+
+def _elo_update(elo_a, elo_b, score_a):
+    """New (elo_a, elo_b) after a game where a scored score_a (1 win, 0.5 draw, 0 loss)"""
+    expected_a = 1 / (1 + 10 ** ((elo_b - elo_a) / 400))
+    delta = ELO_K * (score_a - expected_a)
+    return elo_a + delta, elo_b - delta
+
+
+class RatingLadder:
+    """Incrementally updated ratings backed by SQLite"""
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = path
+        # A generous timeout lets parallel runners share the file
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _get(self, kind, name, version=''):
+        row = self.conn.execute("SELECT mu, sigma, elo FROM ratings WHERE kind=? AND name=? AND version=?",
+                                (kind, name, version)).fetchone()
+        return (row['mu'], row['sigma'], row['elo']) if row else (MU, SIGMA, ELO_START)
+
+    def _put(self, kind, name, version, mu, sigma, elo, result):
+        """Store a rating; result is 1 win, 0.5 draw, 0 loss"""
+        self.conn.execute(
+            """INSERT INTO ratings (kind, name, version, mu, sigma, elo, games, wins, draws, updated)
+               VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?, ?)
+               ON CONFLICT (kind, name, version) DO UPDATE SET
+                   mu=excluded.mu, sigma=excluded.sigma, elo=excluded.elo, games=games + 1,
+                   wins=wins + excluded.wins, draws=draws + excluded.draws, updated=excluded.updated""",
+            (kind, name, version, mu, sigma, elo, int(result == 1), int(result == 0.5),
+             datetime.now().isoformat(timespec='seconds')))
+
+    def _rate_teams(self, kind, teams, winner):
+        """Update two teams of (name, version) entries; winner is 0, 1 or None for a draw"""
+        # An entry on both sides (a mirror match, a shared element) plays itself and learns nothing
+        common = set(teams[0]) & set(teams[1])
+        teams = [[entry for entry in team if entry not in common] for team in teams]
+        if not teams[0] or not teams[1]:
+            return
+        current = [[self._get(kind, name, version) for name, version in team] for team in teams]
+        if winner is None:
+            # Draws move Elo only; the TrueSkill win update has no draw margin
+            new_ts = [[(mu, sigma) for mu, sigma, _ in team] for team in current]
+            scores = [0.5, 0.5]
+        else:
+            loser = 1 - winner
+            new_ts = [None, None]
+            new_ts[winner], new_ts[loser] = _trueskill_update([(mu, s) for mu, s, _ in current[winner]],
+                                                              [(mu, s) for mu, s, _ in current[loser]])
+            scores = [1.0 if winner == 0 else 0.0, 1.0 if winner == 1 else 0.0]
+        # Team Elo: every member moves by the team-average update
+        elo_avg = [sum(e for _, _, e in team) / len(team) for team in current]
+        new_avg = _elo_update(elo_avg[0], elo_avg[1], scores[0])
+        for side in (0, 1):
+            shift = new_avg[side] - elo_avg[side]
+            for (name, version), (mu, sigma), (_, _, elo) in zip(teams[side], new_ts[side], current[side]):
+                self._put(kind, name, version, mu, sigma, elo + shift, scores[side])
+
+    def record_game(self, game_key, ai_types, versions, elements, winner, source='', seed=None):
+        """Ingest one game; returns False (and changes nothing) if game_key was already ingested
+
+        Args:
+            game_key: Unique id of the game, e.g. 'ai_tournament:<seed>:<seats>' or a log filename
+            ai_types: AI type per seat
+            versions: Parameter version per seat (see ai_version)
+            elements: List of drafted elements per seat
+            winner: Winning seat index, or None for a draw
+        """
+        with self.conn:  # One transaction: the game row and all rating updates, or nothing
+            cursor = self.conn.execute(
+                """INSERT OR IGNORE INTO games (game_key, played_at, source, seed, ai1, version1, elements1,
+                                                ai2, version2, elements2, winner)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (game_key, datetime.now().isoformat(timespec='seconds'), source, seed,
+                 ai_types[0], versions[0], json.dumps(elements[0]),
+                 ai_types[1], versions[1], json.dumps(elements[1]), winner))
+            if cursor.rowcount == 0:
+                return False
+            self._rate_teams('ai', [[(ai_types[0], versions[0])], [(ai_types[1], versions[1])]], winner)
+            if elements[0] and elements[1]:
+                self._rate_teams('element', [[(e, '') for e in elements[0]], [(e, '') for e in elements[1]]],
+                                 winner)
+        return True
+
+    def record_engine(self, engine, ai_types, source='', seed=None, game_key=None):
+        """Ingest a finished engine's game; versions and elements are read from the engine"""
+        players = engine.gs.players
+        alive = [i for i, p in enumerate(players) if p.trunks > 0]
+        winner = alive[0] if len(alive) == 1 else None
+        versions = [ai_version(engine.ai_strategies.get(i)) for i in range(len(players))]
+        if game_key is None:
+            # Seeded games are identified by their seed and seating; others just get a fresh key
+            game_key = (f"{source}:{seed}:{'-'.join(ai_types)}:{'-'.join(versions)}" if seed is not None
+                        else f"{source}:{datetime.now().isoformat()}:{id(engine)}")
+        return self.record_game(game_key, ai_types, versions, [player_elements(p) for p in players],
+                                winner, source, seed)
+
+    def ladder(self, kind='ai', name=None, min_games=1):
+        """Ratings of one kind, best first (optionally all versions of one name)"""
+        query = "SELECT * FROM ratings WHERE kind=? AND games>=?"
+        params = [kind, min_games]
+        if name:
+            query += " AND name=?"
+            params.append(name)
+        rows = [dict(row) for row in self.conn.execute(query, params)]
+        for row in rows:
+            row['conservative'] = row['mu'] - 3 * row['sigma']
+        return sorted(rows, key=lambda row: -row['conservative'])
+
+    def game_count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    def import_logs(self, log_dir='game_logs'):
+        """Backfill from saved game logs; AI types come from player names, versions are 'legacy'"""
+        added = skipped = 0
+        for game in iter_logged_games(log_dir):
+            names = list(game.get('player_elements', {}))
+            ai_types = [ai_type_from_name(name) for name in names]
+            if len(names) != 2 or None in ai_types or 'winner' not in game:
+                skipped += 1  # Human games, unfinished games and unknown player names
+                continue
+            winner = names.index(game['winner']) if game['winner'] in names else None
+            if self.record_game(f"log:game_{game['game_id']}.json", ai_types, ['legacy', 'legacy'],
+                                [game['player_elements'][n] for n in names], winner, 'game_logs'):
+                added += 1
+        return added, skipped
+
+
+def format_ladder(rows, title):
+    lines = [title, f"{'#':>3} {'name':<14} {'version':<21} {'rating':>7} {'mu':>6} {'sigma':>6} "
+                    f"{'elo':>6} {'games':>6} {'win%':>6}"]
+    for rank, row in enumerate(rows, 1):
+        lines.append(f"{rank:>3} {row['name']:<14} {row['version'] or '-':<21} {row['conservative']:>7.2f} "
+                     f"{row['mu']:>6.2f} {row['sigma']:>6.2f} {row['elo']:>6.0f} {row['games']:>6} "
+                     f"{row['wins'] / row['games']:>6.1%}")
+    return "\n".join(lines)
+
+
+def main():
+    args = sys.argv[1:]
+    db = DEFAULT_DB
+    if '--db' in args:
+        flag_index = args.index('--db')
+        db = args[flag_index + 1]
+        del args[flag_index:flag_index + 2]
+    with RatingLadder(db) as ladder:
+        if args and args[0] == 'import-logs':
+            log_dir = args[1] if len(args) > 1 else 'game_logs'
+            added, skipped = ladder.import_logs(log_dir)
+            print(f"Imported {added} games from {log_dir}/ ({skipped} skipped); {ladder.game_count()} games rated")
+        elif args and args[0] == 'elements':
+            print(format_ladder(ladder.ladder('element'), "ELEMENT LADDER"))
+        elif not args or args[0] == 'ai':
+            name = args[1] if len(args) > 1 else None
+            print(format_ladder(ladder.ladder('ai', name), f"AI LADDER ({ladder.game_count()} games)"))
+        else:
+            print(f"Usage: {sys.argv[0]} [--db DB] [ai [type] | elements | import-logs [dir]]")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ import json
 import sys
 from collections import defaultdict
 
+from spell_properties import load_spell_properties
+
 def analyze_response_interactions():
     """Analyze which spells trigger which responses"""
     
@@ -19,21 +21,9 @@ def analyze_response_interactions():
         print("No game logs found. Run analytics first.")
         return
     
-    # Load spell data to identify response spells
-    response_spells = set()
-    spell_types = {}
-    try:
-        with open('spells.json', 'r') as f:
-            spell_data = json.load(f)
-            for spell in spell_data:
-                spell_name = spell.get('card_name')
-                types = spell.get('spell_types', [])
-                spell_types[spell_name] = types
-                if 'response' in types:
-                    response_spells.add(spell_name)
-    except:
-        print("Could not load spell data")
-        return
+    # Spell types come from the derived spell properties
+    spell_types = {name: props['types'] for name, props in load_spell_properties().items()}
+    response_spells = {name for name, types in spell_types.items() if 'response' in types}
     
     # Track interactions
     spell_play_counts = defaultdict(int)
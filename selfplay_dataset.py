@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Self-play dataset generator.
+
+Plays headless AI-vs-AI games on a process pool and records every real
+decision an AI makes (which card to prepare, which spell set to draft)
+as one row: the decider's view of the state as a feature vector, the
+legal options, the option chosen and the game's eventual outcome for
+the decider. Rows are written to fixed-size shards in numpy's .npz
+format (numpy.load() reads them; load_shard() reads them without numpy)
+plus a manifest.json describing the columns and features.
+
+Every game is seeded (seed + game index), so a run can be resumed after
+an interruption: games whose rows did not reach a shard are simply
+played again.
+
+Usage:
+    python selfplay_dataset.py --games 1000 [--ai1 expert] [--ai2 expert]
+                               [--shard-size 50000] [--workers N] [--seed S] [--out DIR]
+    python selfplay_dataset.py --resume datasets/<run> [--games N]   # Continue (or extend) a run
+    python selfplay_dataset.py --info datasets/<run>                 # Summarise a run
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import time
+import traceback
+import zipfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from datetime import datetime
+
+from ai.features import FEATURE_NAMES, MAX_OPTIONS, encode_state, set_code
+from analytics import AI_CLASSES, create_engine
+from crash_corpus import CrashCorpus
+from game_logger import NullGameLogger
+from rating_ladder import ai_version
+
+FORMAT_VERSION = 1
+KINDS = ['play', 'draft']
+KIND_PLAY, KIND_DRAFT = range(len(KINDS))
+
+# name: (array typecode, npy dtype, columns per row or None for a vector)
+COLUMNS = {
+    'features': ('f', '<f4', len(FEATURE_NAMES)),
+    'options': ('h', '<i2', MAX_OPTIONS),
+    'chosen': ('h', '<i2', None),
+    'kind': ('b', '|i1', None),
+    'outcome': ('b', '|i1', None),
+    'ai': ('b', '|i1', None),
+    'game': ('i', '<i4', None),
+}
+
+
+def _instrument(ai, seat, rows):
+    """Wrap an AI instance's decision methods so each real choice is appended to rows"""
+    choose_card_to_play = ai.choose_card_to_play
+    choose_draft_set = ai.choose_draft_set
+
+    def recorded_choose_card_to_play(player, gs):
+        valid = ai._get_valid_card_indices(player, gs)
+        features = encode_state(gs, player) if len(valid) > 1 else None
+        index = choose_card_to_play(player, gs)
+        if features is not None and index in valid:  # Forced moves carry no signal
+            rows.append((KIND_PLAY, seat, features, [player.hand[i].id for i in valid], valid.index(index)))
+        return index
+
+    def recorded_choose_draft_set(player, gs, available_sets):
+        offered = [s for s in available_sets if s]
+        features = encode_state(gs, player) if len(offered) > 1 else None
+        drafted = choose_draft_set(player, gs, available_sets)
+        chosen = next((i for i, s in enumerate(offered) if s is drafted), None)
+        if features is not None and chosen is not None:
+            rows.append((KIND_DRAFT, seat, features, [set_code(s) for s in offered], chosen))
+        return drafted
+
+    ai.choose_card_to_play = recorded_choose_card_to_play
+    ai.choose_draft_set = recorded_choose_draft_set
+
+
+# --- games ---
+
+def _seating(game, ai1, ai2):
+    # Alternate seats so neither AI always sits first
+    seats = [ai1, ai2] if game % 2 == 0 else [ai2, ai1]
+    if seats[0] == seats[1]:
+        return seats, [f"{seats[0].upper()}_AI_1", f"{seats[1].upper()}_AI_2"]
+    return seats, [f"{seats[0].upper()}_AI", f"{seats[1].upper()}_AI"]
+
+
+def play_game(game, seed, ai1, ai2):
+    """Pool task: play one seeded game; returns (game, rows, crashed)
+
+    Each row is (kind, ai, features, options, chosen, outcome), with ai an
+    index into [ai1, ai2] and outcome +1/0/-1 for the deciding AI.
+    """
+    seats, names = _seating(game, ai1, ai2)
+    random.seed(seed)
+    engine = None
+    rows = []
+    try:
+        engine = create_engine(names, *seats, logger=NullGameLogger())
+        for seat, ai in engine.ai_strategies.items():
+            _instrument(ai, seat, rows)
+        with redirect_stdout(io.StringIO()):
+            engine.run_game()
+        crash = engine.crash
+    except Exception:
+        crash = traceback.format_exc()
+    if crash:
+        CrashCorpus().record('selfplay_dataset', seed, names, seats, crash, engine.gs if engine else None,
+                             extra={'game': game})
+        return game, [], True
+    survivors = [i for i, p in enumerate(engine.gs.players) if p.trunks > 0]
+    winner = survivors[0] if len(survivors) == 1 else None
+    ai_index = [[ai1, ai2].index(ai_type) for ai_type in seats]
+    return game, [(kind, ai_index[seat], features, options, chosen,
+                   0 if winner is None else (1 if seat == winner else -1))
+                  for kind, seat, features, options, chosen in rows], False
+
+
+def replay_crash(record):
+    """Re-run a crash recorded while generating a dataset"""
+    random.seed(record['seed'])
+    engine = create_engine(record['player_names'], *record['ai_types'], logger=NullGameLogger())
+    with redirect_stdout(io.StringIO()):
+        engine.run_game()
+    return engine.crash
+
+
+# --- shard files ---
+
+def _npy(typecode, dtype, shape, values):
+    """Serialise an array.array as a .npy file (format 1.0, C order, little-endian)"""
+    data = array(typecode, values)
+    if sys.byteorder == 'big':
+        data.byteswap()
+    header = f"{{'descr': '{dtype}', 'fortran_order': False, 'shape': {shape}, }}"
+    header += ' ' * (63 - (10 + len(header)) % 64) + '\n'  # Pad so the data starts 64-byte aligned
+    return b'\x93NUMPY\x01\x00' + len(header).to_bytes(2, 'little') + header.encode('latin1') + data.tobytes()
+
+
+def write_shard(path, rows):
+    """Write rows as a compressed .npz (one .npy member per column), atomically"""
+    n = len(rows)
+    columns = {
+        'features': [v for row in rows for v in row[3]],
+        'options': [v for row in rows for v in row[4] + [-1] * (MAX_OPTIONS - len(row[4]))],
+        'chosen': [row[5] for row in rows],
+        'kind': [row[2] for row in rows],
+        'outcome': [row[7] for row in rows],
+        'ai': [row[6] for row in rows],
+        'game': [row[0] for row in rows],
+    }
+    with zipfile.ZipFile(path + '.tmp', 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, (typecode, dtype, width) in COLUMNS.items():
+            shape = (n, width) if width else (n,)
+            zf.writestr(f"{name}.npy", _npy(typecode, dtype, shape, columns[name]))
+    os.replace(path + '.tmp', path)
+
+
+def load_shard(path):
+    """Read a shard without numpy: {column: (shape, array.array)}"""
+    result = {}
+    with zipfile.ZipFile(path) as zf:
+        for name, (typecode, _, width) in COLUMNS.items():
+            raw = zf.read(f"{name}.npy")
+            header_len = int.from_bytes(raw[8:10], 'little')
+            data = array(typecode)
+            data.frombytes(raw[10 + header_len:])
+            if sys.byteorder == 'big':
+                data.byteswap()
+            rows = len(data) // width if width else len(data)
+            result[name] = ((rows, width) if width else (rows,), data)
+    return result
+
+
+# --- generator ---
+
+class SelfPlayDataset:
+    """Resumable, sharded self-play dataset in a run directory"""
+
+    def __init__(self, out_dir=None, games=1000, ai1='expert', ai2='expert', shard_size=50000,
+                 workers=None, seed=None):
+        self.out_dir = out_dir or os.path.join('datasets', datetime.now().strftime('selfplay_%Y%m%d_%H%M%S'))
+        self.games = games
+        self.ai1 = ai1
+        self.ai2 = ai2
+        self.shard_size = shard_size
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed if seed is not None else random.randrange(2**31)
+        self.shards = []
+        self.crashed = []  # Game indices that crashed (they contribute no rows)
+        self.position = (0, 0)  # (game, rows of that game already in shards)
+        self.ai_versions = {ai: ai_version(AI_CLASSES[ai]()) for ai in (ai1, ai2)}
+
+    @property
+    def rows(self):
+        return sum(shard['rows'] for shard in self.shards)
+
+    def run(self):
+        """Play games from the current position until self.games are covered, writing shards as they fill"""
+        os.makedirs(self.out_dir, exist_ok=True)
+        self.save_manifest()
+        game, skip = self.position
+        print(f"Generating {self.ai1} vs {self.ai2} self-play: games {game}..{self.games - 1}, "
+              f"{self.shard_size} rows per shard, {self.workers} worker(s), into {self.out_dir}")
+        buffer = []  # (game, row index within game, kind, features, options, chosen, ai, outcome)
+        start = time.time()
+        block = self.workers * 8  # Games in flight; bounds memory however large the run
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for first in range(game, self.games, block):
+                games = range(first, min(first + block, self.games))
+                results = pool.map(play_game, games, [self.seed + g for g in games],
+                                   [self.ai1] * len(games), [self.ai2] * len(games))
+                for g, rows, crashed in results:
+                    if crashed:
+                        self.crashed.append(g)
+                    for offset, (kind, ai, features, options, chosen, outcome) in enumerate(rows):
+                        if g == game and offset < skip:
+                            continue  # Already in a shard from an earlier session
+                        buffer.append((g, offset, kind, features, options, chosen, ai, outcome))
+                    while len(buffer) >= self.shard_size:
+                        next_position = (buffer[self.shard_size][:2] if len(buffer) > self.shard_size
+                                         else (g + 1, 0))
+                        self._write(buffer[:self.shard_size], next_position, full=True)
+                        del buffer[:self.shard_size]
+                        print(f"  shard {len(self.shards) - 1}: {self.rows} rows, game {g + 1}/{self.games} "
+                              f"[{self.rows / (time.time() - start):.0f} rows/s]")
+                if not buffer:
+                    self.position = (games[-1] + 1, 0)
+        if buffer:
+            self._write(buffer, (self.games, 0), full=False)
+        self.position = (self.games, 0)
+        self.save_manifest()
+        print(f"Done: {self.rows} rows in {len(self.shards)} shard(s) from {self.games} games "
+              f"({len(self.crashed)} crashed) [{time.time() - start:.1f}s]")
+
+    def _write(self, rows, next_position, full):
+        filename = f"shard_{len(self.shards):05d}.npz"
+        write_shard(os.path.join(self.out_dir, filename), rows)
+        self.shards.append({'file': filename, 'rows': len(rows), 'full': full,
+                            'start': list(self.position), 'end': list(next_position)})
+        self.position = tuple(next_position)
+        self.save_manifest()
+
+    # --- persistence ---
+
+    def save_manifest(self):
+        manifest = {
+            'format': FORMAT_VERSION,
+            'ai_types': [self.ai1, self.ai2], 'ai_versions': self.ai_versions,
+            'games': self.games, 'seed': self.seed, 'shard_size': self.shard_size,
+            'position': list(self.position), 'rows': self.rows, 'crashed': self.crashed,
+            'shards': self.shards,
+            'columns': {name: {'dtype': dtype, 'shape': ['rows', width] if width else ['rows']}
+                        for name, (_, dtype, width) in COLUMNS.items()},
+            'kinds': KINDS,
+            'options': {'play': 'spell id of each playable hand card',
+                        'draft': 'lowest spell id of each offered set', 'padding': -1},
+            'outcome': '+1 win, 0 draw, -1 loss for the deciding AI; ai indexes ai_types',
+            'feature_names': FEATURE_NAMES,
+        }
+        path = os.path.join(self.out_dir, 'manifest.json')
+        with open(path + '.tmp', 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(path + '.tmp', path)
+
+    @classmethod
+    def resume(cls, out_dir, games=None, workers=None):
+        """Reopen a run; a trailing partial shard is dropped and its games are played again"""
+        with open(os.path.join(out_dir, 'manifest.json')) as f:
+            manifest = json.load(f)
+        if manifest['feature_names'] != FEATURE_NAMES:
+            raise ValueError(f"{out_dir} was written with a different feature layout; start a new run")
+        ai1, ai2 = manifest['ai_types']
+        dataset = cls(out_dir, games or manifest['games'], ai1, ai2, manifest['shard_size'], workers,
+                      manifest['seed'])
+        if dataset.ai_versions != manifest['ai_versions']:
+            print(f"Warning: AI versions changed since this run started "
+                  f"({manifest['ai_versions']} -> {dataset.ai_versions}); new rows come from the new versions")
+        dataset.shards = manifest['shards']
+        dataset.position = tuple(manifest['position'])
+        if dataset.shards and not dataset.shards[-1]['full']:
+            partial = dataset.shards.pop()
+            os.remove(os.path.join(out_dir, partial['file']))
+            dataset.position = tuple(partial['start'])
+        dataset.crashed = [g for g in manifest['crashed'] if g < dataset.position[0]]
+        return dataset
+
+
+def print_info(out_dir):
+    with open(os.path.join(out_dir, 'manifest.json')) as f:
+        manifest = json.load(f)
+    print(f"{out_dir}: {' vs '.join(manifest['ai_types'])}, seed {manifest['seed']}")
+    print(f"  {manifest['rows']} rows in {len(manifest['shards'])} shard(s), "
+          f"games covered {manifest['position'][0]}/{manifest['games']} ({len(manifest['crashed'])} crashed)")
+    print(f"  {len(manifest['feature_names'])} features, up to {manifest['columns']['options']['shape'][1]} options")
+    if manifest['shards']:
+        shard = load_shard(os.path.join(out_dir, manifest['shards'][0]['file']))
+        kinds = shard['kind'][1]
+        outcomes = shard['outcome'][1]
+        for k, kind in enumerate(manifest['kinds']):
+            count = sum(1 for v in kinds if v == k)
+            print(f"  shard 0: {count} {kind} decisions")
+        print(f"  shard 0 outcomes: {sum(1 for v in outcomes if v > 0)} win, "
+              f"{sum(1 for v in outcomes if v == 0)} draw, {sum(1 for v in outcomes if v < 0)} loss")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a sharded self-play decision dataset')
+    parser.add_argument('--games', type=int, help='Games to cover in total (default 1000)')
+    parser.add_argument('--ai1', default='expert', choices=list(AI_CLASSES))
+    parser.add_argument('--ai2', default='expert', choices=list(AI_CLASSES))
+    parser.add_argument('--shard-size', type=int, default=50000, help='Rows per shard (default 50000)')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--seed', type=int, help='Base seed; game i is played on seed + i')
+    parser.add_argument('--out', help='Run directory (default datasets/selfplay_<timestamp>)')
+    parser.add_argument('--resume', metavar='RUN_DIR', help='Continue a run, optionally raising --games')
+    parser.add_argument('--info', metavar='RUN_DIR', help='Summarise a run and exit')
+    args = parser.parse_args()
+
+    if args.info:
+        print_info(args.info)
+        return
+    if args.resume:
+        dataset = SelfPlayDataset.resume(args.resume, args.games, args.workers)
+    else:
+        dataset = SelfPlayDataset(args.out, args.games or 1000, args.ai1, args.ai2, args.shard_size,
+                                  args.workers, args.seed)
+    dataset.run()
+
+
+if __name__ == "__main__":
+    main()
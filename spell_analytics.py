@@ -6,6 +6,8 @@ import os
 from collections import defaultdict
 import statistics
 
+from spell_properties import format_range, load_spell_properties
+
 class SpellAnalyzer:
     """Analyze spell balance and element statistics"""
     
@@ -13,6 +15,7 @@ class SpellAnalyzer:
         # Load spell data
         with open('spells.json', 'r') as f:
             self.spells = json.load(f)
+        self.properties = load_spell_properties()
         
         # Load element categories
         if os.path.exists('element_categories.json'):
@@ -52,31 +55,6 @@ class SpellAnalyzer:
         
         self.analyze_card_advantage()
     
-    def get_damage_value(self, action):
-        """Extract damage value from an action"""
-        if not isinstance(action, dict):
-            return 0
-        
-        action_type = action.get('type', '')
-        if action_type == 'damage':
-            return action.get('parameters', {}).get('value', 0)
-        elif action_type == 'damage_per_spell':
-            # Estimate average case (2 spells)
-            return action.get('parameters', {}).get('value', 0) * 2
-        elif action_type == 'damage_multi_target':
-            # Multi-target damage
-            return action.get('parameters', {}).get('value', 0)
-        return 0
-    
-    def get_healing_value(self, action):
-        """Extract healing value from an action"""
-        if not isinstance(action, dict):
-            return 0
-        
-        if action.get('type') == 'heal':
-            return action.get('parameters', {}).get('value', 0)
-        return 0
-    
     def analyze_damage_by_element(self):
         """Analyze average damage output by element"""
         print("DAMAGE OUTPUT BY ELEMENT")
@@ -84,38 +62,17 @@ class SpellAnalyzer:
         
         element_damage = defaultdict(list)
         
-        for spell in self.spells:
-            element = spell['element']
-            total_damage = 0
-            
-            # Check resolve effects
-            for effect in spell.get('resolve_effects', []):
-                action = effect.get('action', {})
-                total_damage += self.get_damage_value(action)
-                
-                # Check player choice options
-                if isinstance(action, dict) and action.get('type') == 'player_choice':
-                    for option in action.get('options', []):
-                        if option.get('type') == 'damage':
-                            total_damage += self.get_damage_value(option)
-                        elif option.get('type') == 'sequence':
-                            for seq_action in option.get('actions', []):
-                                total_damage += self.get_damage_value(seq_action)
-            
-            # Check advance effects
-            for effect in spell.get('advance_effects', []):
-                action = effect.get('action', {})
-                total_damage += self.get_damage_value(action)
-            
-            if total_damage > 0:
-                element_damage[element].append(total_damage)
+        for props in self.properties.values():
+            # Typical damage over a round, from the spell's effect tree
+            if props['damage']['max'] > 0:
+                element_damage[props['element']].append(props['damage'])
         
         # Calculate statistics
         results = []
         for element, damages in element_damage.items():
             if damages:
-                avg_damage = statistics.mean(damages)
-                max_damage = max(damages)
+                avg_damage = statistics.mean(d['typical'] for d in damages)
+                max_damage = max(d['max'] for d in damages)
                 spell_count = len(damages)
                 results.append((element, avg_damage, max_damage, spell_count))
         
@@ -135,38 +92,16 @@ class SpellAnalyzer:
         
         element_healing = defaultdict(list)
         
-        for spell in self.spells:
-            element = spell['element']
-            total_healing = 0
-            
-            # Check resolve effects
-            for effect in spell.get('resolve_effects', []):
-                action = effect.get('action', {})
-                total_healing += self.get_healing_value(action)
-                
-                # Check player choice options
-                if isinstance(action, dict) and action.get('type') == 'player_choice':
-                    for option in action.get('options', []):
-                        if option.get('type') == 'heal':
-                            total_healing += self.get_healing_value(option)
-                        elif option.get('type') == 'sequence':
-                            for seq_action in option.get('actions', []):
-                                total_healing += self.get_healing_value(seq_action)
-            
-            # Check advance effects
-            for effect in spell.get('advance_effects', []):
-                action = effect.get('action', {})
-                total_healing += self.get_healing_value(action)
-            
-            if total_healing > 0:
-                element_healing[element].append(total_healing)
+        for props in self.properties.values():
+            if props['heal']['max'] > 0:
+                element_healing[props['element']].append(props['heal'])
         
         # Calculate statistics
         results = []
         for element, healings in element_healing.items():
             if healings:
-                avg_healing = statistics.mean(healings)
-                max_healing = max(healings)
+                avg_healing = statistics.mean(h['typical'] for h in healings)
+                max_healing = max(h['max'] for h in healings)
                 spell_count = len(healings)
                 results.append((element, avg_healing, max_healing, spell_count))
         
@@ -353,11 +288,10 @@ class SpellAnalyzer:
                 stats['spell_count'] += 1
                 
                 # Check for damage/healing
-                all_effects = str(spell.get('resolve_effects', [])) + str(spell.get('advance_effects', []))
-                
-                if 'damage' in all_effects:
+                props = self.properties[spell['card_name']]
+                if props['damage']['max'] > 0:
                     stats['damage_spells'] += 1
-                if 'heal' in all_effects:
+                if props['heal']['max'] > 0:
                     stats['healing_spells'] += 1
         
         # Display results
@@ -377,32 +311,9 @@ class SpellAnalyzer:
         
         element_self_damage = defaultdict(list)
         
-        for spell in self.spells:
-            element = spell['element']
-            spell_name = spell['card_name']
-            
-            # Check all effects for self-damage
-            all_effects = spell.get('resolve_effects', []) + spell.get('advance_effects', [])
-            
-            for effect in all_effects:
-                action = effect.get('action', {})
-                
-                # Direct self-damage
-                if isinstance(action, dict) and action.get('type') == 'damage' and action.get('target') == 'self':
-                    damage = action.get('parameters', {}).get('value', 0)
-                    element_self_damage[element].append((spell_name, damage))
-                
-                # Player choice with self-damage option
-                if isinstance(action, dict) and action.get('type') == 'player_choice':
-                    for option in action.get('options', []):
-                        if option.get('type') == 'damage' and option.get('target') == 'self':
-                            damage = option.get('parameters', {}).get('value', 0)
-                            element_self_damage[element].append((spell_name, damage))
-                        elif option.get('type') == 'sequence':
-                            for seq_action in option.get('actions', []):
-                                if seq_action.get('type') == 'damage' and seq_action.get('target') == 'self':
-                                    damage = seq_action.get('parameters', {}).get('value', 0)
-                                    element_self_damage[element].append((spell_name, damage))
+        for props in self.properties.values():
+            if props['self_damage']['max'] > 0:
+                element_self_damage[props['element']].append((props['name'], props['self_damage']))
         
         # Display results
         for element in sorted(element_self_damage.keys()):
@@ -410,7 +321,7 @@ class SpellAnalyzer:
             category = self.get_element_category(element)
             print(f"\n{element} [{category}]:")
             for spell_name, damage in spells:
-                print(f"  - {spell_name}: {damage} self-damage")
+                print(f"  - {spell_name}: {format_range(damage)} self-damage")
     
     def analyze_card_advantage(self):
         """Analyze card advantage mechanics by element"""
@@ -7,6 +7,8 @@ from collections import defaultdict
 import statistics
 import glob
 
+from spell_properties import format_range, load_spell_properties
+
 class EnhancedSpellAnalyzer:
     """Analyze spell balance with both theoretical potential and real-world data"""
     
@@ -14,6 +16,7 @@ class EnhancedSpellAnalyzer:
         # Load spell data
         with open('spells.json', 'r') as f:
             self.spells = json.load(f)
+        self.properties = load_spell_properties()
         
         # Load element categories
         if os.path.exists('element_categories.json'):
@@ -58,200 +61,9 @@ class EnhancedSpellAnalyzer:
         self.analyze_special_effects()
     
     def calculate_damage_potential(self, spell):
-        """Calculate theoretical damage potential for a spell"""
-        potentials = {
-            'min': 0,
-            'max': 0,
-            'typical': 0,  # Realistic expectation
-            'conditions': []
-        }
-        
-        # Analyze resolve effects
-        for effect in spell.get('resolve_effects', []):
-            damage_info = self._analyze_effect_damage(effect, spell)
-            if damage_info:
-                potentials['conditions'].append(damage_info)
-        
-        # Analyze advance effects
-        for effect in spell.get('advance_effects', []):
-            damage_info = self._analyze_effect_damage(effect, spell)
-            if damage_info:
-                damage_info['source'] = 'advance'
-                potentials['conditions'].append(damage_info)
-        
-        # Calculate totals
-        if potentials['conditions']:
-            # For conditional effects, determine min/max/typical
-            self._calculate_conditional_totals(potentials, spell)
-        else:
-            # No conditions found, set all to 0
-            potentials['min'] = 0
-            potentials['max'] = 0
-            potentials['typical'] = 0
-        
-        return potentials
-    
-    def _analyze_effect_damage(self, effect, spell):
-        """Analyze damage from a single effect"""
-        condition = effect.get('condition', {})
-        action = effect.get('action', {})
-        
-        damage_info = {
-            'condition_type': condition.get('type', 'always'),
-            'damage': 0,
-            'scaling': False,
-            'notes': []
-        }
-        
-        # Handle different action types
-        if isinstance(action, dict):
-            action_type = action.get('type', '')
-            
-            if action_type == 'damage':
-                damage_info['damage'] = action.get('parameters', {}).get('value', 0)
-                
-            elif action_type == 'damage_per_spell':
-                damage_info['damage'] = 1  # Base multiplier
-                damage_info['scaling'] = True
-                damage_info['scaling_type'] = 'per_spell'
-                spell_type = action.get('parameters', {}).get('spell_type', 'any')
-                damage_info['notes'].append(f"Scales with {spell_type} spells")
-                
-            elif action_type == 'damage_per_spell_from_other_clashes':
-                damage_info['damage'] = 1
-                damage_info['scaling'] = True
-                damage_info['scaling_type'] = 'per_spell_other_clashes'
-                damage_info['notes'].append("Scales with spells from other clashes")
-                
-            elif action_type == 'damage_multi_target':
-                damage_info['damage'] = action.get('parameters', {}).get('value', 0)
-                damage_info['notes'].append("Hits all enemies")
-                
-            elif action_type == 'player_choice':
-                # Analyze all options
-                options_damage = []
-                for option in action.get('options', []):
-                    opt_damage = self._analyze_option_damage(option)
-                    if opt_damage > 0:
-                        options_damage.append(opt_damage)
-                if options_damage:
-                    damage_info['damage'] = max(options_damage)  # Best case
-                    damage_info['notes'].append(f"Choice between {len(action.get('options', []))} options")
-                    
-            elif action_type == 'auto_optimal_choice':
-                # Similar to player_choice but automatic
-                options_damage = []
-                for option in action.get('options', []):
-                    opt_damage = self._analyze_option_damage(option)
-                    if opt_damage > 0:
-                        options_damage.append(opt_damage)
-                if options_damage:
-                    damage_info['damage'] = max(options_damage)
-                    damage_info['notes'].append("Auto-selects optimal choice")
-                    
-            elif action_type == 'sequence':
-                # Sum all damage in sequence
-                total_damage = 0
-                for seq_action in action.get('actions', []):
-                    if seq_action.get('type') == 'damage':
-                        total_damage += seq_action.get('parameters', {}).get('value', 0)
-                damage_info['damage'] = total_damage
-                
-        elif isinstance(action, list):
-            # Multiple actions
-            total_damage = 0
-            for act in action:
-                if act.get('type') == 'damage':
-                    total_damage += act.get('parameters', {}).get('value', 0)
-            damage_info['damage'] = total_damage
-        
-        # Only return if there's damage
-        if damage_info['damage'] > 0 or damage_info['scaling']:
-            return damage_info
-        return None
-    
-    def _analyze_option_damage(self, option):
-        """Get damage from a choice option"""
-        if option.get('type') == 'damage':
-            return option.get('parameters', {}).get('value', 0)
-        elif option.get('type') == 'damage_per_spell':
-            return 3  # Assume 3 spells typical
-        elif option.get('type') == 'sequence':
-            total = 0
-            for act in option.get('actions', []):
-                if act.get('type') == 'damage':
-                    total += act.get('parameters', {}).get('value', 0)
-            return total
-        return 0
-    
-    def _calculate_conditional_totals(self, potentials, spell):
-        """Calculate min/max/typical damage considering conditions"""
-        # Group by condition type
-        always_damage = 0
-        conditional_damages = []
-        advance_damages = []
-        
-        # Special handling for spells with explicit conditions
-        spell_name = spell.get('card_name', '')
-        
-        for cond in potentials['conditions']:
-            if cond['condition_type'] == 'always':
-                if cond.get('source') == 'advance':
-                    advance_damages.append(cond['damage'])
-                else:
-                    always_damage += cond['damage']
-            elif cond['condition_type'] == 'if_not':
-                # This is an "otherwise" condition - mutually exclusive with others
-                conditional_damages.append(('otherwise', cond['damage']))
-            else:
-                conditional_damages.append(('conditional', cond['damage']))
-        
-        # Calculate minimum (worst case)
-        potentials['min'] = always_damage
-        
-        # Calculate maximum (best case)
-        max_damage = always_damage
-        
-        # Handle conditional damages
-        if conditional_damages:
-            # If there's an "otherwise", it's either/or
-            otherwise_damages = [d for t, d in conditional_damages if t == 'otherwise']
-            regular_conditionals = [d for t, d in conditional_damages if t == 'conditional']
-            
-            if otherwise_damages and regular_conditionals:
-                # Either the conditional OR the otherwise
-                max_damage += max(max(regular_conditionals), max(otherwise_damages))
-                potentials['typical'] = always_damage + min(max(regular_conditionals), max(otherwise_damages))
-            elif regular_conditionals:
-                max_damage += sum(regular_conditionals)
-                potentials['typical'] = always_damage + (sum(regular_conditionals) // 2)  # Assume half trigger
-            else:
-                max_damage += sum(otherwise_damages)
-                potentials['typical'] = always_damage + sum(otherwise_damages)
-        else:
-            potentials['typical'] = always_damage
-        
-        # Add advance damage potential
-        if advance_damages:
-            # Can potentially trigger multiple times
-            advance_total = sum(advance_damages)
-            if spell.get('card_name') in ['Ignite', 'Flow', 'Gust']:  # Self-advancing spells
-                max_damage += advance_total * 3  # Could advance 3 times
-                potentials['typical'] += advance_total  # Typically once
-            else:
-                max_damage += advance_total
-        
-        potentials['max'] = max_damage
-        
-        # Handle scaling damage
-        for cond in potentials['conditions']:
-            if cond.get('scaling'):
-                if cond['scaling_type'] == 'per_spell':
-                    potentials['max'] *= 6  # Could have 6 spells
-                    potentials['typical'] *= 3  # Typically 3 spells
-                elif cond['scaling_type'] == 'per_spell_other_clashes':
-                    potentials['max'] *= 9  # 3 other clashes * 3 spells each
-                    potentials['typical'] *= 3  # Typically 3-4 spells
+        """Theoretical damage potential for a spell, derived from its effect tree by spell_properties"""
+        props = self.properties[spell['card_name']]
+        return dict(props['damage'], notes=props['notes'])
     
     def analyze_damage_potential(self):
         """Analyze theoretical damage potential by element"""
@@ -270,7 +82,7 @@ class EnhancedSpellAnalyzer:
                     'min': potential['min'],
                     'max': potential['max'],
                     'typical': potential['typical'],
-                    'notes': potential.get('conditions', [])
+                    'notes': potential['notes']
                 })
         
         # Calculate and display statistics
@@ -306,37 +118,24 @@ class EnhancedSpellAnalyzer:
                 if spell['max'] >= 5:
                     print(f"\n{result['element']} - {spell['name']}:")
                     print(f"  Damage Range: {spell['min']}-{spell['max']} (typical: {spell['typical']})")
-                    for note in spell['notes']:
-                        if note.get('notes'):
-                            print(f"  Notes: {', '.join(note['notes'])}")
+                    if spell['notes']:
+                        print(f"  Notes: {', '.join(spell['notes'])}")
     
     def analyze_healing_potential(self):
         """Analyze theoretical healing potential"""
         print("\nHEALING POTENTIAL BY ELEMENT")
         print("-" * 40)
         
-        # Similar structure to damage analysis but for healing
         element_healing = defaultdict(list)
         
-        for spell in self.spells:
-            element = spell['element']
-            healing_found = False
-            
-            # Check all effects for healing
-            all_effects_str = str(spell.get('resolve_effects', [])) + str(spell.get('advance_effects', []))
-            
-            if 'heal' in all_effects_str:
-                # Simple detection for now
-                if 'heal_per_spell' in all_effects_str:
-                    element_healing[element].append({
-                        'name': spell['card_name'],
-                        'potential': 'Scales with spells'
-                    })
-                else:
-                    element_healing[element].append({
-                        'name': spell['card_name'],
-                        'potential': 'Fixed healing'
-                    })
+        for props in self.properties.values():
+            if props['heal']['max'] > 0:
+                heal = props['heal']
+                element_healing[props['element']].append({
+                    'name': props['name'],
+                    'potential': (f"{format_range(heal)} healing (typical: {heal['typical']:g})"
+                                  + (", scales with spells" if props['scaling'] else ""))
+                })
         
         # Display results
         for element in sorted(element_healing.keys()):
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo spell values from engine micro-simulations.
+
+spell_properties.py reads each spell's output off its effect tree; this
+estimator measures it instead. Every trial plays one round of the real
+engine from a randomised start: both players hold two random sets (the
+caster's include the spell under test), health (from MIN_HEALTH up), max
+health, trunks, round number and Ringleader are drawn at random, and the
+caster is made to prepare the spell in a random clash it may be played in.
+Trials where the round ends before that clash are not counted. The rest of the
+round is played by the AIs, so the board the spell meets - spells cast
+before it, the opponent's spell in its clash, later advances - comes from
+real play. Every action the spell takes goes through ActionHandler, and
+the damage, self-damage, healing, weaken and bolster it produced are read
+back from the round's event log.
+
+All spells are measured on the same seeds, spread over a process pool in
+chunks of trials. The result is spell_values.json: for each spell the
+empirical distribution of each output per cast, with means and
+percentiles, next to the typical values derived by spell_properties.py.
+
+Usage:
+    python spell_montecarlo.py run [--trials 200] [--spells Fireball,Ignite] [--ai hard] [--workers N] [--seed S]
+    python spell_montecarlo.py show [spell]
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import time
+import traceback
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from datetime import datetime
+
+from analytics import AI_CLASSES, create_engine
+from crash_corpus import CrashCorpus
+from elephants_prototype import SPELL_DATA, RoundOverException
+from game_logger import NullGameLogger
+from spell_properties import OUTPUTS, load_spell_properties
+
+VALUES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'spell_values.json')
+CHUNK_SIZE = 25       # Trials per pool task
+PLAYER_NAMES = ['CASTER', 'OPPONENT']
+MAX_HEALTH_RANGE = (4, 6)
+MIN_HEALTH = 2        # Players at 1 health mostly end the round before the spell is reached
+MAX_ROUND = 5
+MEASURED = OUTPUTS + ('resolutions',)
+
+
+def legal_clashes(card):
+    """Clashes the card may be prepared in (notfirst/notlast of 2 or more rule out the first/last clash)"""
+    return [clash for clash in range(1, 5)
+            if not (clash == 1 and card.notfirst >= 2) and not (clash == 4 and card.notlast >= 2)]
+
+
+def _randomise(engine, card, rng):
+    """Random start-of-round position with `card` in the caster's hand; returns the clash it is forced into"""
+    gs = engine.gs
+    own_set = next(s for s in gs.main_deck if card in s)
+    others = [s for s in gs.main_deck if s is not own_set]
+    rng.shuffle(others)
+    drafted = [[own_set, others[0]], [others[1], others[2]]]
+    gs.main_deck = others[3:]
+    for player, player_sets in zip(gs.players, drafted):
+        cards = [c for s in player_sets for c in s]
+        rng.shuffle(cards)
+        if player is gs.players[0]:
+            cards.remove(card)
+            cards.insert(0, card)
+        player.hand, player.discard_pile = cards[:4], cards[4:]
+        player.max_health = rng.randint(*MAX_HEALTH_RANGE)
+        player.health = rng.randint(MIN_HEALTH, player.max_health)
+        player.trunks = rng.randint(1, 3)
+    gs.round_num = rng.randint(1, MAX_ROUND)
+    gs.ringleader_index = rng.randrange(len(gs.players))
+    return rng.choice(legal_clashes(card))
+
+
+def _force_clash(ai, card, clash):
+    """Make the caster's AI hold `card` until `clash` and prepare it then; other choices are its own"""
+    choose_card_to_play = ai.choose_card_to_play
+
+    def forced(player, gs):
+        if gs.clash_num == clash:
+            return player.hand.index(card) if card in player.hand else choose_card_to_play(player, gs)
+        chosen = choose_card_to_play(player, gs)
+        if chosen is not None and player.hand[chosen] is card:
+            others = [i for i, c in enumerate(player.hand) if c is not card and gs.clash_num in legal_clashes(c)]
+            chosen = others[0] if others else None
+        return chosen
+
+    ai.choose_card_to_play = forced
+
+
+def _play_round(engine):
+    gs = engine.gs
+    try:
+        for clash in range(1, 5):
+            gs.clash_num = clash
+            engine._run_clash()
+            if gs.game_over:
+                break
+    except RoundOverException:
+        pass
+
+
+def measure(gs, card):
+    """{output: amount} the card produced this round, or None if it never became active
+
+    resolutions counts the clashes it resolved or produced output in, so a
+    resolution that knocked a player out (ending the round) still counts.
+    """
+    caster = gs.players[0].name
+    events = [e for e in gs.event_log if e.get('card_id') == card.id]
+    if not any(e['type'] == 'spell_active_in_clash' for e in events):
+        return None
+    totals = dict.fromkeys(MEASURED, 0)
+    resolved = set()
+    for event in events:
+        kind, value = event['type'], event.get('value', 0)
+        if kind == 'player_damaged' and event.get('player') == caster:
+            totals['self_damage' if event.get('target') == caster else 'damage'] += value
+        elif kind == 'player_healed':
+            totals['heal'] += value
+        elif kind == 'player_weakened' and event.get('target') != caster:
+            totals['weaken'] += value
+        elif kind == 'player_bolstered':
+            totals['bolster'] += value
+        elif kind != 'spell_resolved':
+            continue
+        resolved.add(event['clash'])
+    totals['resolutions'] = len(resolved)
+    return totals
+
+
+def play_trial(spell_id, ai, seed):
+    """One randomised round with the spell forced into a clash; returns (engine, measured outputs or None)"""
+    random.seed(seed)
+    engine = create_engine(PLAYER_NAMES, ai, ai, logger=NullGameLogger())
+    card = engine.gs.all_cards[spell_id]
+    clash = _randomise(engine, card, random.Random(seed))
+    _force_clash(engine.ai_strategies[0], card, clash)
+    with redirect_stdout(io.StringIO()):
+        _play_round(engine)
+    return engine, measure(engine.gs, card)
+
+
+def play_chunk(spell_id, ai, seeds):
+    """Pool task: trials of one spell; returns (spell id, {output: Counter of amounts}, cast, failed)"""
+    histograms = {output: Counter() for output in MEASURED}
+    cast = failed = 0
+    for seed in seeds:
+        engine = None
+        try:
+            engine, outputs = play_trial(spell_id, ai, seed)
+        except Exception:
+            failed += 1
+            CrashCorpus().record('spell_montecarlo', seed, PLAYER_NAMES, [ai, ai], traceback.format_exc(),
+                                 engine.gs if engine else None, extra={'spell_id': spell_id})
+            continue
+        if outputs is None:
+            continue  # Discarded, or the round ended before its clash
+        cast += 1
+        for output, amount in outputs.items():
+            histograms[output][amount] += 1
+    return spell_id, histograms, cast, failed
+
+
+def replay_crash(record):
+    """Re-run a crashed trial; returns the traceback, or None if it now plays through"""
+    try:
+        play_trial(record['spell_id'], record['ai_types'][0], record['seed'])
+    except Exception:
+        return traceback.format_exc()
+    return None
+
+
+def summarise(histogram):
+    """Mean, percentiles, maximum and share of casts with any output, from a {amount: casts} histogram"""
+    amounts = sorted((float(amount), n) for amount, n in histogram.items())
+    casts = sum(n for _, n in amounts)
+    if not casts:
+        return {'mean': 0.0, 'p10': 0, 'p50': 0, 'p90': 0, 'max': 0, 'nonzero': 0.0}
+
+    def percentile(q):
+        seen = 0
+        for amount, n in amounts:
+            seen += n
+            if seen >= q * casts:
+                return amount
+        return amounts[-1][0]
+
+    return {
+        'mean': round(sum(a * n for a, n in amounts) / casts, 3),
+        'p10': percentile(0.1), 'p50': percentile(0.5), 'p90': percentile(0.9),
+        'max': amounts[-1][0],
+        'nonzero': round(sum(n for a, n in amounts if a) / casts, 3),
+    }
+
+
+class SpellMonteCarlo:
+    """Empirical output distributions of each spell over randomised one-round trials"""
+
+    def __init__(self, spells=None, trials=200, ai='hard', workers=None, seed=None):
+        by_name = {spell['card_name'].lower(): spell for spell in SPELL_DATA}
+        if spells:
+            unknown = [name for name in spells if name.lower() not in by_name]
+            if unknown:
+                raise KeyError(f"Unknown spell(s): {', '.join(unknown)}")
+            self.spells = [by_name[name.lower()] for name in spells]
+        else:
+            self.spells = list(SPELL_DATA)
+        self.trials = trials
+        self.ai = ai
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed if seed is not None else random.randrange(2**31)
+        self.histograms = defaultdict(lambda: {output: Counter() for output in MEASURED})
+        self.cast = Counter()
+        self.failed = Counter()
+
+    def run(self):
+        seeds = list(range(self.seed, self.seed + self.trials))
+        chunks = [seeds[i:i + CHUNK_SIZE] for i in range(0, len(seeds), CHUNK_SIZE)]
+        tasks = [(spell['id'], self.ai, chunk) for spell in self.spells for chunk in chunks]
+        print(f"Spell Monte Carlo: {len(self.spells)} spell(s) x {self.trials} trials ({self.ai} AI), "
+              f"seeds {self.seed}..{seeds[-1]}, {self.workers} worker(s)")
+        start = time.time()
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(play_chunk, *task) for task in tasks]
+            for done, future in enumerate(futures, 1):
+                spell_id, histograms, cast, failed = future.result()
+                for output, histogram in histograms.items():
+                    self.histograms[spell_id][output].update(histogram)
+                self.cast[spell_id] += cast
+                self.failed[spell_id] += failed
+                if done % len(chunks) == 0 and (done // len(chunks)) % 10 == 0 or done == len(futures):
+                    print(f"  {done // len(chunks)}/{len(self.spells)} spells [{time.time() - start:.1f}s]")
+        if sum(self.failed.values()):
+            print(f"{sum(self.failed.values())} trial(s) crashed (see python crash_corpus.py)")
+
+    def to_dict(self):
+        properties = load_spell_properties()
+        spells = {}
+        for spell in self.spells:
+            histograms = self.histograms[spell['id']]
+            props = properties[spell['card_name']]
+            spells[spell['card_name']] = {
+                'id': spell['id'],
+                'element': spell['element'],
+                'trials': self.trials,
+                'cast': self.cast[spell['id']],
+                'failed': self.failed[spell['id']],
+                'outputs': {output: dict(summarise(histograms[output]),
+                                         derived_typical=props[output]['typical'] if output in props else None,
+                                         histogram={str(a): n for a, n in sorted(histograms[output].items())})
+                            for output in MEASURED},
+            }
+        return {'built': datetime.now().isoformat(timespec='seconds'), 'ai': self.ai, 'seed': self.seed,
+                'trials': self.trials, 'spells': spells}
+
+    def save(self, path=VALUES_PATH):
+        """Write the results, keeping spells measured by earlier runs that this one did not cover"""
+        data = self.to_dict()
+        if os.path.exists(path):
+            with open(path) as f:
+                previous = json.load(f)
+            data['spells'] = {**previous.get('spells', {}), **data['spells']}
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+        return path
+
+
+def format_table(data):
+    """Per-cast means (p10-p90) of every spell, with the derived typical damage for comparison"""
+    lines = [f"SPELL VALUES PER CAST ({data['ai']} AI; mean, p10-p90 in brackets)",
+             f"{'Spell':<14} {'Element':<10} {'Cast':>5} {'Damage':>14} {'Derived':>8} {'Heal':>12} "
+             f"{'Weaken':>12} {'Bolster':>12} {'Self':>6} {'Res':>5}"]
+
+    def cell(stats, width):
+        text = f"{stats['mean']:.2f} [{stats['p10']:g}-{stats['p90']:g}]" if stats['max'] else "-"
+        return f"{text:>{width}}"
+
+    for name, spell in sorted(data['spells'].items(), key=lambda item: (item[1]['element'], item[0])):
+        outputs = spell['outputs']
+        cast = spell['cast'] / spell['trials'] if spell['trials'] else 0
+        derived = outputs['damage']['derived_typical']
+        self_damage = outputs['self_damage']['mean']
+        lines.append(f"{name:<14} {spell['element']:<10} {cast:>5.0%} {cell(outputs['damage'], 14)} "
+                     f"{f'{derived:g}' if derived else '-':>8} {cell(outputs['heal'], 12)} "
+                     f"{cell(outputs['weaken'], 12)} {cell(outputs['bolster'], 12)} "
+                     f"{f'{self_damage:.2f}' if self_damage else '-':>6} "
+                     f"{outputs['resolutions']['mean']:>5.2f}")
+    return "\n".join(lines)
+
+
+def format_spell(name, spell):
+    lines = [f"{name} ({spell['element']}): cast in {spell['cast']} of {spell['trials']} trials"]
+    for output, stats in spell['outputs'].items():
+        if not stats['max']:
+            continue
+        derived = f", derived typical {stats['derived_typical']:g}" if stats['derived_typical'] is not None else ""
+        lines.append(f"  {output:<12} mean {stats['mean']:.2f}, median {stats['p50']:g}, "
+                     f"p10-p90 {stats['p10']:g}-{stats['p90']:g}, max {stats['max']:g}, "
+                     f"nonzero {stats['nonzero']:.0%}{derived}")
+        total = sum(stats['histogram'].values())
+        for amount, n in stats['histogram'].items():
+            lines.append(f"    {amount:>4}: {n / total:>6.1%} {'#' * round(40 * n / total)}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Estimate spell output distributions by engine micro-simulation')
+    sub = parser.add_subparsers(dest='command', required=True)
+    run_parser = sub.add_parser('run', help='Simulate trials and write spell_values.json')
+    run_parser.add_argument('--trials', type=int, default=200, help='Trials per spell (default 200)')
+    run_parser.add_argument('--spells', help='Comma-separated spell names (default: every spell)')
+    run_parser.add_argument('--ai', default='hard', choices=list(AI_CLASSES), help='AI playing both seats')
+    run_parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    run_parser.add_argument('--seed', type=int)
+    show_parser = sub.add_parser('show', help='Print the saved table, or one spell with its histograms')
+    show_parser.add_argument('spell', nargs='?')
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        spells = [name.strip() for name in args.spells.split(',')] if args.spells else None
+        try:
+            estimator = SpellMonteCarlo(spells, args.trials, args.ai, args.workers, args.seed)
+        except KeyError as e:
+            print(e.args[0])
+            sys.exit(1)
+        estimator.run()
+        data = estimator.to_dict()
+        print(format_table(data))
+        print(f"\nSaved to {estimator.save()}")
+        return
+    if not os.path.exists(VALUES_PATH):
+        print(f"No spell values at {VALUES_PATH}; run: python spell_montecarlo.py run")
+        sys.exit(1)
+    with open(VALUES_PATH) as f:
+        data = json.load(f)
+    if args.spell:
+        name = next((n for n in data['spells'] if n.lower() == args.spell.lower()), None)
+        if name is None:
+            print(f"No values for {args.spell}")
+            sys.exit(1)
+        print(format_spell(name, data['spells'][name]))
+    else:
+        print(format_table(data))
+
+
+if __name__ == "__main__":
+    main()
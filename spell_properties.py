@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Spell properties derived from the effect trees in spells.json.
+
+The analysis reports all need the same facts about each spell - how much
+damage, healing, weaken and bolster it can produce (minimum, maximum and a
+typical value), what it costs its caster, how many times it can resolve and
+which conditions trigger it. This module derives them once, by walking each
+spell's resolve and advance effects, and caches the result in
+spell_properties.json keyed by a hash of spells.json, so every report reads
+the same numbers and they are only re-derived when the catalogue changes.
+
+Ranges follow the effect tree:
+    sequences and action lists add up
+    player_choice spans its options (typical: their mean)
+    auto_optimal_choice takes the best option
+    a conditional effect may not fire (typical: CONDITION_CHANCE of its value),
+    and an 'otherwise' effect is the alternative of the one before it
+    *_per_spell actions count 0..MAX_SPELLS_COUNTED spells (typical: TYPICAL_SPELLS_COUNTED)
+    a spell that advances itself resolves again in each later clash it reaches
+
+Usage:
+    python spell_properties.py              # Table of every spell
+    python spell_properties.py <spell>      # One spell's derived properties as JSON
+"""
+
+import hashlib
+import json
+import os
+import sys
+from collections import defaultdict
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SPELLS_PATH = os.path.join(BASE_DIR, 'spells.json')
+CACHE_PATH = os.path.join(BASE_DIR, 'spell_properties.json')
+DERIVATION_VERSION = 1  # Bump when the rules below change, so cached properties are re-derived
+
+OUTPUTS = ('damage', 'self_damage', 'heal', 'weaken', 'bolster')
+CLASHES = 4
+MAX_SPELLS_COUNTED = 8      # Active spells a *_per_spell action can count (a spell per clash per player)
+TYPICAL_SPELLS_COUNTED = 2  # Other matching spells typically on the board
+MAX_ENEMY_SPELLS = 4        # Enemy spells of one type a per-type action can count
+CONDITION_CHANCE = 0.5      # Share of the time a conditional effect is assumed to fire
+
+_loaded = {}
+
+
+def _zero():
+    return (0, 0, 0)
+
+
+def _add(a, b):
+    return tuple(x + y for x, y in zip(a, b))
+
+
+def _scale(r, lo, hi, typ):
+    return (r[0] * lo, r[1] * hi, r[2] * typ)
+
+
+def _combine(parts, combine):
+    """Apply combine(list of ranges) output by output over a list of {output: range}"""
+    outputs = {name for part in parts for name in part}
+    return {name: combine([part.get(name, _zero()) for part in parts]) for name in outputs}
+
+
+def _sum(parts):
+    return _combine(parts, lambda ranges: tuple(sum(r[i] for r in ranges) for i in range(3)))
+
+
+def _either(parts):
+    """One of the parts happens, not known in advance"""
+    return _combine(parts, lambda ranges: (min(r[0] for r in ranges), max(r[1] for r in ranges),
+                                           sum(r[2] for r in ranges) / len(ranges)))
+
+
+def _best(parts):
+    return _combine(parts, lambda ranges: (max(r[0] for r in ranges), max(r[1] for r in ranges),
+                                           max(r[2] for r in ranges)))
+
+
+def _maybe(part, chance=CONDITION_CHANCE):
+    return {name: (min(0, r[0]), r[1], r[2] * chance) for name, r in part.items()}
+
+
+class _Deriver:
+    """Walks one spell's effect trees"""
+
+    def __init__(self, spell, max_flat_damage):
+        self.spell = spell
+        self.types = set(spell.get('spell_types', []))
+        self.max_flat_damage = max_flat_damage
+        self.scaling = False
+        self.choice = False
+
+    def action(self, action):
+        """{output: (min, max, typical)} for one action (or list of actions)"""
+        if isinstance(action, list):
+            return _sum([self.action(a) for a in action])
+        kind = action.get('type')
+        params = action.get('parameters', {})
+        if kind == 'sequence':
+            return _sum([self.action(a) for a in action.get('actions', [])])
+        if kind == 'player_choice':
+            self.choice = True
+            return _either([self.action(o) for o in action.get('options', [])])
+        if kind == 'auto_optimal_choice':
+            self.choice = True
+            return _best([self.action(o) for o in action.get('options', [])])
+        if kind in ('damage', 'damage_multi_target', 'heal', 'weaken', 'bolster'):
+            value = params.get('value', 0)
+            output = kind if kind != 'damage_multi_target' else 'damage'
+            if output == 'damage' and action.get('target') == 'self':
+                output = 'self_damage'
+            return {output: (value, value, value)}
+        if kind in ('damage_per_spell', 'heal_per_spell', 'weaken_per_spell'):
+            self.scaling = True
+            spell_type = params.get('spell_type', 'any')
+            counts_self = not params.get('exclude_self', False) and (spell_type == 'any' or spell_type in self.types)
+            lo = 1 if counts_self else 0
+            hi = min(params.get('limit', MAX_SPELLS_COUNTED), MAX_SPELLS_COUNTED)
+            per = params.get('value', 1)
+            return {kind[:-len('_per_spell')]: (lo * per, hi * per, min(lo + TYPICAL_SPELLS_COUNTED, hi) * per)}
+        if kind == 'damage_per_enemy_spell_type':
+            self.scaling = True
+            per = params.get('value', 1)
+            return {'damage': (0, MAX_ENEMY_SPELLS * per, per)}
+        if kind == 'discard_from_hand_for_damage':
+            hi = params.get('damage_per_card', 1) * params.get('max_cards', 1)
+            return {'damage': (0, hi, hi / 2)}
+        if kind == 'damage_equal_to_enemy_attack_damage':
+            self.scaling = True
+            return {'damage': (0, self.max_flat_damage, self.max_flat_damage / 2)}
+        return {}
+
+    def effects(self, effects):
+        """Outputs of a phase's effect list, pairing each 'otherwise' with the effect before it"""
+        parts = []
+        i = 0
+        while i < len(effects):
+            effect = effects[i]
+            kind = (effect.get('condition') or {}).get('type', 'always')
+            value = self.action(effect.get('action', {}))
+            following = effects[i + 1] if i + 1 < len(effects) else None
+            if following and (following.get('condition') or {}).get('type') == 'otherwise':
+                parts.append(_either([value, self.action(following.get('action', {}))]))
+                i += 2
+                continue
+            parts.append(value if kind == 'always' else _maybe(value))
+            i += 1
+        return _sum(parts)
+
+    def resolutions(self):
+        """(min, max, typical) times the spell resolves in a round, from its self-advance effects"""
+        limit = None
+        conditional = False
+        for effect in self.spell.get('advance_effects') or []:
+            found = _find_self_advance(effect.get('action', {}))
+            if found is not None:
+                limit = found if limit is None else max(limit, found)
+                conditional |= (effect.get('condition') or {}).get('type', 'always') != 'always'
+        if limit is None:
+            return (1, 1, 1)
+        first = 2 if self.spell.get('notfirst', 0) >= 2 else 1
+        last = CLASHES - 1 if self.spell.get('notlast', 0) >= 2 else CLASHES
+        counts = [min(CLASHES - clash, limit) + 1 for clash in range(first, last + 1)]
+        typical = sum(counts) / len(counts)
+        if conditional:
+            typical = 1 + (typical - 1) * CONDITION_CHANCE
+        return (1, max(counts), typical)
+
+
+def _find_self_advance(action):
+    """Advance limit (CLASHES if unlimited) of a 'this_spell' advance inside an action tree, else None"""
+    if isinstance(action, list):
+        found = [_find_self_advance(a) for a in action]
+    elif action.get('type') == 'advance' and action.get('target') == 'this_spell':
+        return action.get('parameters', {}).get('limit', CLASHES)
+    else:
+        found = [_find_self_advance(a) for a in action.get('options', []) + action.get('actions', [])]
+    found = [f for f in found if f is not None]
+    return max(found) if found else None
+
+
+def _conditions(spell):
+    conditions = []
+    for phase in ('resolve', 'advance'):
+        for effect in spell.get(f'{phase}_effects') or []:
+            condition = effect.get('condition') or {}
+            if condition.get('type', 'always') not in ('always', 'otherwise'):
+                conditions.append({'phase': phase, 'type': condition['type'],
+                                   'parameters': condition.get('parameters', {}),
+                                   'text': _describe(condition)})
+    return conditions
+
+
+def _describe(condition):
+    if condition['type'] == 'if_not':
+        return 'not ' + _describe(condition.get('sub_condition', {'type': 'unknown'}))
+    params = condition.get('parameters', {})
+    details = ", ".join(f"{k}={v}" for k, v in params.items())
+    return condition['type'].replace('_', ' ') + (f" ({details})" if details else "")
+
+
+def _notes(props):
+    notes = []
+    if props['resolutions']['max'] > 1:
+        notes.append(f"resolves up to {props['resolutions']['max']} times by advancing")
+    if props['scaling']:
+        notes.append("scales with spells on the board")
+    if props['choice']:
+        notes.append("choice between options")
+    notes += [f"{c['phase']}: {c['text']}" for c in props['conditions']]
+    if props['self_damage']['max']:
+        notes.append(f"costs up to {props['self_damage']['max']} self-damage")
+    return notes
+
+
+def _range(r):
+    return {'min': r[0], 'max': r[1], 'typical': round(r[2], 2)}
+
+
+def derive_properties(spells):
+    """{spell name: properties} for a list of spell definitions"""
+    max_flat_damage = max((e['action']['parameters'].get('value', 0) for s in spells
+                           for e in s.get('resolve_effects') or []
+                           if isinstance(e.get('action'), dict) and e['action'].get('type') == 'damage'
+                           and e['action'].get('target') != 'self'), default=0)
+    properties = {}
+    for spell in spells:
+        deriver = _Deriver(spell, max_flat_damage)
+        resolve = deriver.effects(spell.get('resolve_effects') or [])
+        advance = deriver.effects(spell.get('advance_effects') or [])
+        resolutions = deriver.resolutions()
+        per_resolution = _sum([resolve, advance])
+        props = {
+            'id': spell['id'],
+            'name': spell['card_name'],
+            'element': spell['element'],
+            'types': spell.get('spell_types', []),
+            'priority': spell.get('priority'),
+            'is_conjury': spell.get('is_conjury', False),
+            'resolutions': _range(resolutions),
+            'scaling': deriver.scaling,
+            'choice': deriver.choice,
+            'conditions': _conditions(spell),
+        }
+        for output in OUTPUTS:
+            props[output] = _range(_scale(per_resolution.get(output, _zero()), *resolutions))
+            props[f'{output}_per_resolution'] = _range(per_resolution.get(output, _zero()))
+        props['conditional'] = bool(props['conditions'])
+        props['notes'] = _notes(props)
+        properties[spell['card_name']] = props
+    return properties
+
+
+def _content_hash(raw):
+    return hashlib.sha1(raw + f"|v{DERIVATION_VERSION}".encode()).hexdigest()
+
+
+def load_spell_properties(spells_path=SPELLS_PATH, cache_path=CACHE_PATH):
+    """Derived properties of every spell, from the cache when it matches the catalogue's hash"""
+    with open(spells_path, 'rb') as f:
+        raw = f.read()
+    digest = _content_hash(raw)
+    if digest in _loaded:
+        return _loaded[digest]
+    properties = None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path) as f:
+                cached = json.load(f)
+            if cached.get('hash') == digest:
+                properties = cached['spells']
+        except (OSError, ValueError, KeyError):
+            pass
+    if properties is None:
+        properties = derive_properties(json.loads(raw))
+        if cache_path:
+            with open(cache_path + '.tmp', 'w') as f:
+                json.dump({'hash': digest, 'spells': properties}, f, indent=2)
+            os.replace(cache_path + '.tmp', cache_path)
+    _loaded[digest] = properties
+    return properties
+
+
+def spells_by_element(output='damage', properties=None):
+    """{element: [properties of its spells that can produce output]}, in catalogue order"""
+    properties = properties or load_spell_properties()
+    grouped = defaultdict(list)
+    for props in properties.values():
+        if props[output]['max'] > 0:
+            grouped[props['element']].append(props)
+    return grouped
+
+
+def format_range(r):
+    return f"{r['min']}" if r['min'] == r['max'] else f"{r['min']}-{r['max']}"
+
+
+def main():
+    properties = load_spell_properties()
+    if len(sys.argv) > 1:
+        name = " ".join(sys.argv[1:])
+        match = next((p for n, p in properties.items() if n.lower() == name.lower()), None)
+        if match is None:
+            print(f"Unknown spell {name}")
+            sys.exit(1)
+        print(json.dumps(match, indent=2))
+        return
+    print(f"{'Spell':<16} {'Element':<10} {'Damage':>10} {'Heal':>10} {'Weaken':>10} {'Bolster':>10} "
+          f"{'Self':>6} {'Res':>4}")
+    for props in sorted(properties.values(), key=lambda p: (p['element'], p['name'])):
+        cells = [f"{format_range(props[o])} ({props[o]['typical']:g})" if props[o]['max'] else "-"
+                 for o in ('damage', 'heal', 'weaken', 'bolster')]
+        print(f"{props['name']:<16} {props['element']:<10} " + " ".join(f"{c:>10}" for c in cells)
+              + f" {format_range(props['self_damage']) if props['self_damage']['max'] else '-':>6}"
+              f" {props['resolutions']['max']:>4}")
+
+
+if __name__ == "__main__":
+    main()
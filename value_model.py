@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Train the learned value model used by ValueAI (and optionally ExpertAI).
+
+Fits a logistic regression of each decision's eventual outcome on the
+decider's state features plus per-option weights over a small decision
+context (see ai/features.py and ai/value.py), by SGD over the shards of
+one or more self-play datasets (selfplay_dataset.py). Every tenth game is
+held out; the report compares the model's log loss with a constant
+baseline and how often its top-ranked option is the one actually chosen.
+
+The model is written to value_model.json, which ValueAI loads on startup.
+ExpertAI mixes it into its scoring when its 'value_model' weight is set.
+
+Usage:
+    python value_model.py train datasets/<run> [datasets/<run2> ...] [--epochs 3] [--lr 0.01]
+                                [--l2 1e-5] [--out value_model.json]
+    python value_model.py evaluate datasets/<run> [--model value_model.json]
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import time
+from datetime import datetime
+
+from ai.features import DRAFT_CONTEXT, FEATURE_NAMES, PLAY_CONTEXT, draft_context, play_context
+from ai.value import DEFAULT_MODEL, ValueModel
+from selfplay_dataset import KIND_DRAFT, KIND_PLAY, load_shard
+
+HOLDOUT_EVERY = 10  # Games with index % HOLDOUT_EVERY == 0 are held out
+
+
+def _shard_paths(run_dirs):
+    paths = []
+    for run_dir in run_dirs:
+        with open(os.path.join(run_dir, 'manifest.json')) as f:
+            manifest = json.load(f)
+        if manifest['feature_names'] != FEATURE_NAMES:
+            raise ValueError(f"{run_dir} uses a different feature layout than ai/features.py")
+        paths += [os.path.join(run_dir, shard['file']) for shard in manifest['shards']]
+    return paths
+
+
+def iter_decisions(paths, holdout=None, rng=None):
+    """Yield (features, kind, options, chosen, label) per row; holdout=True/False filters held-out games"""
+    width = len(FEATURE_NAMES)
+    for path in paths:
+        shard = load_shard(path)
+        features = shard['features'][1]
+        options = shard['options'][1]
+        max_options = shard['options'][0][1]
+        order = list(range(shard['kind'][0][0]))
+        if rng:
+            rng.shuffle(order)
+        for r in order:
+            game = shard['game'][1][r]
+            if holdout is not None and (game % HOLDOUT_EVERY == 0) != holdout:
+                continue
+            row_options = [o for o in options[r * max_options:(r + 1) * max_options] if o >= 0]
+            label = (shard['outcome'][1][r] + 1) / 2  # Win 1, draw 0.5, loss 0
+            yield features[r * width:(r + 1) * width], shard['kind'][1][r], row_options, shard['chosen'][1][r], label
+
+
+def _context(features, kind, option):
+    return play_context(features) if kind == KIND_PLAY else draft_context(features, option)
+
+
+def _scales(paths):
+    """Largest magnitude of every state feature and context entry, so SGD sees inputs in [-1, 1]"""
+    state = [1.0] * len(FEATURE_NAMES)
+    contexts = {KIND_PLAY: [1.0] * len(PLAY_CONTEXT), KIND_DRAFT: [1.0] * len(DRAFT_CONTEXT)}
+    for features, kind, options, chosen, _ in iter_decisions(paths, holdout=False):
+        for j, x in enumerate(features):
+            if abs(x) > state[j]:
+                state[j] = abs(x)
+        scale = contexts[kind]
+        for k, x in enumerate(_context(features, kind, options[chosen])):
+            if abs(x) > scale[k]:
+                scale[k] = abs(x)
+    return state, contexts
+
+
+def train(run_dirs, epochs=3, lr=0.01, l2=1e-5, seed=0):
+    """Fit a ValueModel on the non-held-out games of the given datasets"""
+    paths = _shard_paths(run_dirs)
+    rng = random.Random(seed)
+    state_scale, context_scale = _scales(paths)
+    bias = 0.0
+    state_weights = [0.0] * len(FEATURE_NAMES)
+    option_weights = {KIND_PLAY: {}, KIND_DRAFT: {}}
+    rows = 0
+    for epoch in range(epochs):
+        start = time.time()
+        step = lr / math.sqrt(epoch + 1)
+        total_loss = seen = 0
+        rng.shuffle(paths)
+        for features, kind, options, chosen, label in iter_decisions(paths, holdout=False, rng=rng):
+            option = options[chosen]
+            x = [(j, v / state_scale[j]) for j, v in enumerate(features) if v]
+            scale = context_scale[kind]
+            c = [v / s for v, s in zip(_context(features, kind, option), scale)]
+            w_option = option_weights[kind].setdefault(option, [0.0] * len(scale))
+            z = bias + sum(state_weights[j] * v for j, v in x) + sum(w * v for w, v in zip(w_option, c))
+            p = 1 / (1 + math.exp(-max(-30.0, min(30.0, z))))
+            total_loss -= label * math.log(max(p, 1e-12)) + (1 - label) * math.log(max(1 - p, 1e-12))
+            seen += 1
+            g = p - label
+            bias -= step * g
+            for j, v in x:
+                state_weights[j] -= step * (g * v + l2 * state_weights[j])
+            for k, v in enumerate(c):
+                w_option[k] -= step * (g * v + l2 * w_option[k])
+        rows = seen
+        print(f"  epoch {epoch + 1}/{epochs}: train log loss {total_loss / max(seen, 1):.4f} "
+              f"over {seen} rows [{time.time() - start:.1f}s]")
+    # Fold the input scaling into the weights so the model works on raw features
+    model = ValueModel(
+        bias, [w / s for w, s in zip(state_weights, state_scale)],
+        {o: [w / s for w, s in zip(ws, context_scale[KIND_PLAY])] for o, ws in option_weights[KIND_PLAY].items()},
+        {o: [w / s for w, s in zip(ws, context_scale[KIND_DRAFT])] for o, ws in option_weights[KIND_DRAFT].items()})
+    return model, rows
+
+
+def evaluate(model, paths, holdout=True):
+    """Log loss vs a constant baseline, and how often the top-ranked option was the one chosen"""
+    outcomes = []
+    agree = {KIND_PLAY: [0, 0, 0.0], KIND_DRAFT: [0, 0, 0.0]}  # matches, decisions, chance matches
+    for features, kind, options, chosen, label in iter_decisions(paths, holdout=holdout):
+        if kind == KIND_PLAY:
+            context = play_context(features)
+            values = [sum(w * x for w, x in zip(model.play_weights.get(o, ()), context)) for o in options]
+        else:
+            values = [sum(w * x for w, x in zip(model.draft_weights.get(o, ()), draft_context(features, o)))
+                      for o in options]
+        z = model.state_score(features) + values[chosen]
+        outcomes.append((1 / (1 + math.exp(-max(-30.0, min(30.0, z)))), label))
+        stats = agree[kind]
+        stats[0] += values.index(max(values)) == chosen
+        stats[1] += 1
+        stats[2] += 1 / len(options)
+    if not outcomes:
+        return {}
+
+    def log_loss(pairs):
+        return -sum(y * math.log(max(p, 1e-12)) + (1 - y) * math.log(max(1 - p, 1e-12)) for p, y in pairs) / len(pairs)
+
+    base_rate = sum(y for _, y in outcomes) / len(outcomes)
+    decisive = [(p, y) for p, y in outcomes if y != 0.5]
+    metrics = {
+        'rows': len(outcomes),
+        'log_loss': log_loss(outcomes),
+        'baseline_log_loss': log_loss([(base_rate, y) for _, y in outcomes]),
+        'accuracy': sum((p > 0.5) == (y > 0.5) for p, y in decisive) / max(len(decisive), 1),
+    }
+    for kind, name in ((KIND_PLAY, 'play'), (KIND_DRAFT, 'draft')):
+        matches, decisions, chance = agree[kind]
+        if decisions:
+            metrics[f'{name}_agreement'] = matches / decisions
+            metrics[f'{name}_chance_agreement'] = chance / decisions
+    return metrics
+
+
+def format_metrics(metrics):
+    if not metrics:
+        return "  (no rows to evaluate)"
+    lines = [f"  rows {metrics['rows']}: log loss {metrics['log_loss']:.4f} "
+             f"(constant baseline {metrics['baseline_log_loss']:.4f}), accuracy {metrics['accuracy']:.1%}"]
+    for name in ('play', 'draft'):
+        if f'{name}_agreement' in metrics:
+            lines.append(f"  {name}: top option matches the recorded choice {metrics[f'{name}_agreement']:.1%} "
+                         f"(chance {metrics[f'{name}_chance_agreement']:.1%})")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train or evaluate the learned value model')
+    sub = parser.add_subparsers(dest='command', required=True)
+    train_parser = sub.add_parser('train', help='Fit a model on self-play datasets')
+    train_parser.add_argument('runs', nargs='+', help='Dataset run directories')
+    train_parser.add_argument('--epochs', type=int, default=3)
+    train_parser.add_argument('--lr', type=float, default=0.01)
+    train_parser.add_argument('--l2', type=float, default=1e-5)
+    train_parser.add_argument('--seed', type=int, default=0)
+    train_parser.add_argument('--out', default=DEFAULT_MODEL)
+    eval_parser = sub.add_parser('evaluate', help="Score a model on every game of the given datasets")
+    eval_parser.add_argument('runs', nargs='+')
+    eval_parser.add_argument('--model', default=DEFAULT_MODEL)
+    args = parser.parse_args()
+
+    if args.command == 'train':
+        print(f"Training on {', '.join(args.runs)} (every {HOLDOUT_EVERY}th game held out)")
+        model, rows = train(args.runs, args.epochs, args.lr, args.l2, args.seed)
+        metrics = evaluate(model, _shard_paths(args.runs))
+        print("Held-out games:")
+        print(format_metrics(metrics))
+        with open(args.out, 'w') as f:
+            json.dump({**model.to_dict(), 'trained_on': args.runs, 'training_rows': rows, 'holdout': metrics,
+                       'trained': datetime.now().isoformat(timespec='seconds')}, f, indent=2)
+        print(f"Saved model {model.version} to {args.out}")
+    else:
+        model = ValueModel.load(args.model)
+        print(f"Model {model.version} on {', '.join(args.runs)}:")
+        print(format_metrics(evaluate(model, _shard_paths(args.runs), holdout=None)))
+
+
+if __name__ == "__main__":
+    main()